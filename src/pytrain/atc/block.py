@@ -17,7 +17,6 @@ from ..db.component_state import SwitchState
 from ..db.component_state_store import ComponentStateStore
 from ..db.engine_state import EngineState, TrainState
 from ..db.irda_state import IrdaState
-from ..db.state_watcher import StateWatcher
 from ..gpio.gpio_handler import GpioHandler, P
 from ..protocol.command_def import CommandDefEnum
 from ..protocol.command_req import CommandReq
@@ -26,6 +25,7 @@ from ..protocol.multibyte.multibyte_constants import TMCC2RailSoundsDialogContro
 from ..protocol.tmcc1.tmcc1_constants import TMCC1_RESTRICTED_SPEED, TMCC1EngineCommandEnum
 from ..protocol.tmcc2.tmcc2_constants import TMCC2_RESTRICTED_SPEED, TMCC2EngineCommandEnum
 from ..utils.validations import Validations
+from .layout import BlockEvent, Layout
 
 log = logging.getLogger(__name__)
 
@@ -51,6 +51,8 @@ class Block:
         stop_pin (Optional[P]): Pin for the stop section button in the block.
         left_to_right (bool): Default directionality of the block (left to right if True).
         dialog (bool): Determines whether dialogs are triggered for block events (default is True).
+        layout (Optional[Layout]): The block graph the block belongs to; defaults to the layout
+            shared by the process, which processes every block's events on one ATC thread.
 
     Errors:
         AttributeError: Raised in situations such as invalid block id, missing switches, or incorrect configuration.
@@ -71,6 +73,7 @@ class Block:
         stop_pin: P = None,
         left_to_right: bool = True,
         dialog: bool = True,
+        layout: Layout = None,
     ) -> None:
         # check if block_id is valid
         Validations.validate_int(
@@ -90,14 +93,18 @@ class Block:
             raise AttributeError(f"Block ID {block_id} is in use")
         self._block_id = block_id
         self._block_name = block_name
+        self._layout = layout if layout is not None else Layout.get()
         if sensor_track_id:
             self._sensor_track: IrdaState = ComponentStateStore.get_state(CommandScope.IRDA, sensor_track_id)
         else:
             self._sensor_track = None
 
-        self._enter_btn = self.button(enter_pin) if enter_pin else None
-        self._slow_btn = self.button(slow_pin) if slow_pin else None
-        self._stop_btn = self.button(stop_pin) if stop_pin else None
+        # a simulated layout drives section pins itself
+        self._pins = {"enter": enter_pin, "slow": slow_pin, "stop": stop_pin}
+        simulate = self._layout.is_simulation
+        self._enter_btn = self.button(enter_pin) if enter_pin and not simulate else None
+        self._slow_btn = self.button(slow_pin) if slow_pin and not simulate else None
+        self._stop_btn = self.button(stop_pin) if stop_pin and not simulate else None
 
         self._prev_block: Block | None = None
         self._next_block: Block | None = None
@@ -112,22 +119,14 @@ class Block:
         self._order_activated = []
         self._order_deactivated = []
 
-        # add handlers for state change
-        if self._enter_btn:
-            self._enter_btn.when_activated = self.signal_occupied_enter
-            self._enter_btn.when_activated = self.signal_occupied_exit
-        if self._slow_btn:
-            self._slow_btn.when_activated = self.signal_slow_enter
-            self._slow_btn.when_deactivated = self.signal_slow_exit
-        if self._stop_btn:
-            self._stop_btn.when_activated = self.signal_stop_enter
-            self._stop_btn.when_deactivated = self.signal_stop_exit
-
-        # start thread if sensor track specified, we also delay calling super until
-        # buttons have been created
-        self._sensor_track_watcher = self._switch_watcher = None
-        if self.sensor_track:
-            self._sensor_track_watcher = StateWatcher(self.sensor_track, self._cache_motive)
+        # section edges are routed through the layout and handled on its ATC thread
+        for btn, pin in [(self._enter_btn, enter_pin), (self._slow_btn, slow_pin), (self._stop_btn, stop_pin)]:
+            if btn:
+                btn.when_activated = self._pin_action(pin, True)
+                btn.when_deactivated = self._pin_action(pin, False)
+
+        # add the block to the layout graph; the layout watches the sensor track
+        self._layout.add(self, self._pins)
         # finally, update corresponding state record on all nodes
         self.broadcast_state()
         self._block_state = ComponentStateStore.get_state(CommandScope.BLOCK, self.block_id)
@@ -201,21 +200,25 @@ class Block:
         """
         Is the "entered" block portion occupied?
         """
-        return self._enter_btn.is_active if self._enter_btn else None
+        return self._section_active(self._enter_btn, "enter")
 
     @property
     def is_slowed(self) -> bool:
         """
         Is the "slow" block portion occupied?
         """
-        return self._slow_btn.is_active if self._slow_btn else None
+        return self._section_active(self._slow_btn, "slow")
 
     @property
     def is_stopped(self) -> bool:
         """
         Is the "stopped" block portion occupied?
         """
-        return self._stop_btn.is_active if self._stop_btn else None
+        return self._section_active(self._stop_btn, "stop")
+
+    @property
+    def layout(self) -> Layout:
+        return self._layout
 
     @property
     def is_dialog(self) -> bool:
@@ -282,6 +285,8 @@ class Block:
         from ..comm.comm_buffer import CommBuffer
         from ..pdi.block_req import BlockReq
 
+        if self._layout.is_simulation:
+            return
         block_req = BlockReq(self)
         CommBuffer.get().update_state(block_req)
 
@@ -304,12 +309,23 @@ class Block:
                 raise AttributeError(f"Switch {switch_tmcc_id} not found")
             self._thru_block = thru_block
             self._out_block = out_block
-            self._switch_watcher = StateWatcher(self.switch, self.respond_to_thrown_switch)
+            self._layout.add_switch(self, self.switch)
             # force call to the method that sets next_block
             self.respond_to_thrown_switch()
         else:
             raise AttributeError("Switch TMCC ID cannot be None")
 
+    def handle(self, event: BlockEvent, *data) -> None:
+        """
+        Process a block event; called on the layout's ATC thread
+        """
+        if event == BlockEvent.SENSOR:
+            self._cache_motive(*data)
+        elif event == BlockEvent.SWITCH:
+            self.respond_to_thrown_switch()
+        else:
+            getattr(self, f"signal_{event.value}")()
+
     def signal_occupied_enter(self) -> None:
         log.info(f"Block {self.block_id} occupied enter")
         if 1 not in self._order_activated:
@@ -391,7 +407,7 @@ class Block:
                     scope = self._current_motive.scope
                     tmcc_id = self._current_motive.tmcc_id
                     req = RampedSpeedReq(tmcc_id, "restricted", scope)
-                    req.send()
+                    self._send(req)
 
     def stop_immediate(self):
         if self._current_motive:
@@ -402,16 +418,16 @@ class Block:
             scope = self._current_motive.scope
             tmcc_id = self._current_motive.tmcc_id
             if self._current_motive.is_tmcc:
-                CommandReq(TMCC1EngineCommandEnum.STOP_IMMEDIATE, tmcc_id, scope=scope).send()
+                self._send(CommandReq(TMCC1EngineCommandEnum.STOP_IMMEDIATE, tmcc_id, scope=scope))
             else:
-                CommandReq(TMCC2EngineCommandEnum.STOP_IMMEDIATE, tmcc_id, scope=scope).send()
+                self._send(CommandReq(TMCC2EngineCommandEnum.STOP_IMMEDIATE, tmcc_id, scope=scope))
         elif self.is_occupied:
             # send a stop to all engines, as otherwise, we could have a crash
             if self.is_dialog:
                 self.do_dialog(5)
             else:
-                CommandReq(TMCC1EngineCommandEnum.BLOW_HORN_ONE, 99).send()
-            CommandReq(TMCC1EngineCommandEnum.STOP_IMMEDIATE, 99).send()
+                self._send(CommandReq(TMCC1EngineCommandEnum.BLOW_HORN_ONE, 99))
+            self._send(CommandReq(TMCC1EngineCommandEnum.STOP_IMMEDIATE, 99))
 
     def resume_speed(self) -> None:
         from ..protocol.sequence.ramped_speed_req import RampedSpeedReq
@@ -422,7 +438,7 @@ class Block:
             log.info(f"Resume Speed: {self._original_speed} for {scope.title} {tmcc_id}")
             self.do_dialog(TMCC2RailSoundsDialogControl.TOWER_DEPARTURE_GRANTED)
             req = RampedSpeedReq(tmcc_id, self._original_speed, scope)
-            req.send()
+            self._send(req)
 
     def do_dialog(self, dialog: CommandDefEnum | int) -> None:
         if self.is_dialog and self._current_motive:
@@ -435,9 +451,34 @@ class Block:
                 req = CommandReq.build(TMCC2EngineCommandEnum.NUMERIC, tmcc_id, data=dialog, scope=scope)
             else:
                 raise AttributeError(f"Invalid dialog type: {type(dialog)} ({dialog})")
-            req.send()
-
-    def _cache_motive(self) -> None:
+            self._send(req)
+
+    def _send(self, req: CommandReq) -> None:
+        self._layout.send(self, req)
+
+    def _pin_action(self, pin: P, active: bool):
+        def func() -> None:
+            self._layout.pin_changed(pin, active)
+
+        return func
+
+    def _section_active(self, btn: Button, section: str) -> bool | None:
+        if btn is not None:
+            return btn.is_active
+        if self._pins[section] is not None:
+            return self._layout.is_pin_active(self._pins[section])
+        return None
+
+    def _cache_motive(self, motive: EngineState | TrainState = None, direction: Direction = None) -> None:
+        if motive is not None:
+            # motive reported directly, as by a simulated sensor track
+            last_motive = self.occupied_by
+            self._current_motive = motive
+            self._original_speed = motive.speed
+            self._motive_direction = direction
+            if last_motive != self.occupied_by:
+                self.broadcast_state()
+            return
         scope = "Train" if self.sensor_track.is_train else "Engine"
         if scope == "Train":
             last_id = self.sensor_track.last_train_id
@@ -0,0 +1,256 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from enum import Enum, unique
+from queue import Queue
+from threading import RLock, Thread
+from typing import TYPE_CHECKING, Any, Callable, Hashable
+
+from ..protocol.constants import PROGRAM_NAME, CommandScope
+
+if TYPE_CHECKING:
+    from .block import Block
+
+log = logging.getLogger(__name__)
+
+MAX_LATENCY_SAMPLES = 10_000
+
+
+@unique
+class BlockEvent(Enum):
+    OCCUPIED_ENTER = "occupied_enter"
+    OCCUPIED_EXIT = "occupied_exit"
+    SLOW_ENTER = "slow_enter"
+    SLOW_EXIT = "slow_exit"
+    STOP_ENTER = "stop_enter"
+    STOP_EXIT = "stop_exit"
+    SENSOR = "sensor"
+    SWITCH = "switch"
+
+
+# the events raised when a block's section pins go active and inactive
+SECTION_EVENTS = {
+    "enter": (BlockEvent.OCCUPIED_ENTER, BlockEvent.OCCUPIED_EXIT),
+    "slow": (BlockEvent.SLOW_ENTER, BlockEvent.SLOW_EXIT),
+    "stop": (BlockEvent.STOP_ENTER, BlockEvent.STOP_EXIT),
+}
+
+
+class Layout(Thread):
+    """
+    The block graph of a layout. The layout indexes its blocks by the IRDA
+    sensor tracks, GPIO pins and switches that affect them, so a sensor, pin
+    or switch change is routed straight to the blocks concerned. Each
+    resulting block event is queued and processed, in the order it arrived,
+    on the layout's single ATC thread; a block therefore never sees two
+    events at once, and the blocks on either side of it see them in the same
+    order it did. Each sensor track and switch is watched once, no matter how
+    many blocks it affects.
+
+    A layout created with simulate=True sends no commands and broadcasts no
+    state; commands are passed to on_send instead, so virtual trains can be
+    driven through the layout (see LoopSimulator).
+    """
+
+    _instance = None
+    _lock = RLock()
+
+    @classmethod
+    def get(cls) -> Layout:
+        with cls._lock:
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = Layout()
+            return cls._instance
+
+    def __init__(self, simulate: bool = False, on_send: Callable[[Block, Any], None] = None) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} ATC")
+        self._simulate = simulate
+        self._on_send = on_send
+        self._lock = RLock()
+        self._queue: Queue[tuple[float, Block, BlockEvent, tuple] | None] = Queue()
+        self._blocks: dict[int, Block] = {}
+        self._by_sensor: dict[int, list[Block]] = {}
+        self._by_pin: dict[Hashable, list[tuple[Block, str]]] = {}
+        self._by_switch: dict[int, list[Block]] = {}
+        self._pin_states: dict[Hashable, bool] = {}
+        self._watchers = []
+        self._posted_at: float | None = None
+        self._events = 0
+        self._queue_delays = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self._reaction_times = deque(maxlen=MAX_LATENCY_SAMPLES)
+        self._running = True
+        self.start()
+
+    @property
+    def is_simulation(self) -> bool:
+        return self._simulate
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of block events queued or being processed
+        """
+        return self._queue.unfinished_tasks
+
+    @property
+    def blocks(self) -> list[Block]:
+        with self._lock:
+            return list(self._blocks.values())
+
+    @property
+    def events(self) -> int:
+        """
+        Number of block events processed
+        """
+        return self._events
+
+    @property
+    def queue_delays(self) -> list[float]:
+        """
+        Seconds each recent event waited in the queue before it was processed
+        """
+        return list(self._queue_delays)
+
+    @property
+    def reaction_times(self) -> list[float]:
+        """
+        Seconds from each recent event to the first command sent in response to it
+        """
+        return list(self._reaction_times)
+
+    def block(self, block_id: int) -> Block | None:
+        with self._lock:
+            return self._blocks.get(block_id, None)
+
+    def blocks_for_sensor(self, tmcc_id: int) -> list[Block]:
+        with self._lock:
+            return list(self._by_sensor.get(tmcc_id, []))
+
+    def blocks_for_pin(self, pin: Hashable) -> list[Block]:
+        with self._lock:
+            return [block for block, _ in self._by_pin.get(pin, [])]
+
+    def blocks_for_switch(self, tmcc_id: int) -> list[Block]:
+        with self._lock:
+            return list(self._by_switch.get(tmcc_id, []))
+
+    def add(self, block: Block, pins: dict[str, Hashable] = None) -> None:
+        """
+        Add block to the graph, indexing it by its sensor track and section pins
+        """
+        with self._lock:
+            if block.block_id in self._blocks and self._blocks[block.block_id] is not block:
+                raise AttributeError(f"Block ID {block.block_id} is in use")
+            self._blocks[block.block_id] = block
+            if pins:
+                for section, pin in pins.items():
+                    if pin is not None:
+                        self._by_pin.setdefault(pin, []).append((block, section))
+            if block.sensor_track:
+                tmcc_id = block.sensor_track.tmcc_id
+                if tmcc_id not in self._by_sensor:
+                    self._by_sensor[tmcc_id] = []
+                    self._watch(block.sensor_track, lambda: self.sensor_changed(tmcc_id))
+                self._by_sensor[tmcc_id].append(block)
+
+    def add_switch(self, block: Block, switch: Any) -> None:
+        """
+        Index block by the switch at its end
+        """
+        with self._lock:
+            tmcc_id = switch.tmcc_id
+            if tmcc_id not in self._by_switch:
+                self._by_switch[tmcc_id] = []
+                self._watch(switch, lambda: self.switch_changed(tmcc_id))
+            if block not in self._by_switch[tmcc_id]:
+                self._by_switch[tmcc_id].append(block)
+
+    def is_pin_active(self, pin: Hashable) -> bool:
+        return self._pin_states.get(pin, False)
+
+    def pin_changed(self, pin: Hashable, active: bool) -> None:
+        """
+        A section pin went active or inactive; queue the events for the blocks it belongs to
+        """
+        self._pin_states[pin] = active
+        with self._lock:
+            targets = list(self._by_pin.get(pin, []))
+        for block, section in targets:
+            self.post(block, SECTION_EVENTS[section][0 if active else 1])
+
+    def sensor_changed(self, tmcc_id: int, *data: Any) -> None:
+        """
+        A train passed the sensor track; data optionally gives the train and its direction
+        """
+        for block in self.blocks_for_sensor(tmcc_id):
+            self.post(block, BlockEvent.SENSOR, *data)
+
+    def switch_changed(self, tmcc_id: int) -> None:
+        for block in self.blocks_for_switch(tmcc_id):
+            self.post(block, BlockEvent.SWITCH)
+
+    def post(self, block: Block, event: BlockEvent, *data: Any) -> None:
+        self._queue.put((time.monotonic(), block, event, data))
+
+    def send(self, block: Block, request: Any) -> None:
+        """
+        Send a command on behalf of block, noting how long it took to react to the event being processed
+        """
+        if self._posted_at is not None:
+            self._reaction_times.append(time.monotonic() - self._posted_at)
+            self._posted_at = None
+        if self._on_send is not None:
+            self._on_send(block, request)
+        if not self._simulate:
+            request.send()
+
+    def reset_stats(self) -> None:
+        self._events = 0
+        self._queue_delays.clear()
+        self._reaction_times.clear()
+
+    def reset(self) -> None:
+        self._running = False
+        for watcher in self._watchers:
+            watcher.shutdown()
+        self._watchers.clear()
+        self._queue.put(None)
+
+    def run(self) -> None:
+        while self._running:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                continue
+            posted_at, block, event, data = item
+            self._queue_delays.append(time.monotonic() - posted_at)
+            self._posted_at = posted_at
+            try:
+                block.handle(event, *data)
+            except Exception as e:
+                log.exception(f"Error handling {event.name} in {block}", exc_info=e)
+            self._posted_at = None
+            self._events += 1
+            self._queue.task_done()
+
+    def _watch(self, state: Any, action: Callable) -> None:
+        if self._simulate or state is None or state.scope not in {CommandScope.IRDA, CommandScope.SWITCH}:
+            return
+        from ..db.state_watcher import StateWatcher
+
+        self._watchers.append(StateWatcher(state, action))
@@ -0,0 +1,257 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+from threading import Condition
+from typing import Any
+
+from ..db.component_state_store import ComponentStateStore
+from ..protocol.constants import CommandScope, Direction
+from ..protocol.sequence.sequence_constants import SequenceCommandEnum
+from ..protocol.tmcc1.tmcc1_constants import TMCC1EngineCommandEnum
+from ..protocol.tmcc2.tmcc2_constants import TMCC2EngineCommandEnum
+from .block import Block
+from .layout import Layout
+
+log = logging.getLogger(__name__)
+
+STOP_COMMANDS = {TMCC1EngineCommandEnum.STOP_IMMEDIATE, TMCC2EngineCommandEnum.STOP_IMMEDIATE}
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+class VirtualTrain:
+    """
+    A simulated engine; presents the parts of EngineState that blocks use
+    """
+
+    def __init__(self, tmcc_id: int, speed: int, block: int) -> None:
+        self.tmcc_id = tmcc_id
+        self.scope = CommandScope.ENGINE
+        self.speed = speed
+        self.is_legacy = True
+        self.is_tmcc = False
+        self.block = block
+        self.section = 0
+        self.running = True
+        self.next_due = 0.0
+        self.stops = 0
+
+    def __repr__(self) -> str:
+        return f"<VirtualTrain {self.tmcc_id}: block {self.block} section {self.section} speed {self.speed}>"
+
+
+@dataclass
+class SimulationReport:
+    blocks: int
+    trains: int
+    duration: float
+    events: int
+    events_per_sec: float
+    reactions: int
+    reaction_p50_ms: float
+    reaction_p99_ms: float
+    reaction_max_ms: float
+    queue_p99_ms: float
+    stops: int
+    resumes: int
+    overruns: int
+
+    def __str__(self) -> str:
+        return (
+            f"{self.blocks} blocks, {self.trains} trains, {self.duration:.1f}s: "
+            f"{self.events} events ({self.events_per_sec:.0f}/s), {self.reactions} reactions, "
+            f"p50 {self.reaction_p50_ms:.2f} ms p99 {self.reaction_p99_ms:.2f} ms "
+            f"max {self.reaction_max_ms:.2f} ms, queue p99 {self.queue_p99_ms:.2f} ms, "
+            f"{self.stops} stops, {self.resumes} resumes, {self.overruns} overruns"
+        )
+
+
+class LoopSimulator:
+    """
+    Drives virtual trains around a loop of simulated blocks, each with a
+    sensor track and enter, slow and stop sections, so the layout's reaction
+    to block events can be measured at scale without hardware. A train takes
+    section_time seconds to cross a section at speed; trains start at a spread
+    of speeds up to speed, so faster trains close on slower ones. A train
+    that leaves a stop section into an occupied block is counted as an
+    overrun: the layout did not stop it in time.
+
+    Blocks and sensor tracks are numbered from 1, so the simulator should not
+    share a process with a live layout.
+    """
+
+    def __init__(
+        self,
+        blocks: int = 16,
+        trains: int = 4,
+        section_time: float = 0.050,
+        speed: int = 60,
+    ) -> None:
+        if not 3 <= blocks <= 99:
+            raise AttributeError(f"Blocks must be between 3 and 99: {blocks}")
+        if not 1 <= trains <= blocks // 2:
+            raise AttributeError(f"Trains must be between 1 and {blocks // 2}: {trains}")
+        if not ComponentStateStore.is_built():
+            ComponentStateStore()
+        self._cv = Condition()
+        self._section_time = section_time
+        self._speed = speed
+        self._stops = self._resumes = self._overruns = 0
+        self._layout = Layout(simulate=True, on_send=self._on_send)
+        self._new_sensors = [
+            i for i in range(1, blocks + 1) if not ComponentStateStore.get_state(CommandScope.IRDA, i, False)
+        ]
+        self._blocks: list[Block] = []
+        for i in range(1, blocks + 1):
+            block = Block(
+                i,
+                f"Sim {i}",
+                sensor_track_id=i,
+                enter_pin=(i, "enter"),
+                slow_pin=(i, "slow"),
+                stop_pin=(i, "stop"),
+                dialog=False,
+                layout=self._layout,
+            )
+            if self._blocks:
+                self._blocks[-1].next_block = block
+            self._blocks.append(block)
+        self._blocks[-1].next_block = self._blocks[0]
+        # space the trains evenly around the loop, at a spread of speeds so the faster catch up
+        self._trains = {
+            n: VirtualTrain(n, speed - (n % 4) * speed // 8, (n - 1) * blocks // trains) for n in range(1, trains + 1)
+        }
+        self._occupied: dict[int, VirtualTrain] = {}
+
+    @property
+    def layout(self) -> Layout:
+        return self._layout
+
+    @property
+    def blocks(self) -> list[Block]:
+        return list(self._blocks)
+
+    @property
+    def trains(self) -> list[VirtualTrain]:
+        return list(self._trains.values())
+
+    def run(self, duration: float = 5.0) -> SimulationReport:
+        """
+        Drive the trains for duration seconds and report how the layout kept up
+        """
+        start = time.monotonic()
+        with self._cv:
+            for train in self._trains.values():
+                self._arrive(train, train.block)
+                train.next_due = start + self._crossing_time(train)
+        self._layout.reset_stats()
+        end = start + duration
+        while True:
+            with self._cv:
+                now = time.monotonic()
+                if now >= end:
+                    break
+                due = min((t.next_due for t in self._trains.values() if t.running), default=end)
+                if due > now:
+                    self._cv.wait(min(due, end) - now)
+                    continue
+                for train in self._trains.values():
+                    if train.running and train.next_due <= now:
+                        self._advance(train, now)
+        elapsed = time.monotonic() - start
+        # let the layout drain its queue before reporting
+        deadline = time.monotonic() + 1.0
+        while self._layout.pending and time.monotonic() < deadline:
+            time.sleep(0.005)
+        reactions = self._layout.reaction_times
+        return SimulationReport(
+            blocks=len(self._blocks),
+            trains=len(self._trains),
+            duration=elapsed,
+            events=self._layout.events,
+            events_per_sec=self._layout.events / elapsed if elapsed else 0.0,
+            reactions=len(reactions),
+            reaction_p50_ms=percentile(reactions, 50) * 1000,
+            reaction_p99_ms=percentile(reactions, 99) * 1000,
+            reaction_max_ms=max(reactions, default=0.0) * 1000,
+            queue_p99_ms=percentile(self._layout.queue_delays, 99) * 1000,
+            stops=self._stops,
+            resumes=self._resumes,
+            overruns=self._overruns,
+        )
+
+    def close(self) -> None:
+        self._layout.reset()
+        self._layout.join()
+        for block in self._blocks:
+            ComponentStateStore.delete_state(block.state)
+        for tmcc_id in self._new_sensors:
+            ComponentStateStore.delete_state(ComponentStateStore.get_state(CommandScope.IRDA, tmcc_id, False))
+        self._blocks.clear()
+
+    def _crossing_time(self, train: VirtualTrain) -> float:
+        return self._section_time * self._speed / max(1, train.speed)
+
+    def _arrive(self, train: VirtualTrain, index: int) -> None:
+        block = self._blocks[index]
+        train.block = index
+        train.section = 0
+        self._occupied[index] = train
+        self._layout.sensor_changed(block.sensor_track.tmcc_id, train, Direction.L2R)
+        self._layout.pin_changed((block.block_id, "enter"), True)
+
+    def _advance(self, train: VirtualTrain, now: float) -> None:
+        block_id = self._blocks[train.block].block_id
+        if train.section == 0:
+            self._layout.pin_changed((block_id, "slow"), True)
+            self._layout.pin_changed((block_id, "enter"), False)
+            train.section = 1
+        elif train.section == 1:
+            self._layout.pin_changed((block_id, "stop"), True)
+            self._layout.pin_changed((block_id, "slow"), False)
+            train.section = 2
+        else:
+            index = (train.block + 1) % len(self._blocks)
+            if index in self._occupied:
+                self._overruns += 1
+                log.warning(f"{train} overran into block {index + 1}, occupied by {self._occupied[index]}")
+            del self._occupied[train.block]
+            self._arrive(train, index)
+            self._layout.pin_changed((block_id, "stop"), False)
+        train.next_due = now + self._crossing_time(train)
+
+    def _on_send(self, block: Block, request: Any) -> None:
+        train = self._trains.get(request.address, None)
+        if train is None:
+            return
+        with self._cv:
+            if request.command in STOP_COMMANDS:
+                if train.running:
+                    train.running = False
+                    train.stops += 1
+                    self._stops += 1
+            elif request.command == SequenceCommandEnum.RAMPED_SPEED_SEQ:
+                # the ramp's steps may be issued by the RampController, rather than carried in the request
+                if request.target_speed is not None:
+                    train.speed = request.target_speed
+                    if not train.running and train.speed > 0:
+                        train.running = True
+                        train.next_due = time.monotonic() + self._crossing_time(train)
+                        self._resumes += 1
+            self._cv.notify()
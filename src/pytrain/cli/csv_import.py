@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from __future__ import annotations
+
+import logging
+import sys
+import time
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from pathlib import Path
+from threading import Thread
+from typing import Callable, Dict, Iterable, List, TextIO
+
+from ..db.comp_data import SCOPE_TO_FIELDS_MAP, CompData, UpdatePkg
+from ..db.component_state import ComponentState
+from ..pdi.ack_window import DEFAULT_ACK_TIMEOUT, DEFAULT_WINDOW, AckWindow
+from ..pdi.base_req import BaseReq
+from ..pdi.constants import D4Action, PdiCommand
+from ..pdi.d4_req import D4Req
+from ..pdi.pdi_req import PdiReq
+from ..protocol.command_base import CommandBase
+from ..protocol.constants import (
+    CONTROL_TYPE,
+    DEFAULT_BAUDRATE,
+    DEFAULT_PORT,
+    LOCO_TYPE,
+    SOUND_TYPE,
+    CommandScope,
+)
+from ..utils.argument_parser import PyTrainArgumentParser, UniqueChoice
+from . import CliBase
+
+log = logging.getLogger(__name__)
+
+# the csv_export columns that hold labels of engine and train record fields
+LABEL_COLUMNS = {
+    "type": ("engine_type", {v.lower(): k for k, v in LOCO_TYPE.items()}),
+    "control": ("control_type", {v.lower(): k for k, v in CONTROL_TYPE.items()}),
+    "sound": ("sound_type", {v.lower(): k for k, v in SOUND_TYPE.items()}),
+}
+# the field_to_updates request that writes each of those fields
+TYPE_FIELDS = {"engine_type": "ENGINE_TYPE", "control_type": "CONTROL_TYPE", "sound_type": "SOUND_TYPE"}
+
+
+def _number_key(road_number: str | None) -> str | int | None:
+    # "0012" and "12" are the same road number
+    if road_number is None:
+        return None
+    road_number = road_number.strip()
+    return int(road_number) if road_number.isdigit() else road_number
+
+
+@dataclass(frozen=True)
+class RosterRecord:
+    """
+    The Base 3 record fields set by one row of a CSV roster, in the layout
+    written by csv_export; fields left blank, or "NA", are left as they are
+    """
+
+    scope: CommandScope
+    tmcc_id: int
+    road_name: str | None = None
+    road_number: str | None = None
+    engine_type: int | None = None
+    control_type: int | None = None
+    sound_type: int | None = None
+
+    @classmethod
+    def from_row(cls, scope: CommandScope, row: Dict[str, str]) -> RosterRecord:
+        address = (row.get("address", None) or "").strip()
+        if not address.isdigit():
+            raise ValueError(f"Invalid address: '{address}'")
+        tmcc_id = int(address)
+        max_id = 9999 if scope in {CommandScope.ENGINE, CommandScope.TRAIN} else 98
+        if not 1 <= tmcc_id <= max_id:
+            raise ValueError(f"Invalid {scope.title} address: {tmcc_id}")
+        road_name = (row.get("road_name", None) or "").strip()[:31] or None
+        road_number = (row.get("road_number", None) or "").strip() or None
+        if road_number is not None and len(str(_number_key(road_number))) > 4:
+            raise ValueError(f"Invalid road number: '{road_number}'")
+        types = {}
+        if scope in {CommandScope.ENGINE, CommandScope.TRAIN}:
+            for column, (field, values) in LABEL_COLUMNS.items():
+                label = (row.get(column, None) or "").strip()
+                if label and label.upper() != "NA":
+                    if label.lower() not in values:
+                        raise ValueError(f"Invalid {column}: '{label}'")
+                    types[field] = values[label.lower()]
+        return cls(scope, tmcc_id, road_name, road_number, **types)
+
+    @property
+    def is_two_digit(self) -> bool:
+        return 1 <= self.tmcc_id <= 99
+
+    def changes(self, comp_data: CompData | None) -> List[UpdatePkg]:
+        """
+        The updates that bring comp_data, the record as the Base 3 has it (None if empty), in line with this one
+        """
+        pkgs = []
+        if self.road_name is not None and self.road_name != getattr(comp_data, "road_name", None):
+            pkgs.append(self._text_pkg("road_name", self.road_name, 31))
+        if self.road_number is not None and _number_key(self.road_number) != _number_key(
+            getattr(comp_data, "road_number", None)
+        ):
+            # numeric road numbers are stored as 4 digits, as when set from the GUI
+            number = str(int(self.road_number)).zfill(4) if self.road_number.isdigit() else self.road_number
+            pkgs.append(self._text_pkg("road_number", number, 4))
+        for field, request in TYPE_FIELDS.items():
+            value = getattr(self, field)
+            if value is not None and value != getattr(comp_data, field, None):
+                pkgs.extend(CompData.field_to_updates(request, self.tmcc_id, self.scope, value))
+        return pkgs
+
+    def matches(self, comp_data: CompData | None) -> bool:
+        return not self.changes(comp_data)
+
+    def _text_pkg(self, field: str, text: str, length: int) -> UpdatePkg:
+        # the length byte precedes the text, so one write sets both
+        addr = SCOPE_TO_FIELDS_MAP[self.scope][f"{field}_len"]
+        data = len(text).to_bytes(1, "big") + PdiReq.encode_text(text, length)
+        return UpdatePkg(f"_{field}_len", addr, len(data), data)
+
+
+def coalesce(pkgs: Iterable[UpdatePkg]) -> List[UpdatePkg]:
+    """
+    Merge updates to adjacent Base 3 memory into single writes
+    """
+    merged: List[UpdatePkg] = []
+    for pkg in sorted(pkgs, key=lambda p: p.offset):
+        last = merged[-1] if merged else None
+        if last and last.offset + last.length == pkg.offset:
+            data_bytes = last.data_bytes + pkg.data_bytes
+            merged[-1] = UpdatePkg(last.field, last.offset, len(data_bytes), data_bytes)
+        else:
+            merged.append(pkg)
+    return merged
+
+
+class RosterImportPlan:
+    """
+    The writes that bring the Base 3 in line with a roster. Each record is
+    compared with its state in the ComponentStateStore; only records that
+    differ are written, and only their changed fields, with updates to
+    adjacent memory merged so a changed record is usually one write.
+    """
+
+    def __init__(
+        self,
+        records: Iterable[RosterRecord],
+        get_state: Callable[[CommandScope, int], ComponentState | None],
+    ) -> None:
+        self._writes: List[tuple[RosterRecord, List[PdiReq]]] = []
+        self._unchanged: List[RosterRecord] = []
+        self._skipped: List[RosterRecord] = []
+        self._added: List[RosterRecord] = []
+        self._record_nos: Dict[int, int] = {}
+        for record in records:
+            state = get_state(record.scope, record.tmcc_id)
+            comp_data = state.comp_data if state is not None and state.is_comp_data_record else None
+            pkgs = record.changes(comp_data)
+            if not pkgs:
+                self._unchanged.append(record)
+                continue
+            record_no = None
+            if not record.is_two_digit:
+                # 4-digit records are written by record number, so they must already exist
+                record_no = getattr(state, "record_no", None)
+                if record_no is None or record_no == 0xFFFF:
+                    self._skipped.append(record)
+                    continue
+                self._record_nos[record.tmcc_id] = record_no
+            elif comp_data is None or not comp_data.is_active():
+                self._added.append(record)
+            self._writes.append(
+                (record, [pkg.as_request(record.tmcc_id, record.scope, record_no) for pkg in coalesce(pkgs)])
+            )
+
+    @property
+    def writes(self) -> List[tuple[RosterRecord, List[PdiReq]]]:
+        """
+        The changed records and the requests that write them
+        """
+        return self._writes
+
+    @property
+    def unchanged(self) -> List[RosterRecord]:
+        return self._unchanged
+
+    @property
+    def skipped(self) -> List[RosterRecord]:
+        """
+        The changed 4-digit records not on the Base 3; they must be added there first
+        """
+        return self._skipped
+
+    @property
+    def added(self) -> List[RosterRecord]:
+        """
+        The 2-digit records written to empty Base 3 records; they need to be linked with reindex
+        """
+        return self._added
+
+    def query_req(self, record: RosterRecord) -> PdiReq:
+        """
+        The request that reads record back from the Base 3
+        """
+        if record.is_two_digit:
+            return BaseReq(record.tmcc_id, PdiCommand.BASE_MEMORY, scope=record.scope)
+        return D4Req(
+            self._record_nos[record.tmcc_id],
+            PdiCommand.D4_TRAIN if record.scope == CommandScope.TRAIN else PdiCommand.D4_ENGINE,
+            D4Action.QUERY,
+            start=0,
+            data_length=0xC0,
+        )
+
+
+def read_roster(scope: CommandScope, csvfile: TextIO, has_header: bool = True) -> List[RosterRecord]:
+    """
+    Parse a CSV roster; rows that can't be parsed are logged and skipped
+    """
+    records = {}
+    reader = ComponentState.get_csv_dict_reader(scope, csvfile, has_header=has_header)
+    for row in reader:
+        try:
+            record = RosterRecord.from_row(scope, row)
+        except ValueError as ve:
+            log.warning(f"Skipping line {reader.line_num}: {ve}")
+            continue
+        # a later row for the same record wins
+        records[record.tmcc_id] = record
+    return list(records.values())
+
+
+class CsvImportCmd(CommandBase, Thread):
+    """
+    Command to write Lionel Base 3 database records from a CSV file.
+
+    This is a special case of CommandBase where no actual requests are created nor sent.
+    """
+
+    def __init__(self, cli: CsvImportCli) -> None:
+        self._cli = cli
+        self._scope: CommandScope = cli.scope
+
+        if self._cli.scope is None:
+            raise ValueError("Scope must be specified")
+
+        # with PyTrain initialization sorted out, initialize CommandBase and Thread.
+        # If we are stand-alone, set daemon to False, as we need the process to continue running.
+        CommandBase.__init__(
+            self,
+            None,
+            None,
+            1,
+            scope=self._scope,
+            server=self._cli.args.server if "server" in self._cli.args else None,
+            client=self._cli.args.client if "client" in self._cli.args else False,
+            base=self._cli.args.base if "base" in self._cli.args else None,
+        )
+        Thread.__init__(self, daemon=self.is_daemon, name="CsvImportCmdThread")
+
+        self._command = self._build_command()
+        self._plan: RosterImportPlan | None = None
+        self._acks: AckWindow | None = None
+        self._observed: Dict[int, CompData] = {}
+
+    @property
+    def scope(self) -> CommandScope:
+        return self._cli.scope
+
+    @property
+    def is_verbose(self) -> bool:
+        return self._cli.is_verbose
+
+    @property
+    def is_validate(self) -> bool:
+        return self._cli.is_validate
+
+    def __call__(self, cmd: PdiReq) -> None:
+        """
+        Callback specified in the Subscriber protocol used to send events to listeners.
+        We expect BaseReq and D4Req responses
+        """
+        if cmd and cmd.scope == self._scope and isinstance(cmd, (BaseReq, D4Req)):
+            if cmd.is_comp_data_record:
+                self._observed[cmd.tmcc_id] = cmd.comp_data
+            if self._acks is not None:
+                self._acks.answered(cmd)
+
+    # noinspection PyTypeChecker
+    def send(
+        self,
+        repeat: int = None,
+        delay: float = None,
+        duration: float = None,
+        interval: int = None,
+        shutdown: bool = False,
+        baudrate: int = DEFAULT_BAUDRATE,
+        port: str = DEFAULT_PORT,
+        server: str = None,
+    ):
+        # pause until Base 3 sync complete
+        self.wait_for_sync()
+
+        if self.is_verbose:
+            log.info(f"Importing {self._scope.title} records from '{self._cli.input_file}'...")
+        with open(self._cli.input_file, newline="") as f:
+            records = read_roster(self._scope, f, has_header=self._cli.is_header)
+        self._plan = RosterImportPlan(
+            records, lambda scope, tmcc_id: self._pytrain.store.get_state(scope, tmcc_id, False)
+        )
+        plan = self._plan
+        log.info(
+            f"{len(records)} {self._scope.title} record(s) read: {len(plan.writes)} changed, "
+            f"{len(plan.unchanged)} unchanged"
+        )
+        for record in plan.skipped:
+            log.warning(f"{self._scope.title} {record.tmcc_id} is not on the Base 3; add it there, then re-import")
+        if self._cli.is_validate:
+            for record, _ in plan.writes:
+                log.info(f"{self._scope.title} {record.tmcc_id} differs: {record}")
+        elif plan.writes:
+            self.start()
+
+    def run(self) -> None:
+        try:
+            self.pytrain.pdi_listener.subscribe_any(self)
+            self._do_import()
+        finally:
+            self.pytrain.pdi_listener.unsubscribe_any(self)
+
+    def _do_import(self, window: int = DEFAULT_WINDOW, ack_timeout: float = DEFAULT_ACK_TIMEOUT) -> bool:
+        plan = self._plan
+        self._acks = AckWindow(self.pytrain.pdi_dispatcher.enqueue_command, window, ack_timeout, retries=1)
+        started_at = time.monotonic()
+        reqs = []
+        for record, record_reqs in plan.writes:
+            if self.is_verbose:
+                log.info(f"Writing {self._scope.title} {record.tmcc_id}: {record}")
+            reqs.extend(record_reqs)
+        lost = self._acks.send_all(reqs)
+        elapsed = time.monotonic() - started_at
+        num = len(plan.writes)
+        log.info(
+            f"Wrote {num} {self._scope.title} record(s) in {elapsed:.2f}s "
+            f"({num / elapsed if elapsed > 0 else 0:.1f} records/sec); "
+            f"{self._acks.retried} resent, {len(lost)} unacknowledged"
+        )
+
+        # read back the records written, and only those, to verify them
+        self._observed.clear()
+        lost = self._acks.send_all([plan.query_req(record) for record, _ in plan.writes])
+        if lost:
+            log.warning(f"Timed out waiting for {len(lost)} verification response(s) from Lionel Base 3")
+        mismatched = [record for record, _ in plan.writes if not record.matches(self._observed.get(record.tmcc_id))]
+        for record in mismatched:
+            log.warning(f"{self._scope.title} {record.tmcc_id} not updated: {self._observed.get(record.tmcc_id)}")
+        if plan.added:
+            log.warning(
+                f"{len(plan.added)} {self._scope.title} record(s) added; "
+                f"reindex {self._scope.name.lower()} records to link them"
+            )
+        if mismatched:
+            log.warning(f"{len(mismatched)} {self._scope.title} record(s) not imported; rerun to retry")
+            return False
+        log.info(f"{num} {self._scope.title} record(s) imported and verified")
+        return True
+
+    def _build_command(self) -> bytes | None:
+        return None
+
+    def _command_prefix(self) -> bytes | None:
+        pass
+
+    def _encode_address(self, command_op: int) -> bytes | None:
+        pass
+
+
+class CsvImportCli(CliBase):
+    """
+    Import Lionel Base 3 Database records from CSV files
+    """
+
+    @classmethod
+    def command_parser(cls) -> ArgumentParser:
+        parser = PyTrainArgumentParser(add_help=False)
+        parser.add_argument(
+            "scope",
+            metavar="Record type",
+            nargs="?",
+            type=UniqueChoice(["accessory", "engine", "route", "switch", "train"]),
+            default="engine",
+            help="Record type to import",
+        )
+
+        parser.add_argument(
+            "-input",
+            metavar="File Name",
+            action="store",
+            type=str,
+            help="Input file path (default: <record type>.csv)",
+        )
+
+        parser.add_argument(
+            "-check",
+            action="store_true",
+            help="Report the records that differ only; do not import",
+        )
+
+        parser.add_argument(
+            "-no_header",
+            action="store_true",
+            help="Input file has no column headers",
+        )
+
+        parser.add_argument(
+            "-verbose",
+            action="store_true",
+            help="Verbose",
+        )
+
+        # Return parser
+        return PyTrainArgumentParser(
+            "Import Lionel Base 3 database records in CSV format", parents=[parser, cls.cli_parser()]
+        )
+
+    def __init__(self, arg_parser: ArgumentParser = None, cmd_line: List[str] = None, do_fire: bool = True) -> None:
+        super().__init__(arg_parser, cmd_line, do_fire)
+        self._args = self._args
+        self._check = self._args.check
+        self._no_header = self._args.no_header
+        self._input_file = self._args.input
+        self._verbose = self._args.verbose
+        try:
+            self._scope = CommandScope.by_prefix(self._args.scope, True)
+            if self._input_file is None:
+                self._input_file = Path(f"{self._scope.name.lower()}.csv")
+            else:
+                self._input_file = Path(self._input_file)
+                if not self._input_file.suffix:
+                    self._input_file = self._input_file.with_suffix(".csv")
+            cmd = CsvImportCmd(self)
+            if self.do_fire:
+                cmd.fire(baudrate=self._baudrate, port=self._port, server=self._server)
+            self._command = cmd
+        except ValueError as ve:
+            log.exception(ve)
+
+    @property
+    def scope(self) -> CommandScope:
+        return self._scope
+
+    @property
+    def is_header(self) -> bool:
+        return not self._no_header
+
+    @property
+    def input_file(self) -> Path:
+        return self._input_file
+
+    @property
+    def is_validate(self) -> bool:
+        return self._check
+
+    @property
+    def is_verbose(self) -> bool:
+        return self._verbose
+
+
+def main(args: list[str] | None = None) -> int:
+    if args is None:
+        args = sys.argv[1:]
+    try:
+        CsvImportCli(cmd_line=args)
+        return 0
+    except Exception as e:
+        sys.exit(f"{__file__}: error: {e}\n")
@@ -70,15 +70,24 @@ from ..protocol.constants import (
 )
 from ..protocol.tmcc1.tmcc1_constants import TMCC1SyncCommandEnum
 from ..utils.argument_parser import PyTrainArgumentParser, StripPrefixesHelpFormatter
-from ..utils.dual_logging import set_up_logging
+from ..utils.dual_logging import flush_logging, set_log_level, set_up_logging, shut_down_logging
 from ..utils.host_info import is_steam_deck
-from ..utils.ip_tools import find_base_address, get_ip_address, wait_for_network
+from ..utils.ip_tools import (
+    ServerEndpoint,
+    find_base_address,
+    get_ip_address,
+    load_server_endpoint,
+    save_server_endpoint,
+    scan_for_base,
+    wait_for_network,
+)
 from ..utils.singleton import singleton
 from .acc import AccCli
 from .amc2 import Amc2Cli
 from .asc2 import Asc2Cli
 from .bpc2 import Bpc2Cli
 from .csv_export import CsvCli
+from .csv_import import CsvImportCli
 from .dialogs import DialogsCli
 from .effects import EffectsCli
 from .engine import EngineCli
@@ -96,6 +105,8 @@ DEFAULT_HISTORY_FILE: str = f".{PROGRAM_NAME.lower()}.history"
 # ``PyTrain.requirements_file`` for which one is used.
 REQUIREMENTS: str = "requirements.txt"
 REQUIREMENTS_NO_GPIO: str = "requirements-nogpio.txt"
+# seconds to wait for the last server connected to, which is probed during mDNS discovery
+SERVER_PROBE_TIMEOUT: float = 1.0
 
 ADMIN_COMMAND_TO_ACTION_MAP: Dict[str, CommandDefEnum] = {
     "quit": TMCC1SyncCommandEnum.QUIT,
@@ -243,7 +254,10 @@ class PyTrain:
             else:
                 log.info(f"Sending commands directly to Lionel LCS Ser2 on {self._port} {self._baudrate} baud...")
         else:
-            log.info(f"Sending commands to {PROGRAM_NAME} server at {self._server}:{self._port}...")
+            log.info(
+                f"Sending commands to {PROGRAM_NAME} server at {self._server}:{self._port} "
+                f"({timer() - self._started_at:.2f}s after start)..."
+            )
             self._tmcc_listener = ClientStateListener.build()
             listeners.append(self._tmcc_listener)
             log.info(f"Listening for state updates on port {self._tmcc_listener.port}...")
@@ -787,6 +801,8 @@ class PyTrain:
             self._exit_status = PyTrainExitStatus.REBOOT if reboot is True else PyTrainExitStatus.SHUTDOWN
             raise PyTrainExitException(PyTrainExitStatus.REBOOT if reboot is True else PyTrainExitStatus.SHUTDOWN)
         command = self.power_command(reboot)
+        # the machine going down won't wait for the log writer thread
+        flush_logging()
         result = subprocess.run(command, check=False)
         if result.returncode:
             # Nothing downstream can report this: the caller expects the machine to go
@@ -903,6 +919,7 @@ class PyTrain:
             subprocess.run(["sudo", "rpi-eeprom-update", "-a"], check=False)
             log.info(f"{role} upgrade complete; rebooting...")
             sleep(2)
+            flush_logging()
             subprocess.run(["sudo", "reboot"], check=False)
 
     def relaunch(self, exit_status: PyTrainExitStatus, delay: bool = True) -> None:
@@ -918,6 +935,8 @@ class PyTrain:
         if self.is_service:
             # restart service
             service = f"pytrain_{'server' if self.is_server else 'client'}.service"
+            # systemd stops us with SIGTERM, so atexit never drains the log queue
+            flush_logging()
             subprocess.run(["sudo", "systemctl", "restart", service], check=False)
         else:
             # rerun commandline pgm
@@ -930,6 +949,8 @@ class PyTrain:
                 sys.argv.append("-debug")
             elif self._debug is False and "-debug" in sys.argv:
                 sys.argv.remove("-debug")
+            # execv replaces the process without running atexit; write out queued log records first
+            shut_down_logging()
             os.execv(sys.argv[0], sys.argv)
 
     @property
@@ -1041,13 +1062,26 @@ class PyTrain:
             service was discovered within the waiting period.
         """
         # use poling to see if network is up/loaded at the OS level
+        started_at = timer()
         if not wait_for_network():
             log.warning("Network not ready for mDNS (no IPv4 address yet).")
             return None
 
+        # probe the last server we connected to while browsing; if it answers first, use it
+        cached = load_server_endpoint()
+        cached_alive = Event()
+        if cached:
+
+            def probe() -> None:
+                if scan_for_base([cached.address], cached.port, timeout=SERVER_PROBE_TIMEOUT):
+                    cached_alive.set()
+                    self._server_discovered.set()
+
+            Thread(target=probe, daemon=True, name=f"{PROGRAM_NAME} Server Probe").start()
+
         z = Zeroconf(ip_version=IPVersion.V4Only)
-        an_info = None
-        base3_info = None
+        endpoint = None
+        base3_endpoint = None
         browser = None
         try:
             # listens for services on a background thread
@@ -1057,45 +1091,47 @@ class PyTrain:
             cursor = {0: "|", 1: "\\", 2: "-", 3: "/"}
             if self._headless:
                 log.info(f"Looking for {PROGRAM_NAME} Servers...")
-            while waiting > 0 and an_info is None:
+            while waiting > 0 and endpoint is None:
                 print(f"Looking for {PROGRAM_NAME} servers {cursor[waiting % 4]}", end="\r")
                 waiting -= 1
                 if self._server_discovered.wait(0.5):
                     self._server_discovered.clear()
+                    if cached_alive.is_set():
+                        endpoint = cached
+                        break
 
                     for info in self._pytrain_servers:
-                        is_ser2 = False
-                        is_base3 = False
-                        for prop, value in info.properties.items():
-                            decoded_prop = prop.decode("utf-8")
-                            decoded_value = value.decode("utf-8") if value is not None else None
-                            if decoded_prop == "Ser2":
-                                is_ser2 = decoded_value == "1"
-                            elif decoded_prop == "Base3":
-                                is_base3 = decoded_value == "1"
-                        if is_base3:
-                            base3_info = info
-                        if is_ser2 is True and is_base3 is True:
-                            waiting = 0
-                            an_info = info
+                        found = self.server_endpoint(info)
+                        if found.is_base3:
+                            base3_endpoint = found
+                            # the server we used last time needs no second look
+                            if cached and (found.address, found.port) == (cached.address, cached.port):
+                                endpoint = found
+                                break
+                        if found.is_ser2 is True and found.is_base3 is True:
+                            endpoint = found
                             break
-                if an_info:
-                    # if an_info is non-null, we found a suitable server with both a Base and a Ser2
+                if endpoint:
+                    # if endpoint is non-null, we found a suitable server with both a Base and a Ser2
                     break
-                if base3_info:
+                if base3_endpoint:
                     # if we found a server with a Base 3, and more than
                     # 15 seconds have passed, return it
                     if found_at < 0:
                         found_at = waiting
                     elif ((found_at - waiting) / 2) > 15:
-                        an_info = base3_info
+                        endpoint = base3_endpoint
                         break
         except Exception as e:
             log.warning(e)
         finally:
             if self._headless:
-                if an_info:
-                    log.info(f"Found {PROGRAM_NAME} Server at {an_info.server} on port {an_info.port}")
+                if endpoint:
+                    how = "cached" if endpoint is cached else "mDNS"
+                    log.info(
+                        f"Found {PROGRAM_NAME} Server at {endpoint.address} on port {endpoint.port} "
+                        f"({how}, {timer() - started_at:.2f}s)"
+                    )
                 else:
                     log.info(f"No {PROGRAM_NAME} Server found on local network")
             else:
@@ -1106,12 +1142,36 @@ class PyTrain:
             finally:
                 z.close()
 
-        if an_info:
-            self._server_cache_sync_capable, self._server_cache_sync_port = self.cache_sync_properties(an_info)
-            return an_info.parsed_addresses()[0], an_info.port
+        if endpoint:
+            self._server_cache_sync_capable = endpoint.cache_sync
+            self._server_cache_sync_port = endpoint.cache_sync_port or default_cache_sync_port(endpoint.port)
+            if endpoint != cached:
+                save_server_endpoint(endpoint)
+            return endpoint.address, endpoint.port
         else:
             return None
 
+    @classmethod
+    def server_endpoint(cls, info: ServiceInfo) -> ServerEndpoint:
+        is_ser2 = False
+        is_base3 = False
+        for prop, value in info.properties.items():
+            decoded_prop = prop.decode("utf-8")
+            decoded_value = value.decode("utf-8") if value is not None else None
+            if decoded_prop == "Ser2":
+                is_ser2 = decoded_value == "1"
+            elif decoded_prop == "Base3":
+                is_base3 = decoded_value == "1"
+        cache_sync, cache_sync_port = cls.cache_sync_properties(info)
+        return ServerEndpoint(
+            address=info.parsed_addresses()[0],
+            port=info.port,
+            is_ser2=is_ser2,
+            is_base3=is_base3,
+            cache_sync=cache_sync,
+            cache_sync_port=cache_sync_port,
+        )
+
     def on_service_state_change(
         self,
         zeroconf: Zeroconf,
@@ -1123,7 +1183,7 @@ class PyTrain:
             log.debug(f"Service {name} of type {service_type} state changed: {state_change}")
         if state_change is ServiceStateChange.Added:
             info = zeroconf.get_service_info(service_type, name)
-            if info and log.isEnabledFor(logging.DEBUG):
+            if info:
                 if log.isEnabledFor(logging.DEBUG):
                     log.debug(f"Discovered {PROGRAM_NAME} Server {name} on {info.server} on port {info.port} ({name})")
                 self._pytrain_servers.append(info)
@@ -1429,15 +1489,13 @@ class PyTrain:
     def _disable_debug(self):
         log.info("Debug logging DISABLED...")
         log.setLevel(logging.INFO)
-        for handler in log.root.handlers:
-            handler.setLevel(logging.INFO)
+        set_log_level(logging.INFO)
         self._debug = False
 
     def _enable_debug(self):
         log.info("Debug logging ENABLED...")
         log.setLevel(logging.DEBUG)
-        for handler in log.root.handlers:
-            handler.setLevel(logging.DEBUG)
+        set_log_level(logging.DEBUG)
         self._debug = True
 
     @property
@@ -1692,6 +1750,13 @@ class PyTrain:
         )
         group.add_argument("-train", action="store_const", const=EngineCli, dest="command", help="Issue train commands")
         group.add_argument("-halt", action="store_const", const=HaltCli, dest="command", help="Emergency stop")
+        group.add_argument(
+            "-import",
+            action="store_const",
+            const=CsvImportCli,
+            dest="command",
+            help="Import CSV files of engine/train/switch/accessory records",
+        )
         group.add_argument(
             "-info",
             action="store_const",
@@ -14,8 +14,9 @@ import sys
 import time
 from argparse import ArgumentParser
 from threading import Condition, Event, Thread
-from typing import List
+from typing import Dict, List, Tuple
 
+from ..pdi.ack_window import DEFAULT_ACK_TIMEOUT, DEFAULT_WINDOW, AckWindow
 from ..pdi.base_req import BaseReq
 from ..pdi.constants import PdiCommand
 from ..pdi.pdi_req import PdiReq
@@ -27,6 +28,63 @@ from . import CliBase
 log = logging.getLogger(__name__)
 
 
+class ReindexPlan:
+    """
+    The link updates that turn the Base 3's linked list of records into the
+    target order. Record 100 heads the list (its prev link is 101, its next link
+    the first record) and the last record's next link is 101. Only the records
+    whose current prev/next links differ from their target links are updated,
+    so moving one record rewrites it and its old and new neighbors, not the
+    whole list.
+    """
+
+    def __init__(self, order: List[int], links: Dict[int, Tuple[int, int]], db_order: List[int] = None) -> None:
+        self._order = list(order)
+        self._targets = self.target_links(self._order)
+        self._writes = [(tmcc_id, *target) for tmcc_id, target in self._targets.items() if links.get(tmcc_id) != target]
+        db_order = db_order or []
+        self._moved = [t for i, t in enumerate(self._order) if i >= len(db_order) or db_order[i] != t]
+
+    @staticmethod
+    def target_links(order: List[int]) -> Dict[int, Tuple[int, int]]:
+        """
+        The (prev, next) links of each record, and of record 100, when the records are linked in order
+        """
+        if not order:
+            return {}
+        targets = {}
+        prev_rec = 100
+        for i, tmcc_id in enumerate(order):
+            next_rec = order[i + 1] if i < len(order) - 1 else 101
+            targets[tmcc_id] = (prev_rec, next_rec)
+            prev_rec = tmcc_id
+        # record 100 is written last, once the records it leads to are linked
+        targets[100] = (101, order[0])
+        return targets
+
+    @property
+    def order(self) -> List[int]:
+        return self._order
+
+    @property
+    def writes(self) -> List[Tuple[int, int, int]]:
+        """
+        The (tmcc_id, prev, next) link updates needed, in the order they are to be written
+        """
+        return self._writes
+
+    @property
+    def moved(self) -> List[int]:
+        """
+        The records not at their target position in the current linked list
+        """
+        return self._moved
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._writes
+
+
 class ReindexCmd(CommandBase, Thread):
     """
     Command to reindex Lionel Base 3 database records.
@@ -64,6 +122,9 @@ class ReindexCmd(CommandBase, Thread):
         self._db_order = None
         self._correct_order = []
         self._unlinked_entries = None
+        self._head_links = None
+        self._observed_links = {}
+        self._acks: AckWindow | None = None
         self._cv = Condition()
         self._ev = Event()
         self._first_pass_complete = False
@@ -97,7 +158,10 @@ class ReindexCmd(CommandBase, Thread):
                 log.debug(f"Received: {cmd}")
             with self._cv:
                 key = cmd.as_key
-                if key not in self._waiting_for:
+                if isinstance(cmd, BaseReq) and cmd.reverse_link is not None:
+                    self._observed_links[cmd.tmcc_id] = (cmd.reverse_link, cmd.forward_link)
+                answered = self._acks is not None and self._acks.answered(cmd)
+                if not answered and key not in self._waiting_for:
                     log.warning(f"Unexpected response: {key}: {cmd}")
                 self._waiting_for.pop(key, None)
         else:
@@ -107,6 +171,8 @@ class ReindexCmd(CommandBase, Thread):
             if self.is_verbose:
                 log.info(f"{self._scope.title} {cmd.tmcc_id} prev: {cmd.reverse_link} next: {cmd.forward_link}")
 
+            if cmd.tmcc_id == 100:
+                self._head_links = (cmd.reverse_link, cmd.forward_link)
             if cmd.tmcc_id == 100 and cmd.reverse_link == 101 and 1 <= cmd.forward_link < 99:
                 # record 100 contains a link to the first engine, alphabetically
                 self._frm_found = True
@@ -236,9 +302,11 @@ class ReindexCmd(CommandBase, Thread):
                         f"this may take a while depending on the number of records"
                     )
                 else:
-                    # reindex all records
-                    self._do_reindex()
-                    log.info(f"{self._scope.title} records re-indexed and successfully written to the Base 3 database")
+                    # update the links of the records out of place
+                    if self._do_reindex():
+                        log.info(
+                            f"{self._scope.title} records re-indexed and successfully written to the Base 3 database"
+                        )
         finally:
             self.pytrain.pdi_listener.unsubscribe_any(self)
 
@@ -266,44 +334,49 @@ class ReindexCmd(CommandBase, Thread):
             log.info(f"{len(self._waiting_for)} responses remain...")
         return total_time
 
-    def _do_reindex(self, pause_for: float = 0.06):
-        log.warning(f"Reindexing {len(self._correct_order)} {self._scope.title} records...")
-        prev_rec = 100
-        num_entries = len(self._correct_order)
-        for i, tmcc_id in enumerate(self._correct_order):
-            if i < num_entries - 1:
-                next_rec = self._correct_order[i + 1]
-            else:
-                next_rec = 101
+    def _do_reindex(self, window: int = DEFAULT_WINDOW, ack_timeout: float = DEFAULT_ACK_TIMEOUT) -> bool:
+        links = {e.tmcc_id: (e.prev_link, e.next_link) for e in self._entries}
+        if self._head_links is not None:
+            links[100] = self._head_links
+        plan = ReindexPlan(self._correct_order, links, self._db_order)
+        log.warning(
+            f"Reindexing {len(plan.order)} {self._scope.title} records: "
+            f"{len(plan.moved)} out of place, {len(plan.writes)} link update(s) needed..."
+        )
+        if plan.is_empty:
+            log.warning("... Reindexing complete.")
+            return True
+
+        self._acks = AckWindow(self.pytrain.pdi_dispatcher.enqueue_command, window, ack_timeout)
+        reqs = []
+        for tmcc_id, prev_rec, next_rec in plan.writes:
             if self.is_verbose:
                 log.info(f"Reindexing {self._scope.title} {tmcc_id:02} prev: {prev_rec} next: {next_rec}")
-            req = self._build_links_update_req(tmcc_id, prev_rec, next_rec)
-            if req:
-                self._dispatch_req(req, wait_for=False)
-                time.sleep(pause_for)
-            prev_rec = tmcc_id
-
-        # write final record
-        tmcc_id = 100
-        prev_rec = 101
-        next_rec = self._correct_order[0]
-        if self.is_verbose:
-            log.info(f"Setting {self._scope.title} {tmcc_id:02} to prev: {prev_rec} next: {next_rec}")
-        req = self._build_links_update_req(tmcc_id, prev_rec, next_rec)
-        self._dispatch_req(req, wait_for=False)
-
-        # requery records
-        for tmcc_id in self._correct_order:
-            time.sleep(pause_for)
-            self._dispatch_req(BaseReq(tmcc_id, PdiCommand.BASE_MEMORY, scope=self._scope))
-
-        # wait for requery responses to post
-        timeout = 15
-        total_time = self._wait_for_responses(timeout=timeout)
-        if total_time >= timeout:
-            log.warning("Timed out waiting for reindex responses from Lionel Base 3")
-        else:
-            log.warning("... Reindexing complete.")
+            reqs.append(self._build_links_update_req(tmcc_id, prev_rec, next_rec))
+        lost = self._acks.send_all([r for r in reqs if r])
+        if lost:
+            log.warning(f"Timed out waiting for {len(lost)} link update(s) to be acknowledged by Lionel Base 3")
+
+        # requery the records written, and only those, to verify their links
+        self._observed_links.clear()
+        queries = [BaseReq(tmcc_id, PdiCommand.BASE_MEMORY, scope=self._scope) for tmcc_id, _, _ in plan.writes]
+        lost = self._acks.send_all(queries)
+        if lost:
+            log.warning(f"Timed out waiting for {len(lost)} reindex response(s) from Lionel Base 3")
+        mismatched = 0
+        for tmcc_id, prev_rec, next_rec in plan.writes:
+            observed = self._observed_links.get(tmcc_id, None)
+            if observed != (prev_rec, next_rec):
+                mismatched += 1
+                log.warning(
+                    f"{self._scope.title} {tmcc_id:02} links not updated; expected prev: {prev_rec} "
+                    f"next: {next_rec}, found: {observed}"
+                )
+        if mismatched:
+            log.warning(f"{mismatched} {self._scope.title} record(s) not reindexed; rerun to retry")
+            return False
+        log.warning("... Reindexing complete.")
+        return True
 
     def _dispatch_req(self, req: BaseReq, wait_for: bool = True) -> None:
         if req:
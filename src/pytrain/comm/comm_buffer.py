@@ -131,16 +131,21 @@ class CommBuffer(abc.ABC):
         scope: CommandScope = None,
         requests: set[CommandDefEnum] = None,
     ) -> None:
+        from ..db.engine_state import EngineState
+        from ..protocol.sequence.ramp_controller import RampController
+        from ..protocol.sequence.sequence_constants import SequenceCommandEnum
+
+        if isinstance(motive, EngineState):
+            scope = motive.scope
+            tmcc_id = motive.tmcc_id
+        elif isinstance(motive, int):
+            tmcc_id = motive
+        else:
+            raise ValueError(f"Invalid motive: {motive}")
+        # speed ramps aren't scheduled requests; they're stopped at the source
+        if not requests or SequenceCommandEnum.RAMPED_SPEED_SEQ in requests:
+            RampController.cancel(tmcc_id, scope)
         if cls.is_built():
-            from ..db.engine_state import EngineState
-
-            if isinstance(motive, EngineState):
-                scope = motive.scope
-                tmcc_id = motive.tmcc_id
-            elif isinstance(motive, int):
-                tmcc_id = motive
-            else:
-                raise ValueError(f"Invalid motive: {motive}")
             # Cancel delayed requests for the given tmcc_id/scope/request set
             cls._instance._cancel_delayed_requests(tmcc_id, scope, requests)
 
@@ -168,17 +173,45 @@ class CommBuffer(abc.ABC):
 
     def _cancel_delayed_requests_on_enqueue(self, request: CommandReq, delay_handler: DelayHandler) -> None:
         from ..db.engine_state import CANCEL_PENDINGS_ON_ENQUEUE
+        from ..protocol.sequence.ramp_controller import RampController
         from ..protocol.sequence.ramped_speed_req import CANCELABLE_REQUESTS
 
         """
         Cancel any pending requests if the command we're about to send/enqueue
         would cause pending requests to be canceled when it was received.
         """
+        if request and request.command in CANCEL_PENDINGS_ON_ENQUEUE:
+            if request.scope in {CommandScope.ENGINE, CommandScope.TRAIN}:
+                RampController.cancel(request.tmcc_id, request.scope)
         if delay_handler.has_scheduled and request and request.scope in {CommandScope.ENGINE, CommandScope.TRAIN}:
             if request.command in CANCEL_PENDINGS_ON_ENQUEUE:
-                log.debug(f"Canceling pending requests for {request.command} due to enqueue")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Canceling pending requests for {request.command} due to enqueue")
                 self._cancel_delayed_requests(request.tmcc_id, request.scope, CANCELABLE_REQUESTS)
 
+    def schedule_job(
+        self,
+        command: bytes | CommandReq | PdiReq,
+        interval: float,
+        count: int,
+        delay: float = 0.0,
+        replace: bool = True,
+    ) -> PeriodicJob:
+        """
+        Send command count times, interval seconds apart, the first after delay
+        seconds. When replace is True, the job replaces any periodic job still
+        sending the same command to the same scope and address.
+        """
+        # noinspection PyUnresolvedReferences
+        return self._scheduler.schedule_job(command, interval, count, delay, replace)
+
+    def cancel_job(self, scope: CommandScope, tmcc_id: int, command: CommandDefEnum) -> bool:
+        """
+        Stop the periodic job sending command to scope and tmcc_id; returns True if one was running
+        """
+        # noinspection PyUnresolvedReferences
+        return self._scheduler.cancel_job((scope, tmcc_id, command))
+
     @abc.abstractmethod
     def _cancel_delayed_requests(
         self,
@@ -730,6 +763,7 @@ class DelayHandler(Thread):
         self._ev = Event()
         self._event_cache: dict[tuple[int, CommandScope], Set[TrackedEvent]] = {}
         self._scheduler = sched.scheduler(time.monotonic, self._ev.wait)
+        self._jobs: dict[tuple[CommandScope, int, Any], PeriodicJob] = {}
         self._have_scheduled_requests = False
         self._purge_frequency = purge_frequency
         self.start()
@@ -807,7 +841,50 @@ class DelayHandler(Thread):
             # request in the sched queue
             self._cv.notify()
 
-    def _cache_event(self, command: CommandReq | PdiReq, event: TrackedEvent):
+    def schedule_job(
+        self,
+        command: bytes | CommandReq | PdiReq,
+        interval: float,
+        count: int,
+        delay: float = 0.0,
+        replace: bool = True,
+    ) -> PeriodicJob:
+        with self._cv:
+            request = CommandReq.from_bytes(command) if isinstance(command, bytes) else command
+            key = PeriodicJob.key_for(request)
+            if replace:
+                existing = self._jobs.pop(key, None)
+                if existing:
+                    existing.cancel()
+            job = PeriodicJob(
+                self._scheduler,
+                lock=self._cv,
+                action=self._buffer.enqueue_command,
+                command=command,
+                key=key,
+                interval=interval,
+                count=count,
+                delay=delay,
+            )
+            if replace:
+                self._jobs[key] = job
+            self._cache_event(request, job)
+            if not self._have_scheduled_requests:
+                self._have_scheduled_requests = True
+                self._scheduler.enter(self._purge_frequency, 2, self.purge_inactive_events)
+            self._ev.set()
+            self._cv.notify()
+            return job
+
+    def cancel_job(self, key: tuple[CommandScope, int, Any]) -> bool:
+        with self._cv:
+            job = self._jobs.pop(key, None)
+            if job is None or not job.is_pending():
+                return False
+            job.cancel()
+            return True
+
+    def _cache_event(self, command: CommandReq | PdiReq, event: TrackedEvent | PeriodicJob):
         # method is called under the cv lock in schedule()
         tmcc_id = command.tmcc_id
         scope = command.scope
@@ -851,7 +928,8 @@ class DelayHandler(Thread):
                     event.cancel()
                 deleted += len(to_delete)
                 ce.difference_update(to_delete)
-                log.debug(f"Cancelled {deleted} delayed requests for TMCC {tmcc_id} scope {scope}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Cancelled {deleted} delayed requests for TMCC {tmcc_id} scope {scope}")
 
     def purge_inactive_events(self, reschedule: bool = True):
         with self._cv:
@@ -863,7 +941,10 @@ class DelayHandler(Thread):
                         to_delete.add(event)
                 deleted += len(to_delete)
                 ce.difference_update(to_delete)
-        log.debug(f"Purged {deleted} inactive events...")
+            for key in [k for k, job in self._jobs.items() if not job.is_pending()]:
+                del self._jobs[key]
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Purged {deleted} inactive events...")
         # reschedule, if delay is > 0
         if reschedule:
             self._scheduler.enter(self._purge_frequency, 2, self.purge_inactive_events)
@@ -887,7 +968,8 @@ class TrackedEvent:
             do_action = False
             with lock:
                 if self.was_canceled():
-                    log.debug(f"Event {self} was canceled before it ran.")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(f"Event {self} was canceled before it ran.")
                 elif self.has_run():
                     log.warning(f"Event {self} already ran, ignoring.")
                 else:
@@ -934,6 +1016,97 @@ class TrackedEvent:
         return self._event
 
 
+class PeriodicJob:
+    """
+    A command sent count times, interval seconds apart. The job holds one
+    scheduler entry at a time and re-arms it each time the command is sent,
+    so a long hold costs one entry rather than one per packet, and canceling
+    the job stops it at once. Send times are fixed when the job is created,
+    so they don't drift if the scheduler runs late.
+    """
+
+    def __init__(
+        self,
+        scheduler: sched.scheduler,
+        lock,
+        action,
+        command: bytes | CommandReq | PdiReq,
+        key: tuple,
+        interval: float,
+        count: int,
+        delay: float = 0.0,
+    ) -> None:
+        self.scheduler = scheduler
+        self.key = key
+        self.command = command
+        self.request = None
+        self.interval = max(0.0, interval)
+        self._lock = lock if lock else threading.Lock()
+        self._action = action
+        self._remaining = max(0, count)
+        self._sent = 0
+        self._canceled = False
+        self._next = time.monotonic() + delay
+        self._event = None
+        if self._remaining:
+            self._event = scheduler.enterabs(self._next, 1, self._fire)
+
+    def __repr__(self):
+        status = "pending" if self.is_pending() else "canceled" if self._canceled else "done"
+        return (
+            f"<PeriodicJob status={status!r} key={self.key!r} interval={self.interval:.3f} "
+            f"sent={self._sent} remaining={self._remaining} at {hex(id(self))}>"
+        )
+
+    @staticmethod
+    def key_for(request: CommandReq | PdiReq) -> tuple[CommandScope, int, Any]:
+        return request.scope, request.tmcc_id, getattr(request, "command", None)
+
+    @property
+    def sent(self) -> int:
+        return self._sent
+
+    @property
+    def remaining(self) -> int:
+        return self._remaining
+
+    @property
+    def ends_at(self) -> float:
+        """
+        The monotonic time of the job's last send
+        """
+        return self._next + max(0, self._remaining - 1) * self.interval
+
+    def is_pending(self) -> bool:
+        return self._remaining > 0 and not self._canceled
+
+    def has_run(self) -> bool:
+        return self._remaining == 0
+
+    def was_canceled(self) -> bool:
+        return self._canceled
+
+    def cancel(self) -> None:
+        with self._lock:
+            if self.is_pending():
+                self._canceled = True
+                try:
+                    self.scheduler.cancel(self._event)
+                except ValueError:
+                    pass  # running now; _fire sees the cancel
+
+    def _fire(self) -> None:
+        with self._lock:
+            if not self.is_pending():
+                return
+            self._remaining -= 1
+            self._sent += 1
+            if self._remaining:
+                self._next += self.interval
+                self._event = self.scheduler.enterabs(self._next, 1, self._fire)
+        self._action(self.command, was_delayed=True)
+
+
 class ClientHeartBeat(Thread):
     def __init__(self, tmcc_buffer: CommBufferProxy, heartbeat: bytes = None) -> None:
         from ..protocol.command_req import CommandReq
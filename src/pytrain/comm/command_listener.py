@@ -21,8 +21,7 @@ from ..db.component_state import ComponentState
 from ..db.engine_state import EngineState, TrainState
 from ..pdi.amc2_req import Amc2Req
 from ..pdi.base_req import BaseReq
-from ..pdi.constants import D4Action, PdiCommand
-from ..pdi.d4_req import D4Req
+from ..pdi.constants import PdiCommand
 from ..protocol.command_def import CommandDef, CommandDefEnum
 from ..protocol.command_req import TMCC_FIRST_BYTE_TO_INTERPRETER, CommandReq
 from ..protocol.constants import (
@@ -505,7 +504,8 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
                         # force cancel of all delayed commands
                         CommBuffer.cancel_delayed_requests()
                         if self._filter_updates is True and cmd.is_filtered is True:
-                            log.debug(f"Filtering client update: {cmd}")
+                            if log.isEnabledFor(logging.DEBUG):
+                                log.debug(f"Filtering client update: {cmd}")
                         else:
                             self.publish_all(cmd)
                     # if command is a legacy-style halt, send to engines and trains
@@ -550,7 +550,8 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
                         in ComponentStateStore.
                         """
                         if self._filter_updates is True and cmd.is_filtered is True:
-                            log.debug(f"Filtering client update: {cmd}")
+                            if log.isEnabledFor(logging.DEBUG):
+                                log.debug(f"Filtering client update: {cmd}")
                         else:
                             self.update_client_state(cmd)
                             self.update_base_state(cmd, update_clients=True)
@@ -630,7 +631,8 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
         # noinspection PyTypeChecker
         for client, port in clients:
             if client in self._server_ips and port == self._server_port:
-                log.debug(f"Skipping update of {client}:{port} {command}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Skipping update of {client}:{port} {command}")
                 continue
             try:
                 with self._client_lock:
@@ -680,7 +682,8 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
                             # don't send records that do not have a component state, unless the state is from
                             # an LCS device. Otherwise, this means the Base 2/3 never provided initial state
                             if state.scope not in {CommandScope.BASE, CommandScope.IRDA} and state.comp_data is None:
-                                log.debug(f"Skipping state sync for {scope}:{address}; no initial state available")
+                                if log.isEnabledFor(logging.DEBUG):
+                                    log.debug(f"Skipping state sync for {scope}:{address}; no initial state available")
                                 continue
                             try:
                                 state_bytes = state.as_bytes()
@@ -722,7 +725,8 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
                 if state.comp_data:
                     packet = state.as_bytes()
                 else:
-                    log.debug(f"Skipping state send for {state.scope}:{state.address}; no initial state available")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(f"Skipping state send for {state.scope}:{state.address}; no initial state available")
             if isinstance(packet, list):
                 byte_str = bytes()
                 for pck in packet:
@@ -880,10 +884,13 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
         """
         pkgs = CompData.request_to_query(cmd)
         if pkgs:
-            cmds = []
-            for pkg in pkgs:
+            from ..pdi.base3_db_refresh_manager import Base3DbRefreshManager
+
+            state = ComponentStateStore.get_state(cmd.scope, cmd.address, create=False)
+            if state is None:
+                # nothing to fold into; query the fields directly, as a 2-digit record needs no state to address it
                 if 1 <= cmd.address <= 99:
-                    cmds.append(
+                    for pkg in pkgs:
                         BaseReq(
                             cmd.address,
                             pdi_command=PdiCommand.BASE_MEMORY,
@@ -891,24 +898,14 @@ class CommandDispatcher(Thread, Generic[Topic, Message]):
                             scope=cmd.scope,
                             start=pkg.offset,
                             data_length=pkg.length,
-                        )
-                    )
-                else:
-                    state = ComponentStateStore.get_state(cmd.scope, cmd.address, create=False)
-                    state = cast(EngineState, state)
-                    assert state.record_no != 0xFFFF
-                    pdi_cmd = PdiCommand.D4_ENGINE if cmd.scope == CommandScope.ENGINE else PdiCommand.D4_TRAIN
-                    cmds.append(
-                        D4Req(
-                            state.record_no,
-                            pdi_cmd,
-                            D4Action.QUERY,
-                            start=pkg.offset,
-                            data_length=pkg.length,
-                        )
-                    )
-            for query in cmds:
-                query.send()
+                        ).send()
+                return
+            if not 1 <= cmd.address <= 99:
+                state = cast(EngineState, state)
+                assert state.record_no != 0xFFFF
+            # queries of the same record fold into one read, and into any refresh of it pending or in flight
+            for pkg in pkgs:
+                Base3DbRefreshManager.request_query(state, pkg.offset, pkg.length)
 
     # noinspection PyUnnecessaryCast
     def _on_clear_consist(self, tmcc_cmd: CommandReq) -> None:
@@ -99,7 +99,8 @@ class ClientStateListener(threading.Thread):
     def __call__(self, cmd: PdiReq) -> None:
         if isinstance(cmd, PdiReq):
             self._pdi_state_store.register_pdi_device(cmd)
-            log.debug(f"ClientStateListener: {cmd}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"ClientStateListener: {cmd}")
 
     @property
     def port(self) -> int:
@@ -10,7 +10,9 @@
 from __future__ import annotations
 
 import logging
+import struct
 from abc import ABC, ABCMeta, abstractmethod
+from operator import attrgetter
 from typing import Any, Callable, Generic, TYPE_CHECKING, TypeVar, cast
 
 from ..pdi.constants import D4Action, PdiCommand
@@ -464,6 +466,55 @@ SCOPE_TO_FIELDS_MAP = {
     CommandScope.SWITCH: FIELD_TO_ADDR_SWITCH_MAP,
     CommandScope.ROUTE: FIELD_TO_ADDR_ROUTE_MAP,
 }
+
+
+class CompLayout:
+    """
+    A Base 3 record layout (one of the CompDataHandler maps above) compiled,
+    once, into a struct format. Single byte fields unpack as ints, wider ones
+    as byte strings that are passed to their handler's from_bytes, and the
+    gaps between fields are skipped, so a complete record is decoded with a
+    single unpack. The handlers are also kept in address order, with and
+    without the fields only 4-digit records have, to serialize records.
+    """
+
+    def __init__(self, comp_map: dict[int, CompDataHandler]) -> None:
+        self.comp_map = comp_map
+        fmt = "<"
+        fields: list[tuple[str, Callable | None]] = []
+        offset = 0
+        for addr in sorted(comp_map.keys()):
+            handler = comp_map[addr]
+            if addr < offset:
+                raise ValueError(f"Field {handler.field} at 0x{addr:02x} overlaps the field before it")
+            if addr > offset:
+                fmt += f"{addr - offset}x"
+            if handler.length == 1 and handler.from_bytes is default_from_func:
+                fmt += "B"
+                fields.append((handler.field, None))
+            else:
+                fmt += f"{handler.length}s"
+                fields.append((handler.field, handler.from_bytes))
+            offset = addr + handler.length
+        self._struct = struct.Struct(fmt)
+        self.size: int = self._struct.size
+        self.fields: tuple[tuple[str, Callable | None], ...] = tuple(fields)
+        self.schema: tuple[tuple[int, CompDataHandler], ...] = tuple(sorted(comp_map.items()))
+        self.d2_schema: tuple[tuple[int, CompDataHandler], ...] = tuple(
+            (addr, handler) for addr, handler in self.schema if not handler.is_d4_only
+        )
+
+    def unpack(self, data: bytes) -> tuple:
+        return self._struct.unpack_from(data)
+
+    @property
+    def public_fields(self) -> set[str]:
+        return {handler.field[1:] for handler in self.comp_map.values()}
+
+
+SCOPE_TO_LAYOUT_MAP = {scope: CompLayout(comp_map) for scope, comp_map in SCOPE_TO_COMP_MAP.items()}
+D4_TRAIN_LAYOUT = CompLayout(BASE_MEMORY_D4_TRAIN_READ_MAP)
+
 #
 # Map of Base 3 Command Requests to the corresponding Base 3
 # memory locations that must be updated in turn.
@@ -556,6 +607,17 @@ CONVERSIONS: dict[str, tuple[Callable, Callable]] = {
 }
 
 
+def _field_property(field: str) -> property:
+    def set_field(self: CompData, value: Any) -> None:
+        self.__dict__[field] = value
+
+    return property(attrgetter(field), set_field)
+
+
+def _tmcc_property(name: str) -> property:
+    return property(lambda self: self._get_tmcc(name), lambda self, value: self._set_tmcc(name, value))
+
+
 class CompData(ABC, Generic[R]):
     """
     CompData and it's subclasses are used to hold component state
@@ -567,15 +629,55 @@ class CompData(ABC, Generic[R]):
     PyTrain clients from the server
 
     Each CompData subclass defines a set of fields that will contain the
-    state information. By overriding __getattr__ and __setattr__, we can
-    access the state as simple python properties as well as set them. Only
-    those fields defined in the subclass are accessible; attempting to access
-    others results in an AttributeError exception.
+    state information. When a subclass is declared with its scope, a property
+    is generated for each field of the scope's record layout (and a "_tmcc"
+    property for each field with a TMCC conversion), so the state is read and
+    set as simple python properties. __getattr__ and __setattr__ handle any
+    other names; only those fields defined in the subclass are accessible,
+    attempting to access others results in an AttributeError exception.
     """
 
     __metaclass__ = ABCMeta
 
     _state_store = None
+    _fields: dict[str, str] = {}
+    _accessors: frozenset[str] = frozenset()
+    _blank_state: dict[str, None] = {}
+
+    _tmcc_id: int | None
+    _scope: CommandScope
+    _road_name_len: int | None
+    _road_name: str | None
+    _road_number_len: int | None
+    _road_number: str | None
+    _next_link: int | None
+    _prev_link: int | None
+    _record_type: int | None
+
+    def __init_subclass__(cls, scope: CommandScope | None = None, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        if scope is None:
+            return
+        fields = {"scope", "tmcc_id"} | SCOPE_TO_LAYOUT_MAP[scope].public_fields
+        if scope == CommandScope.TRAIN:
+            fields |= D4_TRAIN_LAYOUT.public_fields
+        field_map = dict(cls._fields)
+        accessors = set(cls._accessors)
+        for name in sorted(fields):
+            if name not in accessors and not hasattr(cls, name):
+                setattr(cls, name, _field_property("_" + name))
+                field_map[name] = "_" + name
+                accessors.add(name)
+        for name in CONVERSIONS:
+            if ("rpm_labor" if name in {"rpm", "labor"} else name) in fields:
+                tmcc_name = f"{name}_tmcc"
+                if tmcc_name not in accessors and not hasattr(cls, tmcc_name):
+                    setattr(cls, tmcc_name, _tmcc_property(name))
+                    accessors.add(tmcc_name)
+        cls._fields = field_map
+        cls._accessors = frozenset(accessors)
+        # every field of the record layout starts out unset
+        cls._blank_state = dict.fromkeys("_" + name for name in sorted(fields - {"scope", "tmcc_id"}))
 
     @classmethod
     def state_store(cls) -> "ComponentStateStore":
@@ -876,15 +978,10 @@ class CompData(ABC, Generic[R]):
     @abstractmethod
     def __init__(self, data: bytes | None, scope: CommandScope, tmcc_id: int = None) -> None:
         super().__init__()
-        self._tmcc_id: int | None = tmcc_id
-        self._scope = scope
-        self._road_name_len: int | None = None
-        self._road_name: str | None = None
-        self._road_number_len: int | None = None
-        self._road_number: str | None = None
-        self._next_link: int | None = None
-        self._prev_link: int | None = None
-        self._record_type: int | None = None
+        state = self.__dict__
+        state.update(self._blank_state)
+        state["_tmcc_id"] = tmcc_id
+        state["_scope"] = scope
 
         # load the data from the byte string
         if data:
@@ -895,10 +992,10 @@ class CompData(ABC, Generic[R]):
                 )
 
             if scope == CommandScope.TRAIN and tmcc_id is None:
-                comp_map = BASE_MEMORY_D4_TRAIN_READ_MAP
+                layout = D4_TRAIN_LAYOUT
             else:
-                comp_map = SCOPE_TO_COMP_MAP.get(self.scope)
-            self._parse_bytes(data, comp_map)
+                layout = SCOPE_TO_LAYOUT_MAP.get(self.scope)
+            self._parse_bytes(data, layout)
         else:
             self._set_defaults()
 
@@ -950,56 +1047,65 @@ class CompData(ABC, Generic[R]):
         if "_" + name in self.__dict__:
             return self.__dict__["_" + name]
         elif name.endswith("_tmcc") and name.replace("_tmcc", "") in CONVERSIONS:
-            name = name.replace("_tmcc", "")
-            tpl = CONVERSIONS[name]
-            # special case labor/rpm
-            if name in {"rpm", "labor"}:
-                name = "rpm_labor"
-            value = self.__dict__["_" + name]
-            if name == "smoke" and isinstance(self, EngineData):
-                if self.is_legacy:
-                    map_dict = BASE_TO_TMCC2_SMOKE_MAP
-                    default = TMCC2EffectsControl.SMOKE_OFF
-                else:
-                    map_dict = BASE_TO_TMCC1_SMOKE_MAP
-                    default = TMCC1EngineCommandEnum.SMOKE_OFF
-                return tpl[0](map_dict, value, default) if value is not None else value
-            elif name in {"target_speed"}:
-                return tpl[0](value, self.is_legacy) if value is not None else value
-            else:
-                return tpl[0](value) if value is not None else value
+            return self._get_tmcc(name.replace("_tmcc", ""))
         else:
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
     def __setattr__(self, name: str, value: Any) -> None:
-        if name.startswith("_"):
+        field = self._fields.get(name, None)
+        if field is not None:
+            self.__dict__[field] = value
+            return
+        if name.startswith("_") or name in self._accessors:
             super().__setattr__(name, value)
             return
         if "_" + name in self.__dict__:
             self.__dict__["_" + name] = value
         elif name.endswith("_tmcc") and name.replace("_tmcc", "") in CONVERSIONS:
-            name = name.replace("_tmcc", "")
-            tpl = CONVERSIONS[name]
-            # Special case rpm and labor, as they are encoded into a single value.
-            # We determine the original values of each, then use our conversion
-            # mechanism to use the conversion function to set the combined value.
-            if name in {"rpm", "labor"}:
-                rpm = self.rpm_tmcc if name == "labor" else value
-                labor = self.labor_tmcc if name == "rpm" else value
-                self.rpm_labor_tmcc = (rpm, labor)
-            elif name == "smoke" and isinstance(self, EngineData):
-                map_dict = TMCC2_TO_BASE_SMOKE_MAP if self.is_legacy is True else TMCC1_TO_BASE_SMOKE_MAP
-                self.__dict__["_" + name] = tpl[1](map_dict, value) if value is not None else value
-            else:
-                # For RPM or Labor, we have to pass the 2 raw values to the conversion function
-                # as a tuple, thus requiring the isinstance check below.
-                if isinstance(value, tuple):
-                    self.__dict__["_" + name] = tpl[1](*value) if value is not None else value
-                else:
-                    self.__dict__["_" + name] = tpl[1](value) if value is not None else value
+            self._set_tmcc(name.replace("_tmcc", ""), value)
         else:
             raise AttributeError(f"'{type(self).__name__}' has no attribute '{name}'")
 
+    def _get_tmcc(self, name: str) -> Any:
+        tpl = CONVERSIONS[name]
+        # special case labor/rpm
+        if name in {"rpm", "labor"}:
+            value = self.__dict__["_rpm_labor"]
+        else:
+            value = self.__dict__["_" + name]
+        if name == "smoke" and isinstance(self, EngineData):
+            if self.is_legacy:
+                map_dict = BASE_TO_TMCC2_SMOKE_MAP
+                default = TMCC2EffectsControl.SMOKE_OFF
+            else:
+                map_dict = BASE_TO_TMCC1_SMOKE_MAP
+                default = TMCC1EngineCommandEnum.SMOKE_OFF
+            return tpl[0](map_dict, value, default) if value is not None else value
+        elif name in {"target_speed"}:
+            return tpl[0](value, self.is_legacy) if value is not None else value
+        else:
+            return tpl[0](value) if value is not None else value
+
+    def _set_tmcc(self, name: str, value: Any) -> None:
+        tpl = CONVERSIONS[name]
+        # Special case rpm and labor, as they are encoded into a single value.
+        # We determine the original values of each, then use our conversion
+        # mechanism to use the conversion function to set the combined value.
+        if name in {"rpm", "labor"}:
+            rpm = self.rpm_tmcc if name == "labor" else value
+            labor = self.labor_tmcc if name == "rpm" else value
+            self.rpm_labor_tmcc = (rpm, labor)
+        elif name == "smoke" and isinstance(self, EngineData):
+            map_dict = TMCC2_TO_BASE_SMOKE_MAP if self.is_legacy is True else TMCC1_TO_BASE_SMOKE_MAP
+            self.__dict__["_" + name] = tpl[1](map_dict, value) if value is not None else value
+        else:
+            # For RPM or Labor, we have to pass the 2 raw values to the conversion function
+            # as a tuple, thus requiring the isinstance check below.
+            if isinstance(value, tuple):
+                self.__dict__["_" + name] = tpl[1](*value) if value is not None else value
+            else:
+                self.__dict__["_" + name] = tpl[1](value) if value is not None else value
+
     def _signal_initializing(self) -> None:
         self.__dict__["__initializing__"] = True
 
@@ -1063,18 +1169,14 @@ class CompData(ABC, Generic[R]):
 
     def as_bytes(self) -> bytes:
         if self.scope == CommandScope.TRAIN and self.tmcc_id > 99:
-            comp_map = BASE_MEMORY_D4_TRAIN_READ_MAP
+            layout = D4_TRAIN_LAYOUT
         else:
-            comp_map = SCOPE_TO_COMP_MAP.get(self.scope)
-        schema = {key: comp_map[key] for key in sorted(comp_map.keys())}
-        if self.tmcc_id <= 99:
-            # delete any entries that are 4-digit specific
-            for k in list(schema.keys()):
-                if schema[k].is_d4_only:
-                    del schema[k]
+            layout = SCOPE_TO_LAYOUT_MAP.get(self.scope)
+        # 2-digit records don't have the 4-digit specific entries
+        schema = layout.schema if self.tmcc_id > 99 else layout.d2_schema
         byte_str = bytes()
         last_idx = 0
-        for idx, tpl in schema.items():
+        for idx, tpl in schema:
             if idx > last_idx:
                 byte_str += b"\xff" * (idx - last_idx)
             data_len = tpl.length
@@ -1094,11 +1196,22 @@ class CompData(ABC, Generic[R]):
 
         return byte_str
 
-    def _parse_bytes(self, data: bytes, pmap: dict) -> None:
+    def _parse_bytes(self, data: bytes, layout: CompLayout) -> None:
+        state = self.__dict__
+        if len(data) >= layout.size:
+            # a complete record; decode it in one pass
+            for (field, func), value in zip(layout.fields, layout.unpack(data)):
+                if state.get(field, 0) is None:
+                    if func is not None:
+                        try:
+                            value = func(value)
+                        except Exception as e:
+                            log.exception(f"Exception decoding {self.scope.title} field '{field}' {e}", exc_info=e)
+                            continue
+                    state[field] = value
+            return
         data_len = len(data)
-        for k, v in pmap.items():
-            if not isinstance(v, CompDataHandler):
-                continue
+        for k, v in layout.comp_map.items():
             item_len = v.length
             if data_len >= ((k + item_len) - 1) and hasattr(self, v.field) and getattr(self, v.field) is None:
                 func = v.from_bytes
@@ -1110,7 +1223,46 @@ class CompData(ABC, Generic[R]):
                     log.exception(f"Exception decoding {self.scope.title} field '{v.field}' {e}", exc_info=e)
 
 
-class EngineData(CompData):
+class EngineData(CompData, scope=CommandScope.ENGINE):
+    _bt_id: int | None
+    _control_id: int | None
+    _control_type: int | None
+    _engine_class: int | None
+    _engine_type: int | None
+    _fuel_level: int | None
+    _labor_level: int | None
+    _lc_flags: int | None
+    _lighting: int | None
+    _max_speed: int | None
+    _min_os: int | None
+    _momentum: int | None
+    _momentum_setting: int | None
+    _rpm_labor: int | None
+    _smoke: int | None
+    _sound_type: int | None
+    _speed: int | None
+    _speed_limit: int | None
+    _target_speed: int | None
+    _timestamp: int | None
+    _train_brake: int | None
+    _train_unit: int | None
+    _train_tmcc_id: int | None
+    _tsdb_left: int | None
+    _tsdb_right: int | None
+    _water_level: int | None
+
+    _unk_11: int | None
+    _unk_12: int | None
+    _unk_13: int | None
+    _unk_5c: int | None
+    _unk_5d: int | None
+    _unk_5e: int | None
+    _unk_5f: int | None
+    _unk_68: int | None
+    _unk_6c: int | None
+    _unk_6: int | None
+    _unk_b: int | None
+
     def __init__(
         self,
         data: bytes | None,
@@ -1118,44 +1270,6 @@ class EngineData(CompData):
         scope: CommandScope = CommandScope.ENGINE,
     ) -> None:
         self._signal_initializing()
-        self._bt_id: int | None = None
-        self._control_id: int | None = None
-        self._control_type: int | None = None
-        self._engine_class: int | None = None
-        self._engine_type: int | None = None
-        self._fuel_level: int | None = None
-        self._labor_level: int | None = None
-        self._lc_flags: int | None = None
-        self._lighting: int | None = None
-        self._max_speed: int | None = None
-        self._min_os: int | None = None
-        self._momentum: int | None = None
-        self._momentum_setting: int | None = None
-        self._rpm_labor: int | None = None
-        self._smoke: int | None = None
-        self._sound_type: int | None = None
-        self._speed: int | None = None
-        self._speed_limit: int | None = None
-        self._target_speed: int | None = None
-        self._timestamp: int | None = None
-        self._train_brake: int | None = None
-        self._train_unit: int | None = None
-        self._train_tmcc_id: int | None = None
-        self._tsdb_left: int | None = None
-        self._tsdb_right: int | None = None
-        self._water_level: int | None = None
-
-        self._unk_11: int | None = None
-        self._unk_12: int | None = None
-        self._unk_13: int | None = None
-        self._unk_5c: int | None = None
-        self._unk_5d: int | None = None
-        self._unk_5e: int | None = None
-        self._unk_5f: int | None = None
-        self._unk_68: int | None = None
-        self._unk_6c: int | None = None
-        self._unk_6: int | None = None
-        self._unk_b: int | None = None
         super().__init__(data, scope, tmcc_id=tmcc_id)
 
     @property
@@ -1163,7 +1277,7 @@ class EngineData(CompData):
         return self._control_type == LEGACY_CONTROL_TYPE
 
 
-class TrainData(EngineData):
+class TrainData(EngineData, scope=CommandScope.TRAIN):
     """
     Represents train data within a Lionel layout.
 
@@ -1180,14 +1294,15 @@ class TrainData(EngineData):
             components are defined.
     """
 
+    _consist_flags: int | None
+    _consist_comps: list[ConsistComponent] | None
+
     def __init__(self, data: bytes | None, tmcc_id: int = None) -> None:
         self._signal_initializing()
-        self._consist_flags: int | None = None
-        self._consist_comps: list[ConsistComponent] | None = None
         super().__init__(data, tmcc_id=tmcc_id, scope=CommandScope.TRAIN)
 
 
-class SwitchData(CompData):
+class SwitchData(CompData, scope=CommandScope.SWITCH):
     """
     Represents the SwitchData class which extends the CompData class.
 
@@ -1202,16 +1317,17 @@ class SwitchData(CompData):
         super().__init__(data, scope=CommandScope.SWITCH, tmcc_id=tmcc_id)
 
 
-class AccessoryData(CompData):
+class AccessoryData(CompData, scope=CommandScope.ACC):
     def __init__(self, data: bytes, tmcc_id: int = None) -> None:
         self._signal_initializing()
         super().__init__(data, scope=CommandScope.ACC, tmcc_id=tmcc_id)
 
 
-class RouteData(CompData):
+class RouteData(CompData, scope=CommandScope.ROUTE):
+    _components: list[RouteComponent] | None
+
     def __init__(self, data: bytes, tmcc_id: int = None) -> None:
         self._signal_initializing()
-        self._components: list[RouteComponent] | None = None
         super().__init__(data, scope=CommandScope.ROUTE, tmcc_id=tmcc_id)
 
     def payload(self) -> str:
@@ -87,6 +87,17 @@ class ComponentState(ABC, CompDataMixin):
             raise ValueError(f"Unsupported scope: {scope.name if scope else 'None'}")
         return csv.DictWriter(csvfile, fieldnames=state_class._csv_headers(include_state=include_state))
 
+    @classmethod
+    def get_csv_dict_reader(cls, scope: CommandScope, csvfile: TextIO, *, has_header: bool = True) -> csv.DictReader:
+        """
+        Reader for files written by get_cvs_dict_writer; without a header, the
+        columns are taken to be those written by default
+        """
+        state_class = SCOPE_TO_STATE_MAP.get(scope, None)
+        if state_class is None:
+            raise ValueError(f"Unsupported scope: {scope.name if scope else 'None'}")
+        return csv.DictReader(csvfile, fieldnames=None if has_header else state_class._csv_headers())
+
     @classmethod
     def _csv_headers(cls, include_state: bool = False) -> list[str]:
         return ["address", "road_number", "road_name"]
@@ -130,8 +141,9 @@ class ComponentState(ABC, CompDataMixin):
     def as_csv(self, include_state: bool = False) -> dict[str, str | int | None]:
         return {
             "address": self._address,
-            "road_number": self.road_number,
-            "road_name": self.road_name,
+            # the stored values, not the display fallbacks, so csv_import reads back what the Base 3 has
+            "road_number": self._road_number or None,
+            "road_name": self._road_name or None,
         }
 
     def results_in(self, command: CommandReq) -> Set[E]:
@@ -399,15 +399,19 @@ class EngineState(ComponentState):
 
             # get the downstream effects of this command, as they also impact state
             cmd_effects = self.results_in(command)
-            log.debug(f"Update: {command}\nEffects: {cmd_effects}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Update: {command}\nEffects: {cmd_effects}")
 
             # Cancel any delayed requests, if impacted
-            if command.command in CANCEL_PENDINGS_SET or (self._ramping and command.command in TARGET_SPEED_SET):
+            if command.command in CANCEL_PENDINGS_SET or (
+                self._ramping and command.command in TARGET_SPEED_SET and not self._is_own_ramp_to(command.data)
+            ):
                 # ignore direction commands if they are the same as the current direction
                 if command.command in DIRECTIONS_SET and self.direction == command.command:
                     pass
                 else:
-                    log.debug(f"Cancelled pending commands TMCC ID: {self.tmcc_id} {command.command}")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug(f"Cancelled pending commands TMCC ID: {self.tmcc_id} {command.command}")
                     self.cancel_ramps()
 
             # handle last numeric
@@ -631,6 +635,15 @@ class EngineState(ComponentState):
         self.comp_data.labor_tmcc = 12
         self._ramping = False
 
+    def _is_own_ramp_to(self, target_speed: int) -> bool:
+        """
+        A new target speed cancels any ramp in progress, unless it's the one
+        this process is ramping to; that ramp was retargeted in place.
+        """
+        from ..protocol.sequence.ramp_controller import RampController
+
+        return RampController.is_ramping_to(self, target_speed)
+
     def update_target_speed(self, target_speed: int = None):
         if target_speed is None:
             if self._ramping:
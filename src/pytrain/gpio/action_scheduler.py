@@ -0,0 +1,248 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from __future__ import annotations
+
+import heapq
+import itertools
+import logging
+import os
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Condition, RLock, Thread
+from typing import Any, Callable
+
+from ..protocol.constants import PROGRAM_NAME
+
+log = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS: int = int(os.environ.get("PYTRAIN_GPIO_WORKERS", 4))
+
+
+class ScheduledAction:
+    """
+    A pending timer, returned by GpioActionScheduler.schedule; cancel it to keep it from firing
+    """
+
+    __slots__ = ("due", "seq", "action", "args", "inline", "cancelled")
+
+    def __init__(self, due: float, seq: int, action: Callable, args: tuple, inline: bool) -> None:
+        self.due = due
+        self.seq = seq
+        self.action = action
+        self.args = args
+        self.inline = inline
+        self.cancelled = False
+
+    def __lt__(self, other: ScheduledAction) -> bool:
+        return (self.due, self.seq) < (other.due, other.seq)
+
+    def cancel(self) -> None:
+        self.cancelled = True
+
+
+class GpioActionScheduler(Thread):
+    """
+    Runs the actions bound to GPIO buttons. A single timer thread keeps a heap of
+    deadlines (delayed commands, hold thresholds and repeat intervals) and sleeps
+    until the next one is due; the actions themselves run on a small, bounded
+    pool of worker threads. Button callbacks only record the edge and arm a timer,
+    so they return immediately, a held button no longer ties up a thread, and
+    presses on different buttons are handled concurrently rather than in turn.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} GPIO Action Scheduler")
+        self._cv = Condition()
+        self._timers: list[ScheduledAction] = []
+        self._seq = itertools.count()
+        self._pool = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix=f"{PROGRAM_NAME} GPIO")
+        self._max_workers = max(1, max_workers)
+        self._running = True
+        self._dispatched = 0
+        self.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    @property
+    def dispatched(self) -> int:
+        """
+        Number of actions handed to the worker pool
+        """
+        return self._dispatched
+
+    @property
+    def pending(self) -> int:
+        with self._cv:
+            return sum(1 for t in self._timers if not t.cancelled)
+
+    def submit(self, action: Callable, *args: Any) -> Future | None:
+        """
+        Run action(*args) on the worker pool as soon as a worker is free
+        """
+        if not self._running:
+            return None
+        self._dispatched += 1
+        try:
+            return self._pool.submit(self._run_action, action, args)
+        except RuntimeError:
+            # pool was shut down out from under us
+            return None
+
+    def schedule(self, delay: float, action: Callable, *args: Any) -> ScheduledAction:
+        """
+        Run action(*args) on the worker pool after delay seconds
+        """
+        return self._add_timer(delay, action, args, inline=False)
+
+    def call_later(self, delay: float, callback: Callable, *args: Any) -> ScheduledAction:
+        """
+        Run callback(*args) on the timer thread itself after delay seconds; reserved
+        for quick checks, such as reading a button's state, that decide what to submit
+        """
+        return self._add_timer(delay, callback, args, inline=True)
+
+    @staticmethod
+    def cancel(timer: ScheduledAction | None) -> None:
+        if timer is not None:
+            timer.cancel()
+
+    def reset(self) -> None:
+        with self._cv:
+            self._running = False
+            for timer in self._timers:
+                timer.cancel()
+            self._timers.clear()
+            self._cv.notify()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def run(self) -> None:
+        while self._running:
+            with self._cv:
+                now = time.monotonic()
+                while self._timers and self._timers[0].cancelled:
+                    heapq.heappop(self._timers)
+                if not self._timers or self._timers[0].due > now:
+                    self._cv.wait(self._timers[0].due - now if self._timers else None)
+                    continue
+                ready = []
+                while self._timers and self._timers[0].due <= now:
+                    timer = heapq.heappop(self._timers)
+                    if not timer.cancelled:
+                        ready.append(timer)
+            # fire outside the lock, so callbacks can arm new timers
+            for timer in ready:
+                if timer.cancelled:
+                    continue
+                if timer.inline:
+                    self._run_action(timer.action, timer.args)
+                else:
+                    self.submit(timer.action, *timer.args)
+
+    def _add_timer(self, delay: float, action: Callable, args: tuple, inline: bool) -> ScheduledAction:
+        timer = ScheduledAction(time.monotonic() + max(0.0, delay), next(self._seq), action, args, inline)
+        with self._cv:
+            heapq.heappush(self._timers, timer)
+            # only wake the timer thread if its next deadline moved up
+            if self._timers[0] is timer:
+                self._cv.notify()
+        return timer
+
+    @staticmethod
+    def _run_action(action: Callable, args: tuple) -> None:
+        try:
+            action(*args)
+        except Exception as e:
+            log.exception(f"Error running GPIO action {action}", exc_info=e)
+
+
+class PressedOrHeldAction:
+    """
+    Button callback that distinguishes a press from a hold without sleeping.
+    The press edge arms a timer for the hold threshold; if the button is still
+    down when it fires, the held action runs (repeating every frequency seconds
+    while the button stays down, if asked), otherwise the pressed action runs.
+    Each repeat is armed only after the previous one finishes, so a slow action
+    never piles up work or runs out of order.
+    """
+
+    def __init__(
+        self,
+        scheduler: Callable[[], GpioActionScheduler],
+        pressed_action: Callable | None,
+        held_action: Callable,
+        held_threshold: float,
+        held_repeat: bool = False,
+        frequency: float = 0.1,
+        data_gen: Callable = None,
+        pass_effects: bool = True,
+    ) -> None:
+        self._scheduler = scheduler
+        self._pressed_action = pressed_action
+        self._held_action = held_action
+        self._held_threshold = max(0.0, held_threshold or 0.0)
+        self._held_repeat = held_repeat
+        self._frequency = max(0.0, frequency or 0.0)
+        self._data_gen = data_gen
+        self._pass_effects = pass_effects
+        self._lock = RLock()
+        self._gen = 0
+        self._timer: ScheduledAction | None = None
+        self._deciding = False
+
+    def press(self, btn: Any) -> None:
+        """
+        The callback to bind to the button's when_pressed
+        """
+        scheduler = self._scheduler()
+        with self._lock:
+            if self._deciding and self._pressed_action is not None:
+                # released and pressed again before the threshold; the first was a press
+                scheduler.submit(self._pressed_action)
+            scheduler.cancel(self._timer)
+            self._gen += 1
+            self._deciding = True
+            self._timer = scheduler.call_later(self._held_threshold, self._decide, btn, self._gen)
+
+    def _decide(self, btn: Any, gen: int) -> None:
+        with self._lock:
+            if gen != self._gen:
+                return
+            self._deciding = False
+            self._timer = None
+        if btn.is_active is True:
+            self._scheduler().submit(self._held, btn, gen, True)
+        elif self._pressed_action is not None:
+            self._scheduler().submit(self._pressed_action)
+
+    def _held(self, btn: Any, gen: int, trigger_effects: bool) -> None:
+        if self._pass_effects:
+            if self._data_gen is not None:
+                self._held_action(new_data=self._data_gen(btn), trigger_effects=trigger_effects)
+            else:
+                self._held_action(trigger_effects=trigger_effects)
+        else:
+            self._held_action()
+        if self._held_repeat:
+            with self._lock:
+                if gen == self._gen:
+                    self._timer = self._scheduler().call_later(self._frequency, self._repeat, btn, gen)
+
+    def _repeat(self, btn: Any, gen: int) -> None:
+        with self._lock:
+            if gen != self._gen:
+                return
+            self._timer = None
+        if btn.is_active:
+            self._scheduler().submit(self._held, btn, gen, False)
@@ -0,0 +1,254 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from __future__ import annotations
+
+import logging
+import time
+from collections import deque
+from statistics import median
+from threading import Condition, Thread
+from typing import Any, Callable
+
+from ..protocol.constants import PROGRAM_NAME
+
+log = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE: float = 50.0  # samples per second, per device
+DEFAULT_MEDIAN_WINDOW: int = 3  # readings; rejects single-sample spikes
+DEFAULT_DEADBAND: float = 0.001  # fraction of full scale
+
+
+class AnalogFilter:
+    """
+    Smooths raw readings from an analog device with an optional median window,
+    followed by an optional exponential moving average, then applies a hysteresis
+    deadband: a value is only reported once it moves more than deadband away from
+    the last value reported, so a pot sitting between two steps doesn't chatter.
+    """
+
+    def __init__(
+        self,
+        median_window: int = DEFAULT_MEDIAN_WINDOW,
+        ema_alpha: float = None,
+        deadband: float = DEFAULT_DEADBAND,
+    ) -> None:
+        if ema_alpha is not None and not 0.0 < ema_alpha <= 1.0:
+            raise ValueError(f"EMA alpha must be in (0, 1]: {ema_alpha}")
+        self._window = deque(maxlen=median_window) if median_window and median_window > 1 else None
+        self._alpha = ema_alpha
+        self._deadband = deadband if deadband and deadband > 0 else 0.0
+        self._smoothed: float | None = None
+        self._reported: float | None = None
+
+    @property
+    def value(self) -> float | None:
+        """
+        The last value reported
+        """
+        return self._reported
+
+    def update(self, raw: float) -> float | None:
+        """
+        Filter a new reading; returns the new value if it is a meaningful change, otherwise None.
+        """
+        value = raw
+        if self._window is not None:
+            self._window.append(raw)
+            value = median(self._window)
+        if self._alpha is not None:
+            value = value if self._smoothed is None else self._smoothed + self._alpha * (value - self._smoothed)
+        self._smoothed = value
+        if self._reported is None or abs(value - self._reported) > self._deadband:
+            self._reported = value
+            return value
+        return None
+
+    def reset(self) -> None:
+        if self._window is not None:
+            self._window.clear()
+        self._smoothed = self._reported = None
+
+
+class AnalogChannel:
+    """
+    A device registered with the AnalogSampler; returned by AnalogSampler.add
+    """
+
+    def __init__(
+        self,
+        device: Any,
+        callback: Callable[[float], None],
+        rate: float,
+        min_interval: float,
+        analog_filter: AnalogFilter,
+    ) -> None:
+        if rate is None or rate <= 0:
+            raise ValueError(f"Sample rate must be positive: {rate}")
+        self._device = device
+        self._callback = callback
+        self._interval = 1.0 / rate
+        self._min_interval = min_interval if min_interval and min_interval > 0 else 0.0
+        self._filter = analog_filter
+        self._pending: float | None = None
+        self._last_emit: float | None = None
+        self._next_due = time.monotonic()
+        self._samples = 0
+        self._emits = 0
+
+    @property
+    def device(self) -> Any:
+        return self._device
+
+    @property
+    def value(self) -> float | None:
+        return self._filter.value
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @property
+    def emits(self) -> int:
+        return self._emits
+
+    @property
+    def next_due(self) -> float:
+        return self._next_due
+
+    def sample(self, now: float) -> None:
+        # stay on the fixed schedule, but don't try to catch up on missed samples
+        self._next_due += self._interval
+        if self._next_due <= now:
+            self._next_due = now + self._interval
+        try:
+            raw = self._device.value
+        except Exception as e:
+            log.warning(f"Error reading {self._device}: {e}")
+            return
+        self._samples += 1
+        changed = self._filter.update(raw)
+        if changed is not None:
+            self._pending = changed
+        # hold the latest change until the rate limit allows it through
+        if self._pending is not None:
+            if self._last_emit is None or now - self._last_emit >= self._min_interval:
+                value, self._pending = self._pending, None
+                self._last_emit = now
+                self._emits += 1
+                try:
+                    self._callback(value)
+                except Exception as e:
+                    log.exception(f"Error handling analog value {value} from {self._device}", exc_info=e)
+
+
+class AnalogSampler(Thread):
+    """
+    Shared service that samples every registered analog device (pots, joysticks,
+    ADC channels) at its own fixed rate from a single thread. Each reading is
+    filtered, and a device's callback fires only on a meaningful change, and no
+    more often than its min_interval; the most recent change is held and delivered
+    once the interval expires, so the final position of a control is never lost.
+    Between samples, the thread sleeps until the next device is due.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} Analog Sampler")
+        self._cv = Condition()
+        self._channels: list[AnalogChannel] = []
+        self._running = True
+        self._samples = 0
+        self._started_at = time.monotonic()
+        self._cpu_time = 0.0
+        self._cpu_reset = False
+        self.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def channels(self) -> list[AnalogChannel]:
+        with self._cv:
+            return list(self._channels)
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @property
+    def samples_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started_at
+        return self._samples / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def cpu_percent(self) -> float:
+        """
+        CPU used by the sampler thread, as a percentage of one core, since the stats were last reset
+        """
+        elapsed = time.monotonic() - self._started_at
+        return 100.0 * self._cpu_time / elapsed if elapsed > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        with self._cv:
+            self._samples = 0
+            self._started_at = time.monotonic()
+            self._cpu_time = 0.0
+            self._cpu_reset = True
+            self._cv.notify()
+
+    def add(
+        self,
+        device: Any,
+        callback: Callable[[float], None],
+        rate: float = DEFAULT_SAMPLE_RATE,
+        min_interval: float = 0.0,
+        analog_filter: AnalogFilter = None,
+    ) -> AnalogChannel:
+        """
+        Sample device.value rate times a second, calling callback with each meaningful change.
+        """
+        channel = AnalogChannel(device, callback, rate, min_interval, analog_filter or AnalogFilter())
+        with self._cv:
+            self._channels.append(channel)
+            self._cv.notify()
+        return channel
+
+    def remove(self, channel: AnalogChannel) -> None:
+        with self._cv:
+            if channel in self._channels:
+                self._channels.remove(channel)
+            self._cv.notify()
+
+    def reset(self) -> None:
+        with self._cv:
+            self._running = False
+            self._channels.clear()
+            self._cv.notify()
+
+    def run(self) -> None:
+        cpu_mark = time.thread_time()
+        while self._running:
+            with self._cv:
+                now = time.monotonic()
+                due = min((c.next_due for c in self._channels), default=None)
+                if due is None or due > now:
+                    self._cv.wait(None if due is None else due - now)
+                    # account for the work done since the last wait
+                    cpu_now = time.thread_time()
+                    if self._cpu_reset:
+                        self._cpu_reset = False
+                    else:
+                        self._cpu_time += cpu_now - cpu_mark
+                    cpu_mark = cpu_now
+                    continue
+                ready = [c for c in self._channels if c.next_due <= now]
+            # read devices and run callbacks outside the lock so they can add or remove channels
+            for channel in ready:
+                channel.sample(now)
+            self._samples += len(ready)
@@ -97,6 +97,7 @@ class Controller(Thread, GpioDevice):
         quilling_horn_chn: int = None,
         num_lasts: int = 4,
         interrupt_pin: int = None,
+        keypad_interrupt: bool = False,
     ) -> Controller:
         if row_pins and column_pins:
             c = Controller(
@@ -110,6 +111,7 @@ class Controller(Thread, GpioDevice):
                 oled_scroll_rate=oled_scroll_rate,
                 row_pins=row_pins,
                 column_pins=column_pins,
+                keypad_interrupt=keypad_interrupt,
                 base_online_pin=base_online_pin,
                 base_offline_pin=base_offline_pin,
                 base_cathode=base_cathode,
@@ -244,6 +246,7 @@ class Controller(Thread, GpioDevice):
         oled_scroll_rate: float = 0.03,
         keypad: Keypad | KeyPadI2C = None,
         num_lasts: int = 3,
+        keypad_interrupt: bool = False,
     ):
         self._lock = RLock()
         if is_lcd is True and is_oled is True:
@@ -259,7 +262,7 @@ class Controller(Thread, GpioDevice):
             self._status = None
 
         if row_pins and column_pins:
-            self._keypad = Keypad(row_pins, column_pins)
+            self._keypad = Keypad(row_pins, column_pins, interrupt=keypad_interrupt)
         else:
             self._keypad = keypad
         self._key_queue = self._keypad.key_queue
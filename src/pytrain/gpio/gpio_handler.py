@@ -1,13 +1,13 @@
 import logging
 import math
-import sched
-import threading
 import time
 from threading import Thread
 from typing import Callable, Dict, Tuple, TypeVar, Union, cast
 
 from gpiozero import AnalogInputDevice, Button, Device, LED, MCP3008, MCP3208
 
+from .action_scheduler import GpioActionScheduler, PressedOrHeldAction, ScheduledAction
+from .analog_sampler import DEFAULT_MEDIAN_WINDOW, DEFAULT_SAMPLE_RATE, AnalogChannel, AnalogFilter, AnalogSampler
 from .i2c.ads_1x15 import Ads1115
 from .i2c.button_i2c import ButtonI2C
 from .i2c.led_i2c import LEDI2C
@@ -17,7 +17,7 @@ from ..db.component_state_store import DependencyCache
 from ..db.engine_state import EngineState
 from ..protocol.command_def import CommandDefEnum
 from ..protocol.command_req import CommandReq
-from ..protocol.constants import CommandScope, DEFAULT_ADDRESS, PROGRAM_NAME
+from ..protocol.constants import CommandScope, DEFAULT_ADDRESS
 from ..protocol.tmcc1.tmcc1_constants import (
     TMCC1AuxCommandEnum,
 )
@@ -77,62 +77,15 @@ class PressedHeldDef:
         )
 
 
-class GpioDelayHandler(Thread):
+class PotHandler:
     """
-    Handle delayed (scheduled) requests. Implementation uses Python's lightweight
-    sched module to keep a list of requests to issue in the future. We use
-    threading.Event.wait() as the sleep function, as it is interruptable. This
-    allows us to schedule requests in any order and still have them fire at the
-    appropriate time.
+    Send commands as a potentiometer (or any device with a gpiozero-style value
+    property) is turned. Rather than each pot polling its ADC from its own thread,
+    the pot is registered with the shared AnalogSampler, which reads it sample_rate
+    times a second, smooths the readings, and calls back only on a meaningful
+    change, at most once every delay seconds.
     """
 
-    def __init__(self) -> None:
-        super().__init__(daemon=True, name=f"{PROGRAM_NAME} GPIO Delay Handler")
-        self._cv = threading.Condition()
-        self._ev = threading.Event()
-        self._scheduler = sched.scheduler(time.monotonic, self._ev.wait)
-        self._running = True
-        self.start()
-
-    def cancel(self, ev: sched.Event) -> None:
-        try:
-            if ev:
-                self._scheduler.cancel(ev)
-        except ValueError:
-            pass
-
-    def reset(self) -> None:
-        self._running = False
-        # clear out any scheduled events
-        for ev in self._scheduler.queue:
-            self.cancel(ev)
-        # send shutdown signal
-        with self._cv:
-            self._ev.set()
-            self._cv.notify()
-
-    def run(self) -> None:
-        while self._running:
-            with self._cv:
-                while self._running and self._scheduler.empty():
-                    self._cv.wait()
-            # run the scheduler outside the cv lock; otherwise,
-            # we couldn't schedule more commands
-            self._ev.clear()
-            self._scheduler.run()
-
-    def schedule(self, delay: float, command: Callable) -> sched.Event:
-        with self._cv:
-            ev = self._scheduler.enter(delay, 1, command)
-            # this interrupts the running scheduler
-            self._ev.set()
-            # and this notifies the main thread to restart, as there is a new
-            # request in the sched queue
-            self._cv.notify()
-            return ev
-
-
-class PotHandler(Thread):
     def __init__(
         self,
         command: CommandReq | None,
@@ -146,9 +99,15 @@ class PotHandler(Thread):
         cmds: Dict[int, T] = None,
         start: bool = True,
         prefix: CommandReq = None,
+        device: AnalogInputDevice = None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        median_window: int = DEFAULT_MEDIAN_WINDOW,
+        ema_alpha: float = None,
+        deadband: float = DEFAULT_VARIANCE,
     ) -> None:
-        super().__init__(daemon=True)
-        if use_12bit:
+        if device is not None:
+            self._pot = device
+        elif use_12bit:
             self._pot = MCP3208(channel=channel, differential=False)
         else:
             self._pot = MCP3008(channel=channel)
@@ -168,6 +127,9 @@ class PotHandler(Thread):
         else:
             self._threshold = None
         self._delay = delay
+        self._sample_rate = sample_rate
+        self._filter = AnalogFilter(median_window=median_window, ema_alpha=ema_alpha, deadband=deadband)
+        self._channel: AnalogChannel | None = None
         self._running = True
         self._scale = scale
         self._command_map = cmds
@@ -179,53 +141,75 @@ class PotHandler(Thread):
     def pot(self) -> AnalogInputDevice:
         return self._pot
 
-    def run(self) -> None:
-        if log.isEnabledFor(logging.DEBUG):
-            log.debug(
-                f"Delay: {self._delay} threshold: {self._threshold} d_min: {self._data_min} d_max: {self._data_max}"
+    @property
+    def channel(self) -> AnalogChannel | None:
+        return self._channel
+
+    def start(self) -> None:
+        if self._running and self._channel is None:
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(
+                    f"Delay: {self._delay} threshold: {self._threshold} "
+                    f"d_min: {self._data_min} d_max: {self._data_max} rate: {self._sample_rate}"
+                )
+            self._channel = GpioHandler.analog_sampler().add(
+                self.pot,
+                self.on_value,
+                rate=self._sample_rate,
+                min_interval=self._delay,
+                analog_filter=self._filter,
             )
-        while self._running:
-            raw_value = self.pot.value
-            value = self._interp(raw_value)
-            if self._scale:
-                value = self._scale[value]
-            if self._last_value is None:
-                self._last_value = value
-                continue
-            elif self._threshold is not None and math.fabs(self._last_value - value) <= self._threshold and value > 0:
-                continue  # pots can take a bit to settle; ignore small changes
-            if self._last_value == 0 and value == 0:
-                continue
+
+    def is_alive(self) -> bool:
+        return self._channel is not None
+
+    def on_value(self, raw_value: float) -> None:
+        """
+        Called by the sampler with the filtered pot reading whenever it changes
+        """
+        value = self._interp(raw_value)
+        if self._scale:
+            value = self._scale[value]
+        if self._last_value is None:
             self._last_value = value
-            byte_str = bytes()
-            if self._command_map and value in self._command_map:
-                cmd = self._command_map[value]
-                if cmd:
-                    if self._prefix:
-                        if GpioHandler.engine_numeric(self._prefix_address) == self._prefix_data:
-                            pass
-                        else:
-                            byte_str += self._prefix.as_bytes * 3
-                    # command could be None, indicating no action
-                    if log.isEnabledFor(logging.DEBUG):
-                        log.debug(f"{cmd} {value} {raw_value}")
-                    if cmd.is_data:
-                        cmd.data = value
-                    byte_str += cmd.as_bytes
-            elif self._command and self._action:
+            return
+        elif self._threshold is not None and math.fabs(self._last_value - value) <= self._threshold and value > 0:
+            return  # pots can take a bit to settle; ignore small changes
+        if self._last_value == 0 and value == 0:
+            return
+        self._last_value = value
+        byte_str = bytes()
+        if self._command_map and value in self._command_map:
+            cmd = self._command_map[value]
+            if cmd:
                 if self._prefix:
                     if GpioHandler.engine_numeric(self._prefix_address) == self._prefix_data:
                         pass
                     else:
                         byte_str += self._prefix.as_bytes * 3
-                self._command.data = value
-                byte_str += self._command.as_bytes
-            if byte_str:
-                self._tmcc_command_buffer.enqueue_command(byte_str)
-            time.sleep(self._delay)
+                # command could be None, indicating no action
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"{cmd} {value} {raw_value}")
+                if cmd.is_data:
+                    cmd.data = value
+                byte_str += cmd.as_bytes
+        elif self._command and self._action:
+            if self._prefix:
+                if GpioHandler.engine_numeric(self._prefix_address) == self._prefix_data:
+                    pass
+                else:
+                    byte_str += self._prefix.as_bytes * 3
+            self._command.data = value
+            byte_str += self._command.as_bytes
+        if byte_str:
+            self._tmcc_command_buffer.enqueue_command(byte_str)
 
     def reset(self) -> None:
         self._running = False
+        sampler = GpioHandler.GPIO_ANALOG_SAMPLER
+        if self._channel is not None and sampler is not None:
+            sampler.remove(self._channel)
+        self._channel = None
 
 
 class JoyStickHandler(PotHandler):
@@ -240,6 +224,11 @@ class JoyStickHandler(PotHandler):
         scale: Dict[int, int] = None,
         cmds: Dict[int, T] = None,
         prefix: CommandReq = None,
+        device: AnalogInputDevice = None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        median_window: int = DEFAULT_MEDIAN_WINDOW,
+        ema_alpha: float = None,
+        deadband: float = DEFAULT_VARIANCE,
     ) -> None:
         super().__init__(
             command,
@@ -253,6 +242,11 @@ class JoyStickHandler(PotHandler):
             cmds=cmds,
             start=False,
             prefix=prefix,
+            device=device,
+            sample_rate=sample_rate,
+            median_window=median_window,
+            ema_alpha=ema_alpha,
+            deadband=deadband,
         )
         self._threshold = None
         self.start()
@@ -262,7 +256,8 @@ class JoyStickHandler(PotHandler):
 class GpioHandler:
     GPIO_DEVICE_CACHE = set()
     GPIO_HANDLER_CACHE = set()
-    GPIO_DELAY_HANDLER = None
+    GPIO_ACTION_SCHEDULER = None
+    GPIO_ANALOG_SAMPLER = None
 
     @staticmethod
     def current_milli_time() -> int:
@@ -553,28 +548,18 @@ class GpioHandler:
         frequency: float = 0.1,
         data_gen: Callable = None,
     ) -> Callable:
-        def func(btn: Button) -> None:
-            # sleep for hold threshold, if button still active, do held_action
-            # otherwise do pressed_action
-            trigger_effects = True
-            time.sleep(held_threshold)
-            if btn.is_active is True:
-                while btn.is_active:
-                    if data_gen is not None:
-                        held_action(new_data=data_gen(btn), trigger_effects=trigger_effects)
-                    else:
-                        held_action(trigger_effects=trigger_effects)
-                    # if held_repeat is true, continue sending when_held action
-                    # with the given frequency of repeat
-                    if held_repeat:
-                        time.sleep(frequency)
-                        trigger_effects = False
-                    else:
-                        break
-            else:
-                pressed_action()
-
-        return func
+        # the press arms a timer for the hold threshold; if the button is still active
+        # when it fires, do held_action (repeating with the given frequency, if asked),
+        # otherwise do pressed_action
+        return PressedOrHeldAction(
+            cls.action_scheduler,
+            pressed_action,
+            held_action,
+            held_threshold,
+            held_repeat=held_repeat,
+            frequency=frequency,
+            data_gen=data_gen,
+        ).press
 
     @classmethod
     def when_toggle_switch(
@@ -677,6 +662,10 @@ class GpioHandler:
         delay: float = 0.05,
         scale: Dict[int, int] = None,
         cmds: Dict[int, T] = None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        median_window: int = DEFAULT_MEDIAN_WINDOW,
+        ema_alpha: float = None,
+        deadband: float = DEFAULT_VARIANCE,
     ) -> PotHandler:
         if isinstance(command, CommandDefEnum):
             command = CommandReq.build(command, address, 0, scope)
@@ -692,6 +681,10 @@ class GpioHandler:
             delay=delay,
             scale=scale,
             cmds=cmds,
+            sample_rate=sample_rate,
+            median_window=median_window,
+            ema_alpha=ema_alpha,
+            deadband=deadband,
         )
         cls.cache_handler(knob)
         cls.cache_device(knob.pot)
@@ -711,6 +704,10 @@ class GpioHandler:
         scale: Dict[int, int] = None,
         cmds: Dict[int, T] = None,
         prefix: CommandReq = None,
+        sample_rate: float = DEFAULT_SAMPLE_RATE,
+        median_window: int = DEFAULT_MEDIAN_WINDOW,
+        ema_alpha: float = None,
+        deadband: float = DEFAULT_VARIANCE,
     ) -> JoyStickHandler:
         if isinstance(command, CommandDefEnum):
             command = CommandReq.build(command, address, 0, scope)
@@ -726,6 +723,10 @@ class GpioHandler:
             scale=scale,
             cmds=cmds,
             prefix=prefix,
+            sample_rate=sample_rate,
+            median_window=median_window,
+            ema_alpha=ema_alpha,
+            deadband=deadband,
         )
         cls.cache_handler(joystick)
         cls.cache_device(joystick.pot)
@@ -773,34 +774,54 @@ class GpioHandler:
         cls.GPIO_DEVICE_CACHE.discard(device)
 
     @classmethod
-    def with_held_action(cls, action: Callable, button: Button, delay: float = 0.10) -> Callable:
-        def held_action() -> None:
-            while button.is_active:
-                action()
-                time.sleep(delay)
+    def analog_sampler(cls) -> AnalogSampler:
+        """
+        The shared sampler that reads all pots and joysticks
+        """
+        if cls.GPIO_ANALOG_SAMPLER is None or not cls.GPIO_ANALOG_SAMPLER.is_running:
+            cls.GPIO_ANALOG_SAMPLER = AnalogSampler()
+            cls.cache_handler(cls.GPIO_ANALOG_SAMPLER)
+        return cls.GPIO_ANALOG_SAMPLER
 
-        return held_action
+    @classmethod
+    def action_scheduler(cls) -> GpioActionScheduler:
+        """
+        The shared timer loop and worker pool that runs button actions
+        """
+        if cls.GPIO_ACTION_SCHEDULER is None or not cls.GPIO_ACTION_SCHEDULER.is_running:
+            cls.GPIO_ACTION_SCHEDULER = GpioActionScheduler()
+            cls.cache_handler(cls.GPIO_ACTION_SCHEDULER)
+        return cls.GPIO_ACTION_SCHEDULER
 
     @classmethod
-    def with_toggle_action(cls, action: Callable, led: LED, auto_timeout: int = None) -> Callable:
-        if cls.GPIO_DELAY_HANDLER is None:
-            cls.GPIO_DELAY_HANDLER = GpioDelayHandler()
-            cls.cache_handler(cls.GPIO_DELAY_HANDLER)
+    def with_held_action(cls, action: Callable, button: Button, delay: float = 0.10) -> Callable:
+        # repeat action every delay seconds for as long as the button is active
+        return PressedOrHeldAction(
+            cls.action_scheduler,
+            None,
+            action,
+            0.0,
+            held_repeat=True,
+            frequency=delay,
+            pass_effects=False,
+        ).press
 
-        ev: sched.Event | None = None
+    @classmethod
+    def with_toggle_action(cls, action: Callable, led: LED, auto_timeout: int = None) -> Callable:
+        ev: ScheduledAction | None = None
 
         def toggle_action() -> None:
             nonlocal ev
             action()
             if led.value:
                 if ev is not None:
-                    cls.GPIO_DELAY_HANDLER.cancel(ev)
+                    cls.action_scheduler().cancel(ev)
                     ev = None
                 led.off()
             else:
                 led.on()
                 if auto_timeout:
-                    ev = cls.GPIO_DELAY_HANDLER.schedule(auto_timeout, led.off)
+                    ev = cls.action_scheduler().schedule(auto_timeout, led.off)
 
         return toggle_action
 
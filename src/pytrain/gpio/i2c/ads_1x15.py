@@ -1,11 +1,24 @@
+import logging
+import threading
 import time
 from abc import ABC, ABCMeta
+from typing import Dict, List, Tuple
 
 from smbus2 import SMBus
 
+from ...protocol.constants import PROGRAM_NAME
+
+log = logging.getLogger(__name__)
+
 # ADS1x15 default i2c address
 I2C_address = 0x48
 
+# Conversions per second for each data rate setting
+ADS101X_RATES = (128, 250, 490, 920, 1600, 2400, 3300, 3300)
+ADS111X_RATES = (8, 16, 32, 64, 128, 250, 475, 860)
+
+DEFAULT_SAMPLER_RATE: float = 100.0  # rounds through all channels per second
+
 
 class Ads1x15(ABC):
     """
@@ -205,6 +218,14 @@ class Ads1x15(ABC):
                 time.sleep(0.001)
         return self.raw_value
 
+    @property
+    def conversion_time(self) -> float:
+        """
+        Seconds a single conversion takes at the current data rate
+        """
+        rates = ADS111X_RATES if self._bits == 16 else ADS101X_RATES
+        return 1.0 / rates[self.data_rate]
+
     @property
     def gain(self):
         """Get programmable gain amplifier configuration"""
@@ -577,3 +598,232 @@ class Ads1115(Ads1x15):
         """
         self.request_adc_differential_2_3()
         return self._get_adc()
+
+
+class Ads1x15Sampler(threading.Thread):
+    """
+    Keeps the ADC in continuous-conversion mode and round-robins its single-ended
+    channels from a background thread, publishing each channel's latest reading
+    into its own slot. Readers take the latest value from the slot without
+    touching the I2C bus. With a single channel, the mux is never rewritten.
+
+    If the ALERT/RDY pin is wired to a GPIO pin, pass it as ready_pin, and the
+    comparator is set up to pulse it at the end of each conversion. Otherwise,
+    the sampler waits one conversion period after each channel switch.
+    """
+
+    _shared: Dict[Tuple[int, int], "Ads1x15Sampler"] = {}
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(
+        cls,
+        adc_type: type = None,
+        address: int = I2C_address,
+        bus_id: int = 1,
+        rate: float = DEFAULT_SAMPLER_RATE,
+        ready_pin: int | str = None,
+        **adc_kwargs,
+    ) -> "Ads1x15Sampler":
+        """
+        Returns the sampler for the ADC at the given bus and address, creating it if need be;
+        the ADC type and settings of the first caller win.
+        """
+        with cls._shared_lock:
+            sampler = cls._shared.get((bus_id, address), None)
+            if sampler is None or not sampler.is_running:
+                adc_type = adc_type or Ads1115
+                adc = adc_type(bus_id=bus_id, address=address, **adc_kwargs)
+                sampler = cls(adc, channels=[], rate=rate, ready_pin=ready_pin)
+                cls._shared[(bus_id, address)] = sampler
+            return sampler
+
+    def __init__(
+        self,
+        adc: Ads1x15,
+        channels: List[int] = None,
+        rate: float = DEFAULT_SAMPLER_RATE,
+        ready_pin: int | str = None,
+    ) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} ADS1x15 Sampler 0x{adc.address:02x}")
+        self._adc = adc
+        self._lock = threading.Lock()
+        self._channels: List[int] = []
+        # one slot per channel holding (raw value, time read); replaced whole, so readers need no lock
+        self._slots: List[Tuple[int, float] | None] = [None] * adc.ports
+        self._first = [threading.Event() for _ in range(adc.ports)]
+        self._interval = 1.0 / rate if rate and rate > 0 else 0.0
+        self._ev = threading.Event()
+        self._ready = threading.Event()
+        self._ready_device = None
+        self._running = True
+        self._samples = 0
+        self._started_at = time.monotonic()
+        self._mux_writes = 0
+        if ready_pin is not None:
+            from gpiozero import DigitalInputDevice
+
+            # ALERT/RDY is open drain and pulses low when a conversion completes
+            self._ready_device = DigitalInputDevice(ready_pin, pull_up=True)
+            self._ready_device.when_activated = self._ready.set
+        for channel in channels if channels is not None else range(adc.ports):
+            self.add_channel(channel)
+        self.start()
+
+    @property
+    def adc(self) -> Ads1x15:
+        return self._adc
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def channels(self) -> List[int]:
+        return list(self._channels)
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @property
+    def mux_writes(self) -> int:
+        return self._mux_writes
+
+    @property
+    def samples_per_second(self) -> float:
+        elapsed = time.monotonic() - self._started_at
+        return self._samples / elapsed if elapsed > 0 else 0.0
+
+    def reset_stats(self) -> None:
+        self._samples = self._mux_writes = 0
+        self._started_at = time.monotonic()
+
+    def add_channel(self, channel: int) -> "Ads1x15Channel":
+        if channel < 0 or channel >= self._adc.ports:
+            raise ValueError(f"Channel number out of range (0 - {self._adc.ports - 1})")
+        with self._lock:
+            if channel not in self._channels:
+                self._channels = sorted(self._channels + [channel])
+        return Ads1x15Channel(self, channel)
+
+    def channel(self, channel: int) -> "Ads1x15Channel":
+        """
+        Returns a view of channel, sampling it if it isn't already
+        """
+        return self.add_channel(channel)
+
+    def raw(self, channel: int, timeout: float = None) -> int | None:
+        """
+        Latest raw reading of channel, waiting up to timeout seconds for the first one
+        """
+        slot = self._slots[channel]
+        if slot is None and timeout:
+            self._first[channel].wait(timeout)
+            slot = self._slots[channel]
+        return slot[0] if slot is not None else None
+
+    def voltage(self, channel: int, timeout: float = None) -> float | None:
+        raw = self.raw(channel, timeout)
+        return self._adc.to_voltage(raw) if raw is not None else None
+
+    def age(self, channel: int) -> float | None:
+        """
+        Seconds since channel was last read
+        """
+        slot = self._slots[channel]
+        return time.monotonic() - slot[1] if slot is not None else None
+
+    def run(self) -> None:
+        adc = self._adc
+        adc.mode = adc.MODE_CONTINUOUS
+        if self._ready_device is not None:
+            # conversion-ready mode: hi threshold MSB set, lo threshold MSB clear, assert after one conversion
+            adc.set_comparator_threshold_high(0x8000)
+            adc.set_comparator_threshold_low(0x0000)
+            adc.comparator_queue = adc.COMP_QUE_1_CONV
+        conversion = adc.conversion_time
+        current = None
+        while self._running:
+            started = time.monotonic()
+            channels = self._channels
+            if not channels:
+                self._ev.wait(0.05)
+                continue
+            for channel in channels:
+                if not self._running:
+                    break
+                self._ready.clear()
+                if channel != current:
+                    # changing the mux restarts the conversion on the new channel
+                    adc._set_input_register(channel + 4)
+                    current = channel
+                    self._mux_writes += 1
+                if self._ready_device is not None:
+                    self._ready.wait(2 * conversion + 0.01)
+                else:
+                    self._ev.wait(conversion * 1.05 + 0.0002)
+                try:
+                    raw = adc.raw_value
+                except OSError as e:
+                    log.warning(f"Error reading ADS1x15 channel {channel}: {e}")
+                    continue
+                self._slots[channel] = (raw, time.monotonic())
+                self._first[channel].set()
+                self._samples += 1
+            remaining = self._interval - (time.monotonic() - started)
+            if remaining > 0:
+                self._ev.wait(remaining)
+
+    def reset(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._running = False
+        self._ev.set()
+        if self.is_alive() and threading.current_thread() is not self:
+            self.join(timeout=1.0)
+        with self._shared_lock:
+            for key, sampler in list(self._shared.items()):
+                if sampler is self:
+                    del self._shared[key]
+        if self._ready_device is not None:
+            self._ready_device.close()
+            self._ready_device = None
+        self._adc.close()
+
+
+class Ads1x15Channel:
+    """
+    A single channel of an Ads1x15Sampler, with the same value, voltage and
+    request accessors as Ads1x15, so it can stand in for one
+    """
+
+    def __init__(self, sampler: Ads1x15Sampler, channel: int, timeout: float = 0.25) -> None:
+        self._sampler = sampler
+        self._channel = channel
+        self._timeout = timeout
+
+    @property
+    def sampler(self) -> Ads1x15Sampler:
+        return self._sampler
+
+    @property
+    def channel(self) -> int:
+        return self._channel
+
+    @property
+    def raw_value(self) -> int:
+        raw = self._sampler.raw(self._channel, self._timeout)
+        return raw if raw is not None else 0
+
+    @property
+    def value(self) -> float:
+        return self.voltage
+
+    @property
+    def voltage(self) -> float:
+        return self._sampler.adc.to_voltage(self.raw_value)
+
+    def request(self) -> float:
+        return self.voltage
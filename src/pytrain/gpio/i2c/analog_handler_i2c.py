@@ -1,7 +1,7 @@
 from threading import Thread, Event
 from time import sleep
 
-from .ads_1x15 import Ads1115
+from .ads_1x15 import Ads1115, Ads1x15Sampler
 from ..gpio_handler import GpioHandler
 from ...protocol.command_req import CommandReq
 from ...protocol.constants import CommandScope, PROGRAM_NAME, DEFAULT_ADDRESS
@@ -28,7 +28,10 @@ class AnalogHandler(Thread):
         self._scope = scope if scope and scope in {CommandScope.ENGINE, CommandScope.TRAIN} else CommandScope.ENGINE
         self._repeat = repeat if repeat >= 1 else 1
         super().__init__(daemon=True, name=f"{PROGRAM_NAME} Analog Handler {self.scope.label} {self.address}")
-        self._adc = Ads1115(channel=channel, address=i2c_address, gain=Ads1115.PGA_4_096V, continuous=False)
+        # handlers on the same ADC share one continuously-converting sampler, and read its latest values
+        sampler = Ads1x15Sampler.shared(Ads1115, address=i2c_address, gain=Ads1115.PGA_4_096V)
+        GpioHandler.cache_handler(sampler)
+        self._adc = sampler.channel(channel)
         self._action = self._cmd.as_action(repeat=self._repeat)
         self._ev = Event()
         self._ignore = ignore if ignore is not None and ignore >= 0 else 0
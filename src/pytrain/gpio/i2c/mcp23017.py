@@ -126,6 +126,8 @@ class Mcp23017:
         self._int_pin = None
         self._int_btn = None
         self._clients: Dict[int, I2CDevice] = dict()
+        self._last_edge: Dict[int, float] = dict()
+        self._rechecks: Dict[int, threading.Timer] = dict()
 
     @property
     def interrupt_pin(self) -> int:
@@ -475,34 +477,43 @@ class Mcp23017:
 
     # noinspection PyProtectedMember
     def handle_interrupt(self) -> None:
+        """
+        Service the INT line. Only the port(s) with registered clients are read:
+        INTFx identifies the pins that changed and INTCAPx (which also clears the
+        interrupt) gives their level at the time of the change. Debouncing is done
+        with per-pin timestamps rather than by sleeping in the interrupt thread; an
+        edge that arrives inside a pin's bounce window is re-checked once the window
+        closes, so the settled state is never lost.
+        """
+        from ..gpio_handler import DEFAULT_BOUNCE_TIME
+
         with self._lock:
-            pull_ups = self.pull_ups
-            interrupts = self.interrupted_pins
-            state = None
-            for i in interrupts:
-                from ..gpio_handler import DEFAULT_BOUNCE_TIME
-
-                bounce_time = DEFAULT_BOUNCE_TIME
-                elapsed_bounce_time = 0
-                # for every pin that generated an interrupt, if there is a
-                # client associated with this pin, fire event
-                if i in self._clients:
-                    pull_up = (pull_ups & (1 << i)) != 0
-                    client = self._clients[i]
-                    if hasattr(client, "bounce_time") and client.bounce_time is not None:
-                        bounce_time = client.bounce_time
-                    # do the bounce time here; if multiple I2C buttons were pressed
-                    # at the same time, this may mean we debounce more than we should,
-                    # but we need to make sure each button has settled before we
-                    # decide if its state has changed
-                    if bounce_time > elapsed_bounce_time:
-                        bounce_time -= elapsed_bounce_time
-                        elapsed_bounce_time += bounce_time
-                        time.sleep(bounce_time)
-                    if state is None:
-                        state = self.captures  # clears interrupts, re-enabling them!!
-                    capture_bit = 1 if (state & (1 << i)) != 0 else 0
-                    if pull_up is True:
+            now = time.monotonic()
+            serviced = False
+            for port in sorted({pin // 8 for pin in self._clients}):
+                flags = self.i2c.read_from(self.address, INTFA + port)
+                if flags == 0:
+                    continue
+                capture = self.i2c.read_from(self.address, INTCAPA + port)  # clears this port's interrupt
+                pull_ups = self.i2c.read_from(self.address, GPPUA + port)
+                serviced = True
+                for bit in range(8):
+                    if flags & (1 << bit) == 0:
+                        continue
+                    pin = (port * 8) + bit
+                    client = self._clients.get(pin, None)
+                    if client is None:
+                        continue
+                    bounce_time = getattr(client, "bounce_time", None)
+                    bounce_time = DEFAULT_BOUNCE_TIME if bounce_time is None else bounce_time
+                    elapsed = now - self._last_edge.get(pin, 0.0)
+                    if elapsed < bounce_time:
+                        # still bouncing; look again once the pin has had time to settle
+                        self._schedule_recheck(pin, bounce_time - elapsed)
+                        continue
+                    self._last_edge[pin] = now
+                    capture_bit = (capture >> bit) & 1
+                    if pull_ups & (1 << bit):
                         active = capture_bit == 1
                     else:
                         active = capture_bit == 0
@@ -510,11 +521,29 @@ class Mcp23017:
                     # state at interrupt time if we are to consider it a new event
                     if active == client.is_active:
                         client._signal_event(active)
-            if state is None:
+            if serviced is False:
                 # make sure interrupts are always reset, either because
                 # we processed them above or here
                 self._clear_interrupts()
 
+    def _schedule_recheck(self, pin: int, delay: float) -> None:
+        if pin in self._rechecks:
+            return
+        timer = threading.Timer(delay, self._recheck_pin, args=(pin,))
+        timer.daemon = True
+        self._rechecks[pin] = timer
+        timer.start()
+
+    # noinspection PyProtectedMember
+    def _recheck_pin(self, pin: int) -> None:
+        with self._lock:
+            self._rechecks.pop(pin, None)
+            client = self._clients.get(pin, None)
+            if client is None:
+                return
+            self._last_edge[pin] = time.monotonic()
+            client._signal_event(client.is_active)
+
     def create_interrupt_handler(self, pin, interrupt_pin) -> None:
         if 0 <= pin <= 15:
             with self._lock:
@@ -527,6 +556,9 @@ class Mcp23017:
 
     def close(self) -> None:
         with self._lock:
+            for timer in self._rechecks.values():
+                timer.cancel()
+            self._rechecks.clear()
             if self._int_btn is not None:
                 self._int_btn.close()
                 self._int_btn = None
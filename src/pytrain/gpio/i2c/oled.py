@@ -8,19 +8,26 @@
 #
 
 import atexit
+import logging
+import math
+import time
+from abc import ABCMeta, abstractmethod
 from enum import unique
 from pathlib import Path
-from threading import Event, Thread
+from threading import Condition, RLock, Thread
 
 from luma.core.interface.serial import i2c, spi
 from luma.core.virtual import hotspot
 from luma.oled.device import sh1107, ssd1306, ssd1309, ssd1322, ssd1325, ssd1362
 from PIL import Image, ImageDraw, ImageFont
 
-from ...protocol.constants import Mixins
+from ...protocol.constants import PROGRAM_NAME, Mixins
+from ..utils.glyph_cache import GlyphCache
 from ..utils.sh1122 import sh1122
 from ..utils.text_buffer import TextBuffer
 
+log = logging.getLogger(__name__)
+
 
 # noinspection PyTypeHints
 def make_font(name: str, size: int) -> ImageFont:
@@ -56,6 +63,7 @@ class Oled(Thread, TextBuffer):
         auto_update: bool = True,
         spi_speed: int = 4000000,
         scroll_rate: float = 0.03,
+        blink_rate: float = 1.0,
     ) -> None:
         super().__init__()
         if address:
@@ -76,6 +84,7 @@ class Oled(Thread, TextBuffer):
             spi_dev.max_speed_hz = spi_speed
 
         self._scroll_rate = scroll_rate if scroll_rate and scroll_rate > 0 else 0.03
+        self._blink_rate = blink_rate if blink_rate and blink_rate > 0 else 1.0
 
         # set contrast to maximum
         self._device.contrast(255)
@@ -96,6 +105,9 @@ class Oled(Thread, TextBuffer):
         else:
             self._font = make_font(font_family, font_size)
         self._font_family = self.font.font.family
+        self._glyphs = GlyphCache(self._font, self._row_height, self._device.mode)
+        # devices that can take a band of rows only transmit what changed
+        self._supports_rows = hasattr(self._device, "display_rows")
         self._cols = self._calculate_num_columns()
         self._x_offset = x_offset
         self._temp_draw = ImageDraw.Draw(Image.new(self._device.mode, self._device.size, "black"))
@@ -141,6 +153,10 @@ class Oled(Thread, TextBuffer):
     def font(self):
         return self._font
 
+    @property
+    def glyphs(self) -> GlyphCache:
+        return self._glyphs
+
     @property
     def font_size(self) -> int:
         return self._font_size
@@ -151,6 +167,7 @@ class Oled(Thread, TextBuffer):
         self._font = make_font(self.font_family, font_size)
         rows = int(self._device.height / font_size)
         self._row_height = int(self._device.height / rows)
+        self._glyphs = GlyphCache(self._font, self._row_height, self._device.mode)
         self._clear_image()
         self.update_display(clear=False, selective=False)
 
@@ -162,6 +179,7 @@ class Oled(Thread, TextBuffer):
     def font_family(self, font_family: str) -> None:
         self._font = make_font(font_family, self.font_size)
         self._font_family = self.font.font.family
+        self._glyphs = GlyphCache(self._font, self._row_height, self._device.mode)
         self._clear_image()
         self.update_display(clear=False, selective=False)
 
@@ -221,8 +239,28 @@ class Oled(Thread, TextBuffer):
         left, top, right, bottom = self._canvas.textbbox((0, 0), text, font=self._font)
         return int(right - left), int(bottom - top)
 
-    def display(self, image: Image) -> None:
-        self._device.display(image)
+    def display(self, image: Image, rows: tuple[int, int] | None = None) -> None:
+        """
+        Send image to the device; rows, if given, is the [top, bottom) band of
+        pixel rows that changed, and is all that is transmitted when the device
+        supports it.
+        """
+        if rows is not None and self._supports_rows:
+            self._device.display_rows(image, rows[0], rows[1])
+        else:
+            self._device.display(image)
+
+    def row_band(self, row: int) -> tuple[int, int]:
+        return row * self._row_height, (row + 1) * self._row_height
+
+    def paste_text(self, image: Image, row: int, text: str | None, x: int = None) -> None:
+        """
+        Blank the given text row of image and, if text is given, paste its cached strip at x.
+        """
+        top, bottom = self.row_band(row)
+        image.paste("black", (0, top, image.width, bottom))
+        if text:
+            image.paste(self._glyphs.strip(text), (self._x_offset if x is None else x, top))
 
     def stop(self):
         with self.synchronizer:
@@ -267,28 +305,31 @@ class Oled(Thread, TextBuffer):
             if clear is True and selective is False:
                 self._image = Image.new(self._device.mode, self._device.size, "black")
                 self._canvas = ImageDraw.Draw(self._image)
-            fs = self.row_height
             if selective:
                 rows = self.changed_rows
             else:
+                _ = self.changed_rows  # a full redraw supersedes any pending row changes
                 rows = range(self.rows)
             for i in rows:
-                if clear is True and selective is True:
-                    self._canvas.rectangle((0, (i * fs), self._device.width - 1, ((i + 1) * fs) - 1), "black")
                 if i < len(self):
                     if i in self._hotspots:
                         self._hotspots[i].stop()
                         del self._hotspots[i]
-                    w, h = self.measure_text(self[i])
+                    w = self._glyphs.width(self[i])
                     if w <= self._device.width:
                         if i in self._blinks:
-                            self._hotspots[i] = BlinkingHotspot(self, row=i)
+                            self._hotspots[i] = BlinkingHotspot(self, row=i, rate=self._blink_rate)
                         else:
-                            self._canvas.text((self._x_offset, (i * fs) - 3), self[i], "white", self._font)
+                            self.paste_text(self._image, i, self[i])
                     else:
                         self._hotspots[i] = ScrollingHotspot(self, self[i], row=i, rate=self._scroll_rate)
-            # Display the constructed image on the display
-            self._device.display(self._image)
+                elif clear is True:
+                    self.paste_text(self._image, i, None)
+            # Display the constructed image on the display, sending only the changed rows
+            if selective and rows:
+                self.display(self._image, (self.row_band(rows[0])[0], self.row_band(rows[-1])[1]))
+            elif selective is False:
+                self.display(self._image)
 
     def refresh_display(self) -> None:
         with self.synchronizer:
@@ -304,6 +345,25 @@ class Oled(Thread, TextBuffer):
             self.update_display(clear=True, selective=False)
             self._device.display(self._image)
 
+    def animate(self, hotspots: list["AnimatedHotspot"], now: float) -> bool:
+        """
+        Advance the given hotspots and send the rows that changed to the display
+        in one update; returns False if nothing changed and the frame was skipped.
+        """
+        with self.synchronizer:
+            top = bottom = None
+            for hs in hotspots:
+                # a hotspot stopped while the ticker was waiting for the lock is left alone
+                if hs.is_running and hs.advance(now):
+                    hs.render(self._image)
+                    band_top, band_bottom = hs.band
+                    top = band_top if top is None else min(top, band_top)
+                    bottom = band_bottom if bottom is None else max(bottom, band_bottom)
+            if top is None:
+                return False
+            self.display(self._image, (top, bottom))
+            return True
+
     def _clear_image(self) -> None:
         self._canvas.rectangle((0, 0, self._device.width, self._device.height), "black")
 
@@ -313,138 +373,220 @@ class Oled(Thread, TextBuffer):
         return int(self.width / (w / len(sample)))
 
 
-class ScrollingHotspot(Thread, hotspot):
+FRAME_SLACK: float = 0.002  # seconds; hotspots due this close together share a frame
+
+
+class AnimationTicker(Thread):
     """
-    Support Scrolling Text
+    Drives every scrolling and blinking hotspot in the process from one thread.
+    Each hotspot is advanced on its own schedule, and the hotspots of a display
+    that are due on the same tick are composited into that display's image and
+    sent to it in a single pass. The thread sleeps until the next hotspot is
+    due, or indefinitely when there are none, so CPU use follows what is
+    actually moving on the displays rather than the number of hotspots.
     """
 
-    def __init__(self, oled: Oled, text, row: int = 0, rate: float = 0.03):
-        super().__init__()
-        Thread.__init__(self, daemon=True)
-        hotspot.__init__(self, oled.width, oled.font_size)
-        self._device = oled
-        self._x_offset = oled.x_offset
-        # self._font_size = oled.font_size
-        self._row_height = oled.row_height
-        self._font = oled.font
-        self._row = row
-        self._text = text + " " + text
-        self._scroll_speed = 1
-        self._scroll_rate = rate if rate and rate > 0 else 0.03
-        self._text_width, _ = oled.measure_text(text)
-        x, y = oled.measure_text(" ")
-        self._text_width += x
-        self._ev = Event()
-        self._resume_ev = Event()
-        self._pause_request = False
-        self._is_running = True
+    _instance = None
+    _lock = RLock()
+
+    @classmethod
+    def get(cls) -> "AnimationTicker":
+        with cls._lock:
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = AnimationTicker()
+            return cls._instance
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} OLED Animator")
+        self._cv = Condition()
+        self._hotspots: list[AnimatedHotspot] = []
+        self._frames = 0
+        self._skipped = 0
         self.start()
 
-    def stop(self):
-        self._ev.set()
-        self._resume_ev.set()
-        self._is_running = False
-        self.join()
-
-    def render(self, image):
-        draw = ImageDraw.Draw(image)
-        # Clear the hotspot area
-        draw.rectangle(
-            (0, self._row * self._row_height, self.width - 1, ((self._row + 1) * self._row_height) - 1),
-            fill="black",
-        )
-        # Draw the scrolling text
-        draw.text((self._x_offset, (self._row * self._row_height) - 3), self._text, font=self._font, fill="white")
-        # Scroll the text
-        self._x_offset -= self._scroll_speed
-        if self._x_offset + self._text_width < 0:
-            self._x_offset = self._device.x_offset - 3
-        return image
+    @property
+    def frames(self) -> int:
+        """
+        Number of display updates sent
+        """
+        return self._frames
 
-    def pause(self) -> None:
-        if self.is_alive() and self._pause_request is False:
-            self._pause_request = True
+    @property
+    def skipped(self) -> int:
+        """
+        Number of ticks on which nothing visible changed, so nothing was sent
+        """
+        return self._skipped
 
-    def resume(self) -> None:
-        if self.is_alive() and self._pause_request is True:
-            self._pause_request = False
-            self._resume_ev.set()
+    @property
+    def hotspots(self) -> list["AnimatedHotspot"]:
+        with self._cv:
+            return list(self._hotspots)
+
+    def add(self, hs: "AnimatedHotspot") -> None:
+        with self._cv:
+            if hs not in self._hotspots:
+                self._hotspots.append(hs)
+            self._cv.notify()
+
+    def remove(self, hs: "AnimatedHotspot") -> None:
+        with self._cv:
+            if hs in self._hotspots:
+                self._hotspots.remove(hs)
+            self._cv.notify()
+
+    def wake(self) -> None:
+        with self._cv:
+            self._cv.notify()
 
     def run(self) -> None:
-        while self._is_running and self._ev.is_set() is False:
-            with self._device.synchronizer:
-                self._device.display(self.render(self._device.image))
-            self._ev.wait(self._scroll_rate)
-            if self._pause_request:
-                self._resume_ev.wait()
-                self._resume_ev.clear()
+        while True:
+            with self._cv:
+                now = time.monotonic()
+                active = [hs for hs in self._hotspots if not hs.is_paused]
+                due = min((hs.next_due for hs in active), default=None)
+                if due is None or due > now:
+                    self._cv.wait(None if due is None else due - now)
+                    continue
+                # anything due within the same frame is drawn in this pass
+                ready: dict[Oled, list[AnimatedHotspot]] = {}
+                for hs in active:
+                    if hs.next_due <= now + FRAME_SLACK:
+                        ready.setdefault(hs.oled, []).append(hs)
+            # render outside our lock; each display is updated under its own
+            for oled, hotspots in ready.items():
+                try:
+                    sent = oled.animate(hotspots, now)
+                except Exception as e:
+                    # as when each hotspot ran its own thread, a failure stops the hotspots
+                    # involved, not the animation of every other display
+                    log.exception(f"Error animating {len(hotspots)} hotspot(s); stopping them", exc_info=e)
+                    for hs in hotspots:
+                        hs.stop()
+                    continue
+                if sent:
+                    self._frames += 1
+                else:
+                    self._skipped += 1
 
 
-class BlinkingHotspot(Thread, hotspot):
+class AnimatedHotspot(hotspot, metaclass=ABCMeta):
     """
-    Support Blinking Text
+    A row of an Oled that changes over time; advanced by the AnimationTicker.
+    Subclasses draw the current frame in render()
     """
 
-    def __init__(self, oled: Oled, row: int = 0, rate: int = 1):
-        super().__init__()
-        Thread.__init__(self, daemon=True)
-        hotspot.__init__(self, oled.width, oled.font_size)
+    def __init__(self, oled: Oled, row: int, rate: float) -> None:
+        super().__init__(oled.width, oled.font_size)
         self._device = oled
         self._x_offset = oled.x_offset
-        # self._font_size = oled.font_size
         self._row_height = oled.row_height
         self._font = oled.font
         self._row = row
-        self._text = oled[row]
-        self._text_width, _ = oled.measure_text(self._text)
-        self._ev = Event()
-        self._resume_ev = Event()
-        self._pause_request = False
+        self._rate = rate
+        self._band = oled.row_band(row)
+        self._next_due = self._frame_time()
+        self._paused = False
         self._is_running = True
-        self._rate = rate if rate and rate > 0 else 1
-        self._display_cycle = True
-        self.start()
+        self._ticker = AnimationTicker.get()
+        self._ticker.add(self)
 
-    def stop(self):
-        self._ev.set()
-        self._resume_ev.set()
+    @property
+    def oled(self) -> Oled:
+        return self._device
+
+    @property
+    def band(self) -> tuple[int, int]:
+        return self._band
+
+    @property
+    def next_due(self) -> float:
+        return self._next_due
+
+    @property
+    def is_running(self) -> bool:
+        return self._is_running
+
+    @property
+    def is_paused(self) -> bool:
+        return self._paused
+
+    def is_alive(self) -> bool:
+        return self._is_running
+
+    def advance(self, now: float) -> bool:
+        """
+        Move to the next frame; returns True if the hotspot needs to be redrawn
+        """
+        self._next_due += self._rate
+        if self._next_due <= now:
+            self._next_due = self._frame_time(now + self._rate)
+        return True
+
+    def _frame_time(self, t: float = None) -> float:
+        # snap to the common frame clock, so hotspots with the same rate come due together
+        t = time.monotonic() if t is None else t
+        return math.ceil(t / self._rate) * self._rate
+
+    def stop(self) -> None:
         self._is_running = False
-        self.join()
+        self._ticker.remove(self)
 
     def pause(self) -> None:
-        if self.is_alive() and self._pause_request is False:
-            self._pause_request = True
+        self._paused = True
 
     def resume(self) -> None:
-        if self.is_alive() and self._pause_request is True:
-            self._pause_request = False
-            self._resume_ev.set()
+        if self._paused:
+            self._paused = False
+            self._next_due = self._frame_time()
+            self._ticker.wake()
+
+    @abstractmethod
+    def render(self, image): ...
 
-    def run(self) -> None:
-        while self._is_running and self._ev.is_set() is False:
-            with self._device.synchronizer:
-                self._device.display(self.render(self._device.image))
-            self._ev.wait(self._rate)
-            if not self._ev.is_set():
-                self._display_cycle = not self._display_cycle
-            if self._pause_request:
-                self._resume_ev.wait()
-                self._resume_ev.clear()
+
+class ScrollingHotspot(AnimatedHotspot):
+    """
+    Support Scrolling Text
+    """
+
+    def __init__(self, oled: Oled, text, row: int = 0, rate: float = 0.03):
+        self._text = text + " " + text
+        self._scroll_speed = 1
+        self._text_width = oled.glyphs.width(text) + oled.glyphs.width(" ")
+        super().__init__(oled, row, rate if rate and rate > 0 else 0.03)
 
     def render(self, image):
-        draw = ImageDraw.Draw(image)
-        if not self._display_cycle:
-            # Clear the hotspot area
-            draw.rectangle(
-                (0, self._row * self._row_height, self.width - 1, ((self._row + 1) * self._row_height) - 1),
-                fill="black",
-            )
-        else:
-            # Draw the text
-            draw.text(
-                (self._x_offset, (self._row * self._row_height) - 3),
-                self._text,
-                font=self._font,
-                fill="white",
-            )
+        # Clear the hotspot area and paste the pre-rendered text at the current offset
+        self._device.paste_text(image, self._row, self._text, self._x_offset)
+        # Scroll the text
+        self._x_offset -= self._scroll_speed
+        if self._x_offset + self._text_width < 0:
+            self._x_offset = self._device.x_offset - 3
+        return image
+
+
+class BlinkingHotspot(AnimatedHotspot):
+    """
+    Support Blinking Text
+    """
+
+    def __init__(self, oled: Oled, row: int = 0, rate: float = 1):
+        self._text = oled[row]
+        self._text_width = oled.glyphs.width(self._text)
+        self._display_cycle = True
+        self._drawn = None
+        super().__init__(oled, row, rate if rate and rate > 0 else 1)
+
+    def advance(self, now: float) -> bool:
+        if self._drawn is not None:
+            self._display_cycle = not self._display_cycle
+        super().advance(now)
+        # only redraw if the row's appearance actually changes
+        return self._drawn != self._display_cycle
+
+    def render(self, image):
+        # alternate between the cached text strip and a blank row
+        self._device.paste_text(image, self._row, self._text if self._display_cycle else None)
+        self._drawn = self._display_cycle
         return image
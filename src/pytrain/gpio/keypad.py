@@ -21,6 +21,8 @@ DEFAULT_4X4_KEYS = (
     ("*", "0", "#", "D"),
 )
 
+DEFAULT_KEY_DEBOUNCE: float = 0.02  # seconds; ignore column edges this soon after a release
+
 TELEPHONE_4X3_KEYS = (
     ("1", "2", "3"),
     ("4", "5", "6"),
@@ -41,7 +43,14 @@ class Keypad(EventsMixin, CompositeDevice):
         eol_key: str = "#",
         pin_factory=None,
         key_queue: KeyQueue = None,
+        interrupt: bool = False,
     ):
+        """
+        By default, the matrix is scanned continuously from a background thread.
+        When interrupt is True, all rows are held high and the scan thread sleeps
+        until a column edge wakes it; only the column that changed is then
+        resolved to a row, and release is detected from the falling edge.
+        """
         if keys is None or len(keys) == 0:
             raise ValueError("Must specify at least one row of keys")
         if len(row_pins) != len(keys):
@@ -52,6 +61,12 @@ class Keypad(EventsMixin, CompositeDevice):
                 f"Number of column pins must match the number of keys ({len(column_pins)} != {len(keys[0])})"
             )
 
+        self._interrupt = interrupt is True
+        self._wake = Event()
+        self._debounce = bounce_time if bounce_time is not None else DEFAULT_KEY_DEBOUNCE
+        self._released_at = 0.0
+        self._keypress = self._last_keypress = None
+
         devices = []
         self._rows = []
         for pin in row_pins:
@@ -83,7 +98,10 @@ class Keypad(EventsMixin, CompositeDevice):
             def fire_both_events(ticks, state):
                 # noinspection PyProtectedMember
                 device._fire_events(ticks, device._state_to_value(state))
-                self._fire_events(ticks, self.is_active)
+                if self._interrupt:
+                    self._wake.set()
+                else:
+                    self._fire_events(ticks, self.is_active)
 
             return fire_both_events
 
@@ -93,7 +111,6 @@ class Keypad(EventsMixin, CompositeDevice):
 
         self._when_changed = None
         self._last_value = None
-        self._keypress = self._last_keypress = None
         self._keys = keys
         if key_queue is None:
             self._key_queue = KeyQueue(clear_key=clear_key, digit_key=digit_key, eol_key=eol_key)
@@ -106,8 +123,8 @@ class Keypad(EventsMixin, CompositeDevice):
         # Call _fire_events once to set initial state of events
         self._fire_events(self.pin_factory.ticks(), self.is_active)
 
-        # create the background thread to continually scan the matrix
-        self._scan_thread = GPIOThread(self._scan_keyboard)
+        # create the background thread to scan the matrix, either continually or on demand
+        self._scan_thread = GPIOThread(self._scan_on_interrupt if self._interrupt else self._scan_keyboard)
         self._scan_thread.daemon = True
         self._is_running = True
         self._scan_thread.start()
@@ -118,6 +135,7 @@ class Keypad(EventsMixin, CompositeDevice):
 
     def close(self) -> None:
         self._is_running = False
+        self._wake.set()
         self._reset_pin_states()
         super().close()
         if self._key_queue:
@@ -137,6 +155,18 @@ class Keypad(EventsMixin, CompositeDevice):
     def key_queue(self) -> KeyQueue:
         return self._key_queue
 
+    @property
+    def is_interrupt_driven(self) -> bool:
+        return self._interrupt
+
+    @property
+    def is_active(self) -> bool:
+        # in interrupt mode, the rows are held high, so the composite value
+        # no longer reflects whether a key is down
+        if self._interrupt:
+            return self._keypress is not None
+        return super().is_active
+
     """
     The following methods expose behavior of KeyQueue and are
     repeated here for convenience
@@ -216,6 +246,60 @@ class Keypad(EventsMixin, CompositeDevice):
             if self._keypress is None:
                 time.sleep(0.05)  # give CPU a break
 
+    def _drive_rows(self, active: bool) -> None:
+        for r in self._rows:
+            if r.closed is False:
+                r.value = active
+
+    def _find_row(self, column: Button) -> int | None:
+        """
+        With all rows low, raise one row at a time until the given column follows it.
+        """
+        self._drive_rows(False)
+        try:
+            for r, row in enumerate(self._rows):
+                row.on()
+                try:
+                    if column.is_active:
+                        return r
+                finally:
+                    row.off()
+            return None
+        finally:
+            self._drive_rows(True)
+
+    def _scan_on_interrupt(self) -> None:
+        """
+        Interrupt-driven counterpart of _scan_keyboard. The thread blocks until a
+        column edge sets _wake, then identifies the key using only the column that
+        went active. Edges that arrive within the debounce window of the previous
+        release are treated as contact bounce and ignored.
+        """
+        self._drive_rows(True)
+        while self._is_running:
+            self._wake.wait()
+            self._wake.clear()
+            if not self._is_running:
+                break
+            if time.monotonic() - self._released_at < self._debounce:
+                continue
+            col = next((c for c, dev in enumerate(self._cols) if dev.is_active), None)
+            if col is None:
+                continue
+            column = self._cols[col]
+            row = self._find_row(column)
+            if row is None:
+                continue
+            self._keypress = self._last_keypress = self._keys[row][col]
+            self._fire_events(self.pin_factory.ticks(), True)
+            # block until the falling edge; the timeout only guards against a missed edge
+            while self._is_running and column.is_active:
+                self._wake.wait(0.5)
+                self._wake.clear()
+            self._released_at = time.monotonic()
+            self._keypress = None
+            self._fire_events(self.pin_factory.ticks(), False)
+
 
 Keypad.is_pressed = Keypad.is_active
 Keypad.pressed_time = Keypad.active_time
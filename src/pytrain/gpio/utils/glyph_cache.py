@@ -0,0 +1,100 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from collections import OrderedDict
+from threading import RLock
+
+from PIL import Image, ImageDraw, ImageFont
+
+DEFAULT_GLYPH_CACHE_SIZE = 128
+
+
+class GlyphCache:
+    """
+    Caches one-row-high text strips rendered in a given font, so redrawing a row,
+    scrolling it or blinking it becomes an Image.paste rather than a fresh
+    text layout and rasterization. Strips are rendered white on black, with the
+    text drawn y_offset pixels from the top of the strip, and the cache is
+    bounded with least-recently-used eviction.
+    """
+
+    def __init__(
+        self,
+        font: ImageFont,
+        row_height: int,
+        mode: str = "RGB",
+        y_offset: int = -3,
+        max_entries: int = DEFAULT_GLYPH_CACHE_SIZE,
+    ) -> None:
+        self._font = font
+        self._row_height = row_height
+        self._mode = mode
+        self._y_offset = y_offset
+        self._max_entries = max(1, max_entries)
+        self._strips: OrderedDict[str, Image.Image] = OrderedDict()
+        self._extents: dict[str, tuple[int, int]] = dict()
+        self._measure = ImageDraw.Draw(Image.new(mode, (1, 1)))
+        self._lock = RLock()
+        self._hits = self._misses = 0
+
+    @property
+    def font(self) -> ImageFont:
+        return self._font
+
+    @property
+    def row_height(self) -> int:
+        return self._row_height
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._strips)
+
+    def _extent(self, text: str) -> tuple[int, int]:
+        with self._lock:
+            extent = self._extents.get(text, None)
+            if extent is None:
+                if len(self._extents) >= 4 * self._max_entries:
+                    self._extents.clear()
+                left, _, right, _ = self._measure.textbbox((0, 0), text, font=self._font)
+                extent = self._extents[text] = (int(left), int(right))
+            return extent
+
+    def width(self, text: str) -> int:
+        left, right = self._extent(text)
+        return right - left
+
+    def strip(self, text: str) -> Image.Image:
+        """
+        Returns the rendered strip for text; callers must treat it as read-only.
+        """
+        with self._lock:
+            img = self._strips.get(text, None)
+            if img is not None:
+                self._strips.move_to_end(text)
+                self._hits += 1
+                return img
+            self._misses += 1
+            _, right = self._extent(text)
+            img = Image.new(self._mode, (max(1, right), self._row_height), "black")
+            ImageDraw.Draw(img).text((0, self._y_offset), text, "white", self._font)
+            self._strips[text] = img
+            if len(self._strips) > self._max_entries:
+                self._strips.popitem(last=False)
+            return img
+
+    def clear(self) -> None:
+        with self._lock:
+            self._strips.clear()
+            self._extents.clear()
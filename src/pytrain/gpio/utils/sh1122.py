@@ -6,7 +6,31 @@ import luma.oled.const as const
 from luma.core.framebuffer import full_frame
 from luma.oled.device.greyscale import greyscale_device
 
-__all__ = ["sh1122"]
+__all__ = ["sh1122", "pack_greyscale"]
+
+# maps an 8-bit luma value to its 4-bit greyscale level
+_TO_NIBBLE = [v >> 4 for v in range(256)]
+# moves a 4-bit level into the high nibble of a byte
+_HIGH_NIBBLE = bytes(((v << 4) & 0xFF) for v in range(256))
+
+
+def pack_greyscale(image, nibble_order: int = 0) -> bytearray:
+    """
+    Converts an image to the controller's 4-bit-per-pixel layout, two pixels per
+    byte, using whole-buffer operations rather than a per-pixel Python loop.
+    Equivalent to luma's greyscale_device._render_greyscale (modulo rounding of
+    the RGB -> luma conversion).
+    """
+    if image.mode != "L":
+        image = image.convert("L")
+    levels = image.point(_TO_NIBBLE).tobytes()
+    even, odd = levels[0::2], levels[1::2]
+    hi, lo = (even, odd) if nibble_order == 0 else (odd, even)
+    if len(lo) < len(hi):
+        lo += b"\x00"
+    hi = hi.translate(_HIGH_NIBBLE)
+    packed = int.from_bytes(hi, "big") | int.from_bytes(lo, "big")
+    return bytearray(packed.to_bytes(len(hi), "big"))
 
 
 # noinspection PyPep8Naming
@@ -83,32 +107,37 @@ class sh1122(greyscale_device):
             self.command(cmd)
 
     def _set_position(self, top, right, bottom, left):
-        pass
+        # the SH1122 packs two pixels per column address; we always write whole
+        # rows, so only the starting row needs to be set
+        self.command(self._const.SET_COL_ADR_LSB, self._const.SET_COL_ADR_MSB)
+        self.command(self._const.SET_ROW_ADR, top & 0x3F)
 
     def display(self, image):
         """
         Takes a 1-bit monochrome or 24-bit RGB image and renders it
-        to the greyscale OLED display. RGB pixels are converted to 8-bit
-        greyscale values using a simplified Luma calculation, based on
-        *Y=0.299R+0.587G+0.114B*.
+        to the greyscale OLED display. RGB pixels are converted to 4-bit
+        greyscale values.
         :param image: the image to render
         :type image: PIL.Image.Image
         """
+        self.display_rows(image, 0, self.height)
 
+    def display_rows(self, image, top: int, bottom: int) -> None:
+        """
+        Transmits only the pixel rows in [top, bottom) of the given full-frame image.
+        """
         assert image.mode == self.mode
         assert image.size == self.size
 
+        top = max(0, top)
+        bottom = min(self.height, bottom)
+        if bottom <= top:
+            return
         image = self.preprocess(image)
-
-        for image, bounding_box in self.framebuffer.redraw(image):
-            left, top, right, bottom = bounding_box
-            width = right - left
-            height = bottom - top
-
-            buf = bytearray(width * height >> 1)
-
-            self._populate(buf, image.getdata())
-            self.data(buf)
+        if top > 0 or bottom < self.height:
+            image = image.crop((0, top, self.width, bottom))
+        self._set_position(top, self.width, bottom, 0)
+        self.data(pack_greyscale(image, self._nibble_order))
 
     def cleanup(self):
         self.command(self._const.SET_ENTIRE_OFF)  # to be absolutely sure
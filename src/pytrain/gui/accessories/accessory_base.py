@@ -335,7 +335,7 @@ class AccessoryBase(GuiZeroBase, Generic[S], ABC):
     def on_state_change_action(self, tmcc_id: int) -> Callable:
         def upd():
             if not self._shutdown_flag.is_set():
-                self.queue_message(self.update_button, tmcc_id)
+                self.host.queue_update(self.update_button, tmcc_id)
 
         return upd
 
@@ -405,7 +405,11 @@ class AccessoryBase(GuiZeroBase, Generic[S], ABC):
         self._image = None
         if self.image_file:
             iw, ih = self.get_scaled_jpg_size(self.image_file)
-            self._image = Picture(self.host.app, image=self.image_file, width=iw, height=ih)
+            image = self.image_file
+            if iw and ih and not self.is_animated(self.image_file):
+                # use the shared, pre-scaled image rather than decoding and resizing the original
+                image = self.host.get_image(self.image_file, size=(iw, ih), inverse=False)
+            self._image = Picture(self.host.app, image=image, width=iw, height=ih)
 
         self.host.app.update()
 
@@ -624,6 +628,15 @@ class AccessoryBase(GuiZeroBase, Generic[S], ABC):
             log.exception(f"An error occurred: {e}", exc_info=e)
         return None, None
 
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def is_animated(image_file: str) -> bool:
+        try:
+            with Image.open(image_file) as img:
+                return bool(getattr(img, "is_animated", False))
+        except OSError:
+            return False
+
     # noinspection PyTypeChecker
     def get_scaled_jpg_size(self, image_file: str) -> tuple[int, int]:
         iw, ih = self.get_jpg_size(image_file)
@@ -17,6 +17,7 @@ from guizero.event import EventData
 
 from ..db.accessory_state import AccessoryState
 from ..gui.component_state_gui import ComponentStateGui
+from ..gui.components.hold_button import HoldButton
 from ..gui.state_based_gui import MomentaryActionHandler, StateBasedGui
 from ..pdi.asc2_req import Asc2Req
 from ..pdi.constants import Asc2Action, PdiCommand
@@ -62,18 +63,13 @@ class AccessoriesGui(StateBasedGui):
             y_offset=y_offset,
         )
 
-    def _post_process_state_buttons(self) -> None:
-        for tmcc_id in self._is_momentary:
-            if (tmcc_id, CommandScope.ACC) in self._states:
-                state = self._states[(tmcc_id, CommandScope.ACC)]
-                if state in self._state_buttons:
-                    pb = self._state_buttons[state]
-                    pb.when_left_button_pressed = self.when_pressed
-                    pb.when_left_button_released = self.when_released
-                else:
-                    log.warning(f"No button found for Accessory {tmcc_id}")
-            else:
-                log.warning(f"No state found for Accessory {tmcc_id}")
+    def _bind_state_button(self, pb: HoldButton, pd: AccessoryState) -> None:
+        super()._bind_state_button(pb, pd)
+        # momentary accessories act on press and release; the rest use the button's own handling
+        if pd.address in self._is_momentary:
+            pb.bind_press_handlers(self.when_pressed, self.when_released)
+        else:
+            pb.bind_press_handlers()
 
     def get_target_states(self) -> list[AccessoryState]:
         pds: list[AccessoryState] = []
@@ -14,6 +14,8 @@ from typing import Any, Callable
 
 from guizero import Box
 
+from ..frame_clock import FrameClock, FrameTimer
+
 
 class AnalogGaugeWidget(Box):
     """
@@ -83,7 +85,7 @@ class AnalogGaugeWidget(Box):
         self._inverted = False
 
         # hold state
-        self._hold_after_id: str | None = None
+        self._hold_timer: FrameTimer | None = None
         self._pressed = False
         self._held = False
 
@@ -353,15 +355,12 @@ class AnalogGaugeWidget(Box):
     # Hold scheduling + callbacks
     # ----------------------------
     def _cancel_hold_timer(self) -> None:
-        if self._hold_after_id is not None:
-            try:
-                self.canvas.after_cancel(self._hold_after_id)
-            except tk.TclError:
-                pass
-            self._hold_after_id = None
+        if self._hold_timer is not None:
+            self._hold_timer.cancel()
+            self._hold_timer = None
 
     def _fire_hold(self) -> None:
-        self._hold_after_id = None
+        self._hold_timer = None
         if not self._pressed:
             return
         if self._held:
@@ -394,8 +393,7 @@ class AnalogGaugeWidget(Box):
 
         self._cancel_hold_timer()
         if self.hold_threshold_ms > 0 and callable(self._on_hold):
-            # noinspection PyTypeChecker
-            self._hold_after_id = self.canvas.after(self.hold_threshold_ms, self._fire_hold)
+            self._hold_timer = FrameClock.of(self.canvas).call_later(self.hold_threshold_ms, self._fire_hold)
 
     def _on_release(self, _event) -> None:
         # Always cancel the timer first
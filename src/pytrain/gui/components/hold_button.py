@@ -397,6 +397,19 @@ class HoldButton(PushButton):
         """
         return bool(self._pressed)
 
+    def bind_press_handlers(self, pressed: Callable = None, released: Callable = None) -> None:
+        """Route left-button presses and releases to ``pressed`` and ``released``.
+
+        ``None`` restores the button's own hold handling. A handler that is already
+        bound is left alone, so a recycled button is only re-bound when it changes.
+        """
+        pressed = pressed or self._on_press_event
+        released = released or self._on_release_event
+        if self.when_left_button_pressed != pressed:
+            self.when_left_button_pressed = pressed
+        if self.when_left_button_released != released:
+            self.when_left_button_released = released
+
     def cancel_hold(self, reason: str = "cancel_hold()") -> None:
         """Abandon a hold started by :meth:`begin_hold` before it completes.
 
@@ -12,6 +12,8 @@ from tkinter import TclError, font as tkfont
 
 from guizero import Text
 
+from ..frame_clock import FrameClock, FrameTimer
+
 
 class ScrollingText(Text):
     """
@@ -29,6 +31,8 @@ class ScrollingText(Text):
         _auto_manage_scroll callbacks.
       - needs_scroll() does not call update_idletasks(); if geometry is not
         ready yet, it simply returns False and a later scheduled check will retry.
+      - Ticks and checks run on the window's FrameClock, which holds them while
+        the label is unmapped, so hidden marquees do not wake the Tk loop.
     """
 
     def __init__(
@@ -56,9 +60,9 @@ class ScrollingText(Text):
         self._running = False
         self._pressed = False
 
-        self._tick_after_id: str | None = None
-        self._start_after_id: str | None = None
-        self._manage_after_id: str | None = None
+        self._tick_timer: FrameTimer | None = None
+        self._start_timer: FrameTimer | None = None
+        self._manage_timer: FrameTimer | None = None
 
         self._scroll_buf = ""
         self._font_cache = None
@@ -147,7 +151,7 @@ class ScrollingText(Text):
         delay_ms = max(0, int(delay_ms))
 
         self._running = False
-        self._start_after_id = self._after(delay_ms, self._start_now)
+        self._start_timer = self._after(delay_ms, self._start_now)
 
     def stop_scroll(self, *, reset_to_start: bool = False, cancel_start: bool = True) -> None:
         self._running = False
@@ -164,10 +168,10 @@ class ScrollingText(Text):
 
     def _schedule_start_check(self, delay_ms: int) -> None:
         self._cancel_manage_check()
-        self._manage_after_id = self._after(max(0, int(delay_ms)), self._run_manage_check)
+        self._manage_timer = self._after(max(0, int(delay_ms)), self._run_manage_check)
 
     def _run_manage_check(self) -> None:
-        self._manage_after_id = None
+        self._manage_timer = None
         self._auto_manage_scroll()
 
     def _auto_manage_scroll(self) -> None:
@@ -178,13 +182,13 @@ class ScrollingText(Text):
         if needs_scroll is None:
             self._schedule_start_check(delay_ms=250)
         elif needs_scroll:
-            if not self._running and self._start_after_id is None:
+            if not self._running and self._start_timer is None:
                 self.start_scroll()
         else:
             self.stop_scroll(reset_to_start=True, cancel_start=True)
 
     def _start_now(self) -> None:
-        self._start_after_id = None
+        self._start_timer = None
 
         if self._pressed:
             return
@@ -211,7 +215,7 @@ class ScrollingText(Text):
             delay = self._pause_ms
 
         self._cancel_tick()
-        self._tick_after_id = self._after(delay, self._tick)
+        self._tick_timer = self._after(delay, self._tick)
 
     # -------------------------
     # Internals: touch handling
@@ -245,7 +249,7 @@ class ScrollingText(Text):
             return
 
         if self._touch_mode == "toggle":
-            if self._running or self._start_after_id is not None:
+            if self._running or self._start_timer is not None:
                 self.stop_scroll(reset_to_start=True, cancel_start=True)
                 self._cancel_manage_check()
             else:
@@ -296,38 +300,20 @@ class ScrollingText(Text):
     def _set_label_text(self, s: str) -> None:
         Text.value.fset(self, s)  # type: ignore[union-attr]
 
-    def _after(self, delay_ms: int, fn) -> str | None:
-        try:
-            return self.tk.after(int(delay_ms), fn)
-        except TclError:
-            return None
+    def _after(self, delay_ms: int, fn) -> FrameTimer:
+        return FrameClock.of(self.tk).call_later(int(delay_ms), fn, widget=self.tk)
 
     def _cancel_tick(self) -> None:
-        if self._tick_after_id is None:
-            return
-        try:
-            self.tk.after_cancel(self._tick_after_id)
-        except TclError:
-            pass
-        finally:
-            self._tick_after_id = None
+        if self._tick_timer is not None:
+            self._tick_timer.cancel()
+            self._tick_timer = None
 
     def _cancel_start(self) -> None:
-        if self._start_after_id is None:
-            return
-        try:
-            self.tk.after_cancel(self._start_after_id)
-        except TclError:
-            pass
-        finally:
-            self._start_after_id = None
+        if self._start_timer is not None:
+            self._start_timer.cancel()
+            self._start_timer = None
 
     def _cancel_manage_check(self) -> None:
-        if self._manage_after_id is None:
-            return
-        try:
-            self.tk.after_cancel(self._manage_after_id)
-        except TclError:
-            pass
-        finally:
-            self._manage_after_id = None
+        if self._manage_timer is not None:
+            self._manage_timer.cancel()
+            self._manage_timer = None
@@ -10,6 +10,7 @@
 from __future__ import annotations
 
 import time
+from difflib import SequenceMatcher
 from tkinter import TclError
 from typing import Any, Callable, Optional
 
@@ -61,6 +62,9 @@ class TouchListBox(ListBox):
         self._start_yview: float = 0.0
         self._hold_fired: bool = False
 
+        # Row backgrounds set by sync(), so restyling only touches rows that change
+        self._row_backgrounds: list[str | None] = []
+
         # Resolve the inner Tk Listbox (the widget that actually receives events)
         self._lb = self._resolve_inner_listbox()
         if self._lb is None:
@@ -209,6 +213,49 @@ class TouchListBox(ListBox):
         except (TclError, TypeError, ValueError):
             pass
 
+    def sync(self, items: list[str], backgrounds: list[str | None] | None = None) -> int:
+        """
+        Make the list show ``items``, with the given per-row background colors
+        (``None`` for the list's own), by inserting, deleting and restyling only
+        the rows that differ from what is shown now. Returns the number of rows
+        touched.
+        """
+        backgrounds = list(backgrounds) if backgrounds is not None else [None] * len(items)
+        try:
+            shown = list(self._lb.get(0, "end"))
+        except TclError:
+            return 0
+        styles = self._row_backgrounds
+        if len(styles) != len(shown):
+            # rows were added some other way; restyle them all
+            styles = [""] * len(shown)
+        touched = 0
+        try:
+            if shown != items:
+                ops = SequenceMatcher(None, shown, items, autojunk=False).get_opcodes()
+                # apply from the bottom up, so earlier indices stay valid
+                for tag, i1, i2, j1, j2 in reversed(ops):
+                    if tag == "equal":
+                        continue
+                    if i2 > i1:
+                        self._lb.delete(i1, i2 - 1)
+                        del styles[i1:i2]
+                    if j2 > j1:
+                        self._lb.insert(i1, *items[j1:j2])
+                        styles[i1:i1] = [None] * (j2 - j1)
+                    touched += max(i2 - i1, j2 - j1)
+            default_bg = None
+            for idx, (have, want) in enumerate(zip(styles, backgrounds)):
+                if have != want:
+                    if want is None and default_bg is None:
+                        default_bg = self._lb.cget("background")
+                    self._lb.itemconfig(idx, background=want or default_bg)
+                    touched += 1
+        except TclError:
+            pass
+        self._row_backgrounds = backgrounds
+        return touched
+
     # ---------- Internal helpers ----------
 
     def _dbg(self, msg: str) -> None:
@@ -0,0 +1,169 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Sequence, TypeVar
+
+W = TypeVar("W")
+
+
+class GridWindow:
+    """
+    The visible part of a grid of count items laid out in columns of
+    rows_per_col, first column first, of which visible_cols columns are
+    shown at a time starting at first_col
+    """
+
+    __slots__ = ("_rows", "_visible_cols", "_count", "_first_col")
+
+    def __init__(self, rows_per_col: int, visible_cols: int, count: int, first_col: int = 0) -> None:
+        self._rows = max(1, rows_per_col)
+        self._visible_cols = max(1, visible_cols)
+        self._count = max(0, count)
+        self._first_col = 0
+        self.first_col = first_col
+
+    @property
+    def rows_per_col(self) -> int:
+        return self._rows
+
+    @property
+    def visible_cols(self) -> int:
+        return self._visible_cols
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def cols(self) -> int:
+        return -(-self._count // self._rows)
+
+    @property
+    def max_first_col(self) -> int:
+        return max(0, self.cols - self._visible_cols)
+
+    @property
+    def first_col(self) -> int:
+        return self._first_col
+
+    @first_col.setter
+    def first_col(self, value: int) -> None:
+        self._first_col = max(0, min(value, self.max_first_col))
+
+    @property
+    def start(self) -> int:
+        """
+        Index of the first visible item
+        """
+        return min(self._count, self._first_col * self._rows)
+
+    @property
+    def stop(self) -> int:
+        """
+        Index just past the last visible item
+        """
+        return min(self._count, (self._first_col + self._visible_cols) * self._rows)
+
+    @property
+    def has_left(self) -> bool:
+        return self._first_col > 0
+
+    @property
+    def has_right(self) -> bool:
+        return self._first_col < self.max_first_col
+
+    def slot_position(self, slot: int) -> tuple[int, int]:
+        """
+        The (column, row) of the slot'th visible item, relative to the window
+        """
+        return slot // self._rows, slot % self._rows
+
+    def scroll(self, cols: int) -> bool:
+        """
+        Move the window cols columns to the right (left if negative); returns True if it moved
+        """
+        first_col = self._first_col
+        self.first_col = first_col + cols
+        return self._first_col != first_col
+
+
+class WidgetPool(Generic[W]):
+    """
+    The widgets of a virtualized container, one per visible slot. Widgets
+    are created the first time their slot is needed and are afterward bound
+    to whatever item the slot shows, so scrolling or re-sorting rebinds
+    widgets rather than destroying and recreating them. Widgets left over
+    when fewer slots are needed are hidden, not destroyed, and serve as the
+    buffer for the next render.
+    """
+
+    def __init__(
+        self,
+        create: Callable[[int], W],
+        bind: Callable[[W, Any, int], None],
+        hide: Callable[[W], None] = None,
+        show: Callable[[W], None] = None,
+    ) -> None:
+        self._create = create
+        self._bind = bind
+        self._hide = hide
+        self._show = show
+        self._widgets: list[W] = []
+        self._shown = 0
+        self._created = 0
+
+    def __len__(self) -> int:
+        return len(self._widgets)
+
+    @property
+    def created(self) -> int:
+        """
+        Number of widgets created over the life of the pool
+        """
+        return self._created
+
+    @property
+    def widgets(self) -> list[W]:
+        """
+        The widgets showing items, in slot order
+        """
+        return self._widgets[: self._shown]
+
+    def render(self, items: Sequence[Any]) -> list[W]:
+        """
+        Show items, one per slot, and return the widgets showing them
+        """
+        widgets = self._widgets
+        for slot, item in enumerate(items):
+            if slot < len(widgets):
+                widget = widgets[slot]
+                if slot >= self._shown and self._show:
+                    self._show(widget)
+            else:
+                widget = self._create(slot)
+                widgets.append(widget)
+                self._created += 1
+            self._bind(widget, item, slot)
+        if self._hide:
+            for widget in widgets[len(items) : self._shown]:
+                self._hide(widget)
+        self._shown = len(items)
+        return widgets[: self._shown]
+
+    def clear(self, destroy: Callable[[W], None] = None) -> None:
+        """
+        Drop every widget, passing each to destroy if given
+        """
+        if destroy:
+            for widget in self._widgets:
+                destroy(widget)
+        self._widgets.clear()
+        self._shown = 0
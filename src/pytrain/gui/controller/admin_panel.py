@@ -313,7 +313,7 @@ class AdminPanel(OverlayPanel):
         self._gui.add_hover_action(pb)
 
         # set up sync watcher to manage button state
-        self._sync_watcher = StateWatcher(self._gui.sync_state, self._on_sync_state)
+        self._sync_watcher = StateWatcher(self._gui.sync_state, lambda: self._gui.queue_update(self._on_sync_state))
 
         # Reload/Reset
         row += 1
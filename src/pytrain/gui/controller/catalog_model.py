@@ -0,0 +1,235 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Callable, Iterable
+
+from ...db.accessory_state import AccessoryState
+from ...db.component_state import ComponentState, RouteState, SwitchState
+from ...protocol.constants import CommandScope
+
+SORT_BY_NAME = 0
+SORT_BY_ROAD_NUMBER = 1
+SORT_BY_TMCC_ID = 2
+SORT_ORDERS = (SORT_BY_NAME, SORT_BY_ROAD_NUMBER, SORT_BY_TMCC_ID)
+
+TWO_DIGIT_SCOPES = {CommandScope.ACC, CommandScope.SWITCH, CommandScope.ROUTE}
+
+
+def categories(scope: CommandScope, state: ComponentState) -> int:
+    """
+    Bit mask of the "Show" buttons (bits 0, 1 and 2) that, when selected, include state in the catalog
+    """
+    if scope == CommandScope.ACC:
+        # button 0 selects configured accessories, which aren't states
+        return 0b010 if state.is_lcs else 0b100
+    elif scope == CommandScope.SWITCH:
+        return bool(state.is_thru) | bool(state.is_out) << 1 | bool(state.is_unknown) << 2
+    elif scope == CommandScope.ROUTE:
+        return bool(state.is_active) | bool(state.is_not_active) << 1 | bool(state.is_unknown) << 2
+    elif state.is_diesel:
+        return 0b001
+    return 0b010 if state.is_steam else 0b100
+
+
+def selection_mask(selected: Iterable[int]) -> int:
+    mask = 0
+    for i in selected:
+        mask |= 1 << i
+    return mask
+
+
+def _no_highlight(_state: ComponentState) -> bool:
+    return False
+
+
+def _acc_highlight(state: AccessoryState) -> bool:
+    return bool((state.is_bpc2 and state.is_aux_on) or (state.is_asc2 and state.is_aux2_on))
+
+
+def _switch_highlight(state: SwitchState) -> bool:
+    return bool(state.is_thru)
+
+
+def _route_highlight(state: RouteState) -> bool:
+    return bool(state.is_aligned)
+
+
+_HIGHLIGHTERS: dict[type, Callable[[ComponentState], bool]] = {}
+
+
+def is_highlighted(state: ComponentState) -> bool:
+    """
+    True if the state's catalog entry is shown in green
+    """
+    func = _HIGHLIGHTERS.get(type(state), None)
+    if func is None:
+        if isinstance(state, AccessoryState):
+            func = _acc_highlight
+        elif isinstance(state, SwitchState):
+            func = _switch_highlight
+        elif isinstance(state, RouteState):
+            func = _route_highlight
+        else:
+            func = _no_highlight
+        _HIGHLIGHTERS[type(state)] = func
+    return func(state)
+
+
+class CatalogRow:
+    __slots__ = ("state", "stamp", "signature", "entries", "keys", "categories", "highlighted")
+
+    def __init__(self, scope: CommandScope, state: ComponentState, stamp: float | None, signature: tuple) -> None:
+        name, road_number, road_name, tmcc_id = signature[:4]
+        self.state = state
+        self.stamp = stamp
+        self.signature = signature
+        if scope in TWO_DIGIT_SCOPES:
+            tmcc_entry = f"{tmcc_id:02d}: {name}"
+        else:
+            tmcc_entry = f"{tmcc_id}: {name}"
+        self.entries = (f"{name}", f"{road_number}: {road_name}", tmcc_entry)
+        # ties are broken by address, the order the state store lists states in
+        self.keys = ((name, state.address), (road_number, state.address), (tmcc_id, state.address))
+        self.categories = signature[4]
+        self.highlighted = signature[5]
+
+
+class CatalogView:
+    """
+    One sorted, filtered view of a catalog: its entries, their states and highlights
+    """
+
+    __slots__ = ("entries", "states", "highlighted", "entry_map")
+
+    def __init__(self, rows: list[CatalogRow], sort_order: int) -> None:
+        self.entries = [row.entries[sort_order] for row in rows]
+        self.states = [row.state for row in rows]
+        self.highlighted = [row.highlighted for row in rows]
+        self.entry_map = dict(zip(self.entries, self.states))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class CatalogModel:
+    """
+    The catalog of one scope, kept sorted by name, road number and TMCC ID.
+    A state's row is rebuilt only when the state has been updated since the
+    row was built (its last_updated time moved) and only rows whose entries
+    actually changed are moved, so a roster is sorted once rather than on
+    every refresh. Filtered views are cached until the next change.
+    """
+
+    def __init__(self, scope: CommandScope) -> None:
+        self._scope = scope
+        self._rows: dict[int, CatalogRow] = {}
+        self._sorted: tuple[list, list, list] = ([], [], [])
+        self._views: dict[tuple[int, int], CatalogView] = {}
+        self._version = 0
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @property
+    def scope(self) -> CommandScope:
+        return self._scope
+
+    @property
+    def version(self) -> int:
+        """
+        Incremented each time the catalog changes
+        """
+        return self._version
+
+    def refresh(self, states: Iterable[ComponentState]) -> bool:
+        """
+        Bring the catalog up to date with states, the scope's current states; returns True if anything changed
+        """
+        changed = False
+        seen = set()
+        rows = self._rows
+        for state in states:
+            address = state.address
+            seen.add(address)
+            row = rows.get(address, None)
+            # skip, inline, the states not updated since their rows were built
+            if (
+                row is None
+                or row.state is not state
+                or row.stamp is None
+                or row.stamp != getattr(state, "last_updated", None)
+            ):
+                changed = self.update_state(state, bump=False) or changed
+        for address in [a for a in rows if a not in seen]:
+            self._remove(address)
+            changed = True
+        if changed:
+            self._changed()
+        return changed
+
+    def update_state(self, state: ComponentState, bump: bool = True) -> bool:
+        """
+        Bring one state's row up to date; returns True if it changed
+        """
+        row = self._rows.get(state.address, None)
+        stamp = getattr(state, "last_updated", None)
+        if row is not None and row.state is state and stamp is not None and row.stamp == stamp:
+            # not updated since its row was built
+            return False
+        if not state.is_name:
+            if row is not None:
+                self._remove(state.address)
+                if bump:
+                    self._changed()
+                return True
+            return False
+        signature = (
+            state.name,
+            state.road_number,
+            state.road_name,
+            state.tmcc_id,
+            categories(self._scope, state),
+            is_highlighted(state),
+        )
+        if row is not None and row.state is state and row.signature == signature:
+            row.stamp = stamp
+            return False
+        if row is not None:
+            self._remove(state.address)
+        row = self._rows[state.address] = CatalogRow(self._scope, state, stamp, signature)
+        for order in SORT_ORDERS:
+            insort(self._sorted[order], row.keys[order])
+        if bump:
+            self._changed()
+        return True
+
+    def view(self, sort_order: int, selected: Iterable[int]) -> CatalogView:
+        """
+        The catalog entries, in sort_order, of the states shown by the selected "Show" buttons
+        """
+        mask = selection_mask(selected)
+        key = (sort_order, mask)
+        view = self._views.get(key, None)
+        if view is None:
+            rows = [self._rows[a] for _, a in self._sorted[sort_order]]
+            view = self._views[key] = CatalogView([row for row in rows if row.categories & mask], sort_order)
+        return view
+
+    def _remove(self, address: int) -> None:
+        row = self._rows.pop(address)
+        for order in SORT_ORDERS:
+            rows = self._sorted[order]
+            del rows[bisect_left(rows, row.keys[order])]
+
+    def _changed(self) -> None:
+        self._views.clear()
+        self._version += 1
@@ -11,14 +11,12 @@ from typing import TYPE_CHECKING
 
 from guizero import Box, CheckBox, TitleBox
 
+from .catalog_model import CatalogModel
 from .configured_accessory_adapter import ConfiguredAccessoryAdapter
 from .overlay_panel import OverlayPanel
 from ..components.checkbox_group import CheckBoxGroup
 from ..components.touch_list_box import TouchListBox
 from ..guizero_base import LIONEL_BLUE, LIONEL_ORANGE
-from ...db.accessory_state import AccessoryState
-from ...db.component_state import RouteState, SwitchState
-from ...db.engine_state import EngineState
 from ...protocol.constants import CommandScope
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -44,6 +42,7 @@ class CatalogPanel(OverlayPanel):
         self._scoped_selection = {}
         self._skip_update = False
         self._entry_state_map = {}
+        self._models: dict[CommandScope, CatalogModel] = {}
         self._width_scale_factor = 3.375
         self._sel_1_btn = self._sel_2_btn = self._sel_3_btn = None
         self._configured_acc_labels: list[str] | None = None
@@ -174,54 +173,33 @@ class CatalogPanel(OverlayPanel):
             sort_order = self._scoped_sort_order[scope] if scope in self._scoped_sort_order else 0
             self._set_sort_order_widget(sort_order)
 
-            # rebuild catalog
-            self._catalog.clear()
+            # bring the scope's catalog up to date; only changed states are re-sorted
+            model = self._models.get(scope, None)
+            if model is None:
+                model = self._models[scope] = CatalogModel(scope)
+            model.refresh(self._state_store.get_all(scope))
+
+            items = []
+            backgrounds = []
             self._entry_state_map.clear()
             # include configured accessories, if requested
             need_separator = False
             if scope == CommandScope.ACC and self._sel_1_btn.value == 1:
                 self._harvest_configured_accessories()
                 if self._configured_acc_labels:
-                    for label in self._configured_acc_labels:
-                        self._catalog.append(label)
+                    items.extend(self._configured_acc_labels)
+                    backgrounds.extend([None] * len(self._configured_acc_labels))
                     self._entry_state_map.update(self._configured_acc_dict)
                     need_separator = True
-            states = self.apply_selection_filter(scope, self._state_store.get_all(scope))
-            if sort_order == 0:
-                states.sort(key=lambda x: x.name)
-            elif sort_order == 1:
-                states.sort(key=lambda x: x.road_number)
-            elif sort_order == 2:
-                states.sort(key=lambda x: x.tmcc_id)
-            for state in states:
-                if not state.is_name:
-                    continue
-                if sort_order == 0:
-                    entry = f"{state.name}"
-                elif sort_order == 1:
-                    entry = f"{state.road_number}: {state.road_name}"
-                elif sort_order == 2:
-                    if scope in {CommandScope.ACC, CommandScope.SWITCH, CommandScope.ROUTE}:
-                        entry = f"{state.tmcc_id:02d}: {state.name}"
-                    else:
-                        entry = f"{state.tmcc_id}: {state.name}"
-                else:
-                    entry = None
-                if entry:
-                    if need_separator:
-                        self._catalog.append("-" * 38)
-                        need_separator = False
-                    self._entry_state_map[entry] = state
-                    self._catalog.append(entry)
-                    if isinstance(state, AccessoryState):
-                        if state.is_bpc2 and state.is_aux_on:
-                            self._catalog.set_item_style(background="green")
-                        elif state.is_asc2 and state.is_aux2_on:
-                            self._catalog.set_item_style(background="green")
-                    elif isinstance(state, SwitchState) and state.is_thru:
-                        self._catalog.set_item_style(background="green")
-                    elif isinstance(state, RouteState) and state.is_aligned:
-                        self._catalog.set_item_style(background="green")
+            view = model.view(sort_order, self._selected_categories())
+            if need_separator and view.entries:
+                items.append("-" * 38)
+                backgrounds.append(None)
+            items.extend(view.entries)
+            backgrounds.extend("green" if h else None for h in view.highlighted)
+            self._entry_state_map.update(view.entry_map)
+            # update only the rows that differ from what is shown
+            self._catalog.sync(items, backgrounds)
             self._scope = scope or self.gui.scope
 
     def configure_selection_btns(self, scope: CommandScope):
@@ -304,43 +282,5 @@ class CatalogPanel(OverlayPanel):
                     state.activate_tmcc_id(state.tmcc_ids[-1])
             self._gui.update_component_info(state.tmcc_id)
 
-    def apply_selection_filter(self, scope, states):
-        # Filters states by scope-specific button-selected categories
-        if scope == CommandScope.ACC:
-            sel_lcs = self._sel_2_btn.value == 1
-            sel_other = self._sel_3_btn.value == 1
-
-            def allowed(state: AccessoryState) -> bool:
-                return (sel_lcs and state.is_lcs) or (sel_other and not state.is_lcs)
-        elif scope == CommandScope.SWITCH:
-            sel_thru = self._sel_1_btn.value == 1
-            sel_out = self._sel_2_btn.value == 1
-            sel_other = self._sel_3_btn.value == 1
-
-            def allowed(state: SwitchState) -> bool:
-                return (sel_thru and state.is_thru) or (sel_out and state.is_out) or (sel_other and state.is_unknown)
-        elif scope == CommandScope.ROUTE:
-            sel_aligned = self._sel_1_btn.value == 1
-            sel_not_aligned = self._sel_2_btn.value == 1
-            sel_other = self._sel_3_btn.value == 1
-
-            def allowed(state: RouteState) -> bool:
-                return (
-                    (sel_aligned and state.is_active)
-                    or (sel_not_aligned and state.is_not_active)
-                    or (sel_other and state.is_unknown)
-                )
-        else:
-            sel_diesel = self._sel_1_btn.value == 1
-            sel_steam = self._sel_2_btn.value == 1
-            sel_other = self._sel_3_btn.value == 1
-
-            def allowed(state: EngineState) -> bool:
-                return (
-                    (sel_diesel and state.is_diesel)
-                    or (sel_steam and state.is_steam)
-                    or (sel_other and not state.is_diesel and not state.is_steam)
-                )
-
-        # apply the appropriate "allowed" filter to the list of states
-        return [s for s in states if allowed(s)]
+    def _selected_categories(self) -> set[int]:
+        return {i for i, cb in enumerate((self._sel_1_btn, self._sel_2_btn, self._sel_3_btn)) if cb.value == 1}
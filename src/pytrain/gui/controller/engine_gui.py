@@ -606,7 +606,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
         self.app.tk.after_idle(self._popup.preload_images)
         for image in (self.power_on_path, self.power_off_path, self.turn_off_image, self.op_acc_image):
             self.app.tk.after_idle(lambda img=image: self.get_titled_image(img))
-        self.app.tk.after(750, self._start_accessory_overlay_prewarm)
+        self.frame_clock.call_later(750, self._start_accessory_overlay_prewarm)
         self._start_accessory_config_watcher()
 
         # register this class to receive delete events
@@ -767,7 +767,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
         if self._shutdown_flag.is_set() or self._accessory_overlay_prewarm_active:
             return
         if not self._acc_buttons_future.done():
-            self.app.tk.after(50, lambda: self._start_accessory_overlay_prewarm(generation))
+            self.frame_clock.call_later(50, lambda: self._start_accessory_overlay_prewarm(generation))
             return
         try:
             self._acc_buttons_future.result()
@@ -776,7 +776,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
             return
         self._accessory_overlay_prewarm_active = True
         self._accessory_overlay_prewarm_queue = deque(self.accessories.configured_all())
-        self.app.tk.after(25, lambda: self._prewarm_next_accessory_overlay(generation))
+        self.frame_clock.call_later(25, lambda: self._prewarm_next_accessory_overlay(generation))
 
     def _prewarm_next_accessory_overlay(self, generation: int | None = None) -> None:
         generation = self._accessory_overlay_prewarm_generation if generation is None else generation
@@ -794,7 +794,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
                     acc.activate_tmcc_id(tmcc_ids[0])
                 overlay = self._popup.get_or_create(acc.instance_id, "", acc, self.restore_accessory_info)
                 setattr(overlay, "caa", acc)
-            self.app.tk.after(25, lambda: self._prewarm_next_accessory_overlay(generation))
+            self.frame_clock.call_later(25, lambda: self._prewarm_next_accessory_overlay(generation))
             return
         self._accessory_overlay_prewarm_active = False
 
@@ -882,6 +882,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
     def _schedule_configured_accessory_apply(self, configured: ConfiguredAccessorySet) -> None:
         if self._shutdown_flag.is_set():
             return
+        # runs on the executor thread; the frame clock is Tk-thread only, so hand off via Tk
         self.app.tk.after(0, lambda: self._apply_changed_configured_accessories(configured))
 
     def _apply_changed_configured_accessories(self, configured: ConfiguredAccessorySet) -> None:
@@ -1004,7 +1005,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
         self._accessory_overlay_prewarm_queue.clear()
         self._accessory_overlay_prewarm_active = False
         if not self._shutdown_flag.is_set():
-            self.app.tk.after(25, lambda: self._start_accessory_overlay_prewarm(generation))
+            self.frame_clock.call_later(25, lambda: self._start_accessory_overlay_prewarm(generation))
 
     def show_popup(
         self,
@@ -1205,7 +1206,7 @@ class EngineGui(GuiZeroBase, Generic[S]):
 
         def upd():
             if not self._shutdown_flag.is_set():
-                self._message_queue.put((action, [state]))
+                self.queue_update(action, state)
 
         return upd
 
@@ -367,7 +367,11 @@ class SteamDeckGui(GuiZeroBase):
                 "show_controls": self.on_show_controls,
             },
         )
-        provider = SteamDeckInputProvider(self._controller_profile)
+        # Deck trackpad and paddle input read from hidraw wakes the poll as it arrives,
+        # rather than waiting up to a poll period; that needs Tcl built with threads,
+        # which marshals the reader thread's after_idle() call onto the Tk thread.
+        wake = self._wake_controller_poll if self._tcl_threaded() else None
+        provider = SteamDeckInputProvider(self._controller_profile, wake=wake)
         try:
             provider.start()
         except ControllerUnavailable as exc:
@@ -393,6 +397,29 @@ class SteamDeckGui(GuiZeroBase):
             log.exception("Steam Deck controller polling failed", exc_info=exc)
         self._controller_poll_id = self.app.tk.after(CONTROLLER_POLL_MS, self._poll_controller)
 
+    def _wake_controller_poll(self) -> None:
+        # runs on a hidraw reader thread
+        try:
+            self.app.tk.after_idle(self._poll_controller_now)
+        except (AttributeError, RuntimeError, TclError):
+            pass  # the GUI is closing; nothing to poll
+
+    def _poll_controller_now(self) -> None:
+        poll_id = self._controller_poll_id
+        if poll_id is None:
+            return
+        try:
+            self.app.tk.after_cancel(poll_id)
+        except TclError:
+            pass
+        self._poll_controller()
+
+    def _tcl_threaded(self) -> bool:
+        try:
+            return bool(int(self.app.tk.call("info", "exists", "tcl_platform(threaded)")))
+        except (AttributeError, TclError, ValueError):
+            return False
+
     def _stop_controller_input(self) -> None:
         poll_id = getattr(self, "_controller_poll_id", None)
         if poll_id is not None:
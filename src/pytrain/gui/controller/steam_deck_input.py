@@ -15,13 +15,12 @@ import json
 import logging
 import math
 import os
-import queue
 import struct
 import threading
 import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Callable, Literal, Mapping
+from typing import Any, Callable, Literal, Mapping, NamedTuple
 
 log = logging.getLogger(__name__)
 
@@ -235,8 +234,9 @@ DEFAULT_PROFILE = Path(__file__).with_name("steam_deck_default.json")
 # Deck. As an alternative input path we read the controller's raw 64-byte HID
 # input reports directly from its ``/dev/hidraw*`` node -- those reports carry
 # absolute trackpad coordinates. A dedicated daemon thread performs the blocking
-# reads and hands each report to the (single-threaded) provider through a
-# thread-safe ``queue.Queue``, keeping the reader fully decoupled from pygame.
+# reads, decodes each report and hands the result to the (single-threaded)
+# provider through a ``_HidrawMailbox``, keeping the reader fully decoupled from
+# pygame.
 # This mirrors the probe proven out in ``scripts/deckinfo.py``.
 # ---------------------------------------------------------------------------
 _DECK_VID = 0x28DE
@@ -332,18 +332,116 @@ def _deck_pad_y_fraction(raw_y: int) -> float:
     return max(0.0, min(1.0, fraction))
 
 
+class _DeckHidState(NamedTuple):
+    # The parts of a Deck state report the provider acts on. The coordinate of an
+    # untouched (or unwatched) pad is zeroed, so noise under a lifted finger does
+    # not read as a change.
+    lpad_touched: bool
+    ly: int
+    rpad_touched: bool
+    ry: int
+    paddles: tuple[bool, ...]  # in ``_DECK_PADDLE_BUTTONS`` order
+
+    @property
+    def switches(self) -> tuple[bool, bool, tuple[bool, ...]]:
+        return self.lpad_touched, self.rpad_touched, self.paddles
+
+
+def _decode_deck_state(report: bytes, pads: tuple[bool, bool] = (True, True)) -> _DeckHidState | None:
+    # Decode a Deck "state" packet into a ``_DeckHidState``, or ``None`` for any
+    # other report type / a report too short to decode. ``pads`` says whether the
+    # left and right pads are bound; an unbound pad always reads as untouched.
+    decoded = _decode_deck_pads(report)
+    paddles = _decode_deck_paddles(report)
+    if decoded is None or paddles is None:
+        return None
+    lpad_touched, (_lx, ly), rpad_touched, (_rx, ry) = decoded
+    lpad_touched = lpad_touched and pads[0]
+    rpad_touched = rpad_touched and pads[1]
+    return _DeckHidState(
+        lpad_touched,
+        ly if lpad_touched else 0,
+        rpad_touched,
+        ry if rpad_touched else 0,
+        tuple(paddles.values()),
+    )
+
+
+class _HidrawMailbox:
+    """Hand decoded Deck HID reports from the reader threads to the provider.
+
+    ``put`` takes ``("report", path, bytes)`` or ``("error", path, message)`` tuples
+    and decodes each report on the calling (reader) thread. A report that decodes to
+    the same state as the one before it is dropped. Pad motion is coalesced to the
+    latest position, while every touch and paddle transition is kept, in order, so a
+    tap shorter than the poll period still presses and releases. ``wake`` is called,
+    from the reader thread, on a touch or paddle transition, at most once between
+    takes; pad motion alone waits for the owner's next regular poll, where the
+    latest position is all that is left of it.
+    """
+
+    def __init__(self, wake: Callable[[], None] | None = None, pads: tuple[bool, bool] = (True, True)) -> None:
+        self._wake = wake
+        self._pads = pads
+        self._lock = threading.Lock()
+        self._last: dict[str, _DeckHidState] = {}
+        self._pending: dict[str, list[_DeckHidState]] = {}
+        self._errors: list[tuple[str, str]] = []
+        self._woken = False
+        self.received = self.duplicates = self.coalesced = self.wakes = 0
+
+    def put(self, item: tuple[str, str, Any]) -> None:
+        kind, path, payload = item
+        if kind == "error":
+            with self._lock:
+                self._errors.append((path, payload))
+            return
+        state = _decode_deck_state(payload, self._pads)
+        with self._lock:
+            self.received += 1
+            last = self._last.get(path, None)
+            if state is None or state == last:
+                self.duplicates += 1
+                return
+            self._last[path] = state
+            pending = self._pending.setdefault(path, [])
+            if pending and pending[-1].switches == state.switches:
+                # only the pads moved; the newer position replaces the older
+                pending[-1] = state
+                self.coalesced += 1
+            else:
+                pending.append(state)
+            wake = self._wake is not None and not self._woken and (last is None or last.switches != state.switches)
+            if wake:
+                self._woken = True
+                self.wakes += 1
+        if wake:
+            self._wake()
+
+    def take(self) -> tuple[list[tuple[str, _DeckHidState]], list[tuple[str, str]]]:
+        # Return, and forget, the pending ``(path, state)`` pairs, in arrival order
+        # per node, and the pending ``(path, message)`` errors.
+        with self._lock:
+            states = [(path, state) for path, pending in self._pending.items() for state in pending]
+            errors = self._errors
+            self._pending = {}
+            self._errors = []
+            self._woken = False
+        return states, errors
+
+
 class _HidrawTrackpadReader(threading.Thread):
-    """Read 64-byte HID reports from one Deck hidraw node and queue them.
+    """Read 64-byte HID reports from one Deck hidraw node and post them.
 
     The blocking ``os.read`` runs on its own daemon thread so it never stalls
     the provider's poll loop; each report (or a one-off error) is delivered via
-    ``out_queue`` as ``("report", path, bytes)`` or ``("error", path, message)``.
+    ``mailbox`` as ``("report", path, bytes)`` or ``("error", path, message)``.
     """
 
-    def __init__(self, path: str, out_queue: "queue.Queue") -> None:
+    def __init__(self, path: str, mailbox: _HidrawMailbox) -> None:
         super().__init__(name=f"hidraw:{path}", daemon=True)
         self._path = path
-        self._queue = out_queue
+        self._mailbox = mailbox
         self._stop = threading.Event()
         self._fd: int | None = None
 
@@ -351,17 +449,17 @@ class _HidrawTrackpadReader(threading.Thread):
         try:
             self._fd = os.open(self._path, os.O_RDONLY)
         except OSError as exc:
-            self._queue.put(("error", self._path, f"cannot open ({exc}); a udev rule or root may be required"))
+            self._mailbox.put(("error", self._path, f"cannot open ({exc}); a udev rule or root may be required"))
             return
         while not self._stop.is_set():
             try:
                 report = os.read(self._fd, 64)
             except OSError as exc:
                 if not self._stop.is_set():
-                    self._queue.put(("error", self._path, f"read failed: {exc}"))
+                    self._mailbox.put(("error", self._path, f"read failed: {exc}"))
                 break
             if report:
-                self._queue.put(("report", self._path, report))
+                self._mailbox.put(("report", self._path, report))
 
     def stop(self) -> None:
         self._stop.set()
@@ -622,10 +720,14 @@ class SteamDeckInputProvider:
         *,
         pygame_module=None,
         clock: Callable[[], float] | None = None,
+        wake: Callable[[], None] | None = None,
     ) -> None:
         self.profile = profile
         self._pygame = pygame_module
         self._clock = clock or time.monotonic
+        # Called from a hidraw reader thread when Deck input is waiting, so the
+        # owner can poll now rather than on its next tick.
+        self._wake = wake
         self._joysticks: dict[int, Any] = {}
         # The optional ``pygame._sdl2.controller`` module used to open devices as
         # game controllers (required for touchpad events); ``None`` when SDL's
@@ -665,7 +767,7 @@ class SteamDeckInputProvider:
         # events, so their reports are read directly from ``/dev/hidraw*`` on a
         # background thread and translated into the same ``quilling_horn`` touch
         # actions in ``poll()``. All inert off the Deck / when no pad is bound.
-        self._hidraw_queue: queue.Queue | None = None
+        self._hidraw_mailbox: _HidrawMailbox | None = None
         self._hidraw_readers: list[_HidrawTrackpadReader] = []
         # touch_id -> whether the pad currently has a finger down, so a release
         # is emitted exactly once when the finger lifts.
@@ -771,9 +873,10 @@ class SteamDeckInputProvider:
         paths = _find_deck_hidraw_paths()
         if not paths:
             return
-        self._hidraw_queue = queue.Queue()
+        pads = (_DECK_LEFT_TOUCH_ID in self.profile.touchpads, _DECK_RIGHT_TOUCH_ID in self.profile.touchpads)
+        self._hidraw_mailbox = _HidrawMailbox(self._wake, pads)
         for path in paths:
-            reader = _HidrawTrackpadReader(path, self._hidraw_queue)
+            reader = _HidrawTrackpadReader(path, self._hidraw_mailbox)
             reader.start()
             self._hidraw_readers.append(reader)
         log.info("Reading Steam Deck trackpads directly from hidraw: %s", ", ".join(paths))
@@ -782,53 +885,39 @@ class SteamDeckInputProvider:
         for reader in self._hidraw_readers:
             reader.stop()
         self._hidraw_readers.clear()
-        self._hidraw_queue = None
+        self._hidraw_mailbox = None
         self._hidraw_pad_touched.clear()
         self._hidraw_buttons.clear()
         self._hidraw_errors.clear()
 
     def _drain_hidraw_pads(self) -> list[DeckAction]:
-        # Translate any queued Deck HID reports into the same ``quilling_horn``
-        # touch actions the SDL touchpad path produces. Each report carries both
-        # pads' current touch state and coordinates, so only the most recent one
-        # per node matters: drain the queue, keep the latest, then diff it
-        # against the last-known touch state to emit motion while a finger is
-        # down and a single release when it lifts.
-        if self._hidraw_queue is None:
+        # Translate the Deck HID states waiting in the mailbox into the same
+        # ``quilling_horn`` touch actions the SDL touchpad path produces. The
+        # readers have already decoded the reports, dropped repeats and kept only
+        # the latest pad position between touch/paddle transitions, so each state
+        # is diffed against the last-known touch state to emit motion while a
+        # finger is down and a single release when it lifts.
+        if self._hidraw_mailbox is None:
             return []
-        latest: dict[str, bytes] = {}
-        while True:
-            try:
-                kind, path, payload = self._hidraw_queue.get_nowait()
-            except queue.Empty:
-                break
-            if kind == "error":
-                if path not in self._hidraw_errors:
-                    self._hidraw_errors.add(path)
-                    log.warning("Steam Deck trackpad hidraw %s: %s", path, payload)
-                continue
-            latest[path] = payload
+        states, errors = self._hidraw_mailbox.take()
+        for path, message in errors:
+            if path not in self._hidraw_errors:
+                self._hidraw_errors.add(path)
+                log.warning("Steam Deck trackpad hidraw %s: %s", path, message)
         actions: list[DeckAction] = []
-        for payload in latest.values():
-            actions.extend(self._hidraw_paddle_actions(payload))
-            decoded = _decode_deck_pads(payload)
-            if decoded is None:
-                continue
-            lpad_touched, (_lx, ly), rpad_touched, (_rx, ry) = decoded
-            actions.extend(self._hidraw_pad_action(_DECK_LEFT_TOUCH_ID, lpad_touched, ly))
-            actions.extend(self._hidraw_pad_action(_DECK_RIGHT_TOUCH_ID, rpad_touched, ry))
+        for _path, state in states:
+            actions.extend(self._hidraw_paddle_actions(state))
+            actions.extend(self._hidraw_pad_action(_DECK_LEFT_TOUCH_ID, state.lpad_touched, state.ly))
+            actions.extend(self._hidraw_pad_action(_DECK_RIGHT_TOUCH_ID, state.rpad_touched, state.ry))
         return actions
 
-    def _hidraw_paddle_actions(self, payload: bytes) -> list[DeckAction]:
+    def _hidraw_paddle_actions(self, state: _DeckHidState) -> list[DeckAction]:
         # Turn the paddle bits of one report into press/release actions, feeding them
         # through the same ``_button_actions`` path the SDL buttons use so a paddle is
         # bound, repeated and chorded exactly like any other button. Only edges are
         # emitted; a held paddle produces nothing until it changes.
-        pressed_by_index = _decode_deck_paddles(payload)
-        if pressed_by_index is None:
-            return []
         actions: list[DeckAction] = []
-        for index, pressed in pressed_by_index.items():
+        for index, pressed in zip(_DECK_PADDLE_BUTTONS, state.paddles):
             if self._hidraw_buttons.get(index) == pressed:
                 continue
             self._hidraw_buttons[index] = pressed
@@ -0,0 +1,288 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+import heapq
+import logging
+import math
+import time
+from itertools import count
+from threading import RLock
+from tkinter import TclError
+from typing import Any, Callable
+
+log = logging.getLogger(__name__)
+
+# nominal GUI frame; timers due within half a frame of each other run in the same frame
+FRAME_MS = 20
+
+
+class FrameTimer:
+    """
+    A callback scheduled on a FrameClock; cancel() it to keep it from running
+    """
+
+    __slots__ = ("_clock", "due", "delay_ms", "callback", "widget", "_active", "_seq")
+
+    def __init__(self, clock: FrameClock, due: float, delay_ms: int, callback: Callable, widget: Any, seq: int):
+        self._clock = clock
+        self.due = due
+        self.delay_ms = delay_ms
+        self.callback = callback
+        self.widget = widget
+        self._active = True
+        self._seq = seq
+
+    def __lt__(self, other: FrameTimer) -> bool:
+        return (self.due, self._seq) < (other.due, other._seq)
+
+    @property
+    def active(self) -> bool:
+        """
+        True until the timer runs or is canceled
+        """
+        return self._active
+
+    def cancel(self) -> None:
+        self._clock.cancel(self)
+
+
+class FrameClock:
+    """
+    The one Tk after() chain shared by the timers and animations of a Tk
+    window. Rather than each widget keeping its own after() chain, each
+    waking the Tk loop at its own moment, widgets schedule callbacks with
+    call_later(). The clock keeps a single after() pending, for the earliest
+    callback due, and runs every callback due within half a frame of it
+    in that one wakeup, so the Tk thread sleeps until there is work to do.
+
+    A callback scheduled for a widget is held, rather than run, while the
+    widget is unmapped (hidden, or on a hidden overlay) and runs when the
+    widget is mapped again, so off-screen animations cost nothing.
+
+    There is one clock per Tk root; use FrameClock.of(widget) to get it.
+    """
+
+    _lock = RLock()
+
+    @classmethod
+    def of(cls, widget: Any) -> FrameClock:
+        """
+        The clock of the Tk root widget belongs to; widget may be a guizero or a Tk widget
+        """
+        root = cls._root_of(widget)
+        with cls._lock:
+            clock = getattr(root, "_pytrain_frame_clock", None)
+            if clock is None:
+                clock = cls(root)
+                setattr(root, "_pytrain_frame_clock", clock)
+            return clock
+
+    @classmethod
+    def release(cls, widget: Any) -> FrameClock | None:
+        """
+        Stop, and forget, the clock of widget's Tk root, once the root is destroyed; returns the clock
+        """
+        root = cls._root_of(widget)
+        with cls._lock:
+            clock = getattr(root, "_pytrain_frame_clock", None)
+            if clock is not None:
+                delattr(root, "_pytrain_frame_clock")
+        if clock is not None:
+            clock.stop()
+        return clock
+
+    @staticmethod
+    def _root_of(widget: Any) -> Any:
+        tk = getattr(widget, "tk", widget)
+        root_of = getattr(tk, "_root", None)
+        return root_of() if callable(root_of) else tk
+
+    def __init__(self, root: Any, slack_ms: float = FRAME_MS / 2, now: Callable[[], float] = time.monotonic) -> None:
+        self._root = root
+        self._slack_ms = slack_ms
+        self._now = now
+        self._timers: list[FrameTimer] = []
+        self._held: dict[Any, list[FrameTimer]] = {}
+        self._map_bound: set[Any] = set()
+        self._seq = count()
+        self._after_id: str | None = None
+        self._after_due: float | None = None
+        self._pending = 0
+        self._frames = self._callbacks = 0
+        self._frame_ms = self._max_frame_ms = self._total_frame_ms = 0.0
+
+    def now_ms(self) -> float:
+        return self._now() * 1000.0
+
+    @property
+    def pending(self) -> int:
+        """
+        Number of callbacks waiting to run, not counting those held for unmapped widgets
+        """
+        return self._pending
+
+    @property
+    def held(self) -> int:
+        """
+        Number of callbacks held until their widgets are mapped
+        """
+        return sum(len(timers) for timers in self._held.values())
+
+    @property
+    def frames(self) -> int:
+        """
+        Number of times the clock woke the Tk loop
+        """
+        return self._frames
+
+    @property
+    def callbacks(self) -> int:
+        """
+        Number of callbacks run
+        """
+        return self._callbacks
+
+    @property
+    def frame_ms(self) -> float:
+        """
+        Time spent running the callbacks of the last frame, in milliseconds
+        """
+        return self._frame_ms
+
+    @property
+    def max_frame_ms(self) -> float:
+        return self._max_frame_ms
+
+    @property
+    def mean_frame_ms(self) -> float:
+        return self._total_frame_ms / self._frames if self._frames else 0.0
+
+    def call_later(self, delay_ms: int, callback: Callable, widget: Any = None) -> FrameTimer:
+        """
+        Run callback in delay_ms milliseconds; if widget is given, not while it is unmapped
+        """
+        delay_ms = max(0, int(delay_ms))
+        timer = FrameTimer(self, self.now_ms() + delay_ms, delay_ms, callback, getattr(widget, "tk", widget), 0)
+        self._schedule(timer)
+        return timer
+
+    def cancel(self, timer: FrameTimer | None) -> None:
+        if timer is None or not timer._active:
+            return
+        timer._active = False
+        held = self._held.get(timer.widget, None)
+        if held and timer in held:
+            held.remove(timer)
+        else:
+            self._pending -= 1
+            if self._pending == 0:
+                # nothing left to run; let the Tk loop sleep
+                self._disarm()
+
+    def stop(self) -> None:
+        """
+        Cancel every callback
+        """
+        for timer in self._timers:
+            timer._active = False
+        for timers in self._held.values():
+            for timer in timers:
+                timer._active = False
+        self._timers.clear()
+        self._held.clear()
+        self._pending = 0
+        self._disarm()
+
+    def _schedule(self, timer: FrameTimer) -> None:
+        timer._seq = next(self._seq)
+        heapq.heappush(self._timers, timer)
+        self._pending += 1
+        self._arm()
+
+    def _arm(self) -> None:
+        timers = self._timers
+        while timers and not timers[0]._active:
+            heapq.heappop(timers)
+        if not timers:
+            self._disarm()
+            return
+        due = timers[0].due
+        if self._after_id is not None and self._after_due <= due:
+            # already set to wake in time
+            return
+        self._disarm()
+        try:
+            self._after_id = self._root.after(max(0, math.ceil(due - self.now_ms())), self._frame)
+            self._after_due = due
+        except TclError:
+            # the window is gone
+            self._after_id = None
+
+    def _disarm(self) -> None:
+        if self._after_id is not None:
+            try:
+                self._root.after_cancel(self._after_id)
+            except (TclError, AttributeError):
+                pass
+        self._after_id = self._after_due = None
+
+    def _frame(self) -> None:
+        self._after_id = self._after_due = None
+        started_at = self.now_ms()
+        horizon = started_at + self._slack_ms
+        timers = self._timers
+        ran = 0
+        while timers and timers[0].due <= horizon:
+            timer = heapq.heappop(timers)
+            if not timer._active:
+                continue
+            if timer.widget is not None and not self._is_mapped(timer.widget, timer):
+                continue
+            timer._active = False
+            self._pending -= 1
+            try:
+                timer.callback()
+            except Exception as e:
+                log.exception("Error running GUI timer callback", exc_info=e)
+            ran += 1
+        self._frames += 1
+        self._callbacks += ran
+        self._frame_ms = self.now_ms() - started_at
+        self._max_frame_ms = max(self._max_frame_ms, self._frame_ms)
+        self._total_frame_ms += self._frame_ms
+        self._arm()
+
+    def _is_mapped(self, widget: Any, timer: FrameTimer) -> bool:
+        # hold timer until widget is mapped; a destroyed widget's timers are dropped
+        try:
+            if widget.winfo_ismapped():
+                return True
+        except TclError:
+            timer._active = False
+            self._pending -= 1
+            return False
+        self._pending -= 1
+        self._held.setdefault(widget, []).append(timer)
+        if widget not in self._map_bound:
+            try:
+                widget.bind("<Map>", lambda _e, w=widget: self._release_held(w), add="+")
+                self._map_bound.add(widget)
+            except TclError:
+                pass
+        return False
+
+    def _release_held(self, widget: Any) -> None:
+        timers = self._held.pop(widget, None)
+        if timers:
+            now = self.now_ms()
+            for timer in timers:
+                timer.due = now
+                self._schedule(timer)
@@ -22,7 +22,6 @@ from abc import ABC, ABCMeta, abstractmethod
 from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
 from dataclasses import dataclass
-from io import BytesIO
 from queue import Empty, Queue
 from threading import Condition, Event, RLock, Thread, get_ident
 from time import perf_counter, sleep
@@ -49,6 +48,9 @@ from ..protocol.command_req import CommandReq
 from ..protocol.constants import PROGRAM_NAME, CommandScope
 from .components.hold_button import HoldButton
 from .controller.engine_gui_conf import FONT_SIZE_EXCEPTIONS
+from .frame_clock import FrameClock
+from .image_cache import PhotoImageCache, ThumbnailCache
+from .update_bus import UpdateBus
 
 log = logging.getLogger(__name__)
 E = TypeVar("E", bound=CommandDefEnum)
@@ -60,7 +62,6 @@ WINDOW_SIZE_EXCEPTIONS = (ImportError, RuntimeError, TclError)
 COMMAND_REQUEST_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TypeError, ValueError)
 PROD_INFO_EXCEPTIONS = (AttributeError, OSError, RuntimeError, TypeError, ValueError)
 FINALIZE_EXCEPTIONS = (RuntimeError, TypeError, ValueError)
-MAX_GUI_MESSAGES_PER_POLL = 5
 DEFAULT_LAYOUT_TITLE = "My Layout"
 
 
@@ -287,7 +288,7 @@ class GuiZeroBase(Thread, ABC):
         # queue task for gui main thread
         self._app = None
         self._app_counter = 0
-        self._message_queue = Queue()
+        self._message_queue = UpdateBus()
         self._owns_message_queue = True
         self._request_queue: Queue[_QueuedSendRequest | None] = Queue()
         self._request_queue_shutdown = Event()
@@ -375,6 +376,11 @@ class GuiZeroBase(Thread, ABC):
     def app(self) -> App:
         return self._app
 
+    @property
+    def frame_clock(self) -> FrameClock:
+        """The timer clock shared by this GUI's widgets; only use it on the Tk thread."""
+        return FrameClock.of(self._app)
+
     @property
     def is_shutting_down(self) -> bool:
         return self._shutdown_flag.is_set()
@@ -440,6 +446,18 @@ class GuiZeroBase(Thread, ABC):
     def queue_message(self, message: Callable, *args: Any) -> None:
         self._message_queue.put((message, args))
 
+    def queue_update(self, message: Callable, *args: Any, key: Any = None) -> None:
+        """
+        Queue message(*args) to run on the GUI thread, replacing the same update
+        if it is still waiting; key, which defaults to (message, *args), says
+        what counts as the same update
+        """
+        self._message_queue.post(key if key is not None else (message, *args), message, *args)
+
+    @property
+    def update_bus(self) -> UpdateBus:
+        return self._message_queue
+
     @staticmethod
     def safe_destroy(widget: Any) -> None:
         if widget:
@@ -533,20 +551,8 @@ class GuiZeroBase(Thread, ABC):
                     pass  # ignore, we're shutting down
                 return None
             else:
-                # Process pending messages in the queue
-                for _ in range(MAX_GUI_MESSAGES_PER_POLL):
-                    try:
-                        message = self._message_queue.get_nowait()
-                    except Empty:
-                        break
-                    try:
-                        if isinstance(message, tuple):
-                            if len(message) > 1 and message[1] and len(message[1]) > 0:
-                                message[0](*message[1])
-                            else:
-                                message[0]()
-                    except Exception as e:
-                        log.exception("Error processing GUI message callback", exc_info=e)
+                # Process pending messages, within this frame's time budget
+                self._message_queue.drain()
             return None
 
         self.build_gui()
@@ -577,6 +583,14 @@ class GuiZeroBase(Thread, ABC):
         finally:
             self._debug_heartbeat = None
             self.destroy_gui()
+            clock = FrameClock.release(getattr(app, "tk", app))
+            if clock is not None:
+                log.debug(
+                    f"GUI frame clock: {clock.frames} frames, {clock.callbacks} callbacks, "
+                    f"{clock.mean_frame_ms:.2f} ms mean, {clock.max_frame_ms:.2f} ms max frame time"
+                )
+            # the Tk interpreter is gone; images made on it can't be reused
+            PhotoImageCache().release(getattr(app, "tk", app))
             self._app = app = None
             gc.collect()
             self._ev.set()
@@ -756,18 +770,19 @@ class GuiZeroBase(Thread, ABC):
         preserve_height: bool = False,
         force_lionel: bool = False,
     ) -> ImageTk.PhotoImage:
-        if isinstance(source, io.BytesIO) and hasattr(source, "seek"):
-            source.seek(0)
-        pil_img = Image.open(source)
-        pil_img.load()  # force decode NOW (still pure PIL)
-        orig_width, orig_height = pil_img.size
-
+        # decoded, pre-scaled images are shared by all GUIs; only the header is read to size them
+        thumbnails = ThumbnailCache()
+        orig_width, orig_height = thumbnails.source_size(source)
         scaled_width, scaled_height = self._calc_scaled_image_size(
             orig_width, orig_height, preserve_height, force_lionel
         )
-        print(f"{source} scaled to {scaled_width}x{scaled_height} = {orig_width}x{orig_height}")
-        img = ImageTk.PhotoImage(pil_img.resize((scaled_width, scaled_height)))
-        return img
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"{source} scaled to {scaled_width}x{scaled_height} = {orig_width}x{orig_height}")
+        size = (scaled_width, scaled_height)
+        return PhotoImageCache().get(
+            (thumbnails.digest(source), size, False),
+            lambda: ImageTk.PhotoImage(thumbnails.load(source, size)),
+        )
 
     def get_image(
         self,
@@ -779,29 +794,39 @@ class GuiZeroBase(Thread, ABC):
         force_lionel: bool = False,
     ):
         # Returns cached or newly created image data
-        if path not in self._image_cache:
-            img = None
+        if isinstance(size, int):
+            size = (size, size)
+        key = path if size is None else (path, tuple(size))
+        if key not in self._image_cache:
             if scale:
-                normal_tk = self.get_scaled_image(path, preserve_height=preserve_height)
+                self._image_cache[key] = self.get_scaled_image(path, preserve_height=preserve_height)
             elif force_lionel:
-                normal_tk = self.get_scaled_image(path, force_lionel=True)
-            else:
-                img = Image.open(path)
-                if size:
-                    if isinstance(size, int):
-                        size = (size, size)
-                    img = img.resize(size)
-                normal_tk = ImageTk.PhotoImage(img)
-
-            # cache image(s)
-            if inverse and img:
-                inverted = ImageOps.invert(img.convert("RGB"))
-                inverted.putalpha(img.split()[-1])
-                inverted_tk = ImageTk.PhotoImage(inverted)
-                self._image_cache[path] = (normal_tk, inverted_tk)
+                self._image_cache[key] = self.get_scaled_image(path, force_lionel=True)
             else:
-                self._image_cache[path] = normal_tk
-        return self._image_cache[path]
+                thumbnails = ThumbnailCache()
+                photos = PhotoImageCache()
+                digest = thumbnails.digest(path)
+                img = None
+
+                def load() -> Image.Image:
+                    nonlocal img
+                    if img is None:
+                        img = thumbnails.load(path, size)
+                    return img
+
+                normal_tk = photos.get((digest, size, False), lambda: ImageTk.PhotoImage(load()))
+                # cache image(s)
+                if inverse:
+
+                    def invert() -> ImageTk.PhotoImage:
+                        inverted = ImageOps.invert(load().convert("RGB"))
+                        inverted.putalpha(load().split()[-1])
+                        return ImageTk.PhotoImage(inverted)
+
+                    self._image_cache[key] = (normal_tk, photos.get((digest, size, True), invert))
+                else:
+                    self._image_cache[key] = normal_tk
+        return self._image_cache[key]
 
     def get_titled_image(self, path):
         key = (path, self.titled_button_size, self.titled_button_size)
@@ -846,13 +871,8 @@ class GuiZeroBase(Thread, ABC):
         preserve_height: bool = False,
         force_lionel: bool = False,
     ) -> Image.Image:
-        if isinstance(source, bytes):
-            source = BytesIO(source)
-        if isinstance(source, io.BytesIO) and hasattr(source, "seek"):
-            source.seek(0)
-        pil_img = Image.open(source)
-        pil_img.load()
-        orig_width, orig_height = pil_img.size
+        thumbnails = ThumbnailCache()
+        orig_width, orig_height = thumbnails.source_size(source)
         if force_lionel:
             scaled_width, scaled_height = self._calc_scaled_image_size(300, 100)
         else:
@@ -868,7 +888,7 @@ class GuiZeroBase(Thread, ABC):
             else:
                 scaled_width = int(orig_width * width_scale)
                 scaled_height = int(orig_height * scale)
-        return pil_img.resize((max(1, scaled_width), max(1, scaled_height)))
+        return thumbnails.load(source, (max(1, scaled_width), max(1, scaled_height)))
 
     def _request_prod_info(self, bt_id: str) -> ProdInfo | None:
         prod_info = "N/A"
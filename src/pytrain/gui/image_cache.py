@@ -0,0 +1,266 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from __future__ import annotations
+
+import hashlib
+import io
+import logging
+import os
+import tkinter as tk
+from collections import OrderedDict
+from pathlib import Path
+from threading import RLock
+from typing import Any, Callable, Hashable
+
+# noinspection PyPackageRequirements
+from PIL import Image, ImageTk
+
+from ..utils.singleton import singleton
+
+log = logging.getLogger(__name__)
+
+DEFAULT_THUMBNAIL_DIR = os.environ.get(
+    "PYTRAIN_THUMBNAIL_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "pytrain", "thumbnails"),
+)
+DEFAULT_PHOTO_CACHE_BYTES = int(os.environ.get("PYTRAIN_PHOTO_CACHE_BYTES", 64 * 1024 * 1024))
+
+# modes PNG can store as-is; anything else (CMYK, YCbCr, ...) is stored as RGBA
+PNG_MODES = {"1", "L", "LA", "P", "RGB", "RGBA", "I", "I;16"}
+
+ImageSource = str | Path | bytes | io.BytesIO
+
+
+@singleton
+class ThumbnailCache:
+    """
+    On-disk cache of images pre-scaled to the sizes the GUIs ask for. Entries are
+    keyed by a hash of the source image's content plus the target size, so edited
+    or replaced images are picked up automatically and identical images found
+    under different names share a thumbnail. The cache is populated lazily; if the
+    cache directory can't be written, images are simply scaled in memory.
+    """
+
+    def __init__(self, cache_dir: str | Path = None) -> None:
+        self._cache_dir = Path(cache_dir or DEFAULT_THUMBNAIL_DIR)
+        self._lock = RLock()
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._sizes: dict[tuple[str, int, int], tuple[int, int]] = {}
+        self._writable: bool | None = None
+        self._hits = self._misses = 0
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    @cache_dir.setter
+    def cache_dir(self, cache_dir: str | Path) -> None:
+        with self._lock:
+            self._cache_dir = Path(cache_dir)
+            self._writable = None
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def digest(self, source: ImageSource) -> str:
+        """
+        Returns a content hash for source; file hashes are remembered until the file changes.
+        """
+        if isinstance(source, (str, Path)):
+            key = self._stat_key(source)
+            with self._lock:
+                digest = self._digests.get(key, None)
+            if digest is None:
+                with open(source, "rb") as f:
+                    digest = hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+                with self._lock:
+                    self._digests[key] = digest
+            return digest
+        return hashlib.blake2b(self._read_bytes(source), digest_size=16).hexdigest()
+
+    def source_size(self, source: ImageSource) -> tuple[int, int]:
+        """
+        Returns the native (width, height) of source, reading only the image header.
+        """
+        if isinstance(source, (str, Path)):
+            key = self._stat_key(source)
+            with self._lock:
+                size = self._sizes.get(key, None)
+            if size is None:
+                with Image.open(source) as img:
+                    size = img.size
+                with self._lock:
+                    self._sizes[key] = size
+            return size
+        with Image.open(io.BytesIO(self._read_bytes(source))) as img:
+            return img.size
+
+    def path_for(self, source: ImageSource, size: tuple[int, int]) -> Path:
+        return self._cache_dir / f"{self.digest(source)}-{size[0]}x{size[1]}.png"
+
+    def load(self, source: ImageSource, size: tuple[int, int] | None = None) -> Image.Image:
+        """
+        Returns source decoded and resized to size, from the disk cache when possible.
+        Requests without a size are returned unscaled and uncached; animated images
+        are scaled to a still of their first frame.
+        """
+        if size is None:
+            return self._open(source)
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        thumb = self.path_for(source, size)
+        try:
+            img = Image.open(thumb)
+            img.load()
+            self._hits += 1
+            return img
+        except OSError:
+            pass
+        self._misses += 1
+        img = self._open(source)
+        if img.size != size or getattr(img, "is_animated", False):
+            # resizing an animated image yields its current frame, scaled
+            img = img.resize(size)
+        self._store(img, thumb)
+        return img
+
+    def clear(self) -> None:
+        with self._lock:
+            self._digests.clear()
+            self._sizes.clear()
+            if self._cache_dir.is_dir():
+                for thumb in self._cache_dir.glob("*.png"):
+                    thumb.unlink(missing_ok=True)
+
+    def _open(self, source: ImageSource) -> Image.Image:
+        if isinstance(source, (str, Path)):
+            img = Image.open(source)
+        else:
+            img = Image.open(io.BytesIO(self._read_bytes(source)))
+        img.load()
+        return img
+
+    def _store(self, img: Image.Image, thumb: Path) -> None:
+        if self._writable is False:
+            return
+        try:
+            thumb.parent.mkdir(parents=True, exist_ok=True)
+            tmp = thumb.with_name(f".{thumb.name}.{os.getpid()}.tmp")
+            (img if img.mode in PNG_MODES else img.convert("RGBA")).save(tmp, format="PNG")
+            os.replace(tmp, thumb)
+            self._writable = True
+        except OSError as e:
+            # an unwritable cache just means we scale in memory every time
+            self._writable = False
+            log.warning(f"Thumbnail cache {self._cache_dir} is not writable: {e}")
+
+    @staticmethod
+    def _stat_key(path: str | Path) -> tuple[str, int, int]:
+        st = os.stat(path)
+        return str(path), st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _read_bytes(source: bytes | io.BytesIO) -> bytes:
+        if isinstance(source, io.BytesIO):
+            return source.getvalue()
+        return bytes(source)
+
+
+@singleton
+class PhotoImageCache:
+    """
+    Process-wide LRU of decoded Tk images, shared by every GUI running on the
+    same Tk interpreter. The cache is bounded by the approximate memory the
+    images occupy (4 bytes per pixel). Entries belong to the interpreter that
+    was current when they were created and are dropped when it changes, as Tk
+    images can't be used across interpreters. Callers that display an image
+    must keep their own reference to it, as eviction only releases the cache's.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_PHOTO_CACHE_BYTES) -> None:
+        self._max_bytes = max(0, max_bytes)
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._bytes = 0
+        self._root = None
+        self._lock = RLock()
+        self._hits = self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        with self._lock:
+            self._max_bytes = max(0, max_bytes)
+            self._evict()
+
+    @property
+    def size_in_bytes(self) -> int:
+        return self._bytes
+
+    @property
+    def hits(self) -> int:
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, factory: Callable[[], ImageTk.PhotoImage]) -> ImageTk.PhotoImage:
+        with self._lock:
+            root = getattr(tk, "_default_root", None)
+            if root is not self._root:
+                self.clear()
+                self._root = root
+            entry = self._entries.get(key, None)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            photo = factory()
+            cost = 4 * photo.width() * photo.height()
+            self._entries[key] = (photo, cost)
+            self._bytes += cost
+            self._evict(keep=key)
+            return photo
+
+    def release(self, root: Any = None) -> None:
+        """
+        Drop all images if they belong to root (or unconditionally if root is None);
+        called when a Tk interpreter is torn down.
+        """
+        with self._lock:
+            if root is None or root is self._root:
+                self.clear()
+                self._root = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def _evict(self, keep: Hashable = None) -> None:
+        while self._bytes > self._max_bytes and self._entries:
+            key, (_, cost) = next(iter(self._entries.items()))
+            if key == keep:
+                break
+            del self._entries[key]
+            self._bytes -= cost
@@ -211,7 +211,7 @@ class MotorsGui(StateBasedGui):
             if latest is None:
                 latest = self._state_for_tmcc(tmcc_id) or state
             if latest is not None:
-                self._message_queue.put((self.update_button, [latest]))
+                self.queue_update(self.update_button, latest, key=(self.update_button, tmcc_id))
 
         return upd
 
@@ -18,6 +18,7 @@ from guizero.base import Widget
 
 from .component_state_gui import ComponentStateGui
 from .components.hold_button import HoldButton
+from .components.virtual_grid import GridWindow, WidgetPool
 from .guizero_base import GuiZeroBase
 from ..db.component_state import ComponentState
 from ..db.state_watcher import StateWatcher
@@ -96,6 +97,8 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
         self._max_button_rows = self._max_button_cols = None
         self._first_button_col = 0
         self.sort_func = None
+        self._sorted_states: list[S] = []
+        self._button_pool: WidgetPool[HoldButton] | None = None
         self._screens = self._resolve_screens(screens)
         self._visible_button_cols = max(1, self._screens * self._COLS_PER_SCREEN)
 
@@ -163,7 +166,7 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
     def on_state_change_action(self, state: S) -> Callable:
         def upd():
             if not self._shutdown_flag.is_set() and state in self._state_buttons:
-                self._message_queue.put((self.update_button, [state]))
+                self.queue_update(self.update_button, state)
 
         return upd
 
@@ -306,10 +309,16 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
         for sw in self._state_watchers.values():
             sw.shutdown()
         self._state_watchers.clear()
+        if self._button_pool:
+            # the pool holds every button, hidden or not
+            self._button_pool.clear(self._release_state_widget)
+            self._button_pool = None
+            self._state_buttons.clear()
         if self._state_buttons:
             self._reset_state_buttons()
         self._state_buttons.clear()
         self._states.clear()
+        self._sorted_states = []
         self.sort_func = None
         for widget in [
             self.aggregator_combo,
@@ -354,25 +363,36 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
             if not isinstance(pdb, list):
                 pdb = [pdb]
             for widget in pdb:
-                if hasattr(widget, "component_state"):
-                    widget.component_state = None
-                # Only HoldButton needs explicit press/release unhooking.
-                # Setting these attributes on generic guizero widgets can trigger
-                # event re-binding during teardown against invalid tk handles.
-                if isinstance(widget, HoldButton):
-                    try:
-                        widget.when_left_button_pressed = None
-                        widget.when_left_button_released = None
-                    except GUI_CLEANUP_EXCEPTIONS:
-                        pass
-                self.safe_destroy(widget)
+                self._release_state_widget(widget)
         self._state_buttons.clear()
 
+    def _release_state_widget(self, widget: Widget) -> None:
+        if hasattr(widget, "component_state"):
+            widget.component_state = None
+        # Only HoldButton needs explicit press/release unhooking.
+        # Setting these attributes on generic guizero widgets can trigger
+        # event re-binding during teardown against invalid tk handles.
+        if isinstance(widget, HoldButton):
+            try:
+                widget.when_left_button_pressed = None
+                widget.when_left_button_released = None
+            except GUI_CLEANUP_EXCEPTIONS:
+                pass
+        self.safe_destroy(widget)
+
+    @property
+    def _recycles_state_buttons(self) -> bool:
+        # subclasses that build their own (composite) state buttons get them rebuilt on each page
+        return type(self)._make_state_button is StateBasedGui._make_state_button
+
     # noinspection PyTypeChecker
     def _make_state_buttons(self, states: list[S] = None) -> None:
         with self._cv:
             if states is None:
                 states = []
+            if self._recycles_state_buttons:
+                self._render_state_buttons(states)
+                return
             if self._state_buttons:
                 self._reset_state_buttons()
             active_col_start = self._first_button_col
@@ -423,6 +443,94 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
             self._post_process_state_buttons()
             self.btn_box.visible = True
 
+    # noinspection PyTypeChecker
+    def _render_state_buttons(self, states: list[S]) -> None:
+        """
+        Show the visible page of states on recycled buttons. Buttons are only
+        created for the visible columns, the first time they are needed; on a
+        scroll or sort, they are rebound to the states now visible.
+        """
+        if self._button_pool is None:
+            self._button_pool = WidgetPool(
+                self._create_state_button,
+                self._bind_state_slot,
+                hide=lambda pb: pb.hide(),
+                show=lambda pb: pb.show(),
+            )
+        self.by_name.show()
+        self.by_number.show()
+        if states and self.pd_button_height is None:
+            # measure one button to learn how many fit in a column
+            self._max_button_rows = None
+            self._button_pool.render(states[:1])
+            self.app.update()
+            self.pd_button_width = self._button_pool.widgets[0].tk.winfo_width()
+            self.pd_button_height = self._button_pool.widgets[0].tk.winfo_height()
+        if self._max_button_rows is None and self.pd_button_height:
+            self._max_button_rows = max(1, (self.height - self.y_offset) // self.pd_button_height)
+        window = GridWindow(
+            self._max_button_rows or 1,
+            self._visible_button_cols,
+            len(states),
+            self._first_button_col,
+        )
+        self._first_button_col = window.first_col
+        self._max_button_cols = window.cols
+        visible = states[window.start : window.stop]
+
+        self.btn_box.visible = False
+        self._state_buttons.clear()
+        for pb, pd in zip(self._button_pool.render(visible), visible):
+            self._state_buttons[pd] = pb
+        self._post_process_state_buttons()
+        self.btn_box.visible = True
+
+        if window.has_right:
+            self.right_scroll_btn.enable()
+        else:
+            self.right_scroll_btn.disable()
+        if window.has_left:
+            self.left_scroll_btn.enable()
+        else:
+            self.left_scroll_btn.disable()
+
+    def _state_button_grid(self, slot: int) -> list[int]:
+        col, row = divmod(slot, self._max_button_rows or 1)
+        return [col, row + 4]
+
+    def _create_state_button(self, slot: int) -> HoldButton:
+        return HoldButton(
+            self.btn_box,
+            grid=self._state_button_grid(slot),
+            text="",
+            text_size=int(round(15 * self._scale_by)),
+            width=max(8, int(round(self.width / self._visible_button_cols / (13 * self._scale_by)))),
+            padx=0,
+            pady=self._button_text_pad_y,
+            hold_threshold=1.0,
+            progress_fill_color="darkgrey",
+            progress_empty_color="white",
+            critical_fill_color="red",
+        )
+
+    def _bind_state_slot(self, pb: HoldButton, pd: S, slot: int) -> None:
+        grid = self._state_button_grid(slot)
+        if list(pb.grid) != grid:
+            pb.grid = grid
+        self._bind_state_button(pb, pd)
+
+    def _bind_state_button(self, pb: HoldButton, pd: S) -> None:
+        """
+        Make a recycled button show and switch pd
+        """
+        pb.text = f"{pd.tmcc_id}) {pd.road_name}"
+        pb.on_press = (self.switch_state, [pd])
+        pb.component_state = pd
+        if self.is_active(pd):
+            self.set_button_active(pb)
+        else:
+            self.set_button_inactive(pb)
+
     def _make_state_button(
         self,
         pd: S | Any,
@@ -470,29 +578,27 @@ class StateBasedGui(GuiZeroBase, Generic[S], ABC):
         self.by_name.text_bold = False
 
         self.sort_func = lambda x: x.tmcc_id
-        states = sorted(self._states.values(), key=self.sort_func)
+        self._sorted_states = sorted(self._states.values(), key=self.sort_func)
         self._first_button_col = 0
-        self._make_state_buttons(states)
+        self._make_state_buttons(self._sorted_states)
 
     def sort_by_name(self) -> None:
         self.by_name.text_bold = True
         self.by_number.text_bold = False
 
         self.sort_func = lambda x: x.road_name.lower()
-        states = sorted(self._states.values(), key=self.sort_func)
+        self._sorted_states = sorted(self._states.values(), key=self.sort_func)
         self._first_button_col = 0
-        self._make_state_buttons(states)
+        self._make_state_buttons(self._sorted_states)
 
     def scroll_left(self) -> None:
         self._first_button_col = max(0, self._first_button_col - 1)
-        states = sorted(self._states.values(), key=self.sort_func)
-        self._make_state_buttons(states)
+        self._make_state_buttons(self._sorted_states)
 
     def scroll_right(self) -> None:
         max_first_col = max(0, self._max_button_cols - self._visible_button_cols) if self._max_button_cols else 0
         self._first_button_col = min(self._first_button_col + 1, max_first_col)
-        states = sorted(self._states.values(), key=self.sort_func)
-        self._make_state_buttons(states)
+        self._make_state_buttons(self._sorted_states)
 
     def _post_process_state_buttons(self) -> None:
         pass
@@ -0,0 +1,164 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import OrderedDict
+from itertools import count
+from queue import Empty
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+log = logging.getLogger(__name__)
+
+# share of each 20 ms GUI frame spent running queued callbacks
+FRAME_BUDGET_S = 0.012
+
+
+class UpdateBus:
+    """
+    The queue of callbacks waiting to run on a GUI's Tk thread. Callbacks
+    run in the order they were queued, a frame at a time, until the frame's
+    time budget is spent; the rest wait for the next frame.
+
+    A callback posted with a key replaces any callback with the same key that
+    has not yet run, keeping its place in line, so a burst of state changes
+    to one widget (say, during a speed ramp) costs one redraw, of the latest
+    state, per frame rather than one per change. Callbacks put on the bus
+    without a key are never merged.
+
+    The bus can stand in for the Queue it replaces: put() and get_nowait()
+    take and give (callback, args) tuples.
+    """
+
+    def __init__(self, budget: float = FRAME_BUDGET_S) -> None:
+        self._budget = budget
+        self._lock = Lock()
+        self._pending: OrderedDict[Hashable, tuple[Callable, tuple | list]] = OrderedDict()
+        self._serial = count()
+        self._posted = self._merged = self._dropped = self._processed = 0
+        self._frames = self._deferred_frames = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    @property
+    def budget(self) -> float:
+        return self._budget
+
+    @property
+    def posted(self) -> int:
+        """
+        Number of callbacks queued
+        """
+        return self._posted
+
+    @property
+    def merged(self) -> int:
+        """
+        Number of keyed callbacks replaced by a later one before they ran
+        """
+        return self._merged
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of callbacks discarded by clear()
+        """
+        return self._dropped
+
+    @property
+    def processed(self) -> int:
+        """
+        Number of callbacks run
+        """
+        return self._processed
+
+    @property
+    def frames(self) -> int:
+        """
+        Number of frames drained
+        """
+        return self._frames
+
+    @property
+    def deferred_frames(self) -> int:
+        """
+        Number of frames that ran out of budget with callbacks still waiting
+        """
+        return self._deferred_frames
+
+    def qsize(self) -> int:
+        return len(self._pending)
+
+    def empty(self) -> bool:
+        return not self._pending
+
+    def put(self, message: tuple[Callable, tuple | list]) -> None:
+        """
+        Queue a (callback, args) tuple; it will not be merged with any other
+        """
+        with self._lock:
+            self._pending[(UpdateBus, next(self._serial))] = message
+            self._posted += 1
+
+    def post(self, key: Hashable, callback: Callable, *args: Any) -> None:
+        """
+        Queue callback(*args), replacing the pending callback with the same key, if any
+        """
+        with self._lock:
+            if key in self._pending:
+                self._merged += 1
+            self._pending[key] = (callback, args)
+            self._posted += 1
+
+    def get_nowait(self) -> tuple[Callable, tuple | list]:
+        with self._lock:
+            if not self._pending:
+                raise Empty
+            return self._pending.popitem(last=False)[1]
+
+    def drain(self, budget: float = None) -> int:
+        """
+        Run queued callbacks until the queue is empty or budget seconds have
+        passed; at least one callback runs. Returns the number run.
+        """
+        budget = self._budget if budget is None else budget
+        start = time.monotonic()
+        ran = 0
+        self._frames += 1
+        while True:
+            try:
+                callback, args = self.get_nowait()
+            except Empty:
+                break
+            try:
+                if args:
+                    callback(*args)
+                else:
+                    callback()
+            except Exception as e:
+                log.exception("Error processing GUI message callback", exc_info=e)
+            ran += 1
+            if time.monotonic() - start >= budget:
+                if self._pending:
+                    self._deferred_frames += 1
+                break
+        self._processed += ran
+        return ran
+
+    def clear(self) -> None:
+        """
+        Discard the callbacks not yet run
+        """
+        with self._lock:
+            self._dropped += len(self._pending)
+            self._pending.clear()
@@ -0,0 +1,147 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+from __future__ import annotations
+
+import logging
+from collections import deque
+from threading import Condition
+from typing import Callable, Iterable, List
+
+from .pdi_req import PdiReq
+
+log = logging.getLogger(__name__)
+
+# most requests sent to the Base 3 before one is answered
+DEFAULT_WINDOW = 4
+# seconds to wait for the Base 3 to answer before resending or giving up on a request
+DEFAULT_ACK_TIMEOUT = 1.0
+
+
+class AckWindow:
+    """
+    Paces a stream of PDI requests by the Base 3's answers rather than by
+    fixed sleeps: no more than window requests are awaiting an answer at a
+    time, and the next is sent as soon as one is answered. A request whose
+    answer (the Base 3 reply with the same as_key) does not arrive within
+    ack_timeout is resent up to retries times, then given up on.
+
+    The window does not listen for answers itself; the PdiListener subscriber
+    that owns it passes each reply it receives to answered().
+    """
+
+    def __init__(
+        self,
+        send: Callable[[PdiReq], None],
+        window: int = DEFAULT_WINDOW,
+        ack_timeout: float = DEFAULT_ACK_TIMEOUT,
+        retries: int = 0,
+    ) -> None:
+        self._send = send
+        self._window = max(1, window)
+        self._ack_timeout = ack_timeout
+        self._retries = max(0, retries)
+        self._cv = Condition()
+        # requests awaiting an answer, by key; requests sharing a key are answered in the order sent
+        self._pending: dict[tuple, deque[tuple[PdiReq, int]]] = {}
+        self._outstanding = 0
+        self._sent = self._answered = self._retried = self._lost = 0
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def outstanding(self) -> int:
+        """
+        Number of requests awaiting an answer
+        """
+        return self._outstanding
+
+    @property
+    def sent(self) -> int:
+        """
+        Number of requests sent, including resends
+        """
+        return self._sent
+
+    @property
+    def acknowledged(self) -> int:
+        """
+        Number of requests answered
+        """
+        return self._answered
+
+    @property
+    def retried(self) -> int:
+        return self._retried
+
+    @property
+    def lost(self) -> int:
+        """
+        Number of requests given up on
+        """
+        return self._lost
+
+    def answered(self, reply: PdiReq) -> bool:
+        """
+        Record reply; returns True if it answers a request awaiting an answer
+        """
+        with self._cv:
+            reqs = self._pending.get(reply.as_key, None)
+            if not reqs:
+                return False
+            reqs.popleft()
+            if not reqs:
+                del self._pending[reply.as_key]
+            self._outstanding -= 1
+            self._answered += 1
+            self._cv.notify_all()
+            return True
+
+    def send_all(self, reqs: Iterable[PdiReq]) -> List[PdiReq]:
+        """
+        Send reqs and wait until each is answered or given up on; returns those given up on
+        """
+        lost = []
+        with self._cv:
+            for req in reqs:
+                self._await_answers(self._window - 1, lost)
+                self._dispatch(req, 1)
+            self._await_answers(0, lost)
+        return lost
+
+    def _dispatch(self, req: PdiReq, attempt: int) -> None:
+        # called with self._cv held
+        self._pending.setdefault(req.as_key, deque()).append((req, attempt))
+        self._outstanding += 1
+        self._sent += 1
+        self._send(req)
+
+    def _await_answers(self, limit: int, lost: List[PdiReq]) -> None:
+        # called with self._cv held
+        while self._outstanding > limit:
+            outstanding = self._outstanding
+            if self._cv.wait_for(lambda: self._outstanding < outstanding, self._ack_timeout):
+                continue
+            # nothing was answered in time; resend, or give up on, the oldest request
+            key = next(iter(self._pending))
+            reqs = self._pending[key]
+            req, attempt = reqs.popleft()
+            if not reqs:
+                del self._pending[key]
+            self._outstanding -= 1
+            if attempt <= self._retries:
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Resending unanswered request: {req}")
+                self._retried += 1
+                self._dispatch(req, attempt + 1)
+            else:
+                self._lost += 1
+                lost.append(req)
@@ -14,9 +14,11 @@ import logging
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Callable, Optional, TYPE_CHECKING
 
 from .base_req import BaseReq
+from .constants import D4Action, PdiCommand
+from .pdi_req import PdiReq
 from ..utils.singleton import singleton
 
 log = logging.getLogger(__name__)
@@ -28,6 +30,9 @@ if TYPE_CHECKING:
 else:
     StateT = Any
 
+# PDI commands whose replies may answer a refresh query
+QUERY_REPLY_COMMANDS = frozenset({PdiCommand.BASE_MEMORY, PdiCommand.D4_ENGINE, PdiCommand.D4_TRAIN})
+
 
 @dataclass
 class _Bucket:
@@ -36,6 +41,10 @@ class _Bucket:
     last_t: float = 0.0
     last_activity_t: float = 0.0
     latest_state: Optional[StateT] = None
+    # bytes of the record to read, as (start, end); None to read the whole record
+    span: Optional[tuple[int, int]] = None
+    # when the outstanding query for this record was sent; 0 if none is
+    sent_t: float = 0.0
 
 
 # noinspection PyChainedComparisons
@@ -45,10 +54,17 @@ class Base3DbRefreshManager:
     Debounced, fire-and-forget Base 3 DB query sender.
 
     Call Base3DbRefreshManager.request_refresh(state) freely; calls are debounced
-    independently per key = f"{state.scope}:{state.tmcc_id}".
+    independently per key = f"{state.scope}:{state.tmcc_id}". Requests to read
+    just some fields of a record, request_query(state, start, length), share the
+    record's bucket; while a refresh is pending, further requests for the record
+    fold into it, and the query sent reads the span covering all of them.
 
     When a bucket becomes ready, we do:
-        BaseReq.create_base_query_request(state).send()
+        BaseReq.create_base_query_request(state, ...).send()
+
+    At most one query per record is in flight; requests made while it is
+    outstanding fold into a single follow-up, sent once the Base 3 answers
+    (answered(reply)) or the query times out.
 
     One daemon worker thread total.
     """
@@ -58,10 +74,14 @@ class Base3DbRefreshManager:
         self._wake = threading.Event()
         self._stop = threading.Event()
         self._thread: Optional[threading.Thread] = None
+        self._now: Callable[[], float] = time.monotonic
+        self._send: Callable[[PdiReq], None] = lambda req: req.send()
 
         # Debounce behavior
         self._debounce_s: float = 0.20
         self._max_delay_s: float = 1.0
+        # how long to wait for the answer to a query before sending a follow-up regardless
+        self._in_flight_s: float = 1.0
 
         # Cleanup to prevent unbounded growth
         self._bucket_ttl_s: float = 10.0 * 60.0  # prune idle buckets after 10 min
@@ -69,6 +89,10 @@ class Base3DbRefreshManager:
         self._next_cleanup_t: float = time.monotonic() + self._cleanup_interval_s
 
         self._buckets: dict[str, _Bucket] = {}
+        # outstanding queries, by query key, to the key of their bucket
+        self._in_flight: dict[tuple, str] = {}
+
+        self._requested = self._sent = self._folded = 0
 
     # ---- public API ----
 
@@ -78,7 +102,18 @@ class Base3DbRefreshManager:
         inst._ensure_started()
         if state is not None:
             inst._enqueue(state)
-            log.debug(f"Refresh request: {state.scope}:{state.tmcc_id}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Refresh request: {state.scope}:{state.tmcc_id}")
+
+    @classmethod
+    def request_query(cls, state: StateT, start: int, length: int) -> None:
+        """Refresh the length bytes of the record of state at offset start."""
+        inst = cls()
+        inst._ensure_started()
+        if state is not None:
+            inst._enqueue(state, (start, start + length))
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug(f"Query request: {state.scope}:{state.tmcc_id} [{start}:{start + length}]")
 
     @classmethod
     def flush(cls, state: StateT) -> None:
@@ -88,12 +123,66 @@ class Base3DbRefreshManager:
         inst._force_ready(state)
         inst._wake.set()
 
+    @classmethod
+    def answered(cls, reply: PdiReq) -> bool:
+        """
+        Clear the outstanding query reply answers, releasing any follow-up
+        refresh of its record; returns True if reply answered a query we sent
+        """
+        inst = cls()
+        if not inst._in_flight or reply.pdi_command not in QUERY_REPLY_COMMANDS:
+            return False
+        if reply.pdi_command != PdiCommand.BASE_MEMORY and reply.action != D4Action.QUERY:
+            return False
+        with inst._lock:
+            key = inst._in_flight.pop(inst._query_key(reply), None)
+            b = inst._buckets.get(key) if key is not None else None
+            if b is None:
+                return False
+            b.sent_t = 0.0
+            follow_up = b.pending
+        if follow_up:
+            inst._wake.set()
+        return True
+
+    @property
+    def requested(self) -> int:
+        """Number of refreshes and queries requested"""
+        return self._requested
+
+    @property
+    def sent(self) -> int:
+        """Number of queries sent to the Base 3"""
+        return self._sent
+
+    @property
+    def saved(self) -> int:
+        """Number of requests folded into a query sent for another request; the round trips saved"""
+        return self._folded
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
     # ---- internal ----
 
     @staticmethod
     def _key(state: StateT) -> str:
         return f"{state.scope}:{state.tmcc_id}"
 
+    @staticmethod
+    def _query_key(req: PdiReq) -> tuple:
+        # a reply echoes the record and span of the query it answers; BASE_MEMORY writes
+        # of the same record are acknowledged in kind, and are told apart by their flags
+        flags = req.flags if req.pdi_command == PdiCommand.BASE_MEMORY else None
+        return req.pdi_command, req.scope, req.record_no, req.start, req.data_length, flags
+
+    @staticmethod
+    def _query(state: StateT, span: Optional[tuple[int, int]]) -> PdiReq:
+        if span is None:
+            return BaseReq.create_base_query_request(state)
+        return BaseReq.create_base_query_request(state, start=span[0], data_length=span[1] - span[0])
+
     def _ensure_started(self) -> None:
         with self._lock:
             if self._thread and self._thread.is_alive():
@@ -106,20 +195,31 @@ class Base3DbRefreshManager:
             )
             self._thread.start()
 
-    def _enqueue(self, state: StateT) -> None:
-        """Enqueues state into time‑tracked bucket; wakes processing thread"""
-        now = time.monotonic()
+    def _bucket_locked(self, state: StateT, now: float, span: Optional[tuple[int, int]] = None) -> _Bucket:
         key = self._key(state)
+        b = self._buckets.get(key)
+        if b is None:
+            b = _Bucket()
+            self._buckets[key] = b
+
+        b.latest_state = state
+        b.last_activity_t = now
+        self._requested += 1
+        if b.pending:
+            # rides on the query already pending for this record
+            self._folded += 1
+            if b.span is not None:
+                b.span = None if span is None else (min(b.span[0], span[0]), max(b.span[1], span[1]))
+        else:
+            b.span = span
+        return b
+
+    def _enqueue(self, state: StateT, span: Optional[tuple[int, int]] = None) -> None:
+        """Enqueues state into time‑tracked bucket; wakes processing thread"""
+        now = self._now()
 
         with self._lock:
-            b = self._buckets.get(key)
-            if b is None:
-                b = _Bucket()
-                self._buckets[key] = b
-
-            b.latest_state = state
-            b.last_activity_t = now
-
+            b = self._bucket_locked(state, now, span)
             if not b.pending:
                 b.pending = True
                 b.first_t = now
@@ -128,18 +228,10 @@ class Base3DbRefreshManager:
         self._wake.set()
 
     def _force_ready(self, state: StateT) -> None:
-        now = time.monotonic()
-        key = self._key(state)
+        now = self._now()
 
         with self._lock:
-            b = self._buckets.get(key)
-            if b is None:
-                b = _Bucket()
-                self._buckets[key] = b
-
-            b.latest_state = state
-            b.last_activity_t = now
-
+            b = self._bucket_locked(state, now)
             b.pending = True
             b.first_t = now
             # make it "quiet long enough" immediately
@@ -151,67 +243,108 @@ class Base3DbRefreshManager:
             return
 
         cutoff = now - self._bucket_ttl_s
-        dead = [k for k, b in self._buckets.items() if (not b.pending) and (b.last_activity_t <= cutoff)]
+        for k, b in self._buckets.items():
+            if b.sent_t and now - b.sent_t >= self._in_flight_s:
+                self._expire_locked(k, b)
+        dead = [
+            k for k, b in self._buckets.items() if (not b.pending) and (not b.sent_t) and (b.last_activity_t <= cutoff)
+        ]
         for k in dead:
             self._buckets.pop(k, None)
 
         self._next_cleanup_t = now + self._cleanup_interval_s
 
-    def _run(self) -> None:
-        while not self._stop.is_set():
-            # Wake periodically even without events to ensure max_delay + cleanup work
-            self._wake.wait(timeout=0.25)
-            self._wake.clear()
-
-            if self._stop.is_set():
-                break
-
-            now = time.monotonic()
-            to_send: list[StateT] = []
-            next_sleep: Optional[float] = None
+    def _expire_locked(self, key: str, b: _Bucket) -> None:
+        self._in_flight = {k: v for k, v in self._in_flight.items() if v != key}
+        b.sent_t = 0.0
 
-            with self._lock:
-                # cleanup
-                if self._cleanup_interval_s > 0 and now >= self._next_cleanup_t:
-                    self._cleanup_locked(now)
+    def _dispatch_ready(self, now: float) -> Optional[float]:
+        """
+        Send the query of every ready bucket; returns how long until the
+        next bucket may be ready, or None if nothing is pending
+        """
+        to_send: list[tuple[str, PdiReq]] = []
+        next_sleep: Optional[float] = None
 
-                for b in self._buckets.values():
-                    if not b.pending or b.latest_state is None:
+        with self._lock:
+            # cleanup
+            if self._cleanup_interval_s > 0 and now >= self._next_cleanup_t:
+                self._cleanup_locked(now)
+
+            for key, b in self._buckets.items():
+                if not b.pending or b.latest_state is None:
+                    continue
+
+                if b.sent_t:
+                    waited = now - b.sent_t
+                    if waited < self._in_flight_s:
+                        # a query for this record is outstanding; hold the follow-up until it is answered
+                        candidate = max(0.01, self._in_flight_s - waited)
+                        if next_sleep is None or candidate < next_sleep:
+                            next_sleep = candidate
                         continue
+                    # no answer; stop waiting for one
+                    self._expire_locked(key, b)
 
-                    quiet_for = now - b.last_t
-                    age = now - b.first_t
+                quiet_for = now - b.last_t
+                age = now - b.first_t
 
-                    should_send = quiet_for >= self._debounce_s or (self._max_delay_s > 0 and age >= self._max_delay_s)
+                should_send = quiet_for >= self._debounce_s or (self._max_delay_s > 0 and age >= self._max_delay_s)
 
-                    if should_send:
-                        to_send.append(b.latest_state)
-                        b.pending = False
-                    else:
-                        # compute the earliest time we should re-check
-                        by_quiet = self._debounce_s - quiet_for
-                        by_max = (self._max_delay_s - age) if self._max_delay_s > 0 else by_quiet
-                        candidate = max(0.01, min(by_quiet, by_max))
-                        if next_sleep is None or candidate < next_sleep:
-                            next_sleep = candidate
-
-            # send outside lock
-            if to_send:
-                for state in to_send:
+                if should_send:
                     try:
-                        if state is not None:
-                            BaseReq.create_base_query_request(state).send()
-                            log.debug(f"Update requested: {state.scope}:{state.tmcc_id}")
+                        req = self._query(b.latest_state, b.span)
                     except Exception as e:
-                        log.exception(f"Base3DbRefreshManager: failed to send base query request: {e}")
-                continue
-
-            if next_sleep is not None:
-                # Sleep until the earliest bucket is due (or until new activity arrives),
-                # then re-evaluate with a fresh time.monotonic().
-                self._wake.wait(timeout=next_sleep)
-                self._wake.clear()
-                continue
+                        log.exception(f"Base3DbRefreshManager: failed to build base query request: {e}")
+                    else:
+                        self._in_flight[self._query_key(req)] = key
+                        b.sent_t = now
+                        to_send.append((key, req))
+                    b.pending = False
+                    b.span = None
+                else:
+                    # compute the earliest time we should re-check
+                    by_quiet = self._debounce_s - quiet_for
+                    by_max = (self._max_delay_s - age) if self._max_delay_s > 0 else by_quiet
+                    candidate = max(0.01, min(by_quiet, by_max))
+                    if next_sleep is None or candidate < next_sleep:
+                        next_sleep = candidate
+
+        # send outside lock
+        for key, req in to_send:
+            try:
+                self._send(req)
+                self._sent += 1
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug(f"Update requested: {key}")
+            except Exception as e:
+                with self._lock:
+                    self._in_flight.pop(self._query_key(req), None)
+                    b = self._buckets.get(key)
+                    if b is not None:
+                        b.sent_t = 0.0
+                log.exception(f"Base3DbRefreshManager: failed to send base query request: {e}")
+        if to_send and log.isEnabledFor(logging.DEBUG):
+            log.debug(
+                f"Base3DbRefreshManager: {self._sent} queries sent for {self._requested} requests, "
+                f"{self._folded} round trips saved"
+            )
+        return next_sleep
+
+    def _run(self) -> None:
+        timeout = 0.25
+        while not self._stop.is_set():
+            # Wake periodically even without events to ensure max_delay + cleanup work
+            self._wake.wait(timeout=timeout)
+            self._wake.clear()
+
+            if self._stop.is_set():
+                break
+
+            # Sleep until the earliest bucket is due (or until new activity arrives),
+            # then re-evaluate with a fresh time
+            next_sleep = self._dispatch_ready(self._now())
+            timeout = 0.25 if next_sleep is None else min(next_sleep, 0.25)
 
     def stop(self) -> None:
         """Optional; daemon thread means you don't need this for shutdown."""
@@ -119,16 +119,27 @@ class BaseReq(PdiReq, CompDataMixin):
     # noinspection PyTypeChecker,PyUnusedLocal
     @classmethod
     def request_config(cls, state: ComponentState, cmd: CommandReq) -> BaseReq | None:
+        from .base3_db_refresh_manager import Base3DbRefreshManager
+
         refresh_requested = False
         if state.scope in {CommandScope.ENGINE, CommandScope.TRAIN}:
             state_changes = BaseReq.update_eng(cmd)
             refresh_requested = BaseReq.process_sync_reqs(state_changes, lambda r: r.send())
-        return None if refresh_requested else cls.create_base_query_request(state)
+        if not refresh_requested:
+            # query now, unless a query of this record is already outstanding
+            Base3DbRefreshManager.flush(state)
+        return None
 
     @classmethod
-    def create_base_query_request(cls, state: ComponentState) -> BaseReq | D4Req:
+    def create_base_query_request(cls, state: ComponentState, start: int = 0, data_length: int = 0) -> BaseReq | D4Req:
         if 1 <= state.tmcc_id <= 99:
-            return cls(state.address, pdi_command=PdiCommand.BASE_MEMORY, scope=state.scope)
+            return cls(
+                state.address,
+                pdi_command=PdiCommand.BASE_MEMORY,
+                scope=state.scope,
+                start=start,
+                data_length=data_length,
+            )
         else:
             from .d4_req import D4Req
 
@@ -136,8 +147,8 @@ class BaseReq(PdiReq, CompDataMixin):
                 state.record_no,
                 PdiCommand.D4_TRAIN if state.scope == CommandScope.TRAIN else PdiCommand.D4_ENGINE,
                 D4Action.QUERY,
-                start=0,
-                data_length=0xC0,
+                start=start,
+                data_length=data_length if data_length else 0xC0,
             )
 
     @classmethod
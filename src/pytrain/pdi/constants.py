@@ -276,12 +276,37 @@ class ActionDef:
         return f"{self.bits} [{opts}]"
 
 
+# action bits to action, per PdiAction enum; built the first time an enum decodes an action byte
+_ACTION_BITS_MAP: dict[type, dict[int, PdiAction]] = {}
+
+
 @unique
 class PdiAction(Mixins, FriendlyMixins):
     """
     Marker interface for all Pdi Action enums
     """
 
+    @classmethod
+    def by_bits(cls, bits: int) -> PdiAction | None:
+        """
+        The action of this enum with the given bits, as received in PDI packets
+        """
+        actions = _ACTION_BITS_MAP.get(cls, None)
+        if actions is None:
+            actions = {}
+            for action in cls.__members__.values():
+                actions.setdefault(action.bits, action)
+            _ACTION_BITS_MAP[cls] = actions
+        return actions.get(bits, None)
+
+    @classmethod
+    def _missing_(cls, value) -> PdiAction:
+        if type(value) is int:
+            action = cls.by_bits(value)
+            if action is not None:
+                return action
+        return super()._missing_(value)
+
     def __repr__(self) -> str:
         return f"{self.title} [{self.opts}]"
 
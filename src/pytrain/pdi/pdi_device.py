@@ -275,7 +275,7 @@ class DeviceWrapper:
                     action_byte = 0x7FF & action_byte
                 else:
                     error = False
-                action = self.enums.by_value(action_byte)
+                action = self.enums.by_bits(action_byte)
                 return self.req_class(data, action=action, error=error)
             else:
                 return self.req_class(data)
@@ -421,14 +421,17 @@ class PdiDevice(Mixins, FriendlyMixins):
 
     @classmethod
     def from_pdi_command(cls, cmd: PdiCommand) -> PdiDevice | None:
-        try:
-            return cls(cmd.name.split("_")[0].upper())
-        except ValueError as ve:
-            raise NotImplementedError(f"Unsupported PDI command: {cmd.name if cmd else 'unknown'}") from ve
+        device = PDI_COMMAND_TO_DEVICE_MAP.get(cmd, None)
+        if device is None:
+            raise NotImplementedError(f"Unsupported PDI command: {cmd.name if cmd else 'unknown'}")
+        return device
 
     @classmethod
     def from_data(cls, data: bytes) -> PdiDevice:
-        return cls(PdiCommand(data[1]).name.split("_")[0].upper())
+        device = PDI_COMMAND_TO_DEVICE_MAP.get(PdiCommand(data[1]), None)
+        if device is None:
+            raise ValueError(f"Unsupported PDI command: {PdiCommand(data[1]).name}")
+        return device
 
     @property
     def can_build_device(self) -> bool:
@@ -475,6 +478,19 @@ class PdiDevice(Mixins, FriendlyMixins):
         return self.value.identify(tmcc_id, ident)
 
 
+def _device_of(cmd: PdiCommand) -> PdiDevice | None:
+    # PDI commands are named for the device that handles them (BASE_MEMORY, ASC2_SET, ...)
+    try:
+        return PdiDevice(cmd.name.split("_")[0].upper())
+    except ValueError:
+        return None
+
+
+PDI_COMMAND_TO_DEVICE_MAP: dict[PdiCommand, PdiDevice] = {
+    cmd: device for cmd in PdiCommand if (device := _device_of(cmd)) is not None
+}
+
+
 class SystemDeviceDict(defaultdict):
     """
     Maintains a dictionary of CommandScope to ComponentStateDict
@@ -18,6 +18,7 @@ from queue import Queue
 from threading import Thread
 from typing import Generic, Tuple
 
+from .base3_db_refresh_manager import Base3DbRefreshManager, QUERY_REPLY_COMMANDS
 from .base_req import BaseReq
 from .constants import PDI_EOP, PDI_SOP, PDI_STF, PdiAction, PdiCommand
 from .pdi_req import PdiReq, TmccReq
@@ -319,6 +320,9 @@ class PdiDispatcher(Thread, Generic[Topic, Message]):
 
                 # publish dispatched pdi commands to listeners
                 if isinstance(cmd, PdiReq):
+                    if cmd.pdi_command in QUERY_REPLY_COMMANDS:
+                        # release refreshes of this record held for the answer to a query
+                        Base3DbRefreshManager.answered(cmd)
                     if isinstance(cmd, BaseReq):
                         # on the PyTrain server, we need to know when the initial
                         # roster sync is complete; we do this by looking for the
@@ -11,6 +11,7 @@
 from __future__ import annotations
 
 import logging
+import re
 import sys
 from abc import ABC, ABCMeta, abstractmethod
 from time import sleep
@@ -34,6 +35,12 @@ log = logging.getLogger(__name__)
 
 T = TypeVar("T", bound=PdiAction)
 
+PDI_RESERVED_BYTES = bytes((PDI_SOP, PDI_STF, PDI_EOP))
+STF_BYTE = PDI_STF.to_bytes(1, byteorder="big")
+STUFF_RE = re.compile(b"[" + re.escape(PDI_RESERVED_BYTES) + b"]")
+STUFF_TEMPLATE = STF_BYTE + rb"\g<0>"
+UNSTUFF_RE = re.compile(re.escape(STF_BYTE) + b"(.?)", re.DOTALL)
+
 LIONEL_ENGINE_RECORD_LENGTH: int = 0xC0
 SCOPE_TO_RECORD_LENGTH = {
     CommandScope.ENGINE: LIONEL_ENGINE_RECORD_LENGTH,
@@ -53,15 +60,9 @@ class PdiReq(ABC):
     def from_bytes(cls, data: bytes) -> Self:
         # throws an exception if we can't dereference
         pdi_cmd = PdiCommand(data[1])
-        try:
-            from .pdi_device import PdiDevice
+        from .pdi_device import PdiDevice
 
-            dev = PdiDevice.from_pdi_command(pdi_cmd)
-            return dev.build_req(data)
-        except AttributeError as ae:
-            raise ae
-        except ValueError as ve:
-            raise ve
+        return PdiDevice.from_pdi_command(pdi_cmd).build_req(data)
 
     @classmethod
     def scope_record_length(cls, scope: CommandScope) -> int:
@@ -112,33 +113,22 @@ class PdiReq(ABC):
         Used to calculate checksums on packets we send as well as to strip Stuff bytes
         from packets we receive
         """
-        byte_stream = bytes()
-        check_sum = 0
-        last_byte = None
-        for b in data:
-            check_sum += b
-            if b in {PDI_SOP, PDI_STF, PDI_EOP}:
-                if add_stf:
-                    # add the stuff byte to the output and account for it in the check sum
-                    check_sum += PDI_STF
-                    byte_stream += PDI_STF.to_bytes(1, byteorder="big")
-                elif b in {PDI_SOP, PDI_EOP}:
-                    # we are parsing a received packet; strip stuff byte
-                    pass  # we want this byte added to the output stream
-                else:
-                    # this must be a stuff byte, and we are receiving; strip it
-                    # unless the previous byte was also a stuff byte
-                    if last_byte != PDI_STF:
-                        last_byte = b
-                        continue
-            byte_stream += b.to_bytes(1, byteorder="big")
-            last_byte = b
-        # do checksum calculation on buffer
-        byte_sum = check_sum
-        check_sum = 0xFF & (0 - check_sum)
+        byte_stream = bytes(data)
+        # the checksum covers the packet as sent, stuff bytes included
+        byte_sum = sum(byte_stream)
+        if add_stf:
+            # precede each SOP, STF, and EOP byte with a stuff byte
+            stuffed = len(byte_stream) - len(byte_stream.translate(None, PDI_RESERVED_BYTES))
+            if stuffed:
+                byte_stream = STUFF_RE.sub(STUFF_TEMPLATE, byte_stream)
+                byte_sum += PDI_STF * stuffed
+        elif PDI_STF in byte_stream:
+            # we are parsing a received packet; strip the stuff bytes, keeping the bytes they precede
+            byte_stream = UNSTUFF_RE.sub(rb"\1", byte_stream)
+        check_sum = 0xFF & (0 - byte_sum)
         if check_sum in {PDI_SOP, PDI_STF, PDI_EOP}:
             if add_stf:
-                byte_stream += PDI_STF.to_bytes(1, byteorder="big")
+                byte_stream += STF_BYTE
             byte_sum += PDI_STF
             check_sum = 0xFF & (0 - byte_sum)
         return byte_stream, check_sum.to_bytes(1, byteorder="big")
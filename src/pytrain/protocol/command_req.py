@@ -63,10 +63,43 @@ log = logging.getLogger(__name__)
 E = TypeVar("E", bound=CommandDefEnum)
 R = TypeVar("R", bound="CommandReq")
 
+# most traffic is a small set of words (speed steps, bell, horn, the same few engines);
+# the requests they build are kept as templates, and copied rather than rebuilt
+INTERN_LIMIT = 4096
+
 
 class CommandReq:
+    """
+    A TMCC1 or Legacy (TMCC2) command word, with its address and data applied.
+
+    Plain CommandReqs are built by the tens of thousands (every decoded word,
+    every ramp step, every effect), so the class uses __slots__ and caches its
+    encoded bytes until its address, data, or scope change. Requests built
+    with the same (command, address, data, scope), or decoded from the same
+    bytes, are copied from an interned template rather than constructed and
+    validated again; each caller still gets its own instance to modify.
+    """
+
     from ..pdi.pdi_req import PdiReq
 
+    __slots__ = (
+        "_command_def_enum",
+        "_command_name",
+        "_command_def",
+        "_address",
+        "_data",
+        "_native_scope",
+        "_scope",
+        "_buffer",
+        "_message_processor",
+        "_is_tmcc_rx",
+        "_is_tmcc4",
+        "_command_bits",
+        "_as_bytes",
+        # created only if something sets an attribute of its own on a request
+        "__dict__",
+    )
+
     @classmethod
     def build(
         cls,
@@ -77,6 +110,10 @@ class CommandReq:
     ) -> Self:
         if isinstance(command, bytes):
             return cls.from_bytes(bytes(command))
+        key = (command, address, data, scope)
+        template = _INTERNED_REQS.get(key, None)
+        if template is not None:
+            return template._clone()
         cls._vet_request(command, address, data, scope)
         # we have to do these imports here to avoid cyclic dependencies
         from ..protocol.multibyte.multibyte_constants import TMCC2MultiByteEnum
@@ -91,7 +128,9 @@ class CommandReq:
 
             return MultiByteReq.build(command, address, data, scope)
         elif isinstance(command, CommandDefEnum):
-            return CommandReq(command, address, data, scope)
+            req = CommandReq(command, address, data, scope)
+            _intern(_INTERNED_REQS, key, req)
+            return req
         else:
             raise TypeError(f"Command type not recognized {command}")
 
@@ -109,10 +148,17 @@ class CommandReq:
             return PdiReq.from_bytes(param)
         first_byte = int(param[0])
         cmd_req = None
-        if first_byte in TMCC4_FIRST_BYTE_TO_INTERPRETER:
-            cmd_req = TMCC4_FIRST_BYTE_TO_INTERPRETER[first_byte](param)
-        elif is_tmcc4 is False and first_byte in TMCC_FIRST_BYTE_TO_INTERPRETER:
-            cmd_req = TMCC_FIRST_BYTE_TO_INTERPRETER[first_byte](param)
+        template = _INTERNED_WORDS.get((bytes(param), is_tmcc4), None)
+        if template is not None:
+            cmd_req = template._clone()
+        else:
+            if first_byte in TMCC4_FIRST_BYTE_TO_INTERPRETER:
+                cmd_req = TMCC4_FIRST_BYTE_TO_INTERPRETER[first_byte](param)
+            elif is_tmcc4 is False and first_byte in TMCC_FIRST_BYTE_TO_INTERPRETER:
+                cmd_req = TMCC_FIRST_BYTE_TO_INTERPRETER[first_byte](param)
+            if type(cmd_req) is CommandReq:
+                # multibyte requests are rarer, and keep state of their own
+                _intern(_INTERNED_WORDS, (bytes(param), is_tmcc4), cmd_req)
         if cmd_req is not None:
             if from_tmcc_rx:
                 cmd_req._is_tmcc_rx = True
@@ -171,7 +217,11 @@ class CommandReq:
             # return TMCC1_COMMAND_PREFIX.to_bytes(1, byteorder="big")
         elif isinstance(command, TMCC2CommandDef):
             validated_scope = cls._validate_requested_scope(command, scope)
-            return TMCC2CommandPrefix(validated_scope.name).as_bytes
+            prefix = _TMCC2_PREFIX_BYTES.get(validated_scope, None)
+            if prefix is None:
+                # the enum lookup by name is slow; there are only a few scopes
+                prefix = _TMCC2_PREFIX_BYTES[validated_scope] = TMCC2CommandPrefix(validated_scope.name).as_bytes
+            return prefix
         raise TypeError(f"Command type not recognized {command}")
 
     # noinspection PyUnreachableCode
@@ -259,11 +309,15 @@ class CommandReq:
             buffer = CommBuffer.build(baudrate=baudrate, port=port, server=server)
         delay = 0 if delay is None else delay
         duration = 0 if duration is None else duration
-        for rep_no in range(repeat):
+        # delayed repeats are sent, back to back, by one periodic job
+        batched = delay > 0 and repeat > 1
+        for rep_no in range(1 if batched else repeat):
             for prefix in prefix_bytes:
                 buffer.enqueue_command(prefix, delay)
             # send the command to the Lionel Base 3 (or Ser 2)
-            if request:
+            if batched:
+                buffer.schedule_job(request if request else cmd, 0, repeat, delay, replace=False)
+            elif request:
                 buffer.enqueue_command(request, delay)
             else:
                 buffer.enqueue_command(cmd, delay)
@@ -277,13 +331,14 @@ class CommandReq:
                     else:
                         continue  # we shouldn't ever get here
                     buffer.enqueue_command(effect_cmd.as_bytes, delay)
-            if duration > 0:
-                # convert duration into milliseconds, then queue a command to fire
-                # every 100 msec for the duration
-                interval = interval if interval else DEFAULT_DURATION_INTERVAL_MSEC
-                # Queues repeated commands at fixed intervals over duration
-                for d in range(interval, int(round(duration * 1000)), interval):
-                    buffer.enqueue_command(cmd, delay + (d / 1000.0))
+        if duration > 0:
+            # resend the command every interval (default, 50 msec) for the duration;
+            # one periodic job does this, replacing any hold of the same command. It is
+            # scheduled once, not once per repeat, whose resends would land on the same ticks
+            interval = interval if interval else DEFAULT_DURATION_INTERVAL_MSEC
+            count = len(range(interval, int(round(duration * 1000)), interval))
+            if count:
+                buffer.schedule_job(cmd, interval / 1000.0, count, delay + (interval / 1000.0))
 
     @staticmethod
     def results_in(command: CommandReq) -> Set[E]:
@@ -348,6 +403,7 @@ class CommandReq:
         self._message_processor = None
         self._is_tmcc_rx = False
         self._is_tmcc4 = False
+        self._as_bytes: bytes | None = None
 
         # save the command bits from the def, as we will be modifying them
         self._command_bits: int = self._command_def.bits
@@ -358,10 +414,43 @@ class CommandReq:
 
     def __eq__(self, other):
         if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
+            return self._eq_key() == other._eq_key()
         else:
             return False
 
+    def _eq_key(self) -> tuple:
+        # everything but the cached encoding; reading __dict__ creates it, so plain requests
+        # compare their slots, and only subclasses, which set attributes of their own, add theirs
+        key = (
+            self._command_def_enum,
+            self._address,
+            self._data,
+            self._scope,
+            self._buffer,
+            self._message_processor,
+            self._is_tmcc_rx,
+            self._is_tmcc4,
+            self._command_bits,
+        )
+        return key if type(self) is CommandReq else key + (self.__dict__,)
+
+    def _clone(self) -> CommandReq:
+        clone = object.__new__(CommandReq)
+        clone._command_def_enum = self._command_def_enum
+        clone._command_name = self._command_name
+        clone._command_def = self._command_def
+        clone._address = self._address
+        clone._data = self._data
+        clone._native_scope = self._native_scope
+        clone._scope = self._scope
+        clone._buffer = None
+        clone._message_processor = None
+        clone._is_tmcc_rx = self._is_tmcc_rx
+        clone._is_tmcc4 = self._is_tmcc4
+        clone._command_bits = self._command_bits
+        clone._as_bytes = self._as_bytes
+        return clone
+
     # noinspection PyCallingNonCallable
     def __call__(self, message: CommandReq) -> None:
         """
@@ -566,13 +655,16 @@ class CommandReq:
 
     @property
     def as_bytes(self) -> bytes:
-        if self.scope is None:
-            first_byte = self.command_def.first_byte
-        else:
-            first_byte = self._determine_first_byte(self.command_def, self.scope)
-        byte_str = first_byte + self._command_bits.to_bytes(2, byteorder="big")
-        if self.address > 99:
-            byte_str += str(self.address).zfill(4).encode()
+        byte_str = self._as_bytes
+        if byte_str is None:
+            if self.scope is None:
+                first_byte = self.command_def.first_byte
+            else:
+                first_byte = self._determine_first_byte(self.command_def, self.scope)
+            byte_str = first_byte + self._command_bits.to_bytes(2, byteorder="big")
+            if self.address > 99:
+                byte_str += str(self.address).zfill(4).encode()
+            self._as_bytes = byte_str
         return byte_str
 
     def as_action(
@@ -619,6 +711,7 @@ class CommandReq:
         return send_func
 
     def _apply_address(self, new_address: int = None) -> int:
+        self._as_bytes = None
         if not self.command_def.is_addressable:  # HALT command
             return self._command_bits
         # reset existing address bits, if any
@@ -643,6 +736,7 @@ class CommandReq:
         apply the data bits to the command action bytes to form the complete byte
         set to send to the Lionel LCS SER2.
         """
+        self._as_bytes = None
         data = new_data if new_data is not None else self.data
         if self.num_data_bits and data is None:
             raise ValueError("Data is required")
@@ -667,6 +761,7 @@ class CommandReq:
         return self._command_bits
 
     def _apply_scope(self, new_scope: CommandScope = None) -> int:
+        self._as_bytes = None
         scope = new_scope if new_scope is not None else self.scope
         if self.syntax == CommandSyntax.TMCC and self.identifier == TMCC1CommandIdentifier.ENGINE:
             self._command_bits &= TMCC1_TRAIN_COMMAND_PURIFIER
@@ -748,6 +843,22 @@ class CommandReq:
         return cls.build_tmcc2_command_req(param, is_tmcc4=True)
 
 
+_INTERNED_REQS: dict[tuple, CommandReq] = {}
+_INTERNED_WORDS: dict[tuple[bytes, bool], CommandReq] = {}
+
+
+def _intern(interned: dict, key: tuple, req: CommandReq) -> None:
+    if len(interned) >= INTERN_LIMIT:
+        interned.clear()
+    # the template is a private copy, so later changes to req don't leak into it;
+    # encode it now so every copy starts with its bytes
+    _ = req.as_bytes
+    interned[key] = req._clone()
+
+
+_TMCC2_PREFIX_BYTES: dict[CommandScope, bytes] = {}
+
+
 TMCC4_FIRST_BYTE_TO_INTERPRETER = {
     LEGACY_ENGINE_COMMAND_PREFIX: CommandReq.build_tmcc4_command_req,
     LEGACY_TRAIN_COMMAND_PREFIX: CommandReq.build_tmcc4_command_req,
@@ -0,0 +1,333 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from __future__ import annotations
+
+import logging
+import time
+from threading import Condition, RLock, Thread
+from typing import Any, Callable
+
+from ..command_def import CommandDefEnum
+from ..constants import DEFAULT_ADDRESS, PROGRAM_NAME, CommandScope
+from ..tmcc2.tmcc2_constants import TMCC2EngineCommandEnum, tmcc2_speed_to_rpm
+
+log = logging.getLogger(__name__)
+
+FIRST_STEP_DELAY: float = 0.100  # seconds from the request to the first speed step
+BASE_STEP_INTERVAL: float = 0.200  # seconds between speed steps at momentum 0
+MIN_DIALOG_DELAY: float = 2.5  # engineer dialog never follows the tower by less than this
+
+Sender = Callable[[CommandDefEnum, int, int, CommandScope], None]
+Step = list[tuple[CommandDefEnum, int]]
+
+
+def labor_delta(cur_speed: int, new_speed: int, cur_labor: int) -> int:
+    delta = new_speed - cur_speed
+    if delta > 0:
+        return min(31, max(0, round((delta * 0.09546) - 0.5401)) + cur_labor)
+    elif delta < 0:
+        return max(0, cur_labor - max(0, round((-0.06030 * delta) + 0.01052)))
+    else:
+        return cur_labor
+
+
+def send_request(command: CommandDefEnum, address: int, data: int, scope: CommandScope) -> None:
+    from ..command_req import CommandReq
+
+    CommandReq.build(command, address, data, scope).send()
+
+
+class SpeedRamp:
+    """
+    One engine or train's speed change in progress. Nothing is precomputed;
+    each call to step() emits the commands for the next speed step, with
+    labor and RPM commands sent only when their values actually change.
+    """
+
+    def __init__(
+        self,
+        state: Any,
+        target: int,
+        speed_enum: CommandDefEnum,
+        engineer: CommandDefEnum = None,
+        now: float = None,
+    ) -> None:
+        now = time.monotonic() if now is None else now
+        self._state = state
+        self._scope = state.scope
+        self._tmcc_id = state.tmcc_id
+        self._is_legacy = state.is_legacy
+        self._is_rpm = state.is_legacy and state.is_rpm
+        self._speed = state.speed
+        if state.is_ramping:
+            self._rpm = 0
+            self._base_labor = 12
+        else:
+            self._rpm = state.rpm
+            self._base_labor = state.labor
+        self._labor = None
+        self._target = self._speed
+        self._speed_enum = speed_enum
+        self._due = now + FIRST_STEP_DELAY
+        self._dialog = None
+        self._dialog_due = None
+        self._primed = False
+        self._done = False
+        self.retarget(target, speed_enum, engineer, now)
+
+    def __repr__(self) -> str:
+        return f"<SpeedRamp {self._scope.title} {self._tmcc_id}: {self._speed} -> {self._target}>"
+
+    @property
+    def key(self) -> tuple[CommandScope, int]:
+        return self._scope, self._tmcc_id
+
+    @property
+    def speed(self) -> int:
+        """
+        The last speed step sent
+        """
+        return self._speed
+
+    @property
+    def target(self) -> int:
+        return self._target
+
+    @property
+    def next_due(self) -> float:
+        return self._due
+
+    @property
+    def is_done(self) -> bool:
+        return self._done
+
+    def retarget(
+        self,
+        target: int,
+        speed_enum: CommandDefEnum = None,
+        engineer: CommandDefEnum = None,
+        now: float = None,
+    ) -> None:
+        """
+        Change the speed this ramp is heading to, continuing from the last step sent
+        """
+        now = time.monotonic() if now is None else now
+        state = self._state
+        if state.speed_max is not None:
+            target = min(target, state.speed_max)
+        if speed_enum is not None:
+            self._speed_enum = speed_enum
+        tmcc2 = self._is_legacy
+        self._inc = 3 if tmcc2 else 1
+        if state.momentum is not None:
+            self._interval = BASE_STEP_INTERVAL + (state.momentum * (0.010 if tmcc2 else 0.1))
+            if tmcc2:
+                self._inc = 2 if state.momentum >= 4 else self._inc
+                self._inc = 1 if state.momentum >= 6 else self._inc
+        else:
+            self._interval = BASE_STEP_INTERVAL
+        reversing = (self._target - self._speed) * (target - self._speed) <= 0
+        self._target = target
+        self._done = False
+        if reversing:
+            # labor and rpm follow the direction of the speed change
+            self._primed = False
+        # keep the current cadence, but don't make a new request wait behind a slow step
+        self._due = min(self._due, now + FIRST_STEP_DELAY) if self._speed != target else now
+        self._dialog = engineer
+        self._started = now
+        self._dialog_due = None
+
+    def step(self, now: float) -> Step:
+        """
+        Returns the commands for the next step of the ramp and arms the time of the one after
+        """
+        cmds: Step = []
+        if self._dialog_due is not None:
+            cmds.append((self._dialog, 0))
+            self._dialog = self._dialog_due = None
+            self._done = True
+            return cmds
+        target = self._target
+        if not self._primed:
+            self._primed = True
+            if self._speed != target:
+                self._send_labor(cmds, labor_delta(self._speed, target, self._base_labor))
+                # if we're decelerating, kill RPM up front
+                if self._is_rpm and self._speed > target:
+                    self._send_rpm(cmds, tmcc2_speed_to_rpm(target))
+        if self._speed < target:
+            speed = self._speed + self._inc
+        else:
+            speed = self._speed - self._inc
+        if (self._speed < speed < target) or (target < speed < self._speed):
+            accelerating = speed > self._speed
+            cmds.append((self._speed_enum, speed))
+            self._speed = speed
+            if self._is_legacy:
+                self._send_labor(cmds, labor_delta(speed, target, self._base_labor))
+                if self._is_rpm and accelerating:
+                    self._send_rpm(cmds, tmcc2_speed_to_rpm(speed))
+            self._due = max(self._due + self._interval, now)
+            return cmds
+        # make sure the final speed is requested
+        cmds.append((self._speed_enum, target))
+        self._speed = target
+        if self._is_legacy:
+            self._send_labor(cmds, self._base_labor)
+            if self._is_rpm:
+                self._send_rpm(cmds, tmcc2_speed_to_rpm(target))
+        if self._dialog is not None:
+            self._dialog_due = max(now, self._started + MIN_DIALOG_DELAY)
+            self._due = self._dialog_due
+        else:
+            self._done = True
+        return cmds
+
+    def _send_labor(self, cmds: Step, labor: int) -> None:
+        if labor != self._labor:
+            cmds.append((TMCC2EngineCommandEnum.ENGINE_LABOR, labor))
+            self._labor = labor
+
+    def _send_rpm(self, cmds: Step, rpm: int) -> None:
+        if rpm != self._rpm:
+            cmds.append((TMCC2EngineCommandEnum.DIESEL_RPM, rpm))
+            self._rpm = rpm
+
+
+class RampController(Thread):
+    """
+    Runs every speed ramp in the process from one thread, with at most one
+    active ramp per engine or train. The thread sleeps until the next ramp
+    step is due and computes that step only when its time comes, so a new
+    speed request simply retargets the engine's ramp in place, and canceling
+    a ramp is a dictionary delete rather than a sweep of scheduled commands.
+    """
+
+    _instance = None
+    _lock = RLock()
+
+    @classmethod
+    def get(cls) -> RampController:
+        with cls._lock:
+            if cls._instance is None or not cls._instance.is_alive():
+                cls._instance = RampController()
+            return cls._instance
+
+    @classmethod
+    def cancel(cls, tmcc_id: int = DEFAULT_ADDRESS, scope: CommandScope = None) -> None:
+        """
+        Stop the ramps of the given engine or train; TMCC ID 99 stops them all
+        """
+        instance = cls._instance
+        if instance is not None:
+            instance.cancel_ramp(tmcc_id, scope)
+
+    @classmethod
+    def is_ramping_to(cls, state: Any, target: int) -> bool:
+        """
+        True if this process is ramping state's engine or train to target
+        """
+        instance = cls._instance
+        if instance is None:
+            return False
+        ramp = instance.ramp_for(state.scope, state.tmcc_id)
+        if ramp is None:
+            return False
+        if state.speed_max is not None:
+            target = min(target, state.speed_max)
+        return ramp.target == target
+
+    def __init__(self, send: Sender = send_request) -> None:
+        super().__init__(daemon=True, name=f"{PROGRAM_NAME} Ramp Controller")
+        self._send = send
+        self._cv = Condition()
+        self._ramps: dict[tuple[CommandScope, int], SpeedRamp] = {}
+        self._running = True
+        self._steps = 0
+        self.start()
+
+    @property
+    def is_running(self) -> bool:
+        return self._running
+
+    @property
+    def ramps(self) -> list[SpeedRamp]:
+        with self._cv:
+            return list(self._ramps.values())
+
+    @property
+    def steps(self) -> int:
+        """
+        Number of ramp steps taken
+        """
+        return self._steps
+
+    def ramp_for(self, scope: CommandScope, tmcc_id: int) -> SpeedRamp | None:
+        with self._cv:
+            return self._ramps.get((scope, tmcc_id), None)
+
+    def ramp(
+        self,
+        state: Any,
+        target: int,
+        speed_enum: CommandDefEnum,
+        engineer: CommandDefEnum = None,
+    ) -> SpeedRamp:
+        """
+        Ramp state's engine or train to target, retargeting its ramp if one is underway
+        """
+        now = time.monotonic()
+        with self._cv:
+            ramp = self._ramps.get((state.scope, state.tmcc_id), None)
+            if ramp is None:
+                ramp = SpeedRamp(state, target, speed_enum, engineer, now)
+                self._ramps[ramp.key] = ramp
+            else:
+                ramp.retarget(target, speed_enum, engineer, now)
+            self._cv.notify()
+        return ramp
+
+    def cancel_ramp(self, tmcc_id: int = DEFAULT_ADDRESS, scope: CommandScope = None) -> None:
+        with self._cv:
+            if tmcc_id == DEFAULT_ADDRESS:
+                self._ramps.clear()
+            else:
+                for key in [k for k in self._ramps if k[1] == tmcc_id and scope in {None, k[0]}]:
+                    del self._ramps[key]
+            self._cv.notify()
+
+    def reset(self) -> None:
+        with self._cv:
+            self._running = False
+            self._ramps.clear()
+            self._cv.notify()
+
+    def run(self) -> None:
+        while self._running:
+            with self._cv:
+                now = time.monotonic()
+                due = min((r.next_due for r in self._ramps.values()), default=None)
+                if due is None or due > now:
+                    self._cv.wait(None if due is None else due - now)
+                    continue
+                steps = []
+                for ramp in [r for r in self._ramps.values() if r.next_due <= now]:
+                    steps.append((ramp, ramp.step(now)))
+                    if ramp.is_done:
+                        del self._ramps[ramp.key]
+                self._steps += len(steps)
+            # send outside the lock, so new requests aren't held up by a slow connection
+            for ramp, cmds in steps:
+                scope, tmcc_id = ramp.key
+                for command, data in cmds:
+                    try:
+                        self._send(command, tmcc_id, data, scope)
+                    except Exception as e:
+                        log.exception(f"Error sending {command} {data} to {scope.title} {tmcc_id}", exc_info=e)
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from abc import ABC, ABCMeta
 
+from .ramp_controller import RampController, labor_delta  # noqa: F401
 from .sequence_constants import SequenceCommandEnum
 from .sequence_req import SequenceReq, T
 from ..constants import CommandScope, DEFAULT_ADDRESS
@@ -23,16 +24,6 @@ CANCELABLE_REQUESTS = {
 }
 
 
-def labor_delta(cur_speed: int, new_speed: int, cur_labor: int) -> int:
-    delta = new_speed - cur_speed
-    if delta > 0:
-        return min(31, max(0, round((delta * 0.09546) - 0.5401)) + cur_labor)
-    elif delta < 0:
-        return max(0, cur_labor - max(0, round((-0.06030 * delta) + 0.01052)))
-    else:
-        return cur_labor
-
-
 class RampedSpeedReqBase(SequenceReq, ABC):
     __metaclass__ = ABCMeta
 
@@ -57,6 +48,9 @@ class RampedSpeedReqBase(SequenceReq, ABC):
 
         # set the target speed value
         self._target_speed = speed_req
+        self._speed_enum = None
+        self._engineer = None
+        self._ramped = False
 
         # if there is no state information, treat this as an ABSOLUTE_SPEED req
         if address == DEFAULT_ADDRESS or not isinstance(self.state, EngineState) or self.state.speed is None:
@@ -86,76 +80,30 @@ class RampedSpeedReqBase(SequenceReq, ABC):
             )
             self.add(target_enum, self.address, self._target_speed, self.scope)
 
-            speed_enum = (
+            self._speed_enum = (
                 TMCC2EngineCommandEnum.ABSOLUTE_SPEED if self.state.is_legacy else TMCC1EngineCommandEnum.ABSOLUTE_SPEED
             )
             # issue tower dialog, if requested
             if tower and dialog:
                 # noinspection PyUnreachableCode
                 self.add(tower, address, scope=scope)
-            # use current speed and momentum to build up or down speed
-            cs = self.state.speed
-            delay = 0.100
-            inc = 3 if self.is_tmcc2 else 1
-            if self.state.is_ramping:
-                c_rpm = 0
-                init_labor = 12
-            else:
-                c_rpm = self.state.rpm
-                init_labor = self.state.labor
-            if self.state.momentum is not None:
-                delay_inc = 0.200 + (self.state.momentum * (0.010 if self.is_tmcc2 else 0.1))
-                if self.is_tmcc2:
-                    inc = 2 if self.state.momentum >= 4 else inc
-                    inc = 1 if self.state.momentum >= 6 else inc
-            else:
-                delay_inc = 0.200
-            speed_req = min(speed_req, self.state.speed_max)
-            # are we speeding up or down?
-            log.debug(f"CS: {cs} Requested Speed: {speed_req}")
-            ramp = range(cs + inc, speed_req + 1, inc) if cs < speed_req else range(cs - inc, speed_req + 1, -inc)
-            if ramp:
-                # increase or decrease labor
-                c_labor = labor_delta(cs, speed_req, init_labor)
-                self.add(TMCC2EngineCommandEnum.ENGINE_LABOR, address, data=c_labor, scope=scope, delay=delay)
-                # if we're decelerating, kill RPM and labor up front
-                if self.state.is_legacy and cs > speed_req:
-                    if self.state.is_rpm:
-                        rpm = tmcc2_speed_to_rpm(speed_req)
-                        self.add(TMCC2EngineCommandEnum.DIESEL_RPM, address, data=rpm, scope=scope, delay=delay)
-                        c_rpm = rpm
-                for speed in ramp:
-                    self.add(speed_enum, address, speed, scope, delay=delay)
-                    if self.state.is_legacy:
-                        labor = labor_delta(speed, speed_req, init_labor)
-                        if labor != c_labor:
-                            self.add(TMCC2EngineCommandEnum.ENGINE_LABOR, address, data=labor, scope=scope, delay=delay)
-                            c_labor = labor
-                        if self.state.is_rpm and cs < speed_req:
-                            rpm = tmcc2_speed_to_rpm(speed)
-                            if rpm != c_rpm:
-                                self.add(TMCC2EngineCommandEnum.DIESEL_RPM, address, data=rpm, scope=scope, delay=delay)
-                                c_rpm = rpm
-                    delay += delay_inc
-                # make sure the final speed is requested
-                self.add(speed_enum, address, speed_req, scope, delay=delay)
-                if self.state.is_legacy:
-                    self.add(TMCC2EngineCommandEnum.ENGINE_LABOR, address, data=init_labor, scope=scope, delay=delay)
-                    if self.state.is_rpm:
-                        rpm = tmcc2_speed_to_rpm(speed_req)
-                        if rpm != c_rpm:
-                            self.add(TMCC2EngineCommandEnum.DIESEL_RPM, address, data=rpm, scope=scope, delay=delay)
-            else:
-                self.add(speed_enum, address, speed_req, scope)
-            # issue engineer dialog, if requested
-            if engr and dialog:
-                if delay < 2.00:
-                    delay = 2.50
-                self.add(engr, address, scope=scope, delay=delay)
+            # the speed steps themselves are computed, one at a time, by the ramp controller
+            self._engineer = engr if dialog else None
+            self._ramped = True
+
+    @property
+    def target_speed(self) -> int:
+        """
+        The speed the ramp ends at, however its steps are issued
+        """
+        return self._target_speed
 
     def _on_before_send(self) -> None:
-        # Cancel any existing ramps
-        if self.state:
+        if self._ramped:
+            # start a ramp, or retarget the one already underway
+            RampController.get().ramp(self.state, self._target_speed, self._speed_enum, self._engineer)
+        elif self.state:
+            # Cancel any existing ramps
             self.state.cancel_ramps()
 
 
@@ -22,12 +22,16 @@
 #                                                                               -
 # -------------------------------------------------------------------------------
 
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 
 # Imports
 import sys
+import threading
 
 
 # Logging formatter supporting colorized output
@@ -68,6 +72,110 @@ class ConsoleFormatter(LogFormatter):
         return super().formatStack(stack_trace)
 
 
+# Handler that defers all formatting to the writer thread
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    The stock QueueHandler runs the full formatter (time stamp, colors, traceback text)
+    on the emitting thread before enqueuing each record. Records here never leave the
+    process, so only the message args are merged on the emitting thread, capturing
+    mutable args as they were when logged; the console and file formatters run on the
+    QueueListener thread instead.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if record.args:
+            # a copy, so other handlers of the record still see its args
+            record = copy.copy(record)
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+
+# Listener that recognizes the marker records queued by flush_logging()
+class _FlushAwareListener(logging.handlers.QueueListener):
+    def handle(self, record: logging.LogRecord) -> None:
+        flush_event = getattr(record, "flush_event", None)
+        if flush_event is not None:
+            flush_event.set()
+            return
+        super().handle(record)
+
+
+# Writer thread state; the listener owns the console and file handlers
+_listener: logging.handlers.QueueListener | None = None
+_queue_handler: DeferredQueueHandler | None = None
+_sink_handlers: list[logging.Handler] = []
+_lock = threading.RLock()
+
+
+def _derive_root_level() -> None:
+    # the root logger only needs to be as verbose as its most verbose handler;
+    # anything below that is discarded by logger.isEnabledFor() before a record is built
+    levels = [h.level for h in _sink_handlers if h.level > logging.NOTSET]
+    logging.getLogger().setLevel(min(levels) if levels else logging.WARNING)
+
+
+def set_log_level(level: int | str) -> None:
+    """
+    Change the level of every console and log file handler, then re-derive the root level.
+    """
+    with _lock:
+        for handler in _sink_handlers:
+            handler.setLevel(level)
+        _derive_root_level()
+
+
+def flush_logging(timeout: float = 2.0) -> bool:
+    """
+    Block until every record queued so far has been written; returns False on timeout.
+    """
+    with _lock:
+        listener = _listener
+        handler = _queue_handler
+    if listener is None or handler is None or getattr(listener, "_thread", None) is None:
+        return True
+    done = threading.Event()
+    marker = logging.makeLogRecord({"levelno": logging.CRITICAL, "msg": ""})
+    marker.flush_event = done
+    handler.queue.put_nowait(marker)
+    flushed = done.wait(timeout)
+    for sink in list(_sink_handlers):
+        try:
+            sink.flush()
+        except (OSError, ValueError):
+            pass
+    return flushed
+
+
+def shut_down_logging() -> None:
+    """
+    Stop the writer thread after draining it, and detach the queue and sink handlers.
+    """
+    global _listener, _queue_handler
+    with _lock:
+        listener, _listener = _listener, None
+        handler, _queue_handler = _queue_handler, None
+        sinks = list(_sink_handlers)
+        _sink_handlers.clear()
+    if listener is not None:
+        try:
+            listener.stop()
+        except (AttributeError, RuntimeError):
+            pass
+    root = logging.getLogger()
+    if handler is not None:
+        root.removeHandler(handler)
+    for sink in sinks:
+        root.removeHandler(sink)
+        try:
+            sink.close()
+        except (OSError, ValueError):
+            pass
+
+
+atexit.register(shut_down_logging)
+
+
 # Set up logging
 def set_up_logging(
     console_log_output: str = "stdout",
@@ -78,6 +186,7 @@ def set_up_logging(
     logfile_log_level: str = "INFO",
     logfile_log_color: bool = False,
     logfile_template: str = "%(color)s[%(asctime)s] [%(name)s] [%(levelname)-8s] %(message)s%(no_color)s",
+    use_queue: bool = True,
 ) -> bool:
     # Create logger
     # For simplicity, we use the root logger, i.e., call 'logging.getLogger()'
@@ -86,8 +195,8 @@ def set_up_logging(
     # logger, i.e. 'global logger; logger = logging.getLogger("<name>")'
     logger = logging.getLogger()
 
-    # Set global log level to 'debug' (required for handler levels to work)
-    logger.setLevel(logging.DEBUG)
+    # Tear down any writer thread left from a previous call
+    shut_down_logging()
 
     # Create console handler
     console_log_output = console_log_output.lower()
@@ -110,7 +219,6 @@ def set_up_logging(
     # Create and set formatter, add console handler to logger
     console_formatter = ConsoleFormatter(fmt=console_template, color=console_log_color)
     console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
 
     # Create log file handler
     try:
@@ -132,7 +240,29 @@ def set_up_logging(
     # Create and set formatter, add log file handler to logger
     logfile_formatter = LogFormatter(fmt=logfile_template, color=logfile_log_color)
     logfile_handler.setFormatter(logfile_formatter)
-    logger.addHandler(logfile_handler)
+
+    # Route records through a queue so console and file I/O happen on a single
+    # writer thread rather than on the thread that emitted the record
+    global _listener, _queue_handler
+    with _lock:
+        _sink_handlers.extend([console_handler, logfile_handler])
+        if use_queue is True:
+            _queue_handler = DeferredQueueHandler(queue.SimpleQueue())
+            _listener = _FlushAwareListener(
+                _queue_handler.queue,
+                console_handler,
+                logfile_handler,
+                respect_handler_level=True,
+            )
+            logger.addHandler(_queue_handler)
+            _listener.start()
+        else:
+            logger.addHandler(console_handler)
+            logger.addHandler(logfile_handler)
+
+        # Set global log level from the most verbose handler, so suppressed
+        # levels are rejected before a record is ever created
+        _derive_root_level()
 
     # Success
     return True
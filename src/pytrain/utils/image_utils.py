@@ -7,14 +7,54 @@
 #  SPDX-License-Identifier: LGPL-3.0-only
 #
 
-from PIL import ImageDraw, ImageFont, ImageTk
+from functools import lru_cache
 
+from PIL import Image, ImageDraw, ImageFont, ImageTk
 
-def center_text_on_image(
-    photo: ImageTk.PhotoImage, text: str, font_size: int = 24, styled: bool = True
-) -> ImageTk.PhotoImage:
+DEFAULT_FONT = "DejaVuSans.ttf"
+
+# scratch surface used only to measure text
+_MEASURE = ImageDraw.Draw(Image.new("L", (1, 1)))
+
+
+@lru_cache(maxsize=32)
+def get_font(family: str = DEFAULT_FONT, size: int = 24) -> ImageFont.FreeTypeFont:
+    """
+    Returns the font, loading (and parsing) the font file only once per family and size
+    """
+    return ImageFont.truetype(family, size)
+
+
+@lru_cache(maxsize=256)
+def text_layout(
+    text: str, font_size: int = 24, styled: bool = True, family: str = DEFAULT_FONT
+) -> tuple[int, tuple[tuple[int, str, bool], ...]]:
+    """
+    Measure a label. Returns its total width and its runs as (x offset, text, is big font);
+    unstyled text is one run, styled text one run per character.
     """
-    Draw centered black text over a light-gray rounded rectangle.
+    font_big = get_font(family, font_size)
+    if not styled:
+        bbox = _MEASURE.textbbox((0, 0), text, font=font_big)
+        return bbox[2] - bbox[0], ((0, text, True),)
+    font_small = get_font(family, max(font_size - 6, 1))
+    runs = []
+    cursor_x = 0
+    new_word = True
+    for ch in text:
+        big = ch != " " and new_word
+        bbox = _MEASURE.textbbox((0, 0), ch, font=font_big if big else font_small)
+        runs.append((cursor_x, ch, big))
+        cursor_x += bbox[2] - bbox[0]
+        new_word = ch == " "
+    return cursor_x, tuple(runs)
+
+
+@lru_cache(maxsize=64)
+def label_overlay(text: str, font_size: int = 24, styled: bool = True, family: str = DEFAULT_FONT) -> Image.Image:
+    """
+    Render a label, black text over a light-gray rounded rectangle, as a transparent
+    RGBA image sized to the rectangle. Cached, so treat the result as read-only.
 
     Styled=True → drop-cap effect:
         - first letter of each word = BIG (font_size)
@@ -22,85 +62,57 @@ def center_text_on_image(
 
     Styled=False → all text uses big font_size
     """
-
-    # Convert PhotoImage → PIL Image
-    pil_img = ImageTk.getimage(photo).copy()
-    draw = ImageDraw.Draw(pil_img)
-
-    # Fonts
-    font_big = ImageFont.truetype("DejaVuSans.ttf", font_size)
-    font_small = ImageFont.truetype("DejaVuSans.ttf", max(font_size - 6, 1))
-
     # Uppercase in styled mode
     display_text = text.upper() if styled else text
 
-    img_w, img_h = pil_img.size
+    font_big = get_font(family, font_size)
+    font_small = get_font(family, max(font_size - 6, 1))
 
     # ---- Vertical sizing ----
     ascent_big, descent_big = font_big.getmetrics()
+    ascent_small, _ = font_small.getmetrics()
     text_height_big = ascent_big + descent_big
 
     vpad = int(font_size * 0.25)
     bg_h = text_height_big + vpad * 2
 
-    # ---- Measure total text width (style-aware) ----
-    if not styled:
-        bbox = draw.textbbox((0, 0), display_text, font=font_big)
-        total_text_w = bbox[2] - bbox[0]
-    else:
-        total_text_w = 0
-        new_word = True
-        for ch in display_text:
-            f = font_big if (ch != " " and new_word) else font_small
-            bbox = draw.textbbox((0, 0), ch, font=f)
-            total_text_w += bbox[2] - bbox[0]
-            new_word = ch == " "
-
-    # ---- Horizontal padding (NEW) ----
-    hpad = int(font_size * 0.6)  # adjust if you want more/less
+    # ---- Horizontal sizing ----
+    total_text_w, runs = text_layout(display_text, font_size, styled, family)
+    hpad = int(font_size * 0.6)
     bg_w = total_text_w + (2 * hpad)
 
-    # ---- Box location ----
-    bg_x = (img_w - bg_w) // 2
-    bg_y = (img_h - bg_h) // 2
-    bg_x2 = bg_x + bg_w
-    bg_y2 = bg_y + bg_h
-
+    overlay = Image.new("RGBA", (bg_w + 1, bg_h + 1), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(overlay)
     draw.rounded_rectangle(
-        [bg_x, bg_y, bg_x2, bg_y2],
+        [0, 0, bg_w, bg_h],
         radius=int(font_size * 0.6),
         fill="#DDDDDD",
         outline=None,
     )
 
-    # ---- Horizontal centering with padding ----
-    text_x = bg_x + hpad
-
     # ---- Baseline calculation ----
-    rect_center_y = (bg_y + bg_y2) // 2
-    baseline_y = rect_center_y + (ascent_big - text_height_big // 2)
+    baseline_y = bg_h // 2 + (ascent_big - text_height_big // 2)
 
     # ---- Draw text ----
-    if not styled:
-        draw_y = baseline_y - ascent_big
-        draw.text((text_x, draw_y), display_text, font=font_big, fill="black")
-
-    else:
-        ascent_small, descent_small = font_small.getmetrics()
-        cursor_x = text_x
-        new_word = True
+    for x, run, big in runs:
+        f, ascent = (font_big, ascent_big) if big else (font_small, ascent_small)
+        draw.text((hpad + x, baseline_y - ascent), run, font=f, fill="black")
+    return overlay
 
-        for ch in display_text:
-            f = font_big if (ch != " " and new_word) else font_small
-            ascent = ascent_big if f is font_big else ascent_small
 
-            bbox = draw.textbbox((0, 0), ch, font=f)
-            ch_w = bbox[2] - bbox[0]
-
-            draw_y = baseline_y - ascent
-            draw.text((cursor_x, draw_y), ch, font=f, fill="black")
+def center_text_on_image(
+    photo: ImageTk.PhotoImage, text: str, font_size: int = 24, styled: bool = True
+) -> ImageTk.PhotoImage:
+    """
+    Draw centered black text over a light-gray rounded rectangle; see label_overlay.
+    """
 
-            cursor_x += ch_w
-            new_word = ch == " "
+    # Convert PhotoImage → PIL Image
+    pil_img = ImageTk.getimage(photo).copy()
+    overlay = label_overlay(text, font_size, styled)
 
+    # ---- Box location ----
+    img_w, img_h = pil_img.size
+    bg_w, bg_h = overlay.width - 1, overlay.height - 1
+    pil_img.paste(overlay, ((img_w - bg_w) // 2, (img_h - bg_h) // 2), overlay)
     return ImageTk.PhotoImage(pil_img)
@@ -6,21 +6,44 @@
 #  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
 #  SPDX-License-Identifier: LGPL-3.0-only
 #
+import errno
 import ipaddress
+import json
 import logging
+import os
+import selectors
 import socket
 import subprocess
+import threading
 import time
-from multiprocessing import Pool, cpu_count
-from typing import List
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Iterable, List
 
-from ..protocol.constants import DEFAULT_BASE_PORT
+import psutil
+
+from ..protocol.constants import DEFAULT_BASE_PORT, PROGRAM_NAME
 
 log = logging.getLogger(__name__)
 
 
 TEST_NET_IP = ("192.0.2.1", 80)  # RFC 5737 TEST-NET-1 (non-routable on the public Internet)
 
+# file holding the address of the last Base 3 we found; tried before any scan
+DEFAULT_BASE_CACHE_FILE = os.environ.get("PYTRAIN_BASE_CACHE_FILE", "cache/base_address")
+# file holding the last PyTrain server a client connected to, and its capabilities
+DEFAULT_SERVER_CACHE_FILE = os.environ.get("PYTRAIN_SERVER_CACHE_FILE", "cache/server_endpoint")
+DEFAULT_SCAN_TIMEOUT = 0.25  # per-host connect timeout, in seconds
+DEFAULT_SCAN_CONCURRENCY = 64  # max simultaneous connect attempts
+DEFAULT_VERIFY_TIMEOUT = 1.0  # time a responder has to answer a PDI Base query, in seconds
+
+_IN_PROGRESS = {errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EAGAIN, errno.EALREADY}
+
+# get_ip_address() result, valid as long as the host's IPv4 interface addresses don't change
+_ip_cache_lock = threading.Lock()
+_ip_cache: List[str] | None = None
+_ip_cache_signature: tuple | None = None
+
 
 def wait_for_ipv4(timeout_s: float = 30.0) -> bool:
     deadline = time.monotonic() + timeout_s
@@ -71,7 +94,47 @@ def get_ip_from_command():
         raise e
 
 
-def get_ip_address(max_attempts: int = 32) -> List[str]:
+def _interface_signature() -> tuple | None:
+    """Returns the (interface, IPv4 address) pairs currently configured, or None if unavailable"""
+    try:
+        return tuple(
+            sorted(
+                (name, addr.address)
+                for name, addrs in psutil.net_if_addrs().items()
+                for addr in addrs
+                if addr.family == socket.AF_INET
+            )
+        )
+    except (OSError, AttributeError):
+        return None
+
+
+def clear_ip_address_cache() -> None:
+    global _ip_cache, _ip_cache_signature
+    with _ip_cache_lock:
+        _ip_cache = _ip_cache_signature = None
+
+
+def get_ip_address(max_attempts: int = 32, refresh: bool = False) -> List[str]:
+    """
+    Returns this host's IP address(es). The result is cached and only looked
+    up again when the set of IPv4 interface addresses changes, or when refresh
+    is True.
+    """
+    global _ip_cache, _ip_cache_signature
+    signature = _interface_signature()
+    with _ip_cache_lock:
+        if refresh is False and _ip_cache and signature is not None and signature == _ip_cache_signature:
+            return list(_ip_cache)
+    ips = _lookup_ip_address(max_attempts)
+    if ips:
+        with _ip_cache_lock:
+            _ip_cache = list(ips)
+            _ip_cache_signature = signature
+    return ips
+
+
+def _lookup_ip_address(max_attempts: int = 32) -> List[str]:
     from .. import is_linux
 
     wait_for_network()
@@ -123,11 +186,187 @@ def is_base_address(address, base3_port: int = DEFAULT_BASE_PORT) -> str | None:
         return None
 
 
-def find_base_address() -> str | None:
-    """Discovers Base 3 address by parallel port scanning local network"""
-    num_cpus = cpu_count() - 1
-    possible_ips = list()
+def load_base_address(cache_file: str = DEFAULT_BASE_CACHE_FILE) -> str | None:
+    """Returns the last Base 3 address recorded in cache_file, if any"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            address = f.read().strip()
+        ipaddress.IPv4Address(address)
+        return address
+    except (OSError, ValueError):
+        return None
+
+
+def save_base_address(address: str, cache_file: str = DEFAULT_BASE_CACHE_FILE) -> None:
+    try:
+        Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            f.write(f"{address}\n")
+    except OSError as e:
+        log.warning(f"Unable to record Base 3 address in {cache_file}: {e}")
+
+
+@dataclass(frozen=True)
+class ServerEndpoint:
+    address: str
+    port: int
+    is_ser2: bool = False
+    is_base3: bool = False
+    cache_sync: bool = False
+    cache_sync_port: int | None = None
+
+
+def load_server_endpoint(cache_file: str = DEFAULT_SERVER_CACHE_FILE) -> ServerEndpoint | None:
+    """Returns the last server endpoint recorded in cache_file, if any"""
+    try:
+        with open(cache_file, "r", encoding="utf-8") as f:
+            endpoint = ServerEndpoint(**json.load(f))
+        ipaddress.IPv4Address(endpoint.address)
+        if not isinstance(endpoint.port, int) or not 0 < endpoint.port < 65536:
+            return None
+        return endpoint
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def save_server_endpoint(endpoint: ServerEndpoint, cache_file: str = DEFAULT_SERVER_CACHE_FILE) -> None:
+    try:
+        Path(cache_file).parent.mkdir(parents=True, exist_ok=True)
+        with open(cache_file, "w", encoding="utf-8") as f:
+            json.dump(asdict(endpoint), f)
+            f.write("\n")
+    except OSError as e:
+        log.warning(f"Unable to record {PROGRAM_NAME} server in {cache_file}: {e}")
+
+
+def is_base3(address: str, base3_port: int = DEFAULT_BASE_PORT, timeout: float = DEFAULT_VERIFY_TIMEOUT) -> bool:
+    """
+    Returns True if the host at address answers a PDI Base query on base3_port
+    with a Base record within `timeout` seconds.
+    """
+    from ..pdi.base_req import BaseReq
+    from ..pdi.constants import PDI_SOP, PdiCommand
+
+    reply_prefix = PDI_SOP.to_bytes(1, byteorder="big") + PdiCommand.BASE.as_bytes
+    deadline = time.monotonic() + timeout
+    try:
+        with socket.create_connection((address, base3_port), timeout=timeout) as sock:
+            sock.sendall(BaseReq(0, PdiCommand.BASE).as_bytes)
+            received = bytes()
+            while reply_prefix not in received:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                sock.settimeout(remaining)
+                data = sock.recv(256)
+                if not data:
+                    return False
+                received += data
+            return True
+    except OSError:
+        return False
+
+
+def scan_for_base(
+    addresses: Iterable[str],
+    base3_port: int = DEFAULT_BASE_PORT,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
+    concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    verify: Callable[[str], bool] | None = None,
+) -> str | None:
+    """
+    Issues non-blocking connects to the Base 3 port on the given addresses, keeping
+    up to `concurrency` attempts in flight, each bounded by `timeout` seconds. Returns
+    the first address whose connect completes, and that `verify`, if given, accepts,
+    abandoning the rest of the scan.
+    """
+    candidates = iter(addresses)
+    selector = selectors.DefaultSelector()
+    in_flight: dict[socket.socket, float] = {}
+    exhausted = False
+
+    def release(sock: socket.socket) -> None:
+        in_flight.pop(sock, None)
+        try:
+            selector.unregister(sock)
+        except (KeyError, ValueError):
+            pass
+        sock.close()
+
+    try:
+        while True:
+            # top up the in-flight window
+            while not exhausted and len(in_flight) < concurrency:
+                address = next(candidates, None)
+                if address is None:
+                    exhausted = True
+                    break
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                try:
+                    err = sock.connect_ex((address, base3_port))
+                except OSError:
+                    sock.close()
+                    continue
+                if err == 0:
+                    sock.close()
+                    if verify is None or verify(address):
+                        return address
+                    continue
+                if err not in _IN_PROGRESS:
+                    sock.close()
+                    continue
+                selector.register(sock, selectors.EVENT_WRITE, address)
+                in_flight[sock] = time.monotonic() + timeout
+            if not in_flight:
+                return None
+
+            wait = max(0.0, min(in_flight.values()) - time.monotonic())
+            for key, _ in selector.select(wait):
+                sock = key.fileobj
+                err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                release(sock)
+                if err == 0 and (verify is None or verify(key.data)):
+                    return key.data
+
+            # abandon attempts that have run out of time
+            now = time.monotonic()
+            for sock in [s for s, expires in in_flight.items() if expires <= now]:
+                release(sock)
+    finally:
+        for sock in list(in_flight):
+            release(sock)
+        selector.close()
+
+
+def find_base_address(
+    base3_port: int = DEFAULT_BASE_PORT,
+    cache_file: str | None = DEFAULT_BASE_CACHE_FILE,
+    timeout: float = DEFAULT_SCAN_TIMEOUT,
+    concurrency: int = DEFAULT_SCAN_CONCURRENCY,
+    verify_timeout: float = DEFAULT_VERIFY_TIMEOUT,
+) -> str | None:
+    """
+    Discovers the Base 3 address. The last address found is tried first; failing
+    that, every host on the local /24 network(s) is probed concurrently. Hosts that
+    accept a connection on the Base 3 port must answer a PDI Base query before they
+    are taken to be the Base 3; the first that does is recorded in cache_file for next time.
+    """
     local_ips = get_ip_address()
+
+    def verify(address: str) -> bool:
+        return is_base3(address, base3_port, verify_timeout)
+
+    if cache_file:
+        cached = load_base_address(cache_file)
+        if (
+            cached
+            and cached not in local_ips
+            and scan_for_base([cached], base3_port, timeout=2 * timeout, verify=verify)
+        ):
+            return cached
+
+    possible_ips = list()
     for ip in local_ips:
         parts = ip.split(".")
         me = int(parts[-1])
@@ -136,9 +375,7 @@ def find_base_address() -> str | None:
             if i == me:
                 continue
             possible_ips.append(network + str(i))
-    with Pool(num_cpus) as p:
-        for result in p.imap_unordered(is_base_address, possible_ips):
-            if result is not None:
-                p.terminate()
-                return result
-    return None
+    result = scan_for_base(possible_ips, base3_port, timeout=timeout, concurrency=concurrency, verify=verify)
+    if result is not None and cache_file:
+        save_base_address(result, cache_file)
+    return result
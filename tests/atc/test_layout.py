@@ -0,0 +1,138 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/atc/test_layout.py
+import threading
+import time
+
+import pytest
+
+from src.pytrain.atc.layout import BlockEvent, Layout
+from src.pytrain.atc.simulator import LoopSimulator
+from src.pytrain.db.component_state_store import ComponentStateStore
+from src.pytrain.protocol.constants import CommandScope
+
+
+class FakeSensor:
+    def __init__(self, tmcc_id: int) -> None:
+        self.tmcc_id = tmcc_id
+
+
+class FakeBlock:
+    def __init__(self, block_id: int, sensor: FakeSensor = None) -> None:
+        self.block_id = block_id
+        self.sensor_track = sensor
+        self.handled = []
+        self.threads = set()
+
+    def handle(self, event: BlockEvent, *data) -> None:
+        self.handled.append((event, *data))
+        self.threads.add(threading.current_thread().name)
+
+
+def wait_idle(layout: Layout, timeout: float = 1.0) -> None:
+    deadline = time.monotonic() + timeout
+    while layout.pending and time.monotonic() < deadline:
+        time.sleep(0.002)
+
+
+@pytest.fixture
+def layout():
+    lo = Layout(simulate=True)
+    yield lo
+    lo.reset()
+    lo.join()
+
+
+@pytest.fixture
+def state_store():
+    with ComponentStateStore._lock:
+        _ = ComponentStateStore()
+    yield
+    with ComponentStateStore._lock:
+        ComponentStateStore.reset()
+        ComponentStateStore._instance = None
+
+
+def test_sensor_and_pin_changes_reach_only_the_indexed_blocks(layout):
+    sensor = FakeSensor(5)
+    first, second, other = FakeBlock(1, sensor), FakeBlock(2, sensor), FakeBlock(3)
+    layout.add(first, {"enter": 17, "stop": 18})
+    layout.add(second, {"enter": 18})
+    layout.add(other, {"enter": 19})
+    assert layout.blocks_for_sensor(5) == [first, second]
+    assert layout.blocks_for_pin(18) == [first, second]
+
+    layout.sensor_changed(5, "train", "dir")
+    layout.pin_changed(18, True)
+    wait_idle(layout)
+    assert first.handled == [(BlockEvent.SENSOR, "train", "dir"), (BlockEvent.STOP_ENTER,)]
+    assert second.handled == [(BlockEvent.SENSOR, "train", "dir"), (BlockEvent.OCCUPIED_ENTER,)]
+    assert other.handled == []
+    assert layout.is_pin_active(18) is True
+    assert layout.events == 4
+
+
+def test_events_from_many_threads_are_processed_in_order_on_one_thread(layout):
+    block = FakeBlock(1)
+    layout.add(block, {"enter": 1})
+
+    def toggle() -> None:
+        for _ in range(100):
+            layout.pin_changed(1, True)
+            layout.pin_changed(1, False)
+
+    threads = [threading.Thread(target=toggle) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    wait_idle(layout)
+    assert len(block.handled) == 800
+    assert block.threads == {layout.name}
+
+
+def test_duplicate_block_id_is_rejected(layout):
+    layout.add(FakeBlock(1))
+    with pytest.raises(AttributeError):
+        layout.add(FakeBlock(1))
+
+
+def test_loop_simulation_stops_trains_before_they_overrun(state_store):
+    sim = LoopSimulator(blocks=8, trains=4, section_time=0.01)
+    try:
+        report = sim.run(0.5)
+    finally:
+        sim.close()
+    assert report.events > 0
+    assert report.reactions > 0
+    assert report.overruns == 0
+    # the simulated blocks are removed, so the simulation can be run again
+    assert ComponentStateStore.get_state(CommandScope.BLOCK, 1, False) is None
+
+
+def test_simulated_ramps_set_their_target_speed(state_store):
+    from src.pytrain.protocol.sequence.ramped_speed_req import RampedSpeedReq
+
+    sim = LoopSimulator(blocks=4, trains=1, section_time=0.01)
+    try:
+        # an engine with state ramps by way of the RampController; the request carries only the target
+        engine = ComponentStateStore.get_state(CommandScope.ENGINE, 1)
+        engine.initialize(CommandScope.ENGINE, 1)
+        engine._speed = 0
+        ramp = RampedSpeedReq(1, 20)
+        assert "ABSOLUTE_SPEED" not in [r.request.command.name for r in ramp.requests]
+
+        train = sim._trains[1]
+        train.running = False
+        sim._on_send(None, ramp)
+        assert train.speed == ramp.target_speed == 20
+        assert train.running is True
+    finally:
+        sim.close()
@@ -0,0 +1,181 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/cli/test_csv_import.py
+import io
+import threading
+from types import SimpleNamespace
+
+from src.pytrain.cli.csv_import import CsvImportCmd, RosterImportPlan, RosterRecord, coalesce, read_roster
+from src.pytrain.db.comp_data import CompData
+from src.pytrain.db.component_state import ComponentState
+from src.pytrain.db.engine_state import EngineState
+from src.pytrain.pdi.base_req import BaseReq
+from src.pytrain.pdi.constants import PdiCommand
+from src.pytrain.protocol.constants import CommandScope
+
+ENGINE_CSV = """address,road_number,road_name,type,control,sound
+12,5344,NYC Hudson,Steam,Legacy,LegacySounds
+14,0012,Santa Fe,Diesel,TMCC,RailSounds
+abc,1,Bad Address,Diesel,TMCC,RailSounds
+15,1,Bad Type,Rocket,TMCC,RailSounds
+2345,8000,Big Boy,Steam,Legacy,NA
+"""
+
+
+def _record(tmcc_id: int, **fields) -> CompData:
+    comp_data = CompData.from_bytes(None, CommandScope.ENGINE, tmcc_id)
+    for field, value in fields.items():
+        setattr(comp_data, field, value)
+    return comp_data
+
+
+def _state(comp_data: CompData, record_no: int = None) -> SimpleNamespace:
+    return SimpleNamespace(comp_data=comp_data, is_comp_data_record=True, record_no=record_no)
+
+
+def test_roster_rows_are_parsed_and_bad_rows_skipped():
+    records = read_roster(CommandScope.ENGINE, io.StringIO(ENGINE_CSV))
+    assert [r.tmcc_id for r in records] == [12, 14, 2345]
+    assert records[0] == RosterRecord(CommandScope.ENGINE, 12, "NYC Hudson", "5344", 1, 2, 3)
+    assert records[2].sound_type is None
+
+
+def test_roster_without_header_uses_export_columns():
+    records = read_roster(CommandScope.SWITCH, io.StringIO("7,0007,Yard Lead,LCS,2\n"), has_header=False)
+    assert records == [RosterRecord(CommandScope.SWITCH, 7, "Yard Lead", "0007")]
+
+
+def test_changed_fields_of_a_record_are_one_write():
+    record = RosterRecord(CommandScope.ENGINE, 12, "NYC Hudson", "5344", 1, 2, 3)
+    pkgs = coalesce(record.changes(_record(12)))
+    assert len(pkgs) == 1
+    assert (pkgs[0].offset, pkgs[0].length) == (0x1E, 40)
+
+    current = _record(12, road_name="NYC Hudson", road_number="5344", engine_type=1, control_type=2, sound_type=3)
+    assert record.changes(current) == []
+    # only the sound type differs
+    current.sound_type = 2
+    assert [(p.offset, p.data_bytes) for p in record.changes(current)] == [(0x45, b"\x03")]
+
+
+def test_road_numbers_match_with_or_without_leading_zeros():
+    record = RosterRecord(CommandScope.ENGINE, 14, road_number="12")
+    assert record.matches(_record(14, road_number="0012"))
+
+
+def test_plan_writes_only_changed_records_that_exist_on_the_base():
+    records = read_roster(CommandScope.ENGINE, io.StringIO(ENGINE_CSV))
+    hudson = _record(12, road_name="NYC Hudson", road_number="5344", engine_type=1, control_type=2, sound_type=3)
+    states = {12: _state(hudson), 14: _state(_record(14))}
+    plan = RosterImportPlan(records, lambda scope, tmcc_id: states.get(tmcc_id, None))
+    assert [r.tmcc_id for r in plan.unchanged] == [12]
+    assert [r.tmcc_id for r, _ in plan.writes] == [14]
+    assert [r.tmcc_id for r in plan.added] == [14]
+    assert [r.tmcc_id for r in plan.skipped] == [2345]
+
+    # a 4-digit engine on the Base 3 is written, by record number
+    states[2345] = _state(_record(2345), record_no=7)
+    plan = RosterImportPlan(records, lambda scope, tmcc_id: states.get(tmcc_id, None))
+    (record, reqs) = plan.writes[-1]
+    assert record.tmcc_id == 2345 and reqs[0].record_no == 7
+
+
+def _engine_state(comp_data: CompData) -> EngineState:
+    state = EngineState()
+    state._address = comp_data.tmcc_id
+    state._update_comp_data(comp_data)
+    state._road_name = comp_data.road_name
+    state._road_number = comp_data.road_number
+    return state
+
+
+def test_exported_roster_imports_without_writes():
+    # records without a road name or number export blanks, not the display fallbacks
+    states = {
+        s.address: s
+        for s in [
+            _engine_state(
+                _record(12, road_name="NYC Hudson", road_number="5344", engine_type=1, control_type=2, sound_type=3)
+            ),
+            _engine_state(_record(14, road_name="Santa Fe")),
+            _engine_state(_record(15, road_number="0015")),
+        ]
+    }
+    csvfile = io.StringIO()
+    writer = ComponentState.get_cvs_dict_writer(CommandScope.ENGINE, csvfile)
+    writer.writeheader()
+    for state in states.values():
+        writer.writerow(state.as_csv())
+    csvfile.seek(0)
+
+    plan = RosterImportPlan(read_roster(CommandScope.ENGINE, csvfile), lambda scope, tmcc_id: states.get(tmcc_id))
+    assert plan.writes == []
+    assert [r.tmcc_id for r in plan.unchanged] == [12, 14, 15]
+
+
+class FakeBase:
+    """
+    Applies writes to its copy of the records and answers each request on its own thread
+    """
+
+    def __init__(self, cmd: CsvImportCmd, records: dict[int, CompData], ignore_writes: set[int] = None) -> None:
+        self.cmd = cmd
+        self.records = records
+        self.ignore_writes = ignore_writes or set()
+        self.sent = []
+
+    def enqueue_command(self, req: BaseReq) -> None:
+        self.sent.append(req)
+        threading.Timer(0.001, self._answer, (req,)).start()
+
+    def _answer(self, req: BaseReq) -> None:
+        reply = BaseReq(req.tmcc_id, PdiCommand.BASE_MEMORY, scope=req.scope)
+        if req.data_bytes:
+            if req.tmcc_id not in self.ignore_writes:
+                data = bytearray(self.records[req.tmcc_id].as_bytes())
+                data[req.start : req.start + req.data_length] = req.data_bytes
+                self.records[req.tmcc_id] = CompData.from_bytes(bytes(data), req.scope, req.tmcc_id)
+        else:
+            reply._comp_data = self.records[req.tmcc_id]
+            reply._comp_data_record = True
+        self.cmd(reply)
+
+
+def _import_cmd(csv: str, records: dict[int, CompData]) -> tuple[CsvImportCmd, FakeBase]:
+    cmd = CsvImportCmd.__new__(CsvImportCmd)
+    cmd._cli = SimpleNamespace(is_verbose=False, scope=CommandScope.ENGINE)
+    cmd._scope = CommandScope.ENGINE
+    cmd._acks = None
+    cmd._observed = {}
+    states = {k: _state(v) for k, v in records.items()}
+    cmd._plan = RosterImportPlan(
+        read_roster(CommandScope.ENGINE, io.StringIO(csv)), lambda scope, tmcc_id: states.get(tmcc_id, None)
+    )
+    base = FakeBase(cmd, dict(records))
+    cmd._pytrain = SimpleNamespace(pdi_dispatcher=base)
+    return cmd, base
+
+
+def test_import_writes_and_verifies_changed_records():
+    csv = "address,road_number,road_name\n" + "".join(f"{i},{1000 + i},Engine {i}\n" for i in range(1, 31))
+    records = {i: _record(i, road_name=f"Engine {i}", road_number=str(1000 + i)) for i in range(1, 31)}
+    for i in (3, 17):
+        records[i] = _record(i)
+    cmd, base = _import_cmd(csv, records)
+    assert cmd._do_import(window=2, ack_timeout=1.0) is True
+    assert [(r.tmcc_id, bool(r.data_bytes)) for r in base.sent] == [(3, True), (17, True), (3, False), (17, False)]
+    assert base.records[17].road_name == "Engine 17" and base.records[17].road_number == "1017"
+
+
+def test_import_reports_records_the_base_did_not_update():
+    records = {5: _record(5)}
+    cmd, base = _import_cmd("address,road_number,road_name\n5,55,Switcher\n", records)
+    base.ignore_writes = {5}
+    assert cmd._do_import(window=4, ack_timeout=0.5) is False
@@ -0,0 +1,128 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/cli/test_reindex.py
+import threading
+from types import SimpleNamespace
+
+from src.pytrain.cli.reindex import ReindexCmd, ReindexPlan
+from src.pytrain.pdi.base_req import BaseReq
+from src.pytrain.pdi.constants import PdiCommand
+from src.pytrain.protocol.constants import CommandScope
+
+
+def _linked(order: list[int]) -> dict[int, tuple[int, int]]:
+    return ReindexPlan.target_links(order)
+
+
+def test_plan_for_an_ordered_list_writes_nothing():
+    order = [3, 1, 7, 5]
+    plan = ReindexPlan(order, _linked(order), order)
+    assert plan.is_empty
+    assert plan.moved == []
+
+
+def test_plan_rewrites_only_the_moved_record_and_its_neighbors():
+    current = [3, 1, 7, 5, 9]
+    order = [3, 7, 5, 1, 9]
+    plan = ReindexPlan(order, _linked(current), current)
+    # 1 moves between 5 and 9: 3 and 7 lose it as a neighbor, 5 and 9 gain it
+    assert plan.writes == [(3, 100, 7), (7, 3, 5), (5, 7, 1), (1, 5, 9), (9, 1, 101)]
+    assert plan.moved == [7, 5, 1]
+
+
+def test_plan_updates_record_100_when_the_first_record_changes():
+    current = [3, 1]
+    plan = ReindexPlan([1, 3], _linked(current), current)
+    assert plan.writes == [(1, 100, 3), (3, 1, 101), (100, 101, 1)]
+
+
+def test_plan_links_unlinked_records():
+    links = _linked([3, 1])
+    links[5] = (255, 255)
+    plan = ReindexPlan([1, 3, 5], links, [3, 1])
+    assert plan.writes[-1] == (100, 101, 1)
+    assert (5, 3, 101) in plan.writes
+
+
+class FakeBase:
+    """
+    Answers each link update and query on its own thread, as the Base 3 would
+    """
+
+    def __init__(self, cmd: ReindexCmd, links: dict[int, tuple[int, int]], drop: set[int] = None) -> None:
+        self.cmd = cmd
+        self.links = dict(links)
+        self.drop = drop or set()
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def enqueue_command(self, req: BaseReq) -> None:
+        with self._lock:
+            self.sent.append(req)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        threading.Timer(0.002, self._answer, (req,)).start()
+
+    def _answer(self, req: BaseReq) -> None:
+        with self._lock:
+            self.in_flight -= 1
+        if req.tmcc_id in self.drop:
+            return
+        reply = BaseReq(req.tmcc_id, PdiCommand.BASE_MEMORY, scope=req.scope)
+        if req.data_bytes:
+            self.links[req.tmcc_id] = (req.data_bytes[0], req.data_bytes[1])
+        else:
+            reply._rev_link, reply._fwd_link = self.links[req.tmcc_id]
+        self.cmd(reply)
+
+
+def _reindex_cmd(current: list[int], order: list[int]) -> tuple[ReindexCmd, FakeBase]:
+    links = _linked(current)
+    cmd = ReindexCmd.__new__(ReindexCmd)
+    cmd._cli = SimpleNamespace(is_verbose=False)
+    cmd._scope = CommandScope.ENGINE
+    cmd._entries = [SimpleNamespace(tmcc_id=t, prev_link=links[t][0], next_link=links[t][1]) for t in order]
+    cmd._entries_map = {e.tmcc_id: e for e in cmd._entries}
+    cmd._correct_order = order
+    cmd._db_order = current
+    cmd._head_links = links[100]
+    cmd._waiting_for = {}
+    cmd._observed_links = {}
+    cmd._acks = None
+    cmd._first_pass_complete = True
+    cmd._cv = threading.Condition()
+    cmd._ev = threading.Event()
+    base = FakeBase(cmd, links)
+    cmd._pytrain = SimpleNamespace(pdi_dispatcher=base, is_synchronized=lambda: True)
+    return cmd, base
+
+
+def test_reindex_writes_and_verifies_only_the_changed_records():
+    current = list(range(1, 21))
+    order = [1, 2, 3, 5, 6, 4] + list(range(7, 21))
+    cmd, base = _reindex_cmd(current, order)
+    assert cmd._do_reindex(window=2, ack_timeout=1.0) is True
+
+    writes = [r.tmcc_id for r in base.sent if r.data_bytes]
+    queries = [r.tmcc_id for r in base.sent if not r.data_bytes]
+    assert writes == [3, 5, 6, 4, 7]
+    assert queries == writes
+    assert ReindexPlan(order, base.links, order).is_empty
+    assert base.max_in_flight <= 2
+
+
+def test_reindex_reports_records_the_base_does_not_answer_for():
+    cmd, base = _reindex_cmd([1, 2], [2, 1])
+    base.drop = {100}
+    assert cmd._do_reindex(window=4, ack_timeout=0.05) is False
+    assert cmd._acks.outstanding == 0
+    assert cmd._acks.lost == 2
@@ -0,0 +1,108 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/cli/test_server_discovery.py
+import socket
+import time
+from threading import Event
+
+import pytest
+from zeroconf import ServiceInfo
+
+import src.pytrain.cli.pytrain as mod
+from src.pytrain.utils.ip_tools import ServerEndpoint, load_server_endpoint, save_server_endpoint
+
+
+def _service_info(port: int, properties: dict[str, str]) -> ServiceInfo:
+    return ServiceInfo(
+        "_pytrain._tcp.local.",
+        f"PyTrain-{port}._pytrain._tcp.local.",
+        addresses=[socket.inet_aton("127.0.0.1")],
+        port=port,
+        properties=properties,
+        server="pytrain.local.",
+    )
+
+
+class DummyZeroconf:
+    def __init__(self, *_args, **_kwargs) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def discovery(monkeypatch, tmp_path):
+    cache_file = str(tmp_path / "cache" / "server_endpoint")
+    announced: list[ServiceInfo] = []
+    pytrain = mod.PyTrain.__new__(mod.PyTrain)
+    pytrain._headless = True
+    pytrain._pytrain_servers = []
+    pytrain._server_discovered = Event()
+    pytrain._server_cache_sync_capable = None
+    pytrain._server_cache_sync_port = None
+
+    class DummyBrowser:
+        def __init__(self, *_args, **_kwargs) -> None:
+            pytrain._pytrain_servers.extend(announced)
+            if announced:
+                pytrain._server_discovered.set()
+
+        def cancel(self) -> None:
+            pass
+
+    monkeypatch.setattr(mod, "wait_for_network", lambda: True, raising=True)
+    monkeypatch.setattr(mod, "Zeroconf", DummyZeroconf, raising=True)
+    monkeypatch.setattr(mod, "ServiceBrowser", DummyBrowser, raising=True)
+    monkeypatch.setattr(mod, "load_server_endpoint", lambda: load_server_endpoint(cache_file), raising=True)
+    monkeypatch.setattr(mod, "save_server_endpoint", lambda ep: save_server_endpoint(ep, cache_file), raising=True)
+    return pytrain, announced, cache_file
+
+
+@pytest.fixture
+def listening_server():
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.bind(("127.0.0.1", 0))
+    server.listen(4)
+    yield server.getsockname()[1]
+    server.close()
+
+
+def test_cached_server_that_answers_is_used_without_waiting_for_mdns(discovery, listening_server):
+    pytrain, _, cache_file = discovery
+    save_server_endpoint(
+        ServerEndpoint("127.0.0.1", listening_server, is_base3=True, cache_sync=True, cache_sync_port=6000),
+        cache_file,
+    )
+    started = time.monotonic()
+    assert pytrain.get_service_info() == ("127.0.0.1", listening_server)
+    assert time.monotonic() - started < 1.0
+    assert (pytrain._server_cache_sync_capable, pytrain._server_cache_sync_port) == (True, 6000)
+
+
+def test_server_found_by_mdns_is_recorded_for_next_time(discovery):
+    pytrain, announced, cache_file = discovery
+    announced.append(_service_info(5555, {"Ser2": "1", "Base3": "1", "CacheSync": "1"}))
+
+    assert pytrain.get_service_info() == ("127.0.0.1", 5555)
+    assert load_server_endpoint(cache_file) == ServerEndpoint(
+        "127.0.0.1", 5555, is_ser2=True, is_base3=True, cache_sync=True, cache_sync_port=5655
+    )
+
+
+def test_base3_only_server_that_was_used_last_time_is_taken_at_once(discovery):
+    pytrain, announced, cache_file = discovery
+    # the cached endpoint doesn't answer the probe (nothing listens on port 1), but mDNS finds it
+    save_server_endpoint(ServerEndpoint("127.0.0.1", 1, is_base3=True), cache_file)
+    announced.append(_service_info(1, {"Base3": "1"}))
+
+    started = time.monotonic()
+    assert pytrain.get_service_info() == ("127.0.0.1", 1)
+    assert time.monotonic() - started < 1.0
@@ -0,0 +1,80 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/comm/test_periodic_job.py
+import time
+from threading import Lock
+
+import pytest
+
+from src.pytrain.comm.comm_buffer import DelayHandler
+from src.pytrain.protocol.command_req import CommandReq
+from src.pytrain.protocol.constants import CommandScope
+from src.pytrain.protocol.tmcc2.tmcc2_constants import TMCC2EngineCommandEnum
+
+
+class DummyBuffer:
+    def __init__(self) -> None:
+        self.lock = Lock()
+        self.sent = []
+
+    def enqueue_command(self, command, delay: float = 0, was_delayed: bool = False) -> None:
+        with self.lock:
+            self.sent.append((command, was_delayed))
+
+
+def wait_for(predicate, timeout: float = 2.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def handler():
+    buffer = DummyBuffer()
+    return DelayHandler(buffer), buffer
+
+
+def test_job_sends_count_packets_from_one_scheduler_entry(handler):
+    delay_handler, buffer = handler
+    horn = CommandReq(TMCC2EngineCommandEnum.BLOW_HORN_ONE, 12).as_bytes
+    job = delay_handler.schedule_job(horn, interval=0.01, count=5, delay=0.01)
+    assert job.key == (CommandScope.ENGINE, 12, TMCC2EngineCommandEnum.BLOW_HORN_ONE)
+    # the job plus the purge task
+    assert delay_handler.queued_requests == 2
+
+    assert wait_for(lambda: job.has_run())
+    assert buffer.sent == [(horn, True)] * 5
+    assert job.sent == 5 and not job.is_pending()
+
+
+def test_canceling_a_job_stops_it_at_once(handler):
+    delay_handler, buffer = handler
+    req = CommandReq(TMCC2EngineCommandEnum.BELL_ONE_SHOT_DING, 7, 3)
+    job = delay_handler.schedule_job(req, interval=0.01, count=1000, delay=0.0)
+    assert wait_for(lambda: job.sent >= 3)
+
+    assert delay_handler.cancel_job(job.key)
+    sent = len(buffer.sent)
+    time.sleep(0.05)
+    assert len(buffer.sent) == sent
+    assert job.was_canceled() and not delay_handler.cancel_job(job.key)
+
+
+def test_a_new_hold_replaces_the_old_one_and_cancel_delayed_requests_stops_jobs(handler):
+    delay_handler, buffer = handler
+    req = CommandReq(TMCC2EngineCommandEnum.BLOW_HORN_ONE, 3)
+    first = delay_handler.schedule_job(req, interval=0.01, count=1000, delay=1.0)
+    second = delay_handler.schedule_job(req, interval=0.01, count=1000, delay=1.0)
+    assert first.was_canceled() and second.is_pending()
+
+    delay_handler.cancel_delayed_requests(3, CommandScope.ENGINE)
+    assert second.was_canceled()
+    assert buffer.sent == []
@@ -18,9 +18,11 @@ from src.pytrain.db.comp_data import (
     CompData,
     CompDataHandler,
     CompDataMixin,
+    CompLayout,
     EngineData,
     FIRST_DATUM_ADDR,
     RouteData,
+    SCOPE_TO_COMP_MAP,
     SwitchData,
     TrainData,
     UpdatePkg,
@@ -191,6 +193,46 @@ class TestCompData:
             assert isinstance(out, bytes)
             assert len(out) == data_len
 
+    @pytest.mark.parametrize(
+        "cls, scope, tmcc_id",
+        [
+            (EngineData, CommandScope.ENGINE, 12),
+            (EngineData, CommandScope.ENGINE, 1234),
+            (TrainData, CommandScope.TRAIN, 12),
+            (AccessoryData, CommandScope.ACC, 12),
+            (SwitchData, CommandScope.SWITCH, 12),
+            (RouteData, CommandScope.ROUTE, 12),
+        ],
+    )
+    def test_compiled_layout_parses_like_the_handlers(self, cls, scope, tmcc_id):
+        data = bytes(0x30 + (i * 7) % 0x40 for i in range(PdiReq.scope_record_length(scope)))
+        comp_data = cls(data, tmcc_id=tmcc_id)  # type: ignore[call-arg]
+        for addr, handler in SCOPE_TO_COMP_MAP[scope].items():
+            if handler.field != "_tmcc_id":
+                expected = handler.from_bytes(data[addr : addr + handler.length])
+                actual = getattr(comp_data, handler.field)
+                assert handler.to_bytes(actual) == handler.to_bytes(expected), handler.field
+        assert comp_data.tmcc_id == tmcc_id
+        assert cls(comp_data.as_bytes(), tmcc_id=tmcc_id).as_bytes() == comp_data.as_bytes()  # type: ignore[call-arg]
+
+    def test_fields_are_generated_properties_of_their_scope(self):
+        assert isinstance(EngineData.__dict__["speed"], property)
+        assert isinstance(TrainData.consist_comps, property)
+        assert "speed" not in vars(SwitchData) and "consist_comps" not in vars(EngineData)
+        eng = EngineData(None, tmcc_id=12)
+        eng.speed = 42
+        assert eng.speed == 42 and eng._speed == 42
+        assert eng.tmcc_id == 12 and eng.scope == CommandScope.ENGINE
+        sw = SwitchData(None, tmcc_id=3)
+        with pytest.raises(AttributeError):
+            _ = sw.speed  # noqa: B018
+        with pytest.raises(AttributeError):
+            sw.speed = 42
+
+    def test_overlapping_layout_fields_are_rejected(self):
+        with pytest.raises(ValueError):
+            CompLayout({0x00: CompDataHandler("_a", 2), 0x01: CompDataHandler("_b")})
+
     def test_route_payload_renders_components(self):
         # Build a RouteData and inject simple components with the required attributes
         buf = b"\xff" * PdiReq.scope_record_length(CommandScope.ROUTE)
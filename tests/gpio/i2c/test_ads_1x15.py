@@ -0,0 +1,117 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/i2c/test_ads_1x15.py
+import time
+
+import pytest
+
+from src.pytrain.gpio.i2c.ads_1x15 import Ads1115, Ads1x15, Ads1x15Sampler
+
+
+class FakeAdsBus:
+    """
+    Models the ADS1115 registers: the conversion register reports the voltage on whichever
+    single-ended channel the config register's mux currently selects.
+    """
+
+    def __init__(self, *args) -> None:
+        self.registers = {Ads1x15.CONFIG_REG: 0x8583, Ads1x15.CONVERSION_REG: 0}
+        self.inputs = [0, 0, 0, 0]
+        self.reads: list[int] = []
+        self.writes: list[tuple[int, int]] = []
+
+    def read_i2c_block_data(self, address: int, register: int, length: int) -> list[int]:
+        self.reads.append(register)
+        if register == Ads1x15.CONVERSION_REG:
+            mux = (self.registers[Ads1x15.CONFIG_REG] >> 12) & 0x07
+            value = self.inputs[mux - 4] if mux >= 4 else 0
+        else:
+            value = self.registers.get(register, 0)
+        return [(value >> 8) & 0xFF, value & 0xFF]
+
+    def write_i2c_block_data(self, address: int, register: int, data: list[int]) -> None:
+        value = (data[0] << 8) | data[1]
+        self.writes.append((register, value))
+        self.registers[register] = value
+
+    def close(self) -> None:
+        pass
+
+
+def wait_until(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.002)
+    return predicate()
+
+
+@pytest.fixture
+def bus(monkeypatch):
+    bus = FakeAdsBus()
+    monkeypatch.setattr("src.pytrain.gpio.i2c.ads_1x15.SMBus", lambda *args: bus)
+    yield bus
+
+
+def test_conversion_time_follows_data_rate(bus):
+    adc = Ads1115(data_rate=Ads1115.DR_ADS111X_860)
+    assert adc.conversion_time == pytest.approx(1 / 860)
+    adc.data_rate = Ads1115.DR_ADS111X_128
+    assert adc.conversion_time == pytest.approx(1 / 128)
+
+
+def test_sampler_round_robins_channels_in_continuous_mode(bus):
+    bus.inputs = [1000, 2000, 3000, 4000]
+    sampler = Ads1x15Sampler(Ads1115(), channels=[0, 2], rate=500)
+    try:
+        assert wait_until(lambda: sampler.raw(0) == 1000 and sampler.raw(2) == 3000)
+        assert sampler.adc.mode == Ads1x15.MODE_CONTINUOUS
+        assert sampler.raw(1) is None  # not sampled
+        bus.inputs[2] = 3500
+        assert wait_until(lambda: sampler.raw(2) == 3500)
+        assert sampler.voltage(0) == pytest.approx(sampler.adc.to_voltage(1000))
+        assert sampler.age(0) < 0.5
+        assert sampler.samples_per_second > 0
+    finally:
+        sampler.close()
+    assert sampler.is_alive() is False
+
+
+def test_single_channel_sampler_never_rewrites_the_mux(bus):
+    bus.inputs = [1234, 0, 0, 0]
+    sampler = Ads1x15Sampler(Ads1115(), channels=[0], rate=1000)
+    try:
+        assert wait_until(lambda: sampler.samples >= 10)
+        assert sampler.mux_writes == 1
+        # readers consume the slot; they don't touch the bus
+        channel = sampler.channel(0)
+        sampler.close()
+        reads = len(bus.reads)
+        for _ in range(100):
+            assert channel.raw_value == 1234
+        assert len(bus.reads) == reads
+    finally:
+        sampler.close()
+
+
+def test_shared_sampler_is_reused_per_address(bus):
+    first = Ads1x15Sampler.shared(Ads1115, address=0x48)
+    try:
+        assert Ads1x15Sampler.shared(Ads1115, address=0x48) is first
+        bus.inputs = [100, 200, 0, 0]
+        horn, brake = first.channel(0), first.channel(1)
+        assert first.channels == [0, 1]
+        assert wait_until(lambda: horn.raw_value == 100 and brake.raw_value == 200)
+        assert brake.request() == pytest.approx(first.adc.to_voltage(200))
+    finally:
+        first.close()
+    assert Ads1x15Sampler.shared(Ads1115, address=0x48) is not first
+    Ads1x15Sampler.shared(Ads1115, address=0x48).close()
@@ -1,3 +1,4 @@
+import time
 import unittest
 
 from src.pytrain.gpio.i2c.mcp23017 import *
@@ -123,3 +124,83 @@ class TestMCP23017(unittest.TestCase):
         mcp.write(INTCAPA, 0x01)
         interrupt_captures = mcp.read_interrupt_captures()
         self.assertEqual(interrupt_captures[0][0], "1")
+
+    def test_handle_interrupt_reads_only_client_port(self):
+        bus = RecordingMBusMock()
+        mcp = Mcp23017(self.mockAddress, I2C(bus))
+        client = FakeClient(GPA2, bounce_time=0.0)
+        mcp.register_client(GPA2, client)
+        mcp.write(INTFA, 0b00000100)
+        mcp.write(INTCAPA, 0b00000100)  # pulled up, so a set capture bit is active
+        bus.reads.clear()
+        mcp.handle_interrupt()
+        self.assertEqual(client.events, [True])
+        self.assertNotIn(INTFB, bus.reads)
+        self.assertNotIn(INTCAPB, bus.reads)
+
+    def test_handle_interrupt_debounces_with_timestamps(self):
+        mcp = Mcp23017(self.mockAddress, I2C(MBusMock()))
+        client = FakeClient(GPB1, bounce_time=0.05)
+        mcp.register_client(GPB1, client)
+        mcp.write(INTFB, 0b00000010)
+        mcp.write(INTCAPB, 0b00000010)
+        start = time.monotonic()
+        mcp.handle_interrupt()
+        # a second edge inside the bounce window is deferred, not dropped
+        client.active = False
+        mcp.handle_interrupt()
+        self.assertLess(time.monotonic() - start, 0.05)  # the interrupt thread never sleeps
+        self.assertEqual(client.events, [True])
+        time.sleep(0.1)
+        self.assertEqual(client.events, [True, False])
+        mcp.close()
+
+    def test_handle_interrupt_capture_polarity(self):
+        mcp = Mcp23017(self.mockAddress, I2C(MBusMock()))
+        client = FakeClient(GPA3, bounce_time=0.0)
+        mcp.register_client(GPA3, client)
+        mcp.write(INTFA, 0b00001000)
+        mcp.write(GPPUA, 0b00000000)  # no pull-up, so a clear capture bit is active
+        mcp.write(INTCAPA, 0b00000000)
+        mcp.handle_interrupt()
+        self.assertEqual(client.events, [True])
+
+        mcp.write(GPPUA, 0b00001000)  # pull-up, so a set capture bit is active
+        mcp.write(INTCAPA, 0b00001000)
+        mcp.handle_interrupt()
+        self.assertEqual(client.events, [True, True])
+
+    def test_handle_interrupt_ignores_edge_not_matching_current_state(self):
+        mcp = Mcp23017(self.mockAddress, I2C(MBusMock()))
+        client = FakeClient(GPA4, bounce_time=0.0)
+        client.active = False
+        mcp.register_client(GPA4, client)
+        mcp.write(INTFA, 0b00010000)
+        mcp.write(INTCAPA, 0b00010000)  # active at interrupt time, but since released
+        mcp.handle_interrupt()
+        self.assertEqual(client.events, [])
+
+
+class RecordingMBusMock(MBusMock):
+    def __init__(self) -> None:
+        super().__init__()
+        self.reads = []
+
+    def read_byte_data(self, address, offset) -> int:
+        self.reads.append(offset)
+        return super().read_byte_data(address, offset)
+
+
+class FakeClient:
+    def __init__(self, pin: int, bounce_time: float) -> None:
+        self.pin = pin
+        self.bounce_time = bounce_time
+        self.active = True
+        self.events = []
+
+    @property
+    def is_active(self) -> bool:
+        return self.active
+
+    def _signal_event(self, active: bool) -> None:
+        self.events.append(active)
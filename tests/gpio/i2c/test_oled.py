@@ -0,0 +1,145 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/i2c/test_oled.py
+import threading
+import time
+
+import pytest
+
+from src.pytrain.gpio.i2c.oled import AnimatedHotspot, AnimationTicker, Oled
+from tests.gpio.utils.test_sh1122 import RecordingSerial
+
+FULL_FRAME = 256 * 64 // 2
+
+
+@pytest.fixture
+def oled(monkeypatch):
+    serial = RecordingSerial()
+    monkeypatch.setattr("src.pytrain.gpio.i2c.oled.i2c", lambda **kwargs: serial)
+    display = Oled(address=0x3C, device="sh1122", auto_update=False, blink_rate=0.05)
+    yield display, serial
+    display.close()
+
+
+def test_only_changed_rows_are_transmitted(oled):
+    display, serial = oled
+    display[0] = "Engine 12"
+    display[1] = "Speed 40"
+    display.refresh_display()  # the initial update is a full frame
+    assert len(serial.payloads[-1]) == FULL_FRAME
+
+    row_bytes = display.row_height * display.width // 2
+    display[2] = "Forward"
+    display.refresh_display()
+    assert len(serial.payloads[-1]) == row_bytes
+
+    # a contiguous band covers the first through last changed row
+    display[0] = "Engine 13"
+    display[3] = "Bell"
+    display.refresh_display()
+    assert len(serial.payloads[-1]) == 4 * row_bytes
+
+
+def test_row_text_is_rendered_from_the_glyph_cache(oled):
+    display, serial = oled
+    display[0] = "Speed 40"
+    display.refresh_display()
+    display[0] = "Speed 41"
+    display.refresh_display()
+    display[0] = "Speed 40"
+    display.refresh_display()
+    assert display.glyphs.hits >= 1
+    band = display.image.crop((0, 0, display.width, display.row_height))
+    assert band.getbbox() is not None  # text was drawn
+
+
+def test_scrolling_rows_push_only_their_band(oled):
+    display, serial = oled
+    display.refresh_display()
+    display[1] = "This line is much too long to fit on the display and must scroll"
+    display.refresh_display()
+    time.sleep(0.1)
+    row_bytes = display.row_height * display.width // 2
+    assert serial.payloads[-1] is not None
+    assert len(serial.payloads[-1]) == row_bytes
+
+
+def test_hotspots_share_one_animation_thread(oled):
+    display, serial = oled
+    display.refresh_display()
+    threads = threading.active_count()
+    for row in range(3):
+        display[row] = f"Row {row} is much too long to fit on the display, so it has to scroll"
+    display.refresh_display()
+    ticker = AnimationTicker.get()
+    assert len([hs for hs in ticker.hotspots if hs.oled is display]) == 3
+    assert threading.active_count() <= threads + 1  # at most the shared ticker was started
+
+    # all rows that move on a tick go out in a single update spanning them
+    sent = len(serial.payloads)
+    frames = ticker.frames
+    time.sleep(0.2)
+    row_bytes = display.row_height * display.width // 2
+    updates = len(serial.payloads) - sent
+    assert 0 < updates <= ticker.frames - frames + 1
+    assert len(serial.payloads[-1]) == 3 * row_bytes
+
+    display.clear()
+    assert not [hs for hs in ticker.hotspots if hs.oled is display]
+
+
+def test_blinking_row_only_redraws_when_it_toggles(oled):
+    display, serial = oled
+    display.refresh_display()
+    display.write("Synchronizing...", 0, blink=True)
+    display.refresh_display()
+    hs = display._hotspots[0]
+    time.sleep(0.32)
+    blinks = len(serial.payloads)
+    assert 4 <= blinks - 2 <= 8
+    hs.pause()
+    time.sleep(0.15)
+    assert len(serial.payloads) == blinks
+    hs.resume()
+    time.sleep(0.1)
+    assert len(serial.payloads) > blinks
+
+
+def test_hotspots_without_render_fail_when_built(oled):
+    display, serial = oled
+
+    class Incomplete(AnimatedHotspot):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete(display, 0, 0.05)
+    assert not [hs for hs in AnimationTicker.get().hotspots if isinstance(hs, Incomplete)]
+
+
+def test_failing_hotspot_is_stopped_without_stopping_the_ticker(oled):
+    display, serial = oled
+    display.refresh_display()
+
+    class Broken(AnimatedHotspot):
+        def render(self, image):
+            raise RuntimeError("render failed")
+
+    broken = Broken(display, 3, 0.02)
+    time.sleep(0.1)
+    ticker = AnimationTicker.get()
+    assert broken not in ticker.hotspots and not broken.is_running
+    assert ticker.is_alive()
+
+    # other hotspots keep animating
+    display[1] = "This line is much too long to fit on the display and must scroll"
+    display.refresh_display()
+    sent = len(serial.payloads)
+    time.sleep(0.1)
+    assert len(serial.payloads) > sent
@@ -0,0 +1,137 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/test_action_scheduler.py
+import threading
+import time
+
+import pytest
+from gpiozero import Button, Device
+from gpiozero.pins.mock import MockFactory
+
+from src.pytrain.gpio.action_scheduler import GpioActionScheduler, PressedOrHeldAction
+from src.pytrain.gpio.gpio_handler import GpioHandler
+
+
+class FakeButton:
+    def __init__(self) -> None:
+        self.is_active = False
+
+
+def wait_until(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.002)
+    return predicate()
+
+
+@pytest.fixture
+def scheduler():
+    sched = GpioActionScheduler(max_workers=2)
+    yield sched
+    sched.reset()
+    sched.join()
+
+
+def test_scheduled_actions_fire_in_deadline_order_and_can_be_cancelled(scheduler):
+    fired = []
+    scheduler.schedule(0.06, fired.append, "late")
+    scheduler.schedule(0.02, fired.append, "early")
+    cancelled = scheduler.schedule(0.04, fired.append, "cancelled")
+    scheduler.cancel(cancelled)
+    assert wait_until(lambda: len(fired) == 2)
+    time.sleep(0.03)
+    assert fired == ["early", "late"]
+
+
+def test_short_press_runs_pressed_action(scheduler):
+    pressed, held = [], []
+    action = PressedOrHeldAction(lambda: scheduler, lambda: pressed.append(1), lambda **kw: held.append(kw), 0.05)
+    btn = FakeButton()
+    btn.is_active = True
+    action.press(btn)
+    btn.is_active = False
+    assert wait_until(lambda: pressed == [1])
+    assert held == []
+
+
+def test_hold_repeats_until_release(scheduler):
+    pressed, held = [], []
+    action = PressedOrHeldAction(
+        lambda: scheduler,
+        lambda: pressed.append(1),
+        lambda **kw: held.append(kw),
+        0.03,
+        held_repeat=True,
+        frequency=0.01,
+        data_gen=lambda _: 7,
+    )
+    btn = FakeButton()
+    btn.is_active = True
+    action.press(btn)
+    assert wait_until(lambda: len(held) >= 4)
+    btn.is_active = False
+    time.sleep(0.05)
+    count = len(held)
+    time.sleep(0.05)
+    assert len(held) == count
+    assert pressed == []
+    assert held[0] == {"new_data": 7, "trigger_effects": True}
+    assert all(kw["trigger_effects"] is False for kw in held[1:])
+
+
+def test_held_buttons_do_not_block_each_other(scheduler):
+    # each held button used to occupy a thread; now all of them share two workers
+    counts = [0] * 8
+    buttons = [FakeButton() for _ in counts]
+    actions = []
+    for i, btn in enumerate(buttons):
+        actions.append(
+            PressedOrHeldAction(
+                lambda: scheduler,
+                None,
+                lambda i=i: counts.__setitem__(i, counts[i] + 1),
+                0.0,
+                held_repeat=True,
+                frequency=0.01,
+                pass_effects=False,
+            )
+        )
+    threads = threading.active_count()
+    for btn, action in zip(buttons, actions):
+        btn.is_active = True
+        action.press(btn)
+    assert wait_until(lambda: all(c >= 3 for c in counts))
+    assert threading.active_count() <= threads + scheduler.max_workers
+    for btn in buttons:
+        btn.is_active = False
+
+
+def test_gpio_handler_pressed_or_held_with_mock_button():
+    Device.pin_factory = MockFactory()
+    try:
+        pressed, held = [], []
+        btn = Button(17)
+        btn.when_pressed = GpioHandler.when_button_pressed_or_held_action(
+            lambda: pressed.append(1), lambda **kw: held.append(kw), held_threshold=0.05
+        )
+        pin = Device.pin_factory.pin(17)
+        start = time.monotonic()
+        pin.drive_low()
+        # the callback returns at once rather than sleeping out the hold threshold
+        assert time.monotonic() - start < 0.04
+        assert wait_until(lambda: held == [{"trigger_effects": True}])
+        pin.drive_high()
+        assert pressed == []
+        btn.close()
+    finally:
+        GpioHandler.reset_all()
+        Device.pin_factory.reset()
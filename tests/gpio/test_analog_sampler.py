@@ -0,0 +1,156 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/test_analog_sampler.py
+import time
+
+import pytest
+from gpiozero import Device, MCP3008
+from gpiozero.pins.mock import MockFactory
+
+from src.pytrain.gpio.analog_sampler import AnalogFilter, AnalogSampler
+from src.pytrain.gpio.gpio_handler import GpioHandler, PotHandler
+from src.pytrain.protocol.command_req import CommandReq
+from src.pytrain.protocol.constants import CommandScope
+from src.pytrain.protocol.tmcc2.tmcc2_constants import TMCC2EngineCommandEnum
+
+
+class FakePot:
+    def __init__(self, value: float = 0.0) -> None:
+        self.value = value
+        self.reads = 0
+
+    def __getattribute__(self, name):
+        if name == "value":
+            object.__setattr__(self, "reads", object.__getattribute__(self, "reads") + 1)
+        return object.__getattribute__(self, name)
+
+
+class RecordingBuffer:
+    def __init__(self) -> None:
+        self.sent: list[bytes] = []
+
+    def enqueue_command(self, command: bytes, delay: float = 0) -> None:
+        self.sent.append(command)
+
+
+def wait_until(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return predicate()
+
+
+@pytest.fixture
+def sampler():
+    sampler = AnalogSampler()
+    yield sampler
+    sampler.reset()
+    sampler.join(timeout=1.0)
+
+
+@pytest.fixture
+def buffer(monkeypatch):
+    buffer = RecordingBuffer()
+    monkeypatch.setattr("src.pytrain.gpio.gpio_handler.CommBuffer.build", lambda *args, **kwargs: buffer)
+    yield buffer
+    GpioHandler.reset_all()
+    GpioHandler.GPIO_ANALOG_SAMPLER = None
+
+
+def test_median_filter_rejects_spikes():
+    f = AnalogFilter(median_window=3, deadband=0.0)
+    assert f.update(0.5) == 0.5
+    assert f.update(0.5) is None
+    assert f.update(1.0) is None  # a single-sample spike is ignored
+    assert f.update(0.5) is None
+    assert f.value == 0.5
+
+
+def test_ema_and_deadband_hysteresis():
+    f = AnalogFilter(median_window=1, ema_alpha=0.5, deadband=0.1)
+    assert f.update(0.0) == 0.0
+    assert f.update(0.1) is None  # smoothed to 0.05, inside the deadband
+    assert f.update(0.3) == pytest.approx(0.175)
+    # hovering around the reported value doesn't report again
+    for raw in (0.2, 0.15, 0.2, 0.15):
+        assert f.update(raw) is None
+    with pytest.raises(ValueError):
+        AnalogFilter(ema_alpha=0.0)
+
+
+def test_sampler_reads_at_fixed_rate_and_emits_only_changes(sampler):
+    pot = FakePot(0.25)
+    seen = []
+    channel = sampler.add(pot, seen.append, rate=100, analog_filter=AnalogFilter(median_window=1))
+    time.sleep(0.3)
+    # the idle pot is read on schedule, not in a tight loop, and reported once
+    assert 15 <= channel.samples <= 40
+    assert seen == [0.25]
+    pot.value = 0.75
+    assert wait_until(lambda: seen == [0.25, 0.75])
+    sampler.remove(channel)
+    reads = channel.samples
+    time.sleep(0.05)
+    assert channel.samples == reads
+    assert sampler.samples_per_second > 0
+
+
+def test_sampler_rate_limits_and_delivers_the_latest_change(sampler):
+    pot = FakePot(0.0)
+    seen = []
+    sampler.add(pot, seen.append, rate=200, min_interval=0.2, analog_filter=AnalogFilter(median_window=1))
+    assert wait_until(lambda: seen == [0.0])
+    for value in (0.1, 0.2, 0.3, 0.4):
+        pot.value = value
+        time.sleep(0.02)
+    # intermediate positions are dropped, but the final one arrives when the interval expires
+    assert wait_until(lambda: len(seen) == 2, timeout=0.5)
+    assert seen == [0.0, 0.4]
+
+
+def test_pot_handler_sends_commands_on_change(buffer):
+    Device.pin_factory = MockFactory()
+    try:
+        cmd = CommandReq(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 5, 0, CommandScope.ENGINE)
+        pot = FakePot(0.0)
+        handler = PotHandler(cmd, device=pot, delay=0.0, sample_rate=100, data_min=0, data_max=199)
+        assert handler.is_alive()
+        assert wait_until(lambda: pot.reads > 2)
+        assert buffer.sent == []  # the first reading only establishes the baseline
+        pot.value = 0.5
+        assert wait_until(lambda: len(buffer.sent) == 1)
+        cmd.data = 100
+        assert buffer.sent[-1] == cmd.as_bytes
+        time.sleep(0.1)
+        assert len(buffer.sent) == 1  # nothing more while the pot is still
+
+        handler.reset()
+        assert handler.is_alive() is False
+        reads = pot.reads
+        time.sleep(0.05)
+        assert pot.reads == reads
+    finally:
+        Device.pin_factory = None
+
+
+def test_pot_handler_samples_mock_mcp3008(buffer):
+    Device.pin_factory = MockFactory()
+    try:
+        handler = GpioHandler.when_pot(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 5, use_12bit=False, sample_rate=50)
+        assert isinstance(handler.pot, MCP3008)
+        sampler = GpioHandler.analog_sampler()
+        assert wait_until(lambda: handler.channel.samples >= 5)
+        assert sampler.samples_per_second > 0
+        assert sampler.cpu_percent >= 0
+    finally:
+        GpioHandler.reset_all()
+        Device.pin_factory = None
@@ -0,0 +1,139 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/test_keypad.py
+import time
+
+import pytest
+from gpiozero.pins.mock import MockFactory, MockPin
+
+from src.pytrain.gpio.keypad import Keypad
+
+ROW_PINS = [5, 6, 13, 19]
+COL_PINS = [12, 16, 20, 21]
+
+
+class Matrix:
+    """
+    Wires mock row (output) pins to mock column (input) pins through a set of pressed keys.
+    """
+
+    def __init__(self, factory: MockFactory) -> None:
+        self.pressed: set[tuple[int, int]] = set()
+        self.rows = []
+        for r, num in enumerate(ROW_PINS):
+            pin = factory.pin(num, pin_class=MatrixRowPin)
+            pin.matrix, pin.row = self, r
+            self.rows.append(pin)
+        self.cols = [factory.pin(num) for num in COL_PINS]
+
+    def update(self) -> None:
+        for c, col in enumerate(self.cols):
+            if col.function != "input":
+                continue
+            high = any(self.rows[r].state and (r, c) in self.pressed for r in range(len(self.rows)))
+            col.drive_high() if high else col.drive_low()
+
+    def press(self, r: int, c: int) -> None:
+        self.pressed.add((r, c))
+        self.update()
+
+    def release(self, r: int, c: int) -> None:
+        self.pressed.discard((r, c))
+        self.update()
+
+
+class MatrixRowPin(MockPin):
+    matrix: Matrix | None = None
+    row: int = 0
+
+    def _change_state(self, value):
+        changed = super()._change_state(value)
+        if changed and self.matrix is not None:
+            self.matrix.update()
+        return changed
+
+
+def wait_until(predicate, timeout: float = 1.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.002)
+    return predicate()
+
+
+@pytest.fixture
+def matrix():
+    factory = MockFactory()
+    yield factory, Matrix(factory)
+    factory.reset()
+
+
+@pytest.mark.parametrize("interrupt", [False, True])
+def test_keypad_reports_key_presses(matrix, interrupt):
+    factory, mx = matrix
+    keypad = Keypad(ROW_PINS, COL_PINS, pin_factory=factory, interrupt=interrupt)
+    try:
+        assert keypad.is_interrupt_driven is interrupt
+        for r, c, key in [(0, 0, "1"), (1, 2, "6"), (3, 1, "0")]:
+            mx.press(r, c)
+            assert wait_until(lambda: keypad.last_keypress == key)
+            mx.release(r, c)
+            assert wait_until(lambda: keypad.is_pressed is False)
+            time.sleep(0.06)  # outlast both the debounce window and a polling pass
+    finally:
+        keypad.close()
+
+
+def test_interrupt_keypad_feeds_key_queue(matrix):
+    factory, mx = matrix
+    keypad = Keypad(ROW_PINS, COL_PINS, pin_factory=factory, interrupt=True)
+    try:
+        for r, c in [(0, 0), (1, 2), (3, 1), (3, 2)]:
+            mx.press(r, c)
+            assert wait_until(lambda: keypad.is_pressed)
+            mx.release(r, c)
+            assert wait_until(lambda: keypad.is_pressed is False)
+            time.sleep(0.03)
+        assert keypad.key_presses == "160"
+        assert keypad.is_eol is True
+    finally:
+        keypad.close()
+
+
+def test_interrupt_keypad_holds_rows_high_and_sleeps_when_idle(matrix):
+    factory, mx = matrix
+    keypad = Keypad(ROW_PINS, COL_PINS, pin_factory=factory, interrupt=True)
+    try:
+        assert wait_until(lambda: all(row.state for row in mx.rows))
+        before = [len(row.states) for row in mx.rows]
+        time.sleep(0.15)
+        # no scanning happens while no key is down
+        assert [len(row.states) for row in mx.rows] == before
+        assert keypad.is_pressed is False
+    finally:
+        keypad.close()
+
+
+def test_interrupt_keypad_ignores_bounce_after_release(matrix):
+    factory, mx = matrix
+    keypad = Keypad(ROW_PINS, COL_PINS, pin_factory=factory, interrupt=True, bounce_time=0.1)
+    try:
+        mx.press(2, 0)
+        assert wait_until(lambda: keypad.last_keypress == "7")
+        mx.release(2, 0)
+        assert wait_until(lambda: keypad.is_pressed is False)
+        # contact chatter immediately after release is not a new key press
+        mx.press(2, 0)
+        mx.release(2, 0)
+        time.sleep(0.05)
+        assert keypad.key_presses == "7"
+    finally:
+        keypad.close()
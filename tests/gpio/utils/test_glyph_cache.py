@@ -0,0 +1,46 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/utils/test_glyph_cache.py
+from PIL import Image, ImageDraw, ImageFont
+
+from src.pytrain.gpio.utils.glyph_cache import GlyphCache
+
+
+def test_strips_are_cached_and_match_direct_rendering():
+    font = ImageFont.load_default(15)
+    cache = GlyphCache(font, row_height=16, mode="RGB")
+    strip = cache.strip("Engine 42")
+    assert cache.strip("Engine 42") is strip
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert strip.height == 16
+
+    direct = Image.new("RGB", strip.size, "black")
+    ImageDraw.Draw(direct).text((0, -3), "Engine 42", "white", font)
+    assert strip.tobytes() == direct.tobytes()
+
+
+def test_width_matches_textbbox():
+    font = ImageFont.load_default(15)
+    cache = GlyphCache(font, row_height=16)
+    left, _, right, _ = ImageDraw.Draw(Image.new("RGB", (1, 1))).textbbox((0, 0), "Speed: 100", font=font)
+    assert cache.width("Speed: 100") == right - left
+
+
+def test_least_recently_used_strips_are_evicted():
+    cache = GlyphCache(ImageFont.load_default(12), row_height=16, max_entries=2)
+    a = cache.strip("a")
+    cache.strip("b")
+    cache.strip("a")  # refresh "a"
+    cache.strip("c")  # evicts "b"
+    assert len(cache) == 2
+    assert cache.strip("a") is a
+    misses = cache.misses
+    cache.strip("b")
+    assert cache.misses == misses + 1
@@ -0,0 +1,76 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gpio/utils/test_sh1122.py
+import random
+
+from luma.core.interface.serial import noop
+from PIL import Image, ImageDraw
+
+from src.pytrain.gpio.utils.sh1122 import pack_greyscale, sh1122
+
+
+class RecordingSerial(noop):
+    def __init__(self) -> None:
+        object.__setattr__(self, "commands", [])
+        object.__setattr__(self, "payloads", [])
+
+    def command(self, *cmd) -> None:
+        self.commands.append(cmd)
+
+    def data(self, data) -> None:
+        self.payloads.append(bytes(data))
+
+
+def reference_pack(image: Image.Image, nibble_order: int = 0) -> bytes:
+    # the per-pixel loop from luma's greyscale_device._render_greyscale, for L images
+    buf = bytearray((image.width * image.height) >> 1)
+    for i, v in enumerate(image.convert("L").tobytes()):
+        grey = v >> 4
+        if grey:
+            if i % 2 == nibble_order:
+                buf[i // 2] |= grey << 4
+            else:
+                buf[i // 2] |= grey
+    return bytes(buf)
+
+
+def test_pack_greyscale_matches_per_pixel_reference():
+    rng = random.Random(42)
+    img = Image.frombytes("L", (256, 8), bytes(rng.randrange(256) for _ in range(256 * 8)))
+    for nibble_order in (0, 1):
+        assert bytes(pack_greyscale(img, nibble_order)) == reference_pack(img, nibble_order)
+
+
+def test_pack_greyscale_text_image():
+    img = Image.new("RGB", (256, 64), "black")
+    ImageDraw.Draw(img).text((2, 2), "Lionel 2026", "white")
+    packed = pack_greyscale(img)
+    assert len(packed) == 256 * 64 // 2
+    assert bytes(packed) == reference_pack(img)
+
+
+def test_display_rows_transmits_only_the_band():
+    serial = RecordingSerial()
+    device = sh1122(serial)
+    serial.commands.clear()
+    serial.payloads.clear()
+
+    img = Image.new("RGB", device.size, "black")
+    ImageDraw.Draw(img).rectangle((0, 16, 255, 31), fill="white")
+    device.display_rows(img, 16, 32)
+
+    assert serial.commands[-1] == (device._const.SET_ROW_ADR, 16)
+    assert len(serial.payloads) == 1
+    assert serial.payloads[0] == b"\xff" * (256 * 16 // 2)
+
+    # a full display still sends the whole frame, starting at row 0
+    device.display(img)
+    assert serial.commands[-1] == (device._const.SET_ROW_ADR, 0)
+    assert len(serial.payloads[-1]) == 256 * 64 // 2
@@ -0,0 +1,14 @@
+import pytest
+
+from src.pytrain.gui.image_cache import PhotoImageCache, ThumbnailCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_image_caches(tmp_path):
+    # keep pre-scaled thumbnails out of the user's cache directory and start each test empty
+    ThumbnailCache.reset()
+    PhotoImageCache.reset()
+    ThumbnailCache(tmp_path / "thumbnails")
+    yield
+    ThumbnailCache.reset()
+    PhotoImageCache.reset()
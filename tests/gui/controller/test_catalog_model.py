@@ -0,0 +1,86 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+from types import SimpleNamespace
+
+from src.pytrain.gui.controller.catalog_model import SORT_BY_NAME, SORT_BY_ROAD_NUMBER, SORT_BY_TMCC_ID, CatalogModel
+from src.pytrain.protocol.constants import CommandScope
+
+ALL = (0, 1, 2)
+
+
+def engine(address: int, road_name: str, road_number: str, diesel: bool = True) -> SimpleNamespace:
+    return SimpleNamespace(
+        address=address,
+        tmcc_id=address,
+        road_name=road_name,
+        road_number=road_number,
+        name=f"{road_name} #{road_number}",
+        is_name=True,
+        is_diesel=diesel,
+        is_steam=not diesel,
+    )
+
+
+def entries(model: CatalogModel, sort_order: int, selected=ALL) -> list[str]:
+    return model.view(sort_order, selected).entries
+
+
+def test_views_are_sorted_for_each_order_and_filtered_by_category():
+    model = CatalogModel(CommandScope.ENGINE)
+    states = [engine(10, "NYC", "300"), engine(2, "BNSF", "900"), engine(33, "PRR", "100", diesel=False)]
+    assert model.refresh(states) is True
+    assert entries(model, SORT_BY_NAME) == ["BNSF #900", "NYC #300", "PRR #100"]
+    assert entries(model, SORT_BY_ROAD_NUMBER) == ["100: PRR", "300: NYC", "900: BNSF"]
+    assert entries(model, SORT_BY_TMCC_ID) == ["2: BNSF #900", "10: NYC #300", "33: PRR #100"]
+    assert entries(model, SORT_BY_NAME, selected=(1,)) == ["PRR #100"]
+
+
+def test_refresh_moves_only_changed_rows():
+    model = CatalogModel(CommandScope.ENGINE)
+    states = [engine(1, "NYC", "300"), engine(2, "BNSF", "900")]
+    model.refresh(states)
+    version = model.version
+    assert model.refresh(states) is False
+    assert model.version == version
+
+    states[1].name = "ATSF #900"
+    states[1].road_name = "ATSF"
+    assert model.update_state(states[1]) is True
+    assert entries(model, SORT_BY_NAME) == ["ATSF #900", "NYC #300"]
+
+    # a state that is gone from the store drops out of the catalog
+    model.refresh(states[1:])
+    assert entries(model, SORT_BY_NAME) == ["ATSF #900"]
+    assert len(model) == 1
+
+
+def test_switch_entries_are_two_digit_and_highlighted_when_thru():
+    from src.pytrain.db.component_state import SwitchState
+
+    class Switch(SwitchState):
+        def __init__(self, address: int, thru: bool) -> None:
+            self._thru = thru
+            self._address = address
+
+        name = property(lambda self: f"Switch {self._address}")
+        road_name = property(lambda self: self.name)
+        road_number = property(lambda self: str(self._address))
+        tmcc_id = property(lambda self: self._address)
+        address = property(lambda self: self._address)
+        is_name = True
+        is_thru = property(lambda self: self._thru)
+        is_out = property(lambda self: not self._thru)
+        is_unknown = False
+
+    model = CatalogModel(CommandScope.SWITCH)
+    model.refresh([Switch(7, True), Switch(12, False)])
+    view = model.view(SORT_BY_TMCC_ID, ALL)
+    assert view.entries == ["07: Switch 7", "12: Switch 12"]
+    assert view.highlighted == [True, False]
+    assert entries(model, SORT_BY_TMCC_ID, selected=(1,)) == ["12: Switch 12"]
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import os
-import queue
 import struct
 from types import SimpleNamespace
 
@@ -34,6 +33,7 @@ from src.pytrain.gui.controller.steam_deck_input import (
     SteamDeckInputProvider,
     TouchpadBinding,
     _DECK_PADDLE_BUTTONS,
+    _HidrawMailbox,
     _decode_deck_paddles,
     _decode_deck_pads,
     _deck_pad_y_fraction,
@@ -2607,7 +2607,7 @@ def _paddle_provider() -> SteamDeckInputProvider:
         }
     )
     provider = SteamDeckInputProvider(profile, pygame_module=_touchpad_pygame([]))
-    provider._hidraw_queue = queue.Queue()
+    provider._hidraw_mailbox = _HidrawMailbox()
     return provider
 
 
@@ -2630,11 +2630,11 @@ def test_decode_deck_paddles_rejects_non_state_and_short_reports() -> None:
 def test_hidraw_paddle_press_and_release_emit_one_action_each() -> None:
     provider = _paddle_provider()
 
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _paddle_report(16)))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report(16)))
     pressed = provider._drain_hidraw_pads()
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _paddle_report(16)))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report(16)))
     held = provider._drain_hidraw_pads()
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _paddle_report()))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report()))
     released = provider._drain_hidraw_pads()
 
     assert [(a.name, a.phase, a.button) for a in pressed] == [("engineer_chatter", "pressed", 16)]
@@ -2645,7 +2645,7 @@ def test_hidraw_paddle_press_and_release_emit_one_action_each() -> None:
 def test_hidraw_paddles_are_independent() -> None:
     provider = _paddle_provider()
 
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _paddle_report(17, 19)))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report(17, 19)))
     actions = provider._drain_hidraw_pads()
 
     assert sorted((a.name, a.button) for a in actions) == [("volume_down", 17), ("volume_up", 19)]
@@ -2657,7 +2657,7 @@ def test_paddle_reported_by_both_routes_fires_once() -> None:
     provider = _paddle_provider()
 
     sdl = provider._button_actions(16, True)
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _paddle_report(16)))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report(16)))
     hidraw = provider._drain_hidraw_pads()
 
     assert [(a.name, a.phase) for a in sdl] == [("engineer_chatter", "pressed")]
@@ -2674,14 +2674,14 @@ def test_capability_warning_ignores_paddles_sdl_does_not_report() -> None:
 
 def _hidraw_provider() -> SteamDeckInputProvider:
     provider = SteamDeckInputProvider(_touchpad_profile(), pygame_module=_touchpad_pygame([]))
-    provider._hidraw_queue = queue.Queue()
+    provider._hidraw_mailbox = _HidrawMailbox()
     return provider
 
 
 def test_hidraw_pad_motion_emits_quilling_horn_for_bound_pads() -> None:
     provider = _hidraw_provider()
     # Right pad touched near the bottom (-32768) -> full horn on the right panel.
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, -32768))))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, -32768))))
 
     actions = provider._drain_hidraw_pads()
 
@@ -2692,8 +2692,8 @@ def test_hidraw_pad_motion_emits_quilling_horn_for_bound_pads() -> None:
 def test_hidraw_uses_only_latest_report_per_node() -> None:
     provider = _hidraw_provider()
     # Two stale reports followed by the current one; only the last is applied.
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, 32767))))
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, 0))))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, 32767))))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, 0))))
 
     actions = provider._drain_hidraw_pads()
 
@@ -2704,14 +2704,14 @@ def test_hidraw_uses_only_latest_report_per_node() -> None:
 
 def test_hidraw_release_emits_single_stop_when_finger_lifts() -> None:
     provider = _hidraw_provider()
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, -32768))))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, -32768))))
     provider._drain_hidraw_pads()  # finger down
 
     # Next drain sees the pad released (no touched pads in the report).
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report()))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report()))
     first = provider._drain_hidraw_pads()
     # A second empty drain must not emit another release.
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report()))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report()))
     second = provider._drain_hidraw_pads()
 
     assert [(a.name, a.target, a.value) for a in first] == [(QUILLING_HORN, "right", 0.0)]
@@ -2724,16 +2724,53 @@ def test_hidraw_ignores_unbound_pad() -> None:
         _profile(touchpads={"1": {"action": "quilling_horn", "target": "right"}}),
         pygame_module=_touchpad_pygame([]),
     )
-    provider._hidraw_queue = queue.Queue()
-    provider._hidraw_queue.put(("report", "/dev/hidraw3", _deck_state_report(lpad=(0, -32768))))
+    provider._hidraw_mailbox = _HidrawMailbox()
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _deck_state_report(lpad=(0, -32768))))
 
     assert provider._drain_hidraw_pads() == []
 
 
+def test_hidraw_mailbox_drops_repeated_reports_and_coalesces_motion() -> None:
+    wakes: list[int] = []
+    mailbox = _HidrawMailbox(lambda: wakes.append(1))
+    for y in (32767, 30000, 20000):
+        mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, y))))
+    mailbox.put(("report", "/dev/hidraw3", _deck_state_report(rpad=(0, 20000))))
+
+    states, errors = mailbox.take()
+
+    assert [(s.rpad_touched, s.ry) for _path, s in states] == [(True, 20000)]
+    assert errors == []
+    assert (mailbox.received, mailbox.duplicates, mailbox.coalesced) == (4, 1, 2)
+    assert wakes == [1]  # once for the whole burst
+
+
+def test_hidraw_mailbox_keeps_a_tap_shorter_than_the_poll() -> None:
+    provider = _paddle_provider()
+
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report(16)))
+    provider._hidraw_mailbox.put(("report", "/dev/hidraw3", _paddle_report()))
+    actions = provider._drain_hidraw_pads()
+
+    assert [(a.name, a.phase) for a in actions] == [("engineer_chatter", "pressed"), ("engineer_chatter", "released")]
+
+
+def test_hidraw_mailbox_ignores_unbound_pad_motion() -> None:
+    wakes: list[int] = []
+    mailbox = _HidrawMailbox(lambda: wakes.append(1), pads=(False, True))
+
+    mailbox.put(("report", "/dev/hidraw3", _deck_state_report()))
+    mailbox.take()
+    mailbox.put(("report", "/dev/hidraw3", _deck_state_report(lpad=(0, -32768))))
+
+    assert mailbox.take() == ([], [])
+    assert wakes == [1]
+
+
 def test_hidraw_reports_open_error_once() -> None:
     provider = _hidraw_provider()
-    provider._hidraw_queue.put(("error", "/dev/hidraw3", "cannot open (permission denied)"))
-    provider._hidraw_queue.put(("error", "/dev/hidraw3", "cannot open (permission denied)"))
+    provider._hidraw_mailbox.put(("error", "/dev/hidraw3", "cannot open (permission denied)"))
+    provider._hidraw_mailbox.put(("error", "/dev/hidraw3", "cannot open (permission denied)"))
 
     assert provider._drain_hidraw_pads() == []
     assert "/dev/hidraw3" in provider._hidraw_errors
@@ -2742,7 +2779,7 @@ def test_hidraw_reports_open_error_once() -> None:
 def test_drain_hidraw_pads_is_noop_without_reader() -> None:
     provider = SteamDeckInputProvider(_touchpad_profile(), pygame_module=_touchpad_pygame([]))
 
-    assert provider._hidraw_queue is None
+    assert provider._hidraw_mailbox is None
     assert provider._drain_hidraw_pads() == []
 
 
@@ -2751,7 +2788,7 @@ def test_start_hidraw_readers_skips_when_no_touchpads_bound() -> None:
 
     provider._start_hidraw_readers()
 
-    assert provider._hidraw_queue is None
+    assert provider._hidraw_mailbox is None
     assert provider._hidraw_readers == []
 
 
@@ -2762,7 +2799,7 @@ def test_start_hidraw_readers_starts_thread_when_deck_node_present(monkeypatch:
     started: list[str] = []
 
     class _FakeReader:
-        def __init__(self, path: str, out_queue: queue.Queue) -> None:
+        def __init__(self, path: str, mailbox: _HidrawMailbox) -> None:
             self.path = path
             self.stopped = False
 
@@ -2778,12 +2815,12 @@ def test_start_hidraw_readers_starts_thread_when_deck_node_present(monkeypatch:
     provider._start_hidraw_readers()
 
     assert started == ["/dev/hidraw-fake"]
-    assert provider._hidraw_queue is not None
+    assert provider._hidraw_mailbox is not None
 
     provider._stop_hidraw_readers()
 
     assert provider._hidraw_readers == []
-    assert provider._hidraw_queue is None
+    assert provider._hidraw_mailbox is None
 
 
 def test_find_deck_hidraw_paths_returns_list() -> None:
@@ -20,6 +20,10 @@ class _Catalog:
     def append(self, item: str) -> None:
         self.items.append(item)
 
+    def sync(self, items: list[str], _backgrounds: list[str | None] | None = None) -> int:
+        self.items[:] = items
+        return len(items)
+
 
 class _Accessory:
     def __init__(self, label: str) -> None:
@@ -134,6 +138,7 @@ def test_reset_configured_accessory_cache_rebuilds_from_current_scope() -> None:
     panel._sel_2_btn = _Button()
     panel._sel_3_btn = _Button()
     panel._entry_state_map = {}
+    panel._models = {}
     panel._skip_update = False
 
     panel.reset_configured_accessory_cache(scope=CommandScope.ACC)
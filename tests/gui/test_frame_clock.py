@@ -0,0 +1,131 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gui/test_frame_clock.py
+from __future__ import annotations
+
+from typing import Callable
+
+from src.pytrain.gui.frame_clock import FrameClock
+
+
+class FakeRoot:
+    """
+    A Tk root whose after() queue is run by advance(), against a fake clock
+    """
+
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.afters: dict[str, tuple[float, Callable]] = {}
+        self.wakeups = 0
+        self._next_id = 0
+
+    def after(self, delay_ms: int, fn: Callable) -> str:
+        self._next_id += 1
+        after_id = f"after#{self._next_id}"
+        self.afters[after_id] = (self.now + delay_ms / 1000, fn)
+        return after_id
+
+    def after_cancel(self, after_id: str) -> None:
+        self.afters.pop(after_id, None)
+
+    def advance(self, ms: int) -> None:
+        end = self.now + ms / 1000
+        while self.afters:
+            after_id, (due, fn) = min(self.afters.items(), key=lambda item: item[1][0])
+            if due > end:
+                break
+            del self.afters[after_id]
+            self.now = due
+            self.wakeups += 1
+            fn()
+        self.now = end
+
+
+class FakeWidget:
+    def __init__(self, mapped: bool = True) -> None:
+        self.mapped = mapped
+        self.bindings: dict[str, list[Callable]] = {}
+
+    def winfo_ismapped(self) -> bool:
+        return self.mapped
+
+    def bind(self, event: str, fn: Callable, add: str | None = None) -> None:
+        self.bindings.setdefault(event, []).append(fn)
+
+    def map(self) -> None:
+        self.mapped = True
+        for fn in self.bindings.get("<Map>", []):
+            fn(None)
+
+
+def _clock() -> tuple[FrameClock, FakeRoot]:
+    root = FakeRoot()
+    return FrameClock(root, now=lambda: root.now), root
+
+
+def test_one_after_is_pending_for_many_timers():
+    clock, root = _clock()
+    ran = []
+    for delay in (100, 50, 104, 300):
+        clock.call_later(delay, lambda d=delay: ran.append(d))
+    assert len(root.afters) == 1
+    assert clock.pending == 4
+
+    root.advance(100)
+    # the timers due at 100 and 104 ms share a frame
+    assert ran == [50, 100, 104]
+    root.advance(200)
+    assert ran == [50, 100, 104, 300]
+    assert (root.wakeups, clock.frames, clock.callbacks, clock.pending) == (3, 3, 4, 0)
+    assert root.afters == {}
+
+
+def test_canceled_timers_do_not_run_or_wake_the_loop():
+    clock, root = _clock()
+    ran = []
+    timer = clock.call_later(50, lambda: ran.append("canceled"))
+    timer.cancel()
+    assert root.afters == {}
+    assert timer.active is False
+
+    clock.call_later(20, lambda: ran.append("kept"))
+    clock.call_later(40, lambda: ran.append("canceled")).cancel()
+    root.advance(100)
+    assert ran == ["kept"] and root.wakeups == 1
+
+
+def test_timers_of_unmapped_widgets_wait_for_the_map():
+    clock, root = _clock()
+    widget = FakeWidget(mapped=False)
+    ran = []
+    clock.call_later(10, lambda: ran.append("hidden"), widget=widget)
+    root.advance(1000)
+    assert ran == [] and clock.held == 1 and clock.pending == 0
+
+    widget.map()
+    root.advance(0)
+    assert ran == ["hidden"] and clock.held == 0
+
+
+def test_callback_errors_do_not_stop_the_clock():
+    clock, root = _clock()
+    ran = []
+    clock.call_later(10, lambda: 1 / 0)
+    clock.call_later(10, lambda: ran.append("after error"))
+    root.advance(10)
+    assert ran == ["after error"]
+
+
+def test_there_is_one_clock_per_root():
+    root = FakeRoot()
+    assert FrameClock.of(root) is FrameClock.of(root)
+    FrameClock.of(root).call_later(10, lambda: None)
+    assert FrameClock.release(root).pending == 0
+    assert root.afters == {}
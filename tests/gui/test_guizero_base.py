@@ -151,6 +151,36 @@ def test_compact_prepared_image_preserves_source_aspect_ratio() -> None:
     gui.close()
 
 
+def test_get_image_shares_decoded_images_across_guis(tmp_path, monkeypatch) -> None:
+    path = tmp_path / "button.png"
+    Image.new("RGBA", (200, 200), "red").save(path)
+    made = []
+
+    class FakePhotoImage:
+        def __init__(self, image: Image.Image) -> None:
+            made.append(image.size)
+            self._size = image.size
+
+        def width(self) -> int:
+            return self._size[0]
+
+        def height(self) -> int:
+            return self._size[1]
+
+    monkeypatch.setattr(mod.ImageTk, "PhotoImage", FakePhotoImage)
+    first, second = DummyGui(), DummyGui()
+
+    normal, inverted = first.get_image(str(path), size=40)
+    assert second.get_image(str(path), size=(40, 40)) == (normal, inverted)
+    # a different size of the same image is its own entry
+    small, _ = first.get_image(str(path), size=20)
+    assert small is not normal
+    assert made == [(40, 40), (40, 40), (20, 20), (20, 20)]
+
+    first.close()
+    second.close()
+
+
 def test_button_divisor_supports_compact_landscape_controls() -> None:
     portrait = DummyGui()
     landscape = DummyGui(button_divisor=8.0)
@@ -164,12 +194,18 @@ def test_button_divisor_supports_compact_landscape_controls() -> None:
     landscape.close()
 
 
-def test_poll_shutdown_processes_up_to_five_messages_per_tick() -> None:
+def test_poll_shutdown_processes_messages_within_the_frame_budget(monkeypatch) -> None:
     gui = DummyGui()
     handled: list[int] = []
+    clock = [0.0]
+    monkeypatch.setattr("src.pytrain.gui.update_bus.time.monotonic", lambda: clock[0])
+
+    def handle(value: int) -> None:
+        handled.append(value)
+        clock[0] += 0.005
 
     for i in range(7):
-        gui.queue_message(lambda value=i: handled.append(value))
+        gui.queue_message(handle, i)
 
     gui.run()
 
@@ -178,8 +214,25 @@ def test_poll_shutdown_processes_up_to_five_messages_per_tick() -> None:
     poll_shutdown = app.repeat_callbacks[0]
     poll_shutdown()
 
-    assert handled == [0, 1, 2, 3, 4]
-    assert gui._message_queue.qsize() == 2
+    # a 12 ms budget is spent by the third 5 ms callback
+    assert handled == [0, 1, 2]
+    assert gui._message_queue.qsize() == 4
+    assert gui.update_bus.deferred_frames == 1
+
+
+def test_queued_updates_to_the_same_widget_are_merged() -> None:
+    gui = DummyGui()
+    handled: list[tuple[str, int]] = []
+
+    for speed in range(10):
+        gui.queue_update(lambda name, value=speed: handled.append((name, value)), "engine", key="engine")
+    gui.queue_update(lambda name: handled.append((name, 0)), "train")
+
+    gui.run()
+    DummyApp.last_instance.repeat_callbacks[0]()
+
+    assert handled == [("engine", 9), ("train", 0)]
+    assert gui.update_bus.merged == 9
 
 
 def test_poll_shutdown_logs_callback_exception_and_continues(caplog) -> None:
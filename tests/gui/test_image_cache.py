@@ -0,0 +1,135 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gui/test_image_cache.py
+import os
+import tkinter as tk
+from io import BytesIO
+
+import pytest
+from PIL import Image
+
+from src.pytrain.gui.image_cache import PhotoImageCache, ThumbnailCache
+
+
+class FakePhoto:
+    def __init__(self, width: int, height: int) -> None:
+        self._width, self._height = width, height
+
+    def width(self) -> int:
+        return self._width
+
+    def height(self) -> int:
+        return self._height
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "engine.png"
+    Image.new("RGB", (640, 320), "orange").save(path)
+    return str(path)
+
+
+def test_thumbnail_is_scaled_once_and_reused_from_disk(source):
+    thumbnails = ThumbnailCache()
+    first = thumbnails.load(source, (160, 80))
+    assert first.size == (160, 80)
+    assert thumbnails.misses == 1
+    assert thumbnails.path_for(source, (160, 80)).is_file()
+
+    second = thumbnails.load(source, (160, 80))
+    assert second.size == (160, 80)
+    assert thumbnails.hits == 1
+    assert second.getpixel((10, 10)) == first.getpixel((10, 10))
+
+
+def test_animated_images_are_scaled(tmp_path):
+    path = tmp_path / "smoke.gif"
+    frames = [Image.new("RGB", (200, 100), color) for color in ("red", "blue", "green")]
+    frames[0].save(path, save_all=True, append_images=frames[1:], duration=100, loop=0)
+    thumbnails = ThumbnailCache()
+    for size in ((50, 25), (200, 100)):
+        first = thumbnails.load(str(path), size)
+        assert first.size == size
+        assert first.convert("RGB").getpixel((5, 5)) == (255, 0, 0)
+        assert thumbnails.load(str(path), size).size == size
+    assert thumbnails.hits == 2
+
+
+def test_thumbnails_are_keyed_by_content(source, tmp_path):
+    thumbnails = ThumbnailCache()
+    copy = tmp_path / "copy.png"
+    copy.write_bytes(open(source, "rb").read())
+    assert thumbnails.digest(source) == thumbnails.digest(str(copy))
+    assert thumbnails.digest(source) == thumbnails.digest(BytesIO(copy.read_bytes()))
+
+    thumbnails.load(source, (64, 32))
+    thumbnails.load(str(copy), (64, 32))
+    assert (thumbnails.hits, thumbnails.misses) == (1, 1)
+
+    # replacing the image invalidates its thumbnails
+    Image.new("RGB", (640, 320), "blue").save(copy)
+    os.utime(copy, ns=(1, 1))
+    assert thumbnails.digest(str(copy)) != thumbnails.digest(source)
+    assert thumbnails.load(str(copy), (64, 32)).getpixel((0, 0)) == (0, 0, 255)
+
+
+def test_source_size_and_unscaled_loads(source):
+    thumbnails = ThumbnailCache()
+    assert thumbnails.source_size(source) == (640, 320)
+    assert thumbnails.load(source).size == (640, 320)
+    assert not thumbnails.cache_dir.exists()
+
+
+def test_unwritable_cache_scales_in_memory(source, tmp_path):
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    thumbnails = ThumbnailCache()
+    thumbnails.cache_dir = blocker / "thumbnails"
+    assert thumbnails.load(source, (32, 16)).size == (32, 16)
+    assert thumbnails.load(source, (32, 16)).size == (32, 16)
+    assert thumbnails.hits == 0
+
+
+def test_photo_cache_is_bounded_by_memory():
+    photos = PhotoImageCache()
+    photos.max_bytes = 4 * 100 * 100 * 2
+    made = []
+
+    def factory(tag):
+        def make():
+            made.append(tag)
+            return FakePhoto(100, 100)
+
+        return make
+
+    a = photos.get("a", factory("a"))
+    assert photos.get("a", factory("a")) is a
+    photos.get("b", factory("b"))
+    photos.get("a", factory("a"))  # a is now most recently used
+    photos.get("c", factory("c"))  # evicts b
+    assert made == ["a", "b", "c"]
+    assert "a" in photos and "c" in photos and "b" not in photos
+    assert photos.size_in_bytes == 2 * 4 * 100 * 100
+
+
+def test_photo_cache_is_dropped_when_tk_root_changes(monkeypatch):
+    photos = PhotoImageCache()
+    first_root, second_root = object(), object()
+    monkeypatch.setattr(tk, "_default_root", first_root, raising=False)
+    photo = photos.get("a", lambda: FakePhoto(10, 10))
+    assert photos.get("a", lambda: FakePhoto(10, 10)) is photo
+
+    monkeypatch.setattr(tk, "_default_root", second_root, raising=False)
+    assert photos.get("a", lambda: FakePhoto(10, 10)) is not photo
+
+    photos.release(first_root)  # not the current root; nothing is dropped
+    assert len(photos) == 1
+    photos.release(second_root)
+    assert len(photos) == 0
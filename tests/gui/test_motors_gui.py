@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-from queue import Queue
 from threading import Condition, Event, RLock
 from types import SimpleNamespace
 from typing import Any
@@ -8,6 +7,7 @@ from typing import Any
 import pytest
 
 import src.pytrain.gui.motors_gui as mod
+from src.pytrain.gui.update_bus import UpdateBus
 
 
 class _DummyTk:
@@ -161,7 +161,7 @@ def _new_gui(height: int) -> mod.MotorsGui:
     gui._making_buttons = True
     gui._cv = Condition(RLock())
     gui._shutdown_flag = Event()
-    gui._message_queue = Queue()
+    gui._message_queue = UpdateBus()
     gui._output_by_tmcc = {}
     gui._last_non_zero_lamp_level = {}
     gui._lamp_toggle_off = {}
@@ -485,7 +485,7 @@ def test_state_change_callback_uses_tmcc_id_and_updates_visible_outputs() -> Non
 
     message, args = gui._message_queue.get_nowait()
     assert message == gui.update_button
-    assert args == [latest_state]
+    assert args == (latest_state,)
 
     message(*args)
     output = gui._output_by_tmcc[watched_state.tmcc_id][("lamp", 1)]
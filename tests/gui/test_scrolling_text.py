@@ -3,6 +3,7 @@ from __future__ import annotations
 from typing import Any, Callable
 
 from src.pytrain.gui.components.scrolling_text import ScrollingText
+from src.pytrain.gui.frame_clock import FrameClock
 
 
 class DummyFont:
@@ -77,9 +78,9 @@ def make_widget(
     widget._touch_mode = "toggle"
     widget._running = False
     widget._pressed = False
-    widget._tick_after_id = None
-    widget._start_after_id = None
-    widget._manage_after_id = None
+    widget._tick_timer = None
+    widget._start_timer = None
+    widget._manage_timer = None
     widget._scroll_buf = ""
     widget._font_cache = DummyFont()
     widget._font_key = "TkDefaultFont"
@@ -101,9 +102,9 @@ def test_auto_manage_retries_when_width_is_not_ready() -> None:
 
     widget._auto_manage_scroll()
 
-    assert widget._manage_after_id is not None
-    assert widget.tk._after_calls[widget._manage_after_id][0] == 250
-    assert widget._start_after_id is None
+    assert widget._manage_timer is not None
+    assert widget._manage_timer.delay_ms == 250
+    assert widget._start_timer is None
 
 
 def test_auto_manage_retries_when_widget_is_not_mapped_yet() -> None:
@@ -111,9 +112,9 @@ def test_auto_manage_retries_when_widget_is_not_mapped_yet() -> None:
 
     widget._auto_manage_scroll()
 
-    assert widget._manage_after_id is not None
-    assert widget.tk._after_calls[widget._manage_after_id][0] == 250
-    assert widget._start_after_id is None
+    assert widget._manage_timer is not None
+    assert widget._manage_timer.delay_ms == 250
+    assert widget._start_timer is None
 
 
 def test_map_event_rechecks_scroll_need() -> None:
@@ -121,34 +122,59 @@ def test_map_event_rechecks_scroll_need() -> None:
 
     widget._on_map()
 
-    assert widget._manage_after_id is not None
-    assert widget.tk._after_calls[widget._manage_after_id][0] == 75
+    assert widget._manage_timer is not None
+    assert widget._manage_timer.delay_ms == 75
 
 
 def test_auto_manage_schedules_one_start_when_text_needs_scroll() -> None:
     widget = make_widget(width=40)
 
     widget._auto_manage_scroll()
-    first_start_id = widget._start_after_id
+    first_start = widget._start_timer
     widget._auto_manage_scroll()
 
-    assert first_start_id is not None
-    assert widget._start_after_id == first_start_id
-    assert list(widget.tk._after_calls) == [first_start_id]
+    assert first_start is not None
+    assert widget._start_timer is first_start
+    assert FrameClock.of(widget.tk).pending == 1
+    assert len(widget.tk._after_calls) == 1
 
 
 def test_setting_same_logical_value_does_not_cancel_pending_scroll_start() -> None:
     widget = make_widget("Canadian National ET44ac #3180", width=80)
 
     widget._auto_manage_scroll()
-    first_start_id = widget._start_after_id
+    first_start = widget._start_timer
     widget.value = "Canadian National ET44ac #3180"
 
-    assert first_start_id is not None
-    assert widget._start_after_id == first_start_id
+    assert first_start is not None
+    assert widget._start_timer is first_start
 
 
 def test_needs_scroll_uses_parent_width_when_label_reports_natural_width() -> None:
     widget = make_widget("Very Long Road Name", width=260, master_width=80)
 
     assert widget.needs_scroll()
+
+
+def test_ticks_are_held_while_the_label_is_unmapped() -> None:
+    widget = make_widget(width=40)
+    clock = FrameClock.of(widget.tk)
+    now = [100.0]
+    clock._now = lambda: now[0]
+    widget._running = True
+    widget._tick()
+    (after_id,) = widget.tk._after_calls
+    now[0] += widget._speed_ms / 1000
+
+    widget.tk.mapped = False
+    text = widget.tk.cget("text")
+    widget.tk.run_after(after_id)
+
+    assert widget.tk.cget("text") == text
+    assert (clock.pending, clock.held) == (0, 1)
+    assert widget.tk._after_calls == {}
+
+    widget.tk.mapped = True
+    for on_map in widget.tk._bindings["<Map>"]:
+        on_map(None)
+    assert (clock.pending, clock.held) == (1, 0)
@@ -0,0 +1,163 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gui/test_state_based_gui.py
+from __future__ import annotations
+
+from threading import Condition, RLock
+from typing import Any
+
+import pytest
+
+import src.pytrain.gui.state_based_gui as mod
+from src.pytrain.protocol.constants import CommandScope
+
+
+class DummyTk:
+    @staticmethod
+    def winfo_height() -> int:
+        return 50
+
+    @staticmethod
+    def winfo_width() -> int:
+        return 120
+
+
+class DummyWidget:
+    def __init__(self, *_args: Any, **kwargs: Any) -> None:
+        self.tk = DummyTk()
+        self.grid = kwargs.get("grid")
+        self.text = kwargs.get("text", "")
+        self.bg = self.text_color = None
+        self.visible = True
+        self.enabled = True
+        self.on_press = None
+
+    def show(self) -> None:
+        self.visible = True
+
+    def hide(self) -> None:
+        self.visible = False
+
+    def enable(self) -> None:
+        self.enabled = True
+
+    def disable(self) -> None:
+        self.enabled = False
+
+    def destroy(self) -> None:
+        self.visible = None
+
+
+class CountingHoldButton(DummyWidget):
+    created = 0
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        CountingHoldButton.created += 1
+
+
+class DummyState:
+    def __init__(self, tmcc_id: int, road_name: str) -> None:
+        self.tmcc_id = tmcc_id
+        self.road_name = road_name
+        self.scope = CommandScope.ACC
+
+
+class DummyApp:
+    def __init__(self) -> None:
+        self.updates = 0
+
+    def update(self) -> None:
+        self.updates += 1
+
+
+class SimpleGui(mod.StateBasedGui):
+    # noinspection PyMissingConstructor
+    def __init__(self) -> None:
+        pass
+
+    def get_target_states(self) -> list:
+        return []
+
+    def is_active(self, state) -> bool:
+        return state.tmcc_id % 2 == 0
+
+    def switch_state(self, state) -> bool:
+        return True
+
+
+def make_gui(count: int) -> SimpleGui:
+    gui = SimpleGui()
+    gui._cv = Condition(RLock())
+    gui._app = DummyApp()
+    gui.width, gui.height, gui.y_offset = 800, 600, 100
+    gui._scale_by = 1.0
+    gui._button_text_pad_y = 12
+    gui._visible_button_cols = 2
+    gui._enabled_bg, gui._disabled_bg, gui._enabled_text, gui._disabled_text = "green", "black", "black", "lightgrey"
+    gui.btn_box = DummyWidget()
+    gui.by_name, gui.by_number = DummyWidget(), DummyWidget()
+    gui.left_scroll_btn, gui.right_scroll_btn = DummyWidget(), DummyWidget()
+    gui.pd_button_height = gui.pd_button_width = None
+    gui._max_button_rows = gui._max_button_cols = None
+    gui._first_button_col = 0
+    gui._button_pool = None
+    gui._sorted_states = []
+    gui.sort_func = None
+    gui._state_buttons = {}
+    gui._states = {}
+    for i in range(1, count + 1):
+        state = DummyState(i, f"Acc {count - i:04d}")
+        gui._states[(i, CommandScope.ACC)] = state
+    return gui
+
+
+@pytest.fixture(autouse=True)
+def patch_widgets(monkeypatch):
+    CountingHoldButton.created = 0
+    monkeypatch.setattr(mod, "HoldButton", CountingHoldButton, raising=True)
+
+
+def test_buttons_are_created_for_the_visible_page_only():
+    gui = make_gui(5000)
+    gui.sort_by_number()
+    # (600 - 100) // 50 rows in each of 2 columns
+    assert gui._max_button_rows == 10
+    assert CountingHoldButton.created == 20
+    assert gui._max_button_cols == 500
+    assert gui.app.updates == 1
+    assert [pd.tmcc_id for pd in gui._state_buttons] == list(range(1, 21))
+    pb = gui._state_buttons[gui._states[(12, CommandScope.ACC)]]
+    assert pb.grid == [1, 5]
+    assert pb.text == "12) Acc 4988"
+    assert pb.on_press == (gui.switch_state, [pb.component_state])
+    assert pb.bg == "green"
+    assert not gui.left_scroll_btn.enabled and gui.right_scroll_btn.enabled
+
+
+def test_scrolling_and_sorting_rebind_the_same_buttons():
+    gui = make_gui(45)
+    gui.sort_by_number()
+    buttons = set(map(id, gui._state_buttons.values()))
+    gui.scroll_right()
+    assert [pd.tmcc_id for pd in gui._state_buttons] == list(range(11, 31))
+    gui.scroll_right()
+    gui.scroll_right()
+    # the last page shows columns 3 and 4; column 4 holds only 5 states
+    assert gui._first_button_col == 3
+    assert [pd.tmcc_id for pd in gui._state_buttons] == list(range(31, 46))
+    assert sum(1 for pb in gui._button_pool._widgets if pb.visible is False) == 5
+    assert gui.left_scroll_btn.enabled and not gui.right_scroll_btn.enabled
+
+    gui.sort_by_name()
+    assert [pd.tmcc_id for pd in gui._state_buttons] == list(range(45, 25, -1))
+    assert set(map(id, gui._state_buttons.values())) == buttons
+    assert all(pb.visible for pb in gui._state_buttons.values())
+    assert CountingHoldButton.created == 20
@@ -219,6 +219,25 @@ def test_controller_poll_routes_actions_on_tk_thread_and_reschedules(monkeypatch
     assert gui._controller_poll_id == "a1"
 
 
+def test_controller_wake_polls_now_in_place_of_the_pending_poll(monkeypatch: pytest.MonkeyPatch) -> None:
+    calls: list[object] = []
+    gui = mod.SteamDeckGui.__new__(mod.SteamDeckGui)
+    gui._app = SimpleNamespace(
+        tk=SimpleNamespace(
+            after_idle=lambda callback: calls.append(("idle", callback)),
+            after_cancel=lambda poll_id: calls.append(("cancel", poll_id)),
+        )
+    )
+    gui._controller_poll_id = "poll-1"
+    monkeypatch.setattr(gui, "_poll_controller", lambda: calls.append("poll"))
+
+    gui._wake_controller_poll()
+    (_, callback) = calls.pop()
+    callback()
+
+    assert calls == [("cancel", "poll-1"), "poll"]
+
+
 def test_controller_shutdown_cancels_poll_and_clears_input() -> None:
     calls: list[str] = []
     gui = mod.SteamDeckGui.__new__(mod.SteamDeckGui)
@@ -243,7 +262,7 @@ def test_missing_pygame_keeps_touch_gui_available(monkeypatch: pytest.MonkeyPatc
     monkeypatch.setattr(mod, "DeckInputRouter", lambda *_args, **_kwargs: SimpleNamespace())
 
     class UnavailableProvider:
-        def __init__(self, _profile) -> None:
+        def __init__(self, _profile, **_kwargs) -> None:
             return
 
         @staticmethod
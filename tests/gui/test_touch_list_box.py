@@ -200,3 +200,52 @@ def test_move_highlight_clamps_at_ends_without_wrapping(mod) -> None:
     # Already at the bottom: moving down is clamped and reports no movement.
     assert widget.move_highlight(1) is False
     assert widget.highlighted_index() == 2
+
+
+class SyncTkListbox(DummyTkListbox):
+    def __init__(self, initial_xview: float = 0.0) -> None:
+        super().__init__(initial_xview)
+        self.items = []
+        self.ops: list[tuple] = []
+
+    def get(self, first: Any, last: Any = None) -> Any:
+        if last is None:
+            return self.items[int(first)]
+        return tuple(self.items)
+
+    def size(self) -> int:
+        return len(self.items)
+
+    def delete(self, first: int, last: int) -> None:
+        self.ops.append(("delete", first, last))
+        del self.items[first : last + 1]
+
+    def insert(self, index: int, *elements: str) -> None:
+        self.ops.append(("insert", index, *elements))
+        self.items[index:index] = elements
+
+    @staticmethod
+    def cget(_option: str) -> str:
+        return "#f7f7f7"
+
+
+def test_sync_touches_only_changed_rows(mod) -> None:
+    DummyListBox.initial_xview = 0.0
+    widget = mod.TouchListBox(object(), items=[])
+    widget._lb = SyncTkListbox()
+
+    widget.sync(["A", "B", "C", "D"], [None, "green", None, None])
+    assert widget._lb.items == ["A", "B", "C", "D"]
+    assert widget._lb.item_styles == {1: {"background": "green"}}
+
+    widget._lb.ops.clear()
+    widget._lb.item_styles.clear()
+    # "C" renamed to "E" and moved to the end; "B" no longer highlighted
+    assert widget.sync(["A", "B", "D", "E"]) == 3
+    assert widget._lb.items == ["A", "B", "D", "E"]
+    assert widget._lb.ops == [("insert", 4, "E"), ("delete", 2, 2)]
+    assert widget._lb.item_styles == {1: {"background": "#f7f7f7"}}
+
+    widget._lb.ops.clear()
+    assert widget.sync(["A", "B", "D", "E"]) == 0
+    assert widget._lb.ops == []
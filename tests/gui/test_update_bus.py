@@ -0,0 +1,53 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gui/test_update_bus.py
+from queue import Empty
+
+import pytest
+
+from src.pytrain.gui.update_bus import UpdateBus
+
+
+def test_keyed_updates_keep_their_place_and_run_with_the_latest_args():
+    bus = UpdateBus()
+    seen = []
+    bus.post("a", seen.append, 1)
+    bus.put((seen.append, ["x"]))
+    bus.post("b", seen.append, 10)
+    bus.post("a", seen.append, 2)
+    bus.put((seen.append, ["x"]))
+
+    assert bus.drain(budget=1.0) == 4
+    assert seen == [2, "x", 10, "x"]
+    assert (bus.posted, bus.merged, bus.processed) == (5, 1, 4)
+
+
+def test_queue_compatible_get_and_clear():
+    bus = UpdateBus()
+    bus.put((print, ()))
+    bus.post("k", print, "hello")
+    assert bus.qsize() == 2
+    assert bus.get_nowait() == (print, ())
+    bus.clear()
+    assert bus.empty() and bus.dropped == 1
+    with pytest.raises(Empty):
+        bus.get_nowait()
+
+
+def test_drain_runs_at_least_one_callback_per_frame():
+    bus = UpdateBus()
+    seen = []
+    for i in range(3):
+        bus.post(i, seen.append, i)
+    assert bus.drain(budget=0.0) == 1
+    assert bus.deferred_frames == 1
+    assert bus.drain(budget=1.0) == 2
+    assert seen == [0, 1, 2]
+    assert bus.frames == 2
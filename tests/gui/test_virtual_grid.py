@@ -0,0 +1,80 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/gui/test_virtual_grid.py
+from src.pytrain.gui.components.virtual_grid import GridWindow, WidgetPool
+
+
+class Slot:
+    def __init__(self, slot: int) -> None:
+        self.slot = slot
+        self.item = None
+        self.visible = True
+
+
+def make_pool() -> WidgetPool[Slot]:
+    def bind(widget: Slot, item, slot: int) -> None:
+        assert widget.slot == slot
+        widget.item = item
+
+    return WidgetPool(
+        Slot,
+        bind,
+        hide=lambda w: setattr(w, "visible", False),
+        show=lambda w: setattr(w, "visible", True),
+    )
+
+
+def test_window_shows_whole_columns_and_clamps_scrolling():
+    window = GridWindow(rows_per_col=5, visible_cols=2, count=23)
+    assert window.cols == 5
+    assert (window.start, window.stop) == (0, 10)
+    assert not window.has_left and window.has_right
+    assert window.slot_position(7) == (1, 2)
+
+    assert window.scroll(10)
+    assert window.first_col == window.max_first_col == 3
+    assert (window.start, window.stop) == (15, 23)
+    assert window.has_left and not window.has_right
+    assert not window.scroll(1)
+
+    assert GridWindow(5, 2, 0, first_col=4).first_col == 0
+
+
+def test_pool_creates_widgets_only_for_visible_slots_and_recycles_them():
+    pool = make_pool()
+    items = list(range(5000))
+    window = GridWindow(rows_per_col=10, visible_cols=2, count=len(items))
+
+    first = pool.render(items[window.start : window.stop])
+    assert pool.created == 20
+    assert [w.item for w in first] == items[:20]
+
+    while window.scroll(1):
+        pool.render(items[window.start : window.stop])
+    assert pool.created == 20
+    assert [w.item for w in pool.widgets] == items[-20:]
+    assert pool.widgets[0] is first[0]
+
+
+def test_pool_hides_surplus_widgets_and_shows_them_again():
+    pool = make_pool()
+    pool.render("abcdef")
+    shown = pool.render("xy")
+    assert [w.item for w in shown] == ["x", "y"]
+    assert len(pool) == 6
+    assert [w.visible for w in pool._widgets] == [True, True, False, False, False, False]
+
+    pool.render("pqrs")
+    assert pool.created == 6
+    assert [w.visible for w in pool._widgets] == [True, True, True, True, False, False]
+
+    destroyed = []
+    pool.clear(destroyed.append)
+    assert len(destroyed) == 6 and len(pool) == 0
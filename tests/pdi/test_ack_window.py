@@ -0,0 +1,71 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/pdi/test_ack_window.py
+import threading
+
+from src.pytrain.pdi.ack_window import AckWindow
+from src.pytrain.pdi.base_req import BaseReq
+from src.pytrain.pdi.constants import PdiCommand
+from src.pytrain.protocol.constants import CommandScope
+
+
+def _query(tmcc_id: int) -> BaseReq:
+    return BaseReq(tmcc_id, PdiCommand.BASE_MEMORY, scope=CommandScope.ENGINE)
+
+
+class Responder:
+    def __init__(self, drop_first: set[int] = None, drop_always: set[int] = None) -> None:
+        self.window: AckWindow | None = None
+        self.drop_first = set(drop_first or ())
+        self.drop_always = drop_always or set()
+        self.sent = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def send(self, req: BaseReq) -> None:
+        with self._lock:
+            self.sent.append(req.tmcc_id)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        threading.Timer(0.002, self._answer, (req,)).start()
+
+    def _answer(self, req: BaseReq) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            if req.tmcc_id in self.drop_always:
+                return
+            if req.tmcc_id in self.drop_first:
+                self.drop_first.discard(req.tmcc_id)
+                return
+        self.window.answered(_query(req.tmcc_id))
+
+
+def test_requests_in_flight_never_exceed_the_window():
+    responder = Responder()
+    window = responder.window = AckWindow(responder.send, window=3, ack_timeout=1.0)
+    assert window.send_all([_query(i) for i in range(1, 21)]) == []
+    assert responder.sent == list(range(1, 21))
+    assert responder.max_in_flight <= 3
+    assert (window.sent, window.acknowledged, window.outstanding) == (20, 20, 0)
+
+
+def test_unanswered_requests_are_resent_then_given_up_on():
+    responder = Responder(drop_first={4}, drop_always={6})
+    window = responder.window = AckWindow(responder.send, window=2, ack_timeout=0.05, retries=1)
+    lost = window.send_all([_query(i) for i in range(1, 9)])
+    assert [r.tmcc_id for r in lost] == [6]
+    assert responder.sent.count(4) == 2 and responder.sent.count(6) == 2
+    assert (window.retried, window.lost, window.outstanding) == (2, 1, 0)
+
+
+def test_replies_to_requests_not_sent_are_not_answers():
+    window = AckWindow(lambda req: None)
+    assert window.answered(_query(1)) is False
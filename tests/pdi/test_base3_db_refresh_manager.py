@@ -0,0 +1,141 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+#
+
+# tests/pdi/test_base3_db_refresh_manager.py
+from types import SimpleNamespace
+
+import pytest
+
+from src.pytrain.pdi.base3_db_refresh_manager import Base3DbRefreshManager
+from src.pytrain.pdi.base_req import BaseReq
+from src.pytrain.pdi.constants import D4Action, PdiCommand
+from src.pytrain.pdi.d4_req import D4Req
+from src.pytrain.protocol.constants import CommandScope
+
+
+def _state(tmcc_id: int, scope: CommandScope = CommandScope.ENGINE, record_no: int = None) -> SimpleNamespace:
+    return SimpleNamespace(scope=scope, tmcc_id=tmcc_id, address=tmcc_id, record_no=record_no)
+
+
+class Clock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def manager():
+    # a manager without its worker thread; tests dispatch against a fake clock
+    Base3DbRefreshManager.reset()
+    mgr = Base3DbRefreshManager()
+    mgr._now = clock = Clock()
+    mgr.queries = []
+    mgr._send = mgr.queries.append
+
+    def advance(seconds: float) -> None:
+        clock.now += seconds
+        mgr._dispatch_ready(clock.now)
+
+    mgr.advance = advance
+    yield mgr
+    Base3DbRefreshManager.reset()
+
+
+def test_refreshes_of_a_record_fold_into_one_query(manager):
+    train = _state(10, CommandScope.TRAIN)
+    engines = [_state(i) for i in range(11, 17)]
+    # a train speed change touches the train and each engine of its consist, twice
+    for _ in range(2):
+        manager._enqueue(train)
+        for engine in engines:
+            manager._enqueue(engine)
+    manager.advance(0.1)
+    assert manager.queries == []
+
+    manager.advance(0.15)
+    assert [(q.scope, q.tmcc_id) for q in manager.queries] == [(CommandScope.TRAIN, 10)] + [
+        (CommandScope.ENGINE, i) for i in range(11, 17)
+    ]
+    assert all(q.pdi_command == PdiCommand.BASE_MEMORY and q.start == 0 for q in manager.queries)
+    assert (manager.requested, manager.sent, manager.saved, manager.in_flight) == (14, 7, 7, 7)
+
+
+def test_field_queries_of_a_record_are_one_read(manager):
+    engine = _state(12)
+    manager._enqueue(engine, (0x20, 0x22))
+    manager._enqueue(engine, (0x40, 0x41))
+    manager.advance(0.25)
+    assert [(q.start, q.data_length) for q in manager.queries] == [(0x20, 0x21)]
+
+    # a 4-digit engine is read by record number; a refresh of the whole record covers its fields
+    big_boy = _state(2345, record_no=7)
+    manager._enqueue(big_boy, (0x20, 0x22))
+    manager._enqueue(big_boy)
+    manager._enqueue(big_boy, (0x40, 0x41))
+    manager.advance(0.25)
+    query = manager.queries[-1]
+    assert isinstance(query, D4Req) and query.action == D4Action.QUERY
+    assert (query.record_no, query.start, query.data_length) == (7, 0, 0xC0)
+    assert (manager.sent, manager.saved) == (2, 3)
+
+
+def test_requests_wait_for_the_query_in_flight(manager):
+    engine = _state(12)
+    manager._enqueue(engine)
+    manager.advance(0.25)
+    assert len(manager.queries) == 1
+
+    # while the Base 3 has yet to answer, requests fold into a single follow-up
+    for _ in range(3):
+        manager._enqueue(engine)
+        manager.advance(0.25)
+    assert len(manager.queries) == 1
+
+    assert Base3DbRefreshManager.answered(BaseReq(12, PdiCommand.BASE_MEMORY, scope=CommandScope.ENGINE)) is True
+    manager.advance(0)
+    assert len(manager.queries) == 2
+    assert (manager.requested, manager.sent, manager.saved) == (4, 2, 2)
+
+    # an unanswered query is given up on, and the follow-up sent
+    manager._enqueue(engine)
+    manager.advance(0.5)
+    assert len(manager.queries) == 2
+    manager.advance(0.5)
+    assert len(manager.queries) == 3
+
+
+def test_replies_to_queries_not_sent_are_not_answers(manager):
+    manager._enqueue(_state(2345, record_no=7))
+    manager.advance(0.25)
+    assert Base3DbRefreshManager.answered(BaseReq(7, PdiCommand.BASE_MEMORY, scope=CommandScope.ENGINE)) is False
+    assert Base3DbRefreshManager.answered(D4Req(7, PdiCommand.D4_TRAIN, D4Action.QUERY, data_length=0xC0)) is False
+    assert Base3DbRefreshManager.answered(D4Req(7, PdiCommand.D4_ENGINE, D4Action.QUERY, data_length=0xC0)) is True
+    assert manager.in_flight == 0
+
+
+def test_write_acks_are_not_answers(manager):
+    engine = _state(12)
+    manager._enqueue(engine, (0x20, 0x22))
+    manager.advance(0.25)
+    assert len(manager.queries) == 1
+
+    # the Base 3 acknowledges a write of the same record and span; that is not the read
+    ack = BaseReq(12, PdiCommand.BASE_MEMORY, flags=0xC2, scope=CommandScope.ENGINE, start=0x20, data_length=2)
+    assert Base3DbRefreshManager.answered(ack) is False
+    # nor is a read of another part of the record
+    other = BaseReq(12, PdiCommand.BASE_MEMORY, scope=CommandScope.ENGINE, start=0x40, data_length=1)
+    assert Base3DbRefreshManager.answered(other) is False
+    assert manager.in_flight == 1
+
+    reply = BaseReq(12, PdiCommand.BASE_MEMORY, scope=CommandScope.ENGINE, start=0x20, data_length=2)
+    assert Base3DbRefreshManager.answered(reply) is True
+    assert manager.in_flight == 0
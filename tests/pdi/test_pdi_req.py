@@ -5,9 +5,13 @@
 #
 #  SPDX-License-Identifier: LPGL
 #
+import random
+
 import pytest
 
-from src.pytrain.pdi.constants import PDI_EOP, PDI_SOP, PDI_STF, PdiCommand
+from src.pytrain.db.component_state_store import ComponentStateStore
+from src.pytrain.pdi.constants import PDI_EOP, PDI_SOP, PDI_STF, Amc2Action, Bpc2Action, PdiCommand
+from src.pytrain.pdi.pdi_device import PDI_COMMAND_TO_DEVICE_MAP, DeviceWrapper, PdiDevice
 from src.pytrain.pdi.pdi_req import PdiReq, PingReq, TmccReq
 from src.pytrain.protocol.command_req import CommandReq
 from src.pytrain.protocol.constants import CommandScope
@@ -179,3 +183,100 @@ def test_calculate_checksum_adds_stuff_bytes_for_reserved_values():
             pos = stuffed_stream.find(bytes([b]), sidx)
             assert pos != -1, f"Expected to find byte {hex(b)} in stuffed stream"
             sidx = pos + 1
+
+
+def _stuff_byte_by_byte(payload: bytes) -> tuple[bytes, int]:
+    """
+    Reference encoder: stuff and checksum one byte at a time
+    """
+    out = bytearray()
+    byte_sum = 0
+    for b in payload:
+        if b in (PDI_SOP, PDI_EOP, PDI_STF):
+            out.append(PDI_STF)
+            byte_sum += PDI_STF
+        out.append(b)
+        byte_sum += b
+    check_sum = 0xFF & -byte_sum
+    if check_sum in (PDI_SOP, PDI_EOP, PDI_STF):
+        out.append(PDI_STF)
+        check_sum = 0xFF & -(byte_sum + PDI_STF)
+    return bytes(out), check_sum
+
+
+def test_stuffing_round_trips_random_payloads():
+    rng = random.Random(49)
+    alphabet = [PDI_SOP, PDI_EOP, PDI_STF, 0x00, 0x01, 0x7F, 0xFF]
+    for _ in range(2000):
+        n = rng.randrange(0, 40)
+        payload = bytes(rng.choice(alphabet) if rng.random() < 0.4 else rng.randrange(256) for _ in range(n))
+        stuffed, checksum = PdiReq._calculate_checksum(payload)
+        assert (stuffed, checksum[0]) == _stuff_byte_by_byte(payload)
+
+        # the receiver strips the stuff bytes and arrives at the same checksum
+        received, recv_checksum = PdiReq._calculate_checksum(stuffed, add_stf=False)
+        assert received == payload
+        assert recv_checksum == checksum
+
+
+def test_every_pdi_command_maps_to_the_device_named_for_it():
+    for cmd in PdiCommand:
+        device = PDI_COMMAND_TO_DEVICE_MAP.get(cmd, None)
+        if device is None:
+            with pytest.raises(NotImplementedError):
+                PdiDevice.from_pdi_command(cmd)
+        else:
+            assert device.name == cmd.name.split("_")[0]
+            assert PdiDevice.from_pdi_command(cmd) is device
+    assert PdiDevice.from_pdi_command(PdiCommand.BASE_MEMORY) is PdiDevice.BASE
+    assert PdiDevice.from_pdi_command(PdiCommand.UPDATE_ENGINE_SPEED) is PdiDevice.UPDATE
+
+
+@pytest.fixture
+def state_store():
+    _ = ComponentStateStore()
+    yield
+    ComponentStateStore.reset()
+    # noinspection PyTypeChecker
+    ComponentStateStore._instance = None
+
+
+# default config requests of these devices are missing the fields their decoders require
+UNDECODABLE = {(PdiDevice.AMC2, Amc2Action.CONFIG), (PdiDevice.BPC2, Bpc2Action.CONFIG)}
+
+
+def _build(device: PdiDevice, cmd: PdiCommand, action) -> PdiReq:
+    wrapper = device.value
+    if device in {PdiDevice.TMCC, PdiDevice.TMCC4}:
+        return wrapper.req_class(CommandReq.build(Engine2.RING_BELL, 7 if device == PdiDevice.TMCC else 1234), cmd)
+    if device == PdiDevice.BLOCK:
+        payload = bytes([cmd, 5, 4, 6, 0x10, 21, 22, 7, 0, CommandScope.ENGINE.value, 1]) + PdiReq.encode_text(
+            "Yard", 33
+        )
+        stuffed, checksum = PdiReq._calculate_checksum(payload)
+        return wrapper.req_class(bytes([PDI_SOP]) + stuffed + checksum + bytes([PDI_EOP]), cmd)
+    return wrapper.req_class(5, cmd, action) if action else wrapper.req_class(5, cmd)
+
+
+@pytest.mark.parametrize("device", [d for d in PdiDevice if isinstance(d.value, DeviceWrapper)], ids=lambda d: d.name)
+def test_requests_round_trip_through_the_codec(device, state_store):
+    wrapper = device.value
+    round_trips = 0
+    for cmd in wrapper.commands:
+        for action in list(wrapper.enums) if wrapper.enums else [None]:
+            if (device, action) in UNDECODABLE:
+                continue
+            try:
+                req = _build(device, cmd, action)
+                packet = req.as_bytes
+            except (AttributeError, TypeError, ValueError):
+                continue  # the request needs more than an address to build
+            decoded = PdiReq.from_bytes(packet)
+            assert type(decoded) is type(req)
+            assert decoded.pdi_device is device
+            assert decoded.as_bytes == packet
+            assert getattr(decoded, "action", None) == action
+            if isinstance(req, TmccReq):
+                assert decoded.tmcc_command.as_bytes == req.tmcc_command.as_bytes
+            round_trips += 1
+    assert round_trips > 0 or not wrapper.commands
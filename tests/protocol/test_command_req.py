@@ -13,6 +13,7 @@
 #
 #
 
+import gc
 import re
 from unittest import mock
 
@@ -236,6 +237,35 @@ class TestCommandReq(TestBase):
             assert mk_enqueue_command.call_count == 5
             mk_enqueue_command.reset_mock()
 
+        with (
+            mock.patch.object(CommBufferSingleton, "enqueue_command") as mk_enqueue_command,
+            mock.patch.object(CommBufferSingleton, "schedule_job") as mk_schedule_job,
+        ):
+            # tests a 10 second hold is one periodic job of 199 resends, 50 msec apart
+            CommandReq._enqueue_command(b"\x01\x02\x03", 1, 0, 10, DEFAULT_BAUDRATE, DEFAULT_PORT, None)
+            mk_enqueue_command.assert_called_once_with(b"\x01\x02\x03", 0)
+            mk_schedule_job.assert_called_once_with(b"\x01\x02\x03", 0.05, 199, 0.05)
+            mk_schedule_job.reset_mock()
+
+            # tests delayed repeats are sent by one job
+            CommandReq._enqueue_command(b"\x01\x02\x03", 4, 2, 0, DEFAULT_BAUDRATE, DEFAULT_PORT, None)
+            mk_schedule_job.assert_called_once_with(b"\x01\x02\x03", 0, 4, 2, replace=False)
+            mk_schedule_job.reset_mock()
+            mk_enqueue_command.reset_mock()
+
+            # tests a repeated hold resends once per interval, not once per repeat
+            CommandReq._enqueue_command(b"\x01\x02\x03", 3, 0, 1, DEFAULT_BAUDRATE, DEFAULT_PORT, None)
+            assert mk_enqueue_command.call_count == 3
+            mk_schedule_job.assert_called_once_with(b"\x01\x02\x03", 0.05, 19, 0.05)
+            mk_schedule_job.reset_mock()
+
+            # tests delayed repeats and their hold are a job each
+            CommandReq._enqueue_command(b"\x01\x02\x03", 2, 1, 0.5, DEFAULT_BAUDRATE, DEFAULT_PORT, None)
+            assert mk_schedule_job.call_args_list == [
+                mock.call(b"\x01\x02\x03", 0, 2, 1, replace=False),
+                mock.call(b"\x01\x02\x03", 0.05, 9, 1.05),
+            ]
+
         # tests for invalid arguments
         with pytest.raises(ValueError, match=re.escape("repeat must be equal to or greater than 1 (-5)")):
             CommandReq._enqueue_command(b"\x01\x02\x03", -5, 0, 0, DEFAULT_BAUDRATE, DEFAULT_PORT, None)
@@ -440,3 +470,54 @@ class TestCommandReq(TestBase):
                     assert req_from_bytes.is_tmcc1 == req.is_tmcc1
                     assert req_from_bytes.is_tmcc2 == req.is_tmcc2
                     assert req_from_bytes.as_bytes == req.as_bytes
+
+    def test_interned_requests_are_independent_copies(self):
+        first = CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 40)
+        second = CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 40)
+        assert first is not second
+        assert first == second and first.as_bytes == second.as_bytes
+
+        # changing one copy changes neither the other nor later builds
+        first.data = 60
+        assert second.data == 40
+        assert CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 40).as_bytes == second.as_bytes
+        assert first.as_bytes == CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 60).as_bytes
+
+    def test_comparing_requests_does_not_create_their_dicts(self):
+        first = CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 40)
+        second = CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 40)
+        assert first == second
+        assert first != CommandReq.build(TMCC2EngineCommandEnum.ABSOLUTE_SPEED, 12, 41)
+        # an instance dict, once created, is among the objects a request refers to
+        assert not [r for r in gc.get_referents(first) if isinstance(r, dict)]
+
+    def test_sequence_requests_keep_their_state(self):
+        from src.pytrain.db.component_state_store import ComponentStateStore
+        from src.pytrain.protocol.sequence.ramped_speed_req import RampedSpeedReq
+
+        with ComponentStateStore._lock:
+            _ = ComponentStateStore()
+        try:
+            ramp = RampedSpeedReq(12, 40)
+            assert ramp.state is None and ramp == ramp
+            assert ramp.requests[0].request.command == TMCC1EngineCommandEnum.ABSOLUTE_SPEED
+        finally:
+            with ComponentStateStore._lock:
+                ComponentStateStore.reset()
+                ComponentStateStore._instance = None
+
+    def test_decoded_words_are_interned_without_rx_flags(self):
+        word = CommandReq.build(TMCC1EngineCommandEnum.BLOW_HORN_ONE, 5).as_bytes
+        rx = CommandReq.from_bytes(word, from_tmcc_rx=True)
+        plain = CommandReq.from_bytes(bytearray(word))
+        assert rx.is_tmcc_rx is True and plain.is_tmcc_rx is False
+        assert plain.command == TMCC1EngineCommandEnum.BLOW_HORN_ONE and plain.address == 5
+
+    def test_cached_bytes_follow_address_and_scope_changes(self):
+        req = CommandReq.build(TMCC1EngineCommandEnum.RING_BELL, 3)
+        engine_bytes = req.as_bytes
+        req.scope = CommandScope.TRAIN
+        assert req.as_bytes != engine_bytes
+        assert req.as_bytes == CommandReq.build(TMCC1EngineCommandEnum.RING_BELL, 3, scope=CommandScope.TRAIN).as_bytes
+        req.address = 4
+        assert req.as_bytes == CommandReq.build(TMCC1EngineCommandEnum.RING_BELL, 4, scope=CommandScope.TRAIN).as_bytes
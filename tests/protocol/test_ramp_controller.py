@@ -0,0 +1,119 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/protocol/test_ramp_controller.py
+import time
+from dataclasses import dataclass
+
+import pytest
+
+from src.pytrain.comm.comm_buffer import CommBuffer
+from src.pytrain.protocol.constants import CommandScope
+from src.pytrain.protocol.multibyte.multibyte_constants import TMCC2RailSoundsDialogControl
+from src.pytrain.protocol.sequence.ramp_controller import RampController, SpeedRamp
+from src.pytrain.protocol.tmcc1.tmcc1_constants import TMCC1EngineCommandEnum
+from src.pytrain.protocol.tmcc2.tmcc2_constants import TMCC2EngineCommandEnum, tmcc2_speed_to_rpm
+
+SPEED = TMCC2EngineCommandEnum.ABSOLUTE_SPEED
+LABOR = TMCC2EngineCommandEnum.ENGINE_LABOR
+RPM = TMCC2EngineCommandEnum.DIESEL_RPM
+
+
+@dataclass
+class FakeState:
+    tmcc_id: int = 12
+    scope: CommandScope = CommandScope.ENGINE
+    speed: int = 0
+    speed_max: int = 199
+    momentum: int = None
+    is_legacy: bool = True
+    is_rpm: bool = True
+    is_ramping: bool = False
+    rpm: int = 0
+    labor: int = 12
+
+
+def run_ramp(ramp: SpeedRamp) -> list:
+    sent, now = [], 0.0
+    while not ramp.is_done:
+        now = max(now, ramp.next_due)
+        sent.append(ramp.step(now))
+    return sent
+
+
+@pytest.fixture
+def controller():
+    sent = []
+    ctrl = RampController(send=lambda cmd, addr, data, scope: sent.append((cmd, addr, data, scope)))
+    RampController._instance = ctrl
+    yield ctrl, sent
+    ctrl.reset()
+    ctrl.join()
+    RampController._instance = None
+
+
+def test_ramp_computes_steps_lazily_and_skips_unchanged_labor_and_rpm():
+    ramp = SpeedRamp(FakeState(), 9, SPEED, now=0.0)
+    assert ramp.next_due == pytest.approx(0.1)
+    steps = run_ramp(ramp)
+    speeds = [d for step in steps for c, d in step if c == SPEED]
+    assert speeds == [3, 6, 9]
+    labors = [d for step in steps for c, d in step if c == LABOR]
+    assert all(a != b for a, b in zip(labors, labors[1:]))
+    assert labors[-1] == 12
+    rpms = [d for step in steps for c, d in step if c == RPM]
+    assert rpms == sorted(set(rpms)) and rpms[-1] == tmcc2_speed_to_rpm(9)
+
+
+def test_tmcc1_ramp_sends_only_speed_steps():
+    state = FakeState(is_legacy=False, is_rpm=False, speed=5, speed_max=31)
+    steps = run_ramp(SpeedRamp(state, 2, TMCC1EngineCommandEnum.ABSOLUTE_SPEED, now=0.0))
+    cmds = [(c, d) for step in steps for c, d in step if c != LABOR]
+    assert cmds == [(TMCC1EngineCommandEnum.ABSOLUTE_SPEED, s) for s in (4, 3, 2)]
+
+
+def test_retarget_continues_from_last_step():
+    ramp = SpeedRamp(FakeState(), 30, SPEED, now=0.0)
+    ramp.step(ramp.next_due)
+    ramp.step(ramp.next_due)
+    assert ramp.speed == 6
+    ramp.retarget(0, now=ramp.next_due - 0.05)
+    speeds = [d for step in run_ramp(ramp) for c, d in step if c == SPEED]
+    assert speeds == [3, 0]
+
+
+def test_dialog_follows_the_final_step():
+    ramp = SpeedRamp(FakeState(), 3, SPEED, TMCC2RailSoundsDialogControl.ENGINEER_SPEED_SLOW, now=0.0)
+    steps = run_ramp(ramp)
+    assert steps[-1] == [(TMCC2RailSoundsDialogControl.ENGINEER_SPEED_SLOW, 0)]
+    assert ramp.next_due >= 2.5
+
+
+def test_controller_keeps_one_ramp_per_engine(controller):
+    ctrl, sent = controller
+    state = FakeState()
+    ramp = ctrl.ramp(state, 9, SPEED)
+    assert ctrl.ramp(state, 6, SPEED) is ramp
+    assert len(ctrl.ramps) == 1
+    assert RampController.is_ramping_to(state, 6)
+    deadline = time.monotonic() + 2
+    while ctrl.ramps and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert ctrl.ramps == []
+    assert [d for c, _, d, _ in sent if c == SPEED] == [3, 6]
+
+
+def test_cancel_delayed_requests_stops_ramp(controller):
+    ctrl, sent = controller
+    ctrl.ramp(FakeState(tmcc_id=7), 90, SPEED)
+    ctrl.ramp(FakeState(tmcc_id=8, scope=CommandScope.TRAIN), 90, SPEED)
+    CommBuffer.cancel_delayed_requests(7, CommandScope.ENGINE)
+    assert [r.key for r in ctrl.ramps] == [(CommandScope.TRAIN, 8)]
+    CommBuffer.cancel_delayed_requests(99)
+    assert ctrl.ramps == []
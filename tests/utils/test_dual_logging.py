@@ -14,10 +14,11 @@ from pathlib import Path
 
 import pytest
 
-from src.pytrain.utils.dual_logging import set_up_logging
+from src.pytrain.utils.dual_logging import flush_logging, set_log_level, set_up_logging, shut_down_logging
 
 
 def _reset_root_logger():
+    shut_down_logging()
     logger = logging.getLogger()
     # close and remove handlers to avoid cross-tests interference and file locks
     for h in list(logger.handlers):
@@ -59,6 +60,7 @@ def test_set_up_logging_stdout_and_file_levels_and_color(tmp_path: Path, capsys)
     logging.debug("debug should not appear")
     logging.info("hello info")
     logging.warning("warn here")
+    assert flush_logging()
 
     captured = capsys.readouterr()
     out = captured.out
@@ -126,6 +128,7 @@ def test_console_formatter_includes_exception_trace(tmp_path: Path):
             raise RuntimeError("boom")
         except RuntimeError:
             logging.exception("had an error")  # exc_info=True path
+        assert flush_logging()
 
     out = f.getvalue()
     # message and traceback should appear
@@ -155,5 +158,100 @@ def test_rotating_file_handler_rollover_when_file_exists(tmp_path: Path):
 
     # new file should receive fresh logs
     logging.info("fresh")
+    assert flush_logging()
     content = log_file.read_text(encoding="utf-8")
     assert "INFO fresh" in content
+
+
+def test_root_level_follows_most_verbose_handler(tmp_path: Path):
+    assert set_up_logging(
+        console_log_output="stdout",
+        console_log_level="WARNING",
+        logfile_file=str(tmp_path / "lvl.log"),
+        logfile_log_level="INFO",
+    )
+    root = logging.getLogger()
+    assert root.level == logging.INFO
+    assert not root.isEnabledFor(logging.DEBUG)
+
+    set_log_level(logging.DEBUG)
+    assert root.level == logging.DEBUG
+
+    set_log_level("ERROR")
+    assert root.level == logging.ERROR
+
+
+def test_records_are_written_off_the_emitting_thread(tmp_path: Path, monkeypatch):
+    import threading
+
+    from src.pytrain.utils.dual_logging import LogFormatter
+
+    log_file = tmp_path / "thread.log"
+    assert set_up_logging(
+        console_log_output="stdout",
+        console_log_level="WARNING",
+        logfile_file=str(log_file),
+        logfile_log_level="INFO",
+        logfile_template="%(threadName)s %(message)s",
+    )
+
+    formatted_on = []
+    format_record = LogFormatter.format
+
+    def probe_format(self, record, *args, **kwargs):
+        formatted_on.append(threading.current_thread())
+        return format_record(self, record, *args, **kwargs)
+
+    monkeypatch.setattr(LogFormatter, "format", probe_format)
+    rendered = {"value": [], "suppressed": []}
+
+    class Probe:
+        def __init__(self, key: str):
+            self.key = key
+
+        def __str__(self):
+            rendered[self.key].append(threading.current_thread())
+            return "probe"
+
+    logging.info("value: %s", Probe("value"))
+    logging.debug("suppressed: %s", Probe("suppressed"))
+    assert flush_logging()
+
+    # the message was merged when logged (pytest's own capture handler may also do so
+    # on this thread), the suppressed one never was, and the formatter ran on the writer thread
+    assert rendered["value"] and all(t is threading.current_thread() for t in rendered["value"])
+    assert rendered["suppressed"] == []
+    assert formatted_on and all(t is not threading.current_thread() for t in formatted_on)
+    content = log_file.read_text(encoding="utf-8")
+    assert "value: probe" in content
+    assert "suppressed" not in content
+
+
+def test_mutable_args_are_logged_as_they_were_when_logged(tmp_path: Path):
+    log_file = tmp_path / "args.log"
+    assert set_up_logging(
+        console_log_output="stdout",
+        console_log_level="WARNING",
+        logfile_file=str(log_file),
+        logfile_log_level="INFO",
+        logfile_template="%(message)s",
+    )
+    speeds = [10, 20]
+    logging.info("speeds: %s", speeds)
+    speeds.append(30)
+    assert flush_logging()
+    assert "speeds: [10, 20]\n" in log_file.read_text(encoding="utf-8")
+
+
+def test_set_up_logging_without_queue_writes_synchronously(tmp_path: Path):
+    log_file = tmp_path / "sync.log"
+    assert set_up_logging(
+        console_log_output="stdout",
+        console_log_level="WARNING",
+        logfile_file=str(log_file),
+        logfile_log_level="INFO",
+        logfile_template="%(levelname)s %(message)s",
+        use_queue=False,
+    )
+    logging.info("direct")
+    assert "INFO direct" in log_file.read_text(encoding="utf-8")
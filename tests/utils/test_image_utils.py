@@ -0,0 +1,39 @@
+#
+#  PyTrain: a library for controlling Lionel Legacy engines, trains, switches, and accessories.
+#
+#  Copyright (c) 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#
+#  SPDX-FileCopyrightText: 2024-2026 Dave Swindell <pytraininfo.gmail.com>
+#  SPDX-License-Identifier: LGPL-3.0-only
+#
+
+# tests/utils/test_image_utils.py
+from src.pytrain.utils.image_utils import get_font, label_overlay, text_layout
+
+
+def test_fonts_are_loaded_once_per_family_and_size():
+    assert get_font(size=24) is get_font(size=24)
+    assert get_font(size=24) is not get_font(size=18)
+
+
+def test_styled_layout_uses_big_font_for_first_letter_of_each_word():
+    width, runs = text_layout("AB CD", 24, styled=True)
+    assert [(ch, big) for _, ch, big in runs] == [("A", True), ("B", False), (" ", False), ("C", True), ("D", False)]
+    offsets = [x for x, _, _ in runs]
+    assert offsets == sorted(offsets) and offsets[0] == 0
+    assert width > offsets[-1]
+
+
+def test_unstyled_layout_is_a_single_run():
+    width, runs = text_layout("Diesel", 24, styled=False)
+    assert runs == ((0, "Diesel", True),)
+    assert width > 0
+
+
+def test_label_overlay_is_cached_and_transparent_outside_the_box():
+    overlay = label_overlay("Diesel", 24, True)
+    assert label_overlay("Diesel", 24, True) is overlay
+    assert overlay.mode == "RGBA"
+    # rounded corners leave the image corners transparent, the middle is the light-gray box
+    assert overlay.getpixel((0, 0))[3] == 0
+    assert overlay.getpixel((2, overlay.height // 2)) == (0xDD, 0xDD, 0xDD, 255)
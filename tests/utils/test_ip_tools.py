@@ -9,10 +9,26 @@
 # tests/utils/test_ip_tools.py
 import socket
 import subprocess
+import threading
 
 import pytest
 
-from src.pytrain.utils.ip_tools import find_base_address, get_ip_address, is_base_address, get_ip_from_command
+from src.pytrain.pdi.base_req import BaseReq
+from src.pytrain.pdi.constants import PdiCommand
+from src.pytrain.utils.ip_tools import (
+    ServerEndpoint,
+    clear_ip_address_cache,
+    find_base_address,
+    get_ip_address,
+    get_ip_from_command,
+    is_base3,
+    is_base_address,
+    load_base_address,
+    load_server_endpoint,
+    save_base_address,
+    save_server_endpoint,
+    scan_for_base,
+)
 
 
 class DummyCompleted:
@@ -25,6 +41,68 @@ class DummyCompleted:
 @pytest.fixture(autouse=True)
 def mock_network_wait(monkeypatch):
     monkeypatch.setattr("src.pytrain.utils.ip_tools.wait_for_network", lambda timeout_s=60.0: True)
+    clear_ip_address_cache()
+    yield
+    clear_ip_address_cache()
+
+
+def _listener(address: str, answer: bool, port: int = 0) -> tuple[socket.socket, threading.Thread]:
+    server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    try:
+        server.bind((address, port))
+    except OSError:
+        server.close()
+        pytest.skip("loopback aliases are not available")
+    server.listen(16)
+
+    def serve() -> None:
+        # answer PDI Base queries as a Base 3 would, or accept connections and say nothing
+        while True:
+            try:
+                conn, _ = server.accept()
+            except OSError:
+                return
+            with conn:
+                try:
+                    conn.settimeout(1.0)
+                    query = conn.recv(256)
+                    if answer and query == BaseReq(0, PdiCommand.BASE).as_bytes:
+                        conn.sendall(BaseReq(0, PdiCommand.BASE).as_bytes)
+                    else:
+                        conn.recv(256)
+                except OSError:
+                    pass
+
+    thread = threading.Thread(target=serve, daemon=True)
+    thread.start()
+    return server, thread
+
+
+def _close(server: socket.socket, thread: threading.Thread) -> None:
+    # shutting the listening socket down wakes the blocked accept()
+    try:
+        server.shutdown(socket.SHUT_RDWR)
+    except OSError:
+        pass
+    server.close()
+    thread.join(2.0)
+
+
+@pytest.fixture
+def base3_stub():
+    # a listening socket on a loopback address other than 127.0.0.1 stands in for a Base 3
+    server, thread = _listener("127.0.0.99", answer=True)
+    yield server.getsockname()
+    _close(server, thread)
+
+
+@pytest.fixture
+def other_listener(base3_stub):
+    # some other device listening on the Base 3 port, which never answers a PDI query
+    server, thread = _listener("127.0.0.98", answer=False, port=base3_stub[1])
+    yield server.getsockname()
+    _close(server, thread)
 
 
 def test_get_ip_address_linux_hostname_success(monkeypatch):
@@ -130,40 +208,98 @@ def test_is_base_address_success_and_failure(monkeypatch):
     assert is_base_address("192.168.0.51") is None
 
 
-def test_find_base_address_returns_first_found(monkeypatch):
-    # Limit CPU count to keep Pool size consistent in tests
-    monkeypatch.setattr("src.pytrain.utils.ip_tools.cpu_count", lambda: 4, raising=True)
+def test_get_ip_address_is_cached_until_interfaces_change(monkeypatch):
+    monkeypatch.setattr("src.pytrain.is_linux", lambda: True, raising=False)
+    calls = {"count": 0}
 
-    # Pretend local machine IP is 192.168.1.42
-    monkeypatch.setattr("src.pytrain.utils.ip_tools.get_ip_address", lambda: ["192.168.1.42"], raising=True)
+    # noinspection PyUnusedLocal
+    def fake_run(cmd, capture_output=True, text=True):
+        calls["count"] += 1
+        return DummyCompleted(returncode=0, stdout=f"192.168.1.{10 + calls['count']}\n")
 
-    # Fake Pool that yields results where one address is found
-    class DummyPool:
-        def __init__(self, n):
-            self.n = n
-            self.terminated = False
+    signature = {"value": (("eth0", "192.168.1.11"),)}
+    monkeypatch.setattr("subprocess.run", fake_run)
+    monkeypatch.setattr("src.pytrain.utils.ip_tools._interface_signature", lambda: signature["value"])
 
-        def __enter__(self):
-            return self
+    assert get_ip_address() == ["192.168.1.11"]
+    assert get_ip_address() == ["192.168.1.11"]
+    assert calls["count"] == 1
+
+    # interface change forces a new lookup
+    signature["value"] = (("wlan0", "192.168.1.12"),)
+    assert get_ip_address() == ["192.168.1.12"]
+    assert calls["count"] == 2
+
+    # as does an explicit refresh
+    assert get_ip_address(refresh=True) == ["192.168.1.13"]
+    assert calls["count"] == 3
+
+
+def test_scan_for_base_returns_first_responder(base3_stub):
+    addr, port = base3_stub
+    # closed ports on other loopback addresses are refused and skipped
+    assert scan_for_base(["127.0.0.2", "127.0.0.3", addr, "127.0.0.4"], port) == addr
+    assert scan_for_base(["127.0.0.2", "127.0.0.3"], port) is None
+
+
+def test_find_base_address_scans_subnet_and_records_result(monkeypatch, tmp_path, base3_stub):
+    addr, port = base3_stub
+    # recorded under a cache directory that doesn't exist yet
+    cache_file = str(tmp_path / "cache" / "base_address")
+    monkeypatch.setattr("src.pytrain.utils.ip_tools.get_ip_address", lambda: ["127.0.0.42"], raising=True)
+
+    assert find_base_address(base3_port=port, cache_file=cache_file) == addr
+    assert load_base_address(cache_file) == addr
+
+
+def test_only_a_verified_base3_is_found_and_recorded(monkeypatch, tmp_path, base3_stub, other_listener):
+    addr, port = base3_stub
+    other, _ = other_listener
+    assert is_base3(addr, port) is True
+    assert is_base3(other, port, timeout=0.2) is False
+
+    # the other device, though it was recorded and accepts connects on the Base 3 port, isn't taken for it
+    monkeypatch.setattr("src.pytrain.utils.ip_tools.get_ip_address", lambda: ["127.0.0.42"], raising=True)
+    cache_file = str(tmp_path / "base")
+    save_base_address(other, cache_file)
+    assert find_base_address(base3_port=port, cache_file=cache_file, verify_timeout=0.2) == addr
+    assert load_base_address(cache_file) == addr
+
+
+def test_find_base_address_tries_cached_address_first(monkeypatch, tmp_path, base3_stub):
+    addr, port = base3_stub
+    cache_file = str(tmp_path / "base")
+    save_base_address(addr, cache_file)
+    monkeypatch.setattr("src.pytrain.utils.ip_tools.get_ip_address", lambda: ["127.0.0.42"], raising=True)
+
+    probed = []
+
+    def recording_scan(addresses, *args, **kwargs):
+        addresses = list(addresses)
+        probed.append(addresses)
+        return addr if addr in addresses else None
+
+    monkeypatch.setattr("src.pytrain.utils.ip_tools.scan_for_base", recording_scan, raising=True)
+    assert find_base_address(base3_port=port, cache_file=cache_file) == addr
+    assert probed == [[addr]]  # no subnet scan needed
 
-        def __exit__(self, exc_type, exc_val, exc_tb):
-            return False
 
-        # Ignore the function, just yield some None results then one match
-        # noinspection PyUnusedLocal,PyMethodMayBeStatic
-        def imap_unordered(self, func, iterable):
-            iterable = list(iterable)
-            assert "192.168.1.42" not in iterable
-            yield None
-            yield None
-            yield "192.168.1.99"
+def test_load_base_address_ignores_missing_or_invalid(tmp_path):
+    assert load_base_address(str(tmp_path / "missing")) is None
+    bad = tmp_path / "bad"
+    bad.write_text("not-an-ip\n", encoding="utf-8")
+    assert load_base_address(str(bad)) is None
 
-        def terminate(self):
-            self.terminated = True
 
-    # Patch Pool constructor at the module where it's used
-    monkeypatch.setattr("src.pytrain.utils.ip_tools.Pool", lambda n: DummyPool(n), raising=True)
+def test_server_endpoint_round_trips_and_ignores_invalid(tmp_path):
+    cache_file = str(tmp_path / "server")
+    endpoint = ServerEndpoint("192.168.1.20", 5555, is_ser2=True, is_base3=True, cache_sync=True, cache_sync_port=5655)
+    save_server_endpoint(endpoint, cache_file)
+    assert load_server_endpoint(cache_file) == endpoint
 
-    # Run and verify we got the discovered address
-    found = find_base_address()
-    assert found == "192.168.1.99"
+    assert load_server_endpoint(str(tmp_path / "missing")) is None
+    bad = tmp_path / "bad"
+    bad.write_text('{"address": "nowhere", "port": 5555}\n', encoding="utf-8")
+    assert load_server_endpoint(str(bad)) is None
+    bad.write_text("[1, 2]\n", encoding="utf-8")
+    assert load_server_endpoint(str(bad)) is None